@@ -48,6 +48,16 @@ from .base import (
     Trait,
     Unit,
 )
+from .generator import (
+    ExamplePayloadGenerator,
+    JsonSchemaCache,
+    JsonSchemaGenerator,
+    PayloadClassCache,
+    PayloadClassGenerator,
+    generate_example_payloads,
+    generate_json_schema,
+    load_payload_classes,
+)
 from .impl import (
     BaseImpl,
     DefaultAbstractEntity,
@@ -87,3 +97,10 @@ from .impl import (
 )
 from .loader.aspect_loader import AspectLoader
 from .loader.samm_graph import SAMMGraph
+from .validation import (
+    BatchPayloadValidator,
+    PayloadValidator,
+    PayloadViolation,
+    compile_batch_validator,
+    compile_validator,
+)
@@ -10,12 +10,19 @@
 #   SPDX-License-Identifier: MPL-2.0
 
 from abc import ABC, abstractmethod
+from typing import Optional, Type, TypeVar
 
 from esmf_aspect_meta_model_python.base.base import Base
 
+T = TypeVar("T", bound=Base)
+
 
 class CacheStrategy(ABC):
-    """Cache Strategy interface class."""
+    """Cache Strategy interface class.
+
+    The lookups by URN and by type have a default implementation which scans the cached elements,
+    so a cache strategy only has to provide get_elements to support them.
+    """
 
     @abstractmethod
     def reset(self) -> None:
@@ -43,6 +50,39 @@ class CacheStrategy(ABC):
             list[Base]: the found elements or an empty list.
         """
 
+    def get_elements(self) -> list[Base]:
+        """Get all cached elements.
+
+        The lookups by URN and by type scan these elements, unless a cache strategy overrides them
+        with indexed lookups.
+
+        Returns:
+            list[Base]: the cached elements.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not provide the cached elements")
+
+    def get_by_urn(self, urn: str) -> Optional[Base]:
+        """Get element by URN.
+
+        Args:
+            urn (str): URN of the element.
+
+        Returns:
+            Base | None: the found element or None.
+        """
+        return next((element for element in self.get_elements() if element.urn == urn), None)
+
+    def get_by_type(self, element_type: Type[T]) -> list[T]:
+        """Get elements by type.
+
+        Args:
+            element_type (Type[Base]): type of the elements, the subclasses of the type are included.
+
+        Returns:
+            list[Base]: the found elements or an empty list.
+        """
+        return [element for element in self.get_elements() if isinstance(element, element_type)]
+
     @abstractmethod
     def resolve_instance(self, model_element: Base) -> Base:
         """Resolve cached element instance or add the given element to the cache.
@@ -0,0 +1,120 @@
+#  Copyright (c) 2024 Robert Bosch Manufacturing Solutions GmbH
+#
+#  See the AUTHORS file(s) distributed with this work for additional
+#  information regarding authorship.
+#
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+#
+#   SPDX-License-Identifier: MPL-2.0
+
+"""Files of the on-disk caches and indexes.
+
+The caches keep their entries in JSON files which are written atomically, so a concurrent reader never gets
+a partially written file, and a missing, broken or outdated file is treated as a cache miss.
+"""
+
+import json
+
+from hashlib import sha256
+from os import replace
+from os.path import dirname
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+from typing import Any, List, Optional, Sequence, Union
+
+
+def get_file_hash(file_path: str) -> str:
+    """Get a hash of the file content.
+
+    :param file_path: path to the file
+    :return: hex digest of the file content
+    """
+    with open(file_path, "rb") as file:
+        return sha256(file.read()).hexdigest()
+
+
+def get_folder_files(folder: str) -> List[str]:
+    """Get names of the turtle files in the folder.
+
+    :param folder: path to the folder
+    :return: sorted list of the file names
+    """
+    return sorted(file_path.name for file_path in Path(folder).glob("*.ttl"))
+
+
+def get_files_key(prefix: str, file_paths: Sequence[str]) -> str:
+    """Get a key of the model files.
+
+    The key is a hash of the prefix, the content of the files and the list of the turtle files in their folders,
+    so it changes as soon as any file is changed, removed or a new file is added to one of the folders.
+
+    :param prefix: prefix of the key, e.g. the cache format and the SAMM version
+    :param file_paths: paths to the model files
+    :return: hex digest
+    """
+    key = sha256(prefix.encode())
+
+    for file_path in sorted(file_paths):
+        key.update(f"\nfile:{file_path}:{get_file_hash(file_path)}".encode())
+
+    for folder in sorted({dirname(file_path) for file_path in file_paths}):
+        key.update(f"\nfolder:{folder}:{'/'.join(get_folder_files(folder))}".encode())
+
+    return key.hexdigest()
+
+
+def read_json(file_path: Union[str, Path]) -> Optional[Any]:
+    """Read a JSON file of a cache.
+
+    :param file_path: path to the file
+    :return: file data or None if the file does not exist or is broken
+    """
+    try:
+        with open(file_path, encoding="utf-8") as file:
+            return json.load(file)
+    except (OSError, ValueError):
+        return None
+
+
+def read_versioned_json(file_path: Union[str, Path], file_format: str, key: Optional[str] = None) -> Optional[dict]:
+    """Read a JSON file of a cache which has a format version and optionally a key of its inputs.
+
+    :param file_path: path to the file
+    :param file_format: expected format version of the file
+    :param key: expected key of the inputs, not checked if not set
+    :return: file data or None if the file does not exist, is broken, has another format or is outdated
+    """
+    data = read_json(file_path)
+    if not isinstance(data, dict) or data.get("format") != file_format:
+        return None
+
+    if key is not None and data.get("key") != key:
+        return None
+
+    return data
+
+
+def write_text(file_path: Union[str, Path], text: str) -> None:
+    """Write a file of a cache atomically.
+
+    The text is written to a temporary file in the same folder, which then replaces the file.
+
+    :param file_path: path to the file
+    :param text: content of the file
+    """
+    file_path = Path(file_path)
+    with NamedTemporaryFile("w", encoding="utf-8", dir=file_path.parent, suffix=".tmp", delete=False) as file:
+        file.write(text)
+
+    replace(file.name, file_path)
+
+
+def write_json(file_path: Union[str, Path], data: Any) -> None:
+    """Write a JSON file of a cache atomically in a compact form.
+
+    :param file_path: path to the file
+    :param data: file data
+    """
+    write_text(file_path, json.dumps(data, ensure_ascii=False, separators=(",", ":")))
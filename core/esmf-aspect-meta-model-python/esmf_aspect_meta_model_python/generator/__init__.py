@@ -0,0 +1,15 @@
+#  Copyright (c) 2024 Robert Bosch Manufacturing Solutions GmbH
+#
+#  See the AUTHORS file(s) distributed with this work for additional
+#  information regarding authorship.
+#
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+#
+#   SPDX-License-Identifier: MPL-2.0
+
+
+from .example_payloads import ExamplePayloadGenerator, generate_example_payloads
+from .json_schema import JsonSchemaCache, JsonSchemaGenerator, generate_json_schema
+from .payload_classes import PayloadClassCache, PayloadClassGenerator, load_payload_classes
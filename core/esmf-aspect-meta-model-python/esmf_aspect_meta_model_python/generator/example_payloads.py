@@ -0,0 +1,357 @@
+#  Copyright (c) 2024 Robert Bosch Manufacturing Solutions GmbH
+#
+#  See the AUTHORS file(s) distributed with this work for additional
+#  information regarding authorship.
+#
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+#
+#   SPDX-License-Identifier: MPL-2.0
+
+import json
+
+from itertools import count as count_from
+from pathlib import Path
+from random import Random
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+from rdflib import Literal
+
+from esmf_aspect_meta_model_python.base.aspect import Aspect
+from esmf_aspect_meta_model_python.base.characteristics.characteristic import Characteristic
+from esmf_aspect_meta_model_python.base.characteristics.collection.collection import Collection
+from esmf_aspect_meta_model_python.base.characteristics.collection.set import Set
+from esmf_aspect_meta_model_python.base.characteristics.collection.sorted_set import SortedSet
+from esmf_aspect_meta_model_python.base.characteristics.enumeration import Enumeration
+from esmf_aspect_meta_model_python.base.characteristics.structured_value import StructuredValue
+from esmf_aspect_meta_model_python.base.characteristics.trait import Trait
+from esmf_aspect_meta_model_python.base.contraints.constraint import Constraint
+from esmf_aspect_meta_model_python.base.contraints.length_constraint import LengthConstraint
+from esmf_aspect_meta_model_python.base.data_types.complex_type import ComplexType
+from esmf_aspect_meta_model_python.base.data_types.data_type import DataType
+from esmf_aspect_meta_model_python.base.data_types.scalar import Scalar
+from esmf_aspect_meta_model_python.base.either import Either
+from esmf_aspect_meta_model_python.base.property import Property
+from esmf_aspect_meta_model_python.generator.json_schema import get_json_value
+from esmf_aspect_meta_model_python.generator.value_factories import (
+    MAX_ATTEMPTS,
+    get_checked_factory,
+    get_enumeration_factory,
+    get_lengths,
+    get_pattern_factory,
+    get_scalar_factory,
+    get_text_factory,
+)
+from esmf_aspect_meta_model_python.loader.access_path_index import AccessPathIndex
+from esmf_aspect_meta_model_python.validation.payload_validator import PayloadValidatorCompiler, PayloadViolation
+from esmf_aspect_meta_model_python.validation.value_checks import get_constraint_check
+
+PayloadFactory = Callable[[Random, int], Any]
+"""Factory of one JSON value of the payload, gets the random generator and the depth of the nested Entities."""
+
+
+def get_example_value(value: Any) -> Any:
+    """Convert an example value or an enumeration value of the model to its JSON form in the payload.
+
+    An RDF literal is converted to its Python value, a language string becomes an object with the text
+    by language. The name of an Entity instance is removed.
+
+    :param value: value of the model
+    :return: JSON value
+    """
+    if isinstance(value, Literal):
+        if value.language:
+            return {value.language: str(value)}
+        value = value.toPython()
+        if isinstance(value, Literal):
+            return str(value)
+    if isinstance(value, dict):
+        return {key: get_example_value(item) for key, item in value.items() if "#" not in key}
+    if isinstance(value, list):
+        return [get_example_value(item) for item in value]
+
+    return get_json_value(value)
+
+
+def _get_constant_factory(value: Any) -> PayloadFactory:
+    """Get a factory of the constant JSON value."""
+    return lambda random, depth: value
+
+
+class ExamplePayloadCompiler:
+    """Compiler of the example payload factories.
+
+    The model is walked once and every Characteristic becomes a factory of its JSON values, so a payload is built
+    without checking the model types again. The constraints of a Trait are passed to the factory of its base
+    Characteristic, the values are generated within them instead of being filtered afterwards.
+
+    :param max_items: maximum number of the items of a collection, if not limited by a length constraint
+    :param max_depth: depth of the nested Entities from which the optional properties are not generated anymore
+    """
+
+    def __init__(self, max_items: int = 3, max_depth: int = 3):
+        self._max_items = max_items
+        self._max_depth = max_depth
+        self._complex_types: Dict[int, PayloadFactory] = {}
+        self._validator_compiler = PayloadValidatorCompiler()
+
+    def _get_example_factory(self, prop: Property) -> Optional[PayloadFactory]:
+        """Get a factory of the example value of the property, if it is set and valid."""
+        example_value = getattr(prop, "example_value", None)
+        if example_value is None:
+            return None
+
+        value = get_example_value(example_value)
+        violations: List[PayloadViolation] = []
+        self._validator_compiler.compile_characteristic(prop.characteristic)(value, (), violations)
+
+        return None if violations else _get_constant_factory(value)
+
+    def compile_properties(self, properties: Sequence[Property]) -> PayloadFactory:
+        """Compile a factory of the JSON object with the values of the properties.
+
+        The optional properties are generated randomly, and not at all in the Entities deeper than the max depth.
+
+        :param properties: properties of an Aspect or an Entity
+        :return: payload factory
+        """
+        fields: List[Tuple[str, bool, PayloadFactory]] = []
+        for prop in properties:
+            if isinstance(prop, Property) and not prop.is_abstract and not prop.is_not_in_payload:
+                factory = self._get_example_factory(prop) or self.compile_characteristic(prop.characteristic)
+                fields.append((AccessPathIndex.get_payload_key(prop), bool(prop.is_optional), factory))
+
+        max_depth = self._max_depth
+
+        def generate(random: Random, depth: int) -> Dict[str, Any]:
+            return {
+                key: factory(random, depth)
+                for key, is_optional, factory in fields
+                if not is_optional or (depth < max_depth and random.random() < 0.5)
+            }
+
+        return generate
+
+    def compile_data_type(
+        self, data_type: Optional[DataType], constraints: Sequence[Constraint] = ()
+    ) -> PayloadFactory:
+        """Compile a factory of the values of the data type.
+
+        :param data_type: data type of a Characteristic
+        :param constraints: constraints of the value
+        :return: payload factory
+        """
+        if isinstance(data_type, ComplexType):
+            return self._compile_complex_type(data_type)
+
+        factory = (
+            get_scalar_factory(data_type.urn, constraints) if isinstance(data_type, Scalar) and data_type.urn else None
+        )
+        if factory is None:
+            factory = get_text_factory(5, 12)
+
+        return lambda random, depth: factory(random)
+
+    def _compile_complex_type(self, complex_type: ComplexType) -> PayloadFactory:
+        """Compile a factory of the Entity values, a recursive Entity uses the factory which is being compiled."""
+        key = id(complex_type)
+        if key not in self._complex_types:
+            factories: List[PayloadFactory] = []
+            self._complex_types[key] = lambda random, depth: factories[0](random, depth + 1)
+            factories.append(self.compile_properties(complex_type.all_properties))
+
+        return self._complex_types[key]
+
+    def compile_characteristic(
+        self,
+        characteristic: Optional[Characteristic],
+        constraints: Sequence[Constraint] = (),
+    ) -> PayloadFactory:
+        """Compile a factory of the values described by the Characteristic.
+
+        :param characteristic: Characteristic of a property
+        :param constraints: constraints of the Traits the Characteristic is the base of
+        :return: payload factory
+        :raises ValueError: if no value is valid for the constraints
+        """
+        if isinstance(characteristic, Trait):
+            return self.compile_characteristic(
+                characteristic.base_characteristic,
+                [*constraints, *characteristic.constraints],
+            )
+        if isinstance(characteristic, Either):
+            return self._compile_either(characteristic)
+        if characteristic is None:
+            return self.compile_data_type(None)
+        if isinstance(characteristic, Collection):
+            return self._compile_collection(characteristic, constraints)
+        if isinstance(characteristic, Enumeration):
+            return self._compile_enumeration(characteristic, constraints)
+        if isinstance(characteristic, StructuredValue) and isinstance(characteristic.data_type, Scalar):
+            return self._compile_structured_value(characteristic)
+
+        return self.compile_data_type(characteristic.data_type, constraints)
+
+    def _compile_either(self, characteristic: Either) -> PayloadFactory:
+        """Compile a factory of the Either values, which are objects with the left or the right value."""
+        left = self.compile_characteristic(characteristic.left)
+        right = self.compile_characteristic(characteristic.right)
+
+        def generate(random: Random, depth: int) -> Dict[str, Any]:
+            if random.random() < 0.5:
+                return {"left": left(random, depth)}
+            return {"right": right(random, depth)}
+
+        return generate
+
+    @staticmethod
+    def _compile_enumeration(enumeration: Enumeration, constraints: Sequence[Constraint]) -> PayloadFactory:
+        """Compile a factory which chooses one of the enumeration values allowed by the constraints."""
+        checks = [check for check in (get_constraint_check(constraint) for constraint in constraints) if check]
+        factory = get_enumeration_factory([get_example_value(value) for value in enumeration.values], checks)
+        if factory is None:
+            raise ValueError(f"No value of the enumeration {enumeration.name} is valid")
+
+        return lambda random, depth: factory(random)
+
+    @staticmethod
+    def _compile_structured_value(characteristic: StructuredValue) -> PayloadFactory:
+        """Compile a factory of the texts which match the deconstruction rule."""
+        rule = characteristic.deconstruction_rule
+        check = PayloadValidatorCompiler.get_deconstruction_check(rule)
+        factory = get_checked_factory(get_pattern_factory(rule), [check], characteristic.name)
+
+        return lambda random, depth: factory(random)
+
+    def _compile_collection(self, collection: Collection, constraints: Sequence[Constraint]) -> PayloadFactory:
+        """Compile a factory of the collection values.
+
+        The length constraints limit the number of items, other constraints apply to every item. The items of
+        a Set or a SortedSet are unique. Without a minimum length a collection is empty in the Entities deeper
+        than the max depth, so a collection of a recursive Entity ends there.
+        """
+        item_constraints = [constraint for constraint in constraints if not isinstance(constraint, LengthConstraint)]
+        if collection.element_characteristic is not None:
+            item_factory = self.compile_characteristic(collection.element_characteristic, item_constraints)
+        else:
+            item_factory = self.compile_data_type(collection.data_type, item_constraints)
+
+        min_items, max_items = get_lengths(constraints, (0, self._max_items))
+        max_depth = self._max_depth
+        if isinstance(collection, (Set, SortedSet)):
+            return self._get_unique_items_factory(item_factory, min_items, max_items, collection.name)
+
+        def generate(random: Random, depth: int) -> List[Any]:
+            size = random.randint(min_items, max_items) if depth < max_depth else min_items
+            return [item_factory(random, depth) for _ in range(size)]
+
+        return generate
+
+    def _get_unique_items_factory(
+        self,
+        item_factory: PayloadFactory,
+        min_items: int,
+        max_items: int,
+        name: str,
+    ) -> PayloadFactory:
+        """Get a factory of the collections with unique items.
+
+        The factory raises ValueError if less unique items than the minimum could be generated, e.g. a Set
+        of booleans with at least three items. The items are not generated when the factory is compiled,
+        the factory of a recursive Entity is not complete yet.
+        """
+        max_depth = self._max_depth
+
+        def generate(random: Random, depth: int) -> List[Any]:
+            size = random.randint(min_items, max_items) if depth < max_depth else min_items
+            items: Dict[str, Any] = {}
+            for _ in range(size * MAX_ATTEMPTS):
+                if len(items) >= size:
+                    break
+                item = item_factory(random, depth)
+                items.setdefault(json.dumps(item, sort_keys=True), item)
+            if len(items) < min_items:
+                raise ValueError(f"Could not generate {min_items} unique items of {name}")
+            return list(items.values())
+
+        return generate
+
+
+class ExamplePayloadGenerator:
+    """Generator of the example payloads of an Aspect.
+
+    The example value of a property is used if it is set and valid, other values are generated randomly within
+    the range, length, regular expression and enumeration constraints. The payloads are valid for the payload
+    validator and differ from each other as far as the model allows it.
+
+    The model is compiled once when the generator is created, the payloads are generated by a streaming iterator.
+
+    :param aspect: loaded Aspect
+    :param seed: seed of the random generator to get the same payloads again
+    :param max_items: maximum number of the items of a collection, if not limited by a length constraint
+    :param max_depth: depth of the nested Entities from which the optional properties are not generated anymore
+    :raises ValueError: if no value of a property is valid for its constraints
+    """
+
+    def __init__(self, aspect: Aspect, seed: Optional[int] = None, max_items: int = 3, max_depth: int = 3):
+        if max_items < 1:
+            raise ValueError("The maximum number of items must be a positive number")
+
+        self._aspect = aspect
+        self._random = Random(seed)
+        self._factory = ExamplePayloadCompiler(max_items, max_depth).compile_properties(aspect.properties)
+
+    @property
+    def aspect(self) -> Aspect:
+        """Aspect of the generated payloads."""
+        return self._aspect
+
+    def generate(self) -> Dict[str, Any]:
+        """Generate one example payload.
+
+        :return: JSON payload
+        :raises ValueError: if a Set or a SortedSet could not get the minimum number of unique items
+        """
+        return self._factory(self._random, 0)
+
+    def iter_payloads(self, count: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """Iterate over the example payloads.
+
+        :param count: number of the payloads, the iterator is endless if it is not set
+        :return: iterator of the JSON payloads
+        """
+        factory = self._factory
+        random = self._random
+        numbers = count_from() if count is None else range(count)
+
+        return (factory(random, 0) for _ in numbers)
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        return self.iter_payloads()
+
+    def write_json_lines(self, file_path: Union[str, Path], count: int) -> None:
+        """Write the example payloads to a JSON lines file, one payload per line.
+
+        :param file_path: path to the file
+        :param count: number of the payloads
+        """
+        with open(file_path, "w", encoding="utf-8") as file:
+            for payload in self.iter_payloads(count):
+                file.write(json.dumps(payload, ensure_ascii=False))
+                file.write("\n")
+
+
+def generate_example_payloads(
+    aspect: Aspect,
+    count: Optional[int] = None,
+    seed: Optional[int] = None,
+) -> Iterator[Dict[str, Any]]:
+    """Generate the example payloads of the Aspect.
+
+    :param aspect: loaded Aspect
+    :param count: number of the payloads, the iterator is endless if it is not set
+    :param seed: seed of the random generator to get the same payloads again
+    :return: iterator of the JSON payloads
+    """
+    return ExamplePayloadGenerator(aspect, seed).iter_payloads(count)
@@ -0,0 +1,513 @@
+#  Copyright (c) 2024 Robert Bosch Manufacturing Solutions GmbH
+#
+#  See the AUTHORS file(s) distributed with this work for additional
+#  information regarding authorship.
+#
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+#
+#   SPDX-License-Identifier: MPL-2.0
+
+import json
+import re
+
+from datetime import date, datetime, time
+from decimal import Decimal
+from hashlib import sha256
+from os.path import abspath
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Set, Union
+
+from esmf_aspect_meta_model_python.base.aspect import Aspect
+from esmf_aspect_meta_model_python.base.bound_definition import BoundDefinition
+from esmf_aspect_meta_model_python.base.characteristics.characteristic import Characteristic
+from esmf_aspect_meta_model_python.base.characteristics.collection.collection import Collection
+from esmf_aspect_meta_model_python.base.characteristics.collection.set import Set as SetCharacteristic
+from esmf_aspect_meta_model_python.base.characteristics.collection.sorted_set import SortedSet
+from esmf_aspect_meta_model_python.base.characteristics.enumeration import Enumeration
+from esmf_aspect_meta_model_python.base.characteristics.state import State
+from esmf_aspect_meta_model_python.base.characteristics.structured_value import StructuredValue
+from esmf_aspect_meta_model_python.base.characteristics.trait import Trait
+from esmf_aspect_meta_model_python.base.contraints.constraint import Constraint
+from esmf_aspect_meta_model_python.base.contraints.language_constraint import LanguageConstraint
+from esmf_aspect_meta_model_python.base.contraints.length_constraint import LengthConstraint
+from esmf_aspect_meta_model_python.base.contraints.range_constraint import RangeConstraint
+from esmf_aspect_meta_model_python.base.contraints.regular_expression_constraint import RegularExpressionConstraint
+from esmf_aspect_meta_model_python.base.data_types.complex_type import ComplexType
+from esmf_aspect_meta_model_python.base.data_types.data_type import DataType
+from esmf_aspect_meta_model_python.base.data_types.scalar import Scalar
+from esmf_aspect_meta_model_python.base.either import Either
+from esmf_aspect_meta_model_python.base.is_described import IsDescribed
+from esmf_aspect_meta_model_python.base.property import Property
+from esmf_aspect_meta_model_python.cache_files import get_files_key, read_json, read_versioned_json, write_json
+from esmf_aspect_meta_model_python.loader.access_path_index import AccessPathIndex
+from esmf_aspect_meta_model_python.loader.aspect_loader import AspectLoader
+from esmf_aspect_meta_model_python.validation.value_checks import (
+    INTEGER_RANGES,
+    NUMBER_TYPES,
+    STRING_TYPES,
+    get_type_name,
+    is_number,
+)
+
+STRING_FORMATS = {
+    "anyURI": "uri",
+    "date": "date",
+    "dateTime": "date-time",
+    "dateTimeStamp": "date-time",
+    "time": "time",
+}
+
+
+def get_json_value(value: Any) -> Any:
+    """Convert a value of the model to a JSON value.
+
+    Dates and times are written as ISO strings, decimals as numbers.
+
+    :param value: value of the model, e.g. an enumeration value or a range bound
+    :return: JSON value
+    """
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return int(value) if value == value.to_integral_value() else float(value)
+    if isinstance(value, dict):
+        return {str(key): get_json_value(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [get_json_value(item) for item in value]
+
+    return value
+
+
+def get_scalar_schema(data_type_urn: str) -> Dict[str, Any]:
+    """Get a schema of the JSON value of the scalar data type.
+
+    :param data_type_urn: URN of the scalar data type
+    :return: schema, empty for an unknown data type
+    """
+    type_name = get_type_name(data_type_urn)
+
+    if type_name in STRING_TYPES:
+        schema: Dict[str, Any] = {"type": "string"}
+        if type_name in STRING_FORMATS:
+            schema["format"] = STRING_FORMATS[type_name]
+        return schema
+
+    if type_name == "boolean":
+        return {"type": "boolean"}
+
+    if type_name in NUMBER_TYPES:
+        return {"type": "number"}
+
+    if type_name == "langString":
+        return {"type": "object", "additionalProperties": {"type": "string"}}
+
+    if type_name in INTEGER_RANGES:
+        schema = {"type": "integer"}
+        min_value, max_value = INTEGER_RANGES[type_name]
+        if min_value is not None:
+            schema["minimum"] = min_value
+        if max_value is not None:
+            schema["maximum"] = max_value
+        return schema
+
+    return {}
+
+
+def get_range_keywords(constraint: RangeConstraint) -> Dict[str, Any]:
+    """Get the schema keywords of the range constraint.
+
+    Only numeric bounds are mapped, the bounds of dates and times can not be expressed in the JSON schema.
+
+    :param constraint: range constraint
+    :return: schema keywords
+    """
+    keywords: Dict[str, Any] = {}
+    min_value = get_json_value(constraint.min_value)
+    max_value = get_json_value(constraint.max_value)
+
+    if constraint.lower_bound_definition != BoundDefinition.OPEN and is_number(min_value):
+        keywords["minimum"] = min_value
+        if constraint.lower_bound_definition == BoundDefinition.GREATER_THAN:
+            keywords["exclusiveMinimum"] = True
+
+    if constraint.upper_bound_definition != BoundDefinition.OPEN and is_number(max_value):
+        keywords["maximum"] = max_value
+        if constraint.upper_bound_definition == BoundDefinition.LESS_THAN:
+            keywords["exclusiveMaximum"] = True
+
+    return keywords
+
+
+def get_constraint_keywords(constraint: Constraint, is_collection: bool = False) -> Dict[str, Any]:
+    """Get the schema keywords of the constraint.
+
+    :param constraint: constraint of a Trait
+    :param is_collection: True if the constraint limits a collection, False for a single value
+    :return: schema keywords, empty if the constraint can not be expressed in the JSON schema
+    """
+    if isinstance(constraint, RangeConstraint):
+        return get_range_keywords(constraint)
+
+    if isinstance(constraint, LengthConstraint):
+        min_keyword, max_keyword = ("minItems", "maxItems") if is_collection else ("minLength", "maxLength")
+        keywords = {min_keyword: constraint.min_value, max_keyword: constraint.max_value}
+        return {keyword: value for keyword, value in keywords.items() if value is not None}
+
+    if isinstance(constraint, RegularExpressionConstraint):
+        return {"pattern": constraint.value}
+
+    if isinstance(constraint, LanguageConstraint):
+        return {"properties": {constraint.language_code: {"type": "string"}}, "additionalProperties": False}
+
+    return {}
+
+
+def add_keywords(schema: Dict[str, Any], keywords: Dict[str, Any]) -> Dict[str, Any]:
+    """Add the keywords to the schema.
+
+    A reference ignores the keywords next to it, so the referenced schema is combined with the keywords.
+
+    :param schema: schema to extend
+    :param keywords: keywords to add
+    :return: extended schema
+    """
+    if not keywords:
+        return schema
+    if "$ref" in schema:
+        return {"allOf": [schema, keywords]}
+
+    return {**schema, **keywords}
+
+
+class JsonSchemaGenerator:
+    """JSON schema generator of the Aspect payload.
+
+    The schema is generated from the loaded Aspect, without the SAMM CLI. Every Entity and AbstractEntity used by
+    the Aspect is a schema in the components section, the properties refer to it, so recursive Entities are
+    supported. An Entity which extends another one contains all inherited properties.
+
+    The payload names are used as keys, the properties which are not optional are required. The Either values and
+    the language strings have the same JSON form as in the payload validator.
+
+    :param aspect: loaded Aspect
+    :param language: language of the descriptions
+    """
+
+    schema_version = "http://json-schema.org/draft-04/schema"
+    generator_version = "1"
+
+    def __init__(self, aspect: Aspect, language: str = "en"):
+        self._aspect = aspect
+        self._language = language
+        self._schemas: Dict[str, Dict[str, Any]] = {}
+        self._schema_names: Dict[int, str] = {}
+        self._used_names: Set[str] = set()
+
+    @property
+    def aspect(self) -> Aspect:
+        """Aspect of the generated schema."""
+        return self._aspect
+
+    @property
+    def language(self) -> str:
+        """Language of the descriptions."""
+        return self._language
+
+    def _add_description(self, schema: Dict[str, Any], element: Any) -> Dict[str, Any]:
+        """Add the description of the model element to the schema."""
+        description = element.get_description(self._language) if isinstance(element, IsDescribed) else None
+        if not description or not isinstance(description, str):
+            return schema
+
+        if "$ref" in schema:
+            return {"description": description, "allOf": [schema]}
+
+        return {"description": description, **schema}
+
+    def _get_object_schema(self, properties: Sequence[Property]) -> Dict[str, Any]:
+        """Get a schema of the JSON object with the properties which are in the payload."""
+        schema: Dict[str, Any] = {"type": "object", "properties": {}}
+        required = []
+        for prop in properties:
+            if not isinstance(prop, Property) or prop.is_abstract or prop.is_not_in_payload:
+                continue
+
+            key = AccessPathIndex.get_payload_key(prop)
+            schema["properties"][key] = self._add_description(
+                self._get_characteristic_schema(prop.characteristic), prop
+            )
+            if not prop.is_optional:
+                required.append(key)
+
+        if required:
+            schema["required"] = required
+
+        return schema
+
+    def _get_schema_name(self, complex_type: ComplexType) -> str:
+        """Get a unique name of the Entity schema in the components section."""
+        urn = getattr(complex_type, "urn", None)
+        name = re.sub("[^A-Za-z0-9._-]", "_", urn if isinstance(urn, str) and urn else complex_type.name)
+        unique_name = name
+        index = 1
+        while unique_name in self._used_names:
+            index += 1
+            unique_name = f"{name}{index}"
+        self._used_names.add(unique_name)
+
+        return unique_name
+
+    def _get_complex_type_schema(self, complex_type: ComplexType) -> Dict[str, Any]:
+        """Get a reference to the Entity schema, the schema is added to the components on the first use."""
+        name = self._schema_names.get(id(complex_type))
+        if name is None:
+            name = self._get_schema_name(complex_type)
+            self._schema_names[id(complex_type)] = name
+            self._schemas[name] = {}
+            schema = self._get_object_schema(complex_type.all_properties)
+            self._schemas[name] = self._add_description(schema, complex_type)
+
+        return {"$ref": f"#/components/schemas/{name}"}
+
+    def _get_data_type_schema(self, data_type: Optional[DataType]) -> Dict[str, Any]:
+        """Get a schema of the value of the data type."""
+        if isinstance(data_type, ComplexType):
+            return self._get_complex_type_schema(data_type)
+        if isinstance(data_type, Scalar) and data_type.urn:
+            return get_scalar_schema(data_type.urn)
+
+        return {}
+
+    def _get_characteristic_schema(self, characteristic: Optional[Characteristic]) -> Dict[str, Any]:
+        """Get a schema of the value described by the Characteristic."""
+        if isinstance(characteristic, Trait):
+            return self._get_trait_schema(characteristic)
+
+        if isinstance(characteristic, Either):
+            return {
+                "oneOf": [
+                    self._get_either_schema("left", characteristic.left),
+                    self._get_either_schema("right", characteristic.right),
+                ]
+            }
+
+        if characteristic is None:
+            return {}
+
+        if isinstance(characteristic, Collection):
+            return self._get_collection_schema(characteristic)
+
+        schema = self._get_data_type_schema(characteristic.data_type)
+        if isinstance(characteristic, Enumeration):
+            schema = self._add_enumeration_keywords(schema, characteristic)
+        elif isinstance(characteristic, StructuredValue):
+            schema = add_keywords(schema, {"pattern": f"^(?:{characteristic.deconstruction_rule})$"})
+
+        return schema
+
+    @staticmethod
+    def _add_enumeration_keywords(schema: Dict[str, Any], enumeration: Enumeration) -> Dict[str, Any]:
+        """Add the enumeration values of scalars and the default value of a State to the schema."""
+        values = [get_json_value(value) for value in enumeration.values if not isinstance(value, dict)]
+        keywords: Dict[str, Any] = {"enum": values} if values else {}
+        if isinstance(enumeration, State) and not isinstance(enumeration.default_value, dict):
+            keywords["default"] = get_json_value(enumeration.default_value)
+
+        return add_keywords(schema, keywords)
+
+    def _get_either_schema(self, key: str, characteristic: Characteristic) -> Dict[str, Any]:
+        """Get a schema of one side of the Either value."""
+        return {
+            "type": "object",
+            "properties": {key: self._get_characteristic_schema(characteristic)},
+            "required": [key],
+            "additionalProperties": False,
+        }
+
+    def _get_collection_schema(self, collection: Collection) -> Dict[str, Any]:
+        """Get a schema of the collection values."""
+        if collection.element_characteristic is not None:
+            items = self._get_characteristic_schema(collection.element_characteristic)
+        else:
+            items = self._get_data_type_schema(collection.data_type)
+
+        schema: Dict[str, Any] = {"type": "array", "items": items}
+        if isinstance(collection, (SetCharacteristic, SortedSet)):
+            schema["uniqueItems"] = True
+
+        return schema
+
+    def _get_trait_schema(self, trait: Trait) -> Dict[str, Any]:
+        """Get a schema of the base Characteristic with the keywords of the constraints.
+
+        The length constraint of a collection limits the number of items, other constraints apply to every item.
+        """
+        schema = self._get_characteristic_schema(trait.base_characteristic)
+        is_collection = isinstance(trait.base_characteristic, Collection) and schema.get("type") == "array"
+        item_keywords: Dict[str, Any] = {}
+        keywords: Dict[str, Any] = {}
+        for constraint in trait.constraints:
+            if is_collection and not isinstance(constraint, LengthConstraint):
+                item_keywords.update(get_constraint_keywords(constraint))
+            else:
+                keywords.update(get_constraint_keywords(constraint, is_collection))
+
+        if item_keywords:
+            schema = {**schema, "items": add_keywords(schema["items"], item_keywords)}
+
+        return add_keywords(schema, keywords)
+
+    def generate(self) -> Dict[str, Any]:
+        """Generate the JSON schema of the Aspect payload.
+
+        :return: JSON schema
+        """
+        self._schemas = {}
+        self._schema_names = {}
+        self._used_names = set()
+
+        schema: Dict[str, Any] = {"$schema": self.schema_version}
+        schema.update(self._add_description(self._get_object_schema(self._aspect.properties), self._aspect))
+        if self._schemas:
+            schema["components"] = {"schemas": self._schemas}
+
+        return schema
+
+    def write(self, file_path: Union[str, Path]) -> None:
+        """Write the JSON schema to a file.
+
+        :param file_path: path to the schema file
+        """
+        with open(file_path, "w", encoding="utf-8") as file:
+            json.dump(self.generate(), file, indent=2, ensure_ascii=False)
+
+
+def get_model_fingerprint(samm_version: str, file_paths: Sequence[str], language: str) -> str:
+    """Get a fingerprint of the resolved Aspect model files.
+
+    As for the graph cache, the fingerprint is a hash of the content of the model files, the list of the turtle
+    files in their folders and the SAMM version, so it changes as soon as any input of the model is changed.
+
+    :param samm_version: SAMM version of the Aspect model
+    :param file_paths: paths to the Aspect model file followed by all its dependency files
+    :param language: language of the schema descriptions
+    :return: hex digest
+    """
+    prefix = f"{JsonSchemaGenerator.generator_version}:{language}:{samm_version}:{file_paths[0]}"
+
+    return get_files_key(prefix, file_paths)
+
+
+class JsonSchemaCache:
+    """On-disk cache of the JSON schemas of the Aspect model files.
+
+    Every model file has a manifest with the fingerprint of its resolved model files. The fingerprint is checked
+    on each call, the stored schema is returned without loading the model if the model files are not changed.
+    Otherwise the model is loaded, the schema is generated and stored with the new fingerprint.
+
+    :param cache_dir: path to the cache directory
+    :param language: language of the schema descriptions
+    """
+
+    def __init__(self, cache_dir: Union[str, Path], language: str = "en"):
+        self._cache_dir = Path(cache_dir)
+        self._cache_dir.mkdir(parents=True, exist_ok=True)
+        self._language = language
+
+    @property
+    def cache_dir(self) -> Path:
+        """Path to the cache directory."""
+        return self._cache_dir
+
+    def _get_manifest_path(self, model_file_path: str) -> Path:
+        """Get a path to the schema manifest of the model file."""
+        name = sha256(f"{self._language}:{abspath(model_file_path)}".encode()).hexdigest()
+
+        return self._cache_dir / f"{name}.schema-manifest.json"
+
+    def _get_entry_path(self, fingerprint: str) -> Path:
+        """Get a path to the cached schema."""
+        return self._cache_dir / f"{fingerprint}.schema.json"
+
+    def _load(self, model_file_path: str) -> Optional[Dict[str, Any]]:
+        """Get the cached schema of the model file if its fingerprint is not changed."""
+        manifest = read_versioned_json(self._get_manifest_path(model_file_path), JsonSchemaGenerator.generator_version)
+        if not manifest:
+            return None
+
+        try:
+            fingerprint = get_model_fingerprint(manifest["samm_version"], manifest["files"], self._language)
+        except OSError:
+            return None
+
+        return read_json(self._get_entry_path(fingerprint)) if fingerprint == manifest["fingerprint"] else None
+
+    def get_schema(self, model_file_path: Union[str, Path]) -> Dict[str, Any]:
+        """Get the JSON schema of the Aspect model file.
+
+        :param model_file_path: path to the Aspect model file
+        :return: JSON schema
+        """
+        model_file_path = abspath(model_file_path)
+        schema = self._load(model_file_path)
+        if schema is not None:
+            return schema
+
+        loader = AspectLoader()
+        aspect = get_aspect(loader.load_aspect_model(model_file_path))
+        file_paths = [model_file_path]
+        rdf_graph = loader.get_graph().get_rdf_graph()
+        for layer in getattr(rdf_graph, "layers", []):
+            file_paths.extend(abspath(file_path) for file_path in layer.file_paths)
+
+        samm_version = loader.get_samm_version()
+        fingerprint = get_model_fingerprint(samm_version, file_paths, self._language)
+        schema = JsonSchemaGenerator(aspect, self._language).generate()
+        write_json(self._get_entry_path(fingerprint), schema)
+
+        manifest_path = self._get_manifest_path(model_file_path)
+        manifest = read_json(manifest_path)
+        write_json(
+            manifest_path,
+            {
+                "format": JsonSchemaGenerator.generator_version,
+                "fingerprint": fingerprint,
+                "samm_version": samm_version,
+                "files": file_paths,
+            },
+        )
+        if manifest and manifest.get("fingerprint") != fingerprint:
+            self._get_entry_path(manifest["fingerprint"]).unlink(missing_ok=True)
+
+        return schema
+
+    def clear(self):
+        """Remove all schemas from the cache."""
+        for pattern in ("*.schema.json", "*.schema-manifest.json"):
+            for file_path in self._cache_dir.glob(pattern):
+                file_path.unlink(missing_ok=True)
+
+
+def get_aspect(elements: List[Any]) -> Aspect:
+    """Get the Aspect from the loaded model elements.
+
+    :param elements: model elements returned by the Aspect loader
+    :return: first Aspect of the elements
+    """
+    for element in elements:
+        if isinstance(element, Aspect):
+            return element
+
+    raise ValueError("The model does not contain an Aspect")
+
+
+def generate_json_schema(aspect: Aspect, language: str = "en") -> Dict[str, Any]:
+    """Generate the JSON schema of the Aspect payload.
+
+    :param aspect: loaded Aspect
+    :param language: language of the descriptions
+    :return: JSON schema
+    """
+    return JsonSchemaGenerator(aspect, language).generate()
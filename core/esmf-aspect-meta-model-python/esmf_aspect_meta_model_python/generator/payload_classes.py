@@ -0,0 +1,559 @@
+#  Copyright (c) 2024 Robert Bosch Manufacturing Solutions GmbH
+#
+#  See the AUTHORS file(s) distributed with this work for additional
+#  information regarding authorship.
+#
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+#
+#   SPDX-License-Identifier: MPL-2.0
+
+import json
+import keyword
+import re
+import sys
+
+from datetime import date, datetime, time
+from hashlib import sha256
+from importlib.util import module_from_spec, spec_from_file_location
+from pathlib import Path
+from threading import Lock
+from types import ModuleType
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
+
+from esmf_aspect_meta_model_python.base.aspect import Aspect
+from esmf_aspect_meta_model_python.base.characteristics.characteristic import Characteristic
+from esmf_aspect_meta_model_python.base.characteristics.collection.collection import Collection
+from esmf_aspect_meta_model_python.base.characteristics.enumeration import Enumeration
+from esmf_aspect_meta_model_python.base.characteristics.trait import Trait
+from esmf_aspect_meta_model_python.base.data_types.complex_type import ComplexType
+from esmf_aspect_meta_model_python.base.data_types.scalar import Scalar
+from esmf_aspect_meta_model_python.base.either import Either
+from esmf_aspect_meta_model_python.base.is_described import IsDescribed
+from esmf_aspect_meta_model_python.base.property import Property
+from esmf_aspect_meta_model_python.cache_files import write_text
+from esmf_aspect_meta_model_python.loader.access_path_index import AccessPathIndex
+from esmf_aspect_meta_model_python.validation.value_checks import INTEGER_RANGES, NUMBER_TYPES, get_type_name
+
+INDENT = "    "
+
+
+def get_identifier(name: str, prefix: str = "_") -> str:
+    """Convert a name to a valid Python identifier.
+
+    :param name: name of the model element or a payload key
+    :param prefix: prefix of a name which starts with a digit
+    :return: identifier
+    """
+    identifier = re.sub(r"\W", "_", name) or prefix
+    if identifier[0].isdigit():
+        identifier = prefix + identifier
+    if keyword.iskeyword(identifier) or identifier in ("cls", "self", "data"):
+        identifier += "_"
+
+    return identifier
+
+
+def get_unique_name(name: str, used_names: Set[str]) -> str:
+    """Get a name which is not used yet and mark it as used.
+
+    :param name: preferred name
+    :param used_names: set of the names which are already used, the result is added to it
+    :return: the name or the name with a number suffix
+    """
+    unique_name = name
+    number = 1
+    while unique_name in used_names:
+        number += 1
+        unique_name = f"{name}{number}"
+
+    used_names.add(unique_name)
+
+    return unique_name
+
+
+def get_docstring(element: Any) -> Optional[str]:
+    """Get a one line docstring from the English description of the model element.
+
+    :param element: model element
+    :return: quoted docstring or None if the element has no English description
+    """
+    description = element.get_description("en") if isinstance(element, IsDescribed) else None
+    if not description:
+        return None
+
+    text = " ".join(description.split()).replace("\\", "\\\\").replace('"', '\\"')
+
+    return f'"""{text}"""'
+
+
+def get_string_literal(value: str) -> str:
+    """Get the Python literal of a string in double quotes."""
+    return json.dumps(value)
+
+
+def get_enumeration_text(value: Any) -> str:
+    """Get the text of an enumeration value, dates and times are written in the ISO format."""
+    return value.isoformat() if isinstance(value, (datetime, date, time)) else str(value)
+
+
+def get_enumeration_literal(value: Any) -> Optional[str]:
+    """Get the Python literal of the JSON value of an enumeration value.
+
+    :param value: value of the enumeration
+    :return: literal or None if the value is not a scalar
+    """
+    if isinstance(value, (datetime, date, time)):
+        return get_string_literal(value.isoformat())
+    if isinstance(value, str):
+        return get_string_literal(value)
+    if isinstance(value, (int, float, bool)):
+        return repr(value)
+
+    return None
+
+
+class PayloadClassGenerator:
+    """Generator of a Python module with the payload classes of an Aspect.
+
+    Every Entity and AbstractEntity used by the Aspect becomes a slotted dataclass, an Entity which extends
+    another one is a subclass of it. The Aspect itself is the root class. Every Enumeration of scalar values
+    becomes an Enum. The classes have the generated from_json and to_json methods, which map the payload names
+    to the attributes directly, without walking the model for every payload.
+
+    The decoding expects a valid payload, e.g. checked with the payload validator. Either values, language strings
+    and Entities in enumerations are kept as plain JSON values, dates and times are kept as strings.
+
+    :param aspect: loaded Aspect
+    """
+
+    generator_version = "1"
+
+    def __init__(self, aspect: Aspect):
+        self._aspect = aspect
+        self._used_names: Set[str] = {"ASPECT_URN", "Any", "Dict", "Enum", "List", "Optional", "dataclass"}
+        self._class_names: Dict[int, str] = {}
+        self._classes: List[Tuple[str, Any]] = []
+        self._enum_names: Dict[int, str] = {}
+        self._enums: List[Tuple[str, Enumeration]] = []
+
+        self._aspect_class = get_unique_name(get_identifier(aspect.name, "Aspect"), self._used_names)
+        for prop in self._get_properties(aspect):
+            self._collect_characteristic(prop.characteristic)
+
+    @property
+    def aspect(self) -> Aspect:
+        """Aspect of the generated classes."""
+        return self._aspect
+
+    @staticmethod
+    def _get_properties(element: Union[Aspect, ComplexType], all_properties: bool = False) -> List[Property]:
+        """Get the properties of an Aspect or an Entity which are in the payload."""
+        if isinstance(element, ComplexType):
+            properties = element.all_properties if all_properties else element.properties
+        else:
+            properties = element.properties
+
+        return [
+            prop
+            for prop in properties
+            if isinstance(prop, Property) and not prop.is_abstract and not prop.is_not_in_payload
+        ]
+
+    def _collect_characteristic(self, characteristic: Optional[Characteristic]) -> None:
+        """Collect the Entities and Enumerations used by the characteristic."""
+        if isinstance(characteristic, Trait):
+            self._collect_characteristic(characteristic.base_characteristic)
+        elif isinstance(characteristic, Either):
+            self._collect_characteristic(characteristic.left)
+            self._collect_characteristic(characteristic.right)
+        elif isinstance(characteristic, Collection) and characteristic.element_characteristic is not None:
+            self._collect_characteristic(characteristic.element_characteristic)
+        elif characteristic is not None:
+            if isinstance(characteristic, Enumeration) and id(characteristic) not in self._enum_names:
+                self._collect_enumeration(characteristic)
+
+            if isinstance(characteristic.data_type, ComplexType):
+                self._collect_complex_type(characteristic.data_type)
+
+    def _collect_enumeration(self, enumeration: Enumeration) -> None:
+        """Collect an Enumeration of scalar values."""
+        if enumeration.values and all(get_enumeration_literal(value) is not None for value in enumeration.values):
+            name = get_unique_name(get_identifier(enumeration.name, "Enumeration"), self._used_names)
+            self._enum_names[id(enumeration)] = name
+            self._enums.append((name, enumeration))
+
+    def _collect_complex_type(self, complex_type: ComplexType) -> None:
+        """Collect an Entity after the Entity it extends and before the Entities of its properties."""
+        if id(complex_type) in self._class_names:
+            return
+
+        if complex_type.extends is not None:
+            self._collect_complex_type(complex_type.extends)
+
+        name = get_unique_name(get_identifier(complex_type.name, "Entity"), self._used_names)
+        self._class_names[id(complex_type)] = name
+        self._classes.append((name, complex_type))
+
+        for prop in self._get_properties(complex_type):
+            self._collect_characteristic(prop.characteristic)
+
+    def _get_value_type(self, characteristic: Optional[Characteristic]) -> str:
+        """Get the type annotation of a value of the characteristic."""
+        if isinstance(characteristic, Trait):
+            return self._get_value_type(characteristic.base_characteristic)
+        if characteristic is None or isinstance(characteristic, Either):
+            return "Any"
+        if isinstance(characteristic, Collection):
+            if characteristic.element_characteristic is not None:
+                return f"List[{self._get_value_type(characteristic.element_characteristic)}]"
+            return f"List[{self._get_data_type(characteristic.data_type)}]"
+        if id(characteristic) in self._enum_names:
+            return self._enum_names[id(characteristic)]
+
+        return self._get_data_type(characteristic.data_type)
+
+    def _get_data_type(self, data_type: Any) -> str:
+        """Get the type annotation of a value of the data type."""
+        if isinstance(data_type, ComplexType):
+            return self._class_names.get(id(data_type), "Dict[str, Any]")
+        if not isinstance(data_type, Scalar) or not data_type.urn:
+            return "Any"
+
+        type_name = get_type_name(data_type.urn)
+        if type_name == "boolean":
+            return "bool"
+        if type_name in INTEGER_RANGES:
+            return "int"
+        if type_name in NUMBER_TYPES:
+            return "float"
+        if type_name == "langString":
+            return "Dict[str, str]"
+
+        return "str"
+
+    def _get_decoder(self, characteristic: Optional[Characteristic], expression: str, depth: int = 0) -> str:
+        """Get the expression which decodes the JSON value of the characteristic."""
+        if isinstance(characteristic, Trait):
+            return self._get_decoder(characteristic.base_characteristic, expression, depth)
+        if characteristic is None or isinstance(characteristic, Either):
+            return expression
+        if isinstance(characteristic, Collection):
+            item = f"item{depth}"
+            if characteristic.element_characteristic is not None:
+                item_decoder = self._get_decoder(characteristic.element_characteristic, item, depth + 1)
+            else:
+                item_decoder = self._get_type_decoder(characteristic.data_type, item)
+            return expression if item_decoder == item else f"[{item_decoder} for {item} in {expression}]"
+        if id(characteristic) in self._enum_names:
+            return f"{self._enum_names[id(characteristic)]}({expression})"
+
+        return self._get_type_decoder(characteristic.data_type, expression)
+
+    def _get_type_decoder(self, data_type: Any, expression: str) -> str:
+        """Get the expression which decodes the JSON value of the data type."""
+        if isinstance(data_type, ComplexType) and id(data_type) in self._class_names:
+            return f"{self._class_names[id(data_type)]}.from_json({expression})"
+
+        return expression
+
+    def _get_encoder(self, characteristic: Optional[Characteristic], expression: str, depth: int = 0) -> str:
+        """Get the expression which encodes the attribute value of the characteristic to JSON."""
+        if isinstance(characteristic, Trait):
+            return self._get_encoder(characteristic.base_characteristic, expression, depth)
+        if characteristic is None or isinstance(characteristic, Either):
+            return expression
+        if isinstance(characteristic, Collection):
+            item = f"item{depth}"
+            if characteristic.element_characteristic is not None:
+                item_encoder = self._get_encoder(characteristic.element_characteristic, item, depth + 1)
+            else:
+                item_encoder = self._get_type_encoder(characteristic.data_type, item)
+            return expression if item_encoder == item else f"[{item_encoder} for {item} in {expression}]"
+        if id(characteristic) in self._enum_names:
+            return f"{expression}.value"
+
+        return self._get_type_encoder(characteristic.data_type, expression)
+
+    def _get_type_encoder(self, data_type: Any, expression: str) -> str:
+        """Get the expression which encodes the attribute value of the data type to JSON."""
+        if isinstance(data_type, ComplexType) and id(data_type) in self._class_names:
+            return f"{expression}.to_json()"
+
+        return expression
+
+    def _get_fields(self, properties: List[Property], used_names: Set[str]) -> List[Tuple[str, str, Property]]:
+        """Get the attribute names and payload keys of the properties."""
+        fields = []
+        for prop in properties:
+            key = AccessPathIndex.get_payload_key(prop)
+            fields.append((get_unique_name(get_identifier(key), used_names), key, prop))
+
+        return fields
+
+    def _generate_enum(self, name: str, enumeration: Enumeration) -> List[str]:
+        """Generate the Enum class of an Enumeration."""
+        lines = [f"class {name}(Enum):"]
+        docstring = get_docstring(enumeration)
+        if docstring:
+            lines.append(INDENT + docstring)
+            lines.append("")
+
+        member_names: Set[str] = set()
+        for value in enumeration.values:
+            literal = get_enumeration_literal(value)
+            member_name = get_identifier(get_enumeration_text(value).upper(), "VALUE_")
+            lines.append(f"{INDENT}{get_unique_name(member_name, member_names)} = {literal}")
+
+        return lines
+
+    def _generate_class(self, name: str, element: Union[Aspect, ComplexType]) -> List[str]:
+        """Generate the dataclass of an Entity or the Aspect."""
+        base_fields: List[Tuple[str, str, Property]] = []
+        used_names: Set[str] = set()
+        base = element.extends if isinstance(element, ComplexType) else None
+        if base is not None:
+            base_fields = self._get_fields(self._get_properties(base, all_properties=True), used_names)
+
+        own_fields = self._get_fields(self._get_properties(element), used_names)
+        base_name = f"({self._class_names[id(base)]})" if base is not None else ""
+
+        lines = ["@dataclass(slots=True, kw_only=True)", f"class {name}{base_name}:"]
+        docstring = get_docstring(element)
+        if docstring:
+            lines.extend((INDENT + docstring, ""))
+
+        for attribute, _, prop in own_fields:
+            value_type = self._get_value_type(prop.characteristic)
+            if prop.is_optional:
+                lines.append(f"{INDENT}{attribute}: Optional[{value_type}] = None")
+            else:
+                lines.append(f"{INDENT}{attribute}: {value_type}")
+
+        fields = own_fields + base_fields
+        if own_fields:
+            lines.append("")
+        lines.extend(self._generate_from_json(name, fields))
+        lines.append("")
+        lines.extend(self._generate_to_json(fields))
+
+        return lines
+
+    def _generate_from_json(self, name: str, fields: List[Tuple[str, str, Property]]) -> List[str]:
+        """Generate the from_json class method."""
+        lines = [
+            f"{INDENT}@classmethod",
+            f"{INDENT}def from_json(cls, data: Dict[str, Any]) -> {name}:",
+            f'{INDENT * 2}"""Decode the JSON object."""',
+        ]
+        arguments = []
+        for index, (attribute, key, prop) in enumerate(fields):
+            if not prop.is_optional:
+                arguments.append(
+                    f"{attribute}={self._get_decoder(prop.characteristic, f'data[{get_string_literal(key)}]')}"
+                )
+                continue
+
+            value = f"value{index}"
+            decoder = self._get_decoder(prop.characteristic, value)
+            if decoder == value:
+                arguments.append(f"{attribute}=data.get({get_string_literal(key)})")
+            else:
+                lines.append(f"{INDENT * 2}{value} = data.get({get_string_literal(key)})")
+                arguments.append(f"{attribute}=None if {value} is None else {decoder}")
+
+        if arguments:
+            lines.append(f"{INDENT * 2}return cls(")
+            lines.extend(f"{INDENT * 3}{argument}," for argument in arguments)
+            lines.append(f"{INDENT * 2})")
+        else:
+            lines.append(f"{INDENT * 2}return cls()")
+
+        return lines
+
+    def _generate_to_json(self, fields: List[Tuple[str, str, Property]]) -> List[str]:
+        """Generate the to_json method, optional attributes without a value are not added."""
+        lines = [
+            f"{INDENT}def to_json(self) -> Dict[str, Any]:",
+            f'{INDENT * 2}"""Encode the object to JSON."""',
+        ]
+        items = []
+        optional_lines = []
+        for attribute, key, prop in fields:
+            encoder = self._get_encoder(prop.characteristic, f"self.{attribute}")
+            if prop.is_optional:
+                optional_lines.append(f"{INDENT * 2}if self.{attribute} is not None:")
+                optional_lines.append(f"{INDENT * 3}data[{get_string_literal(key)}] = {encoder}")
+            else:
+                items.append(f"{INDENT * 3}{get_string_literal(key)}: {encoder},")
+
+        if items:
+            lines.append(f"{INDENT * 2}data: Dict[str, Any] = {{")
+            lines.extend(items)
+            lines.append(f"{INDENT * 2}}}")
+        else:
+            lines.append(f"{INDENT * 2}data: Dict[str, Any] = {{}}")
+        lines.extend(optional_lines)
+        lines.append(f"{INDENT * 2}return data")
+
+        return lines
+
+    def generate(self) -> str:
+        """Generate the source code of the module.
+
+        :return: Python source code
+        """
+        urn = self._aspect.urn or ""
+        lines = [
+            f"# Generated from the Aspect {urn} by the esmf-aspect-model-loader, do not edit.",
+            "from __future__ import annotations",
+            "",
+            "from dataclasses import dataclass",
+            "from enum import Enum",
+            "from typing import Any, Dict, List, Optional",
+            "",
+            f"ASPECT_URN = {get_string_literal(urn)}",
+        ]
+
+        for name, enumeration in self._enums:
+            lines.extend(("", ""))
+            lines.extend(self._generate_enum(name, enumeration))
+
+        for name, element in [*self._classes, (self._aspect_class, self._aspect)]:
+            lines.extend(("", ""))
+            lines.extend(self._generate_class(name, element))
+
+        lines.extend(
+            (
+                "",
+                "",
+                f"def from_json(data: Dict[str, Any]) -> {self._aspect_class}:",
+                f'{INDENT}"""Decode a JSON payload of the Aspect."""',
+                f"{INDENT}return {self._aspect_class}.from_json(data)",
+                "",
+                "",
+                f"def to_json(aspect: {self._aspect_class}) -> Dict[str, Any]:",
+                f'{INDENT}"""Encode the Aspect to a JSON payload."""',
+                f"{INDENT}return aspect.to_json()",
+                "",
+            )
+        )
+
+        return "\n".join(lines)
+
+    def write(self, file_path: Union[str, Path]) -> None:
+        """Write the generated module to a file.
+
+        :param file_path: path to the Python file
+        """
+        Path(file_path).write_text(self.generate(), encoding="utf-8")
+
+
+class PayloadClassCache:
+    """On-disk cache of the generated payload class modules.
+
+    A module is stored as samm_payload_<hash>.py, where the hash is calculated from the generated source code.
+    A module which is already in the cache is imported without writing it again, Python keeps its compiled bytecode
+    next to it. A module which is already imported in the process is reused.
+
+    :param cache_dir: path to the cache directory
+    """
+
+    def __init__(self, cache_dir: Union[str, Path]):
+        self._cache_dir = Path(cache_dir)
+        self._cache_dir.mkdir(parents=True, exist_ok=True)
+        self._modules: Dict[str, ModuleType] = {}
+        self._lock = Lock()
+
+    @property
+    def cache_dir(self) -> Path:
+        """Path to the cache directory."""
+        return self._cache_dir
+
+    @staticmethod
+    def get_module_name(source: str) -> str:
+        """Get the name of the generated module.
+
+        :param source: source code of the module
+        :return: module name
+        """
+        key = sha256(f"{PayloadClassGenerator.generator_version}:{source}".encode()).hexdigest()
+
+        return f"samm_payload_{key[:32]}"
+
+    def load(self, aspect: Aspect) -> ModuleType:
+        """Get the module with the payload classes of the Aspect.
+
+        :param aspect: loaded Aspect
+        :return: imported module
+        """
+        source = PayloadClassGenerator(aspect).generate()
+        module_name = self.get_module_name(source)
+
+        with self._lock:
+            module = self._modules.get(module_name) or sys.modules.get(module_name)
+            if module is None:
+                file_path = self._cache_dir / f"{module_name}.py"
+                if not file_path.exists():
+                    write_text(file_path, source)
+
+                module = import_module_file(module_name, file_path)
+
+            self._modules[module_name] = module
+
+        return module
+
+    def clear(self):
+        """Remove all modules from the cache."""
+        with self._lock:
+            self._modules.clear()
+            for file_path in self._cache_dir.glob("samm_payload_*.py"):
+                file_path.unlink(missing_ok=True)
+
+
+def import_module_file(module_name: str, file_path: Path) -> ModuleType:
+    """Import a Python module from a file.
+
+    :param module_name: name of the module
+    :param file_path: path to the module file
+    :return: imported module
+    """
+    spec = spec_from_file_location(module_name, file_path)
+    if spec is None or spec.loader is None:
+        raise ImportError(f"Could not import the module {file_path}")
+
+    module = module_from_spec(spec)
+    sys.modules[module_name] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        sys.modules.pop(module_name, None)
+        raise
+
+    return module
+
+
+def load_payload_classes(aspect: Aspect, cache_dir: Union[str, Path, None] = None) -> ModuleType:
+    """Generate and import the module with the payload classes of the Aspect.
+
+    :param aspect: loaded Aspect
+    :param cache_dir: optional path to the directory to keep the generated modules
+    :return: module with the classes and the from_json and to_json functions
+    """
+    if cache_dir is not None:
+        return PayloadClassCache(cache_dir).load(aspect)
+
+    source = PayloadClassGenerator(aspect).generate()
+    module_name = PayloadClassCache.get_module_name(source)
+    module = sys.modules.get(module_name)
+    if module is None:
+        module = ModuleType(module_name)
+        sys.modules[module_name] = module
+        try:
+            exec(compile(source, f"<{module_name}>", "exec"), module.__dict__)  # nosec
+        except BaseException:
+            sys.modules.pop(module_name, None)
+            raise
+
+    return module
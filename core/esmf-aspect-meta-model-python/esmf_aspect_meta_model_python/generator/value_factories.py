@@ -0,0 +1,421 @@
+#  Copyright (c) 2024 Robert Bosch Manufacturing Solutions GmbH
+#
+#  See the AUTHORS file(s) distributed with this work for additional
+#  information regarding authorship.
+#
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+#
+#   SPDX-License-Identifier: MPL-2.0
+
+import string
+
+from base64 import b64encode
+from datetime import date, datetime, time, timedelta, timezone
+from math import ceil, floor
+from random import Random
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from esmf_aspect_meta_model_python.base.bound_definition import BoundDefinition
+from esmf_aspect_meta_model_python.base.contraints.constraint import Constraint
+from esmf_aspect_meta_model_python.base.contraints.fixed_point_constraint import FixedPointConstraint
+from esmf_aspect_meta_model_python.base.contraints.language_constraint import LanguageConstraint
+from esmf_aspect_meta_model_python.base.contraints.length_constraint import LengthConstraint
+from esmf_aspect_meta_model_python.base.contraints.range_constraint import RangeConstraint
+from esmf_aspect_meta_model_python.base.contraints.regular_expression_constraint import RegularExpressionConstraint
+from esmf_aspect_meta_model_python.validation.value_checks import (
+    INTEGER_RANGES,
+    NUMBER_TYPES,
+    ValueCheck,
+    get_constraint_check,
+    get_scalar_check,
+    get_type_name,
+)
+
+try:
+    from re import _parser as sre_parse  # type: ignore
+except ImportError:  # pragma: no cover
+    import sre_parse  # type: ignore
+
+ValueFactory = Callable[[Random], Any]
+"""Factory of one JSON value, gets the random generator to use."""
+
+LETTERS = string.ascii_letters + string.digits
+PRINTABLE = string.ascii_letters + string.digits + string.punctuation + " "
+CATEGORIES = {
+    "CATEGORY_DIGIT": string.digits,
+    "CATEGORY_NOT_DIGIT": string.ascii_letters + string.punctuation + " ",
+    "CATEGORY_SPACE": " ",
+    "CATEGORY_NOT_SPACE": string.ascii_letters + string.digits + string.punctuation,
+    "CATEGORY_WORD": string.ascii_letters + string.digits + "_",
+    "CATEGORY_NOT_WORD": string.punctuation.replace("_", "") + " ",
+}
+MAX_EXTRA_REPEATS = 4
+MAX_ATTEMPTS = 100
+DEFAULT_SPAN = 1000
+DATE_START = datetime(2020, 1, 1, tzinfo=timezone.utc)
+DATE_SPAN = timedelta(days=3650)
+
+
+def get_lengths(constraints: Sequence[Constraint], default: Tuple[int, int]) -> Tuple[int, int]:
+    """Get the minimum and the maximum length of a string or a collection.
+
+    :param constraints: constraints of the value
+    :param default: default length range of the value
+    :return: minimum and maximum length
+    """
+    min_length, max_length = default
+    for constraint in constraints:
+        if isinstance(constraint, LengthConstraint):
+            if constraint.min_value is not None:
+                min_length = constraint.min_value
+                max_length = max(max_length, min_length)
+            if constraint.max_value is not None:
+                max_length = constraint.max_value
+                min_length = min(min_length, max_length)
+
+    return min_length, max_length
+
+
+def get_bounds(constraints: Sequence[Constraint]) -> Tuple[Any, Any]:
+    """Get the lower and the upper bound of the range constraints, None for an open bound.
+
+    The bounds of several range constraints are intersected. The bounds are returned as defined, the exclusive
+    bounds are checked by the value checks.
+
+    :param constraints: constraints of the value
+    :return: lower and upper bound
+    """
+    lower = upper = None
+    for constraint in constraints:
+        if isinstance(constraint, RangeConstraint):
+            if constraint.lower_bound_definition != BoundDefinition.OPEN and constraint.min_value is not None:
+                lower = constraint.min_value if lower is None else max(lower, constraint.min_value)
+            if constraint.upper_bound_definition != BoundDefinition.OPEN and constraint.max_value is not None:
+                upper = constraint.max_value if upper is None else min(upper, constraint.max_value)
+
+    return lower, upper
+
+
+def get_text_factory(min_length: int, max_length: int, alphabet: str = LETTERS) -> ValueFactory:
+    """Get a factory of random texts.
+
+    :param min_length: minimum length of the text
+    :param max_length: maximum length of the text
+    :param alphabet: characters of the text
+    :return: value factory
+    """
+    return lambda random: "".join(random.choices(alphabet, k=random.randint(min_length, max_length)))
+
+
+def _get_in_alphabet(items: List[Tuple[Any, Any]]) -> str:
+    """Get the characters matched by a character set of the regular expression."""
+    characters = set()
+    negate = False
+    for op, av in items:
+        name = str(op)
+        if name == "NEGATE":
+            negate = True
+        elif name == "LITERAL":
+            characters.add(chr(av))
+        elif name == "RANGE":
+            characters.update(chr(code) for code in range(av[0], min(av[1], av[0] + 255) + 1))
+        elif name == "CATEGORY":
+            characters.update(CATEGORIES.get(str(av), ""))
+
+    if negate:
+        return "".join(character for character in PRINTABLE if character not in characters)
+
+    return "".join(sorted(characters))
+
+
+def _compile_pattern(items: Any) -> Callable[[Random, Dict[int, str]], str]:
+    """Compile the parsed regular expression to a factory of the matching texts."""
+    factories = [_compile_pattern_item(str(op), av) for op, av in items]
+
+    return lambda random, groups: "".join(factory(random, groups) for factory in factories)
+
+
+def _compile_repeat(av: Any) -> Callable[[Random, Dict[int, str]], str]:
+    """Compile a repeat of the regular expression, an unlimited repeat is cut."""
+    min_count, max_count, items = av
+    max_count = min(max_count, min_count + MAX_EXTRA_REPEATS)
+    factory = _compile_pattern(items)
+
+    return lambda random, groups: "".join(factory(random, groups) for _ in range(random.randint(min_count, max_count)))
+
+
+def _compile_subpattern(av: Any) -> Callable[[Random, Dict[int, str]], str]:
+    """Compile a group of the regular expression, the text of the group is kept for the back references."""
+    group = av[0]
+    factory = _compile_pattern(av[-1])
+
+    def generate(random: Random, groups: Dict[int, str]) -> str:
+        text = factory(random, groups)
+        if group is not None:
+            groups[group] = text
+        return text
+
+    return generate
+
+
+def _compile_branch(av: Any) -> Callable[[Random, Dict[int, str]], str]:
+    """Compile alternatives of the regular expression."""
+    factories = [_compile_pattern(items) for items in av[1]]
+
+    return lambda random, groups: random.choice(factories)(random, groups)
+
+
+def _compile_characters(alphabet: str) -> Callable[[Random, Dict[int, str]], str]:
+    """Compile a character of the regular expression."""
+    alphabet = alphabet or LETTERS
+
+    return lambda random, groups: random.choice(alphabet)
+
+
+def _compile_pattern_item(name: str, av: Any) -> Callable[[Random, Dict[int, str]], str]:
+    """Compile one item of the parsed regular expression.
+
+    Anchors and lookarounds do not produce any text, the generated value is checked with the pattern anyway.
+    """
+    if name == "LITERAL":
+        text = chr(av)
+        return lambda random, groups: text
+    if name in ("MAX_REPEAT", "MIN_REPEAT", "POSSESSIVE_REPEAT"):
+        return _compile_repeat(av)
+    if name == "SUBPATTERN":
+        return _compile_subpattern(av)
+    if name == "BRANCH":
+        return _compile_branch(av)
+    if name == "GROUPREF":
+        return lambda random, groups: groups.get(av, "")
+    if name == "ATOMIC_GROUP":
+        return _compile_pattern(av)
+    if name == "IN":
+        return _compile_characters(_get_in_alphabet(av))
+    if name == "NOT_LITERAL":
+        return _compile_characters(LETTERS.replace(chr(av), ""))
+    if name == "ANY":
+        return _compile_characters(LETTERS)
+
+    return lambda random, groups: ""
+
+
+def get_pattern_factory(pattern: str) -> ValueFactory:
+    """Get a factory of texts which match the regular expression.
+
+    The pattern is parsed once. The factory builds a text for every part of the pattern, repeats without
+    an upper limit are cut after a few repetitions.
+
+    :param pattern: regular expression
+    :return: value factory
+    """
+    factory = _compile_pattern(sre_parse.parse(pattern))
+
+    return lambda random: factory(random, {})
+
+
+def get_checked_factory(factory: ValueFactory, checks: Sequence[ValueCheck], name: str) -> ValueFactory:
+    """Get a factory which returns only the values passing all checks.
+
+    A value failing a check is generated again. A valid value is searched once when the factory is created,
+    it is returned if no valid value is generated after many attempts.
+
+    :param factory: value factory
+    :param checks: value checks
+    :param name: name of the value for the error message
+    :return: value factory
+    :raises ValueError: if no valid value could be generated
+    """
+    if not checks:
+        return factory
+
+    def get_valid_value(random: Random) -> Any:
+        for _ in range(MAX_ATTEMPTS):
+            value = factory(random)
+            if all(check(value) is None for check in checks):
+                return value
+        return fallback
+
+    fallback = None
+    fallback = get_valid_value(Random(0))
+    if fallback is None:
+        raise ValueError(f"Could not generate a valid value of {name}")
+
+    return get_valid_value
+
+
+def get_window(lower: Any, upper: Any) -> Tuple[Any, Any]:
+    """Get a range of the generated numbers within the bounds.
+
+    The numbers are generated from 0 to 1000 if the bounds allow it, otherwise this window is moved into the bounds.
+
+    :param lower: lower bound or None
+    :param upper: upper bound or None
+    :return: lowest and highest generated number
+    """
+    low: Any = 0
+    if upper is not None and upper < DEFAULT_SPAN:
+        low = upper - DEFAULT_SPAN
+    if lower is not None and lower > low:
+        low = lower
+
+    return low, low + DEFAULT_SPAN if upper is None else min(low + DEFAULT_SPAN, upper)
+
+
+def _get_integer_factory(type_name: str, constraints: Sequence[Constraint]) -> ValueFactory:
+    """Get a factory of integers in the range of the data type and of the range constraint."""
+    min_value, max_value = INTEGER_RANGES[type_name]
+    lower, upper = get_bounds(constraints)
+    if lower is not None:
+        min_value = ceil(lower) if min_value is None else max(min_value, ceil(lower))
+    if upper is not None:
+        max_value = floor(upper) if max_value is None else min(max_value, floor(upper))
+
+    low, high = get_window(min_value, max_value)
+
+    return lambda random: random.randint(low, high)
+
+
+def _get_number_factory(constraints: Sequence[Constraint]) -> ValueFactory:
+    """Get a factory of numbers in the range of the range constraint with the digits of the fixed point."""
+    lower, upper = get_bounds(constraints)
+    lower = float(lower) if lower is not None else None
+    upper = float(upper) if upper is not None else None
+    scale = 2
+    for constraint in constraints:
+        if isinstance(constraint, FixedPointConstraint):
+            scale = constraint.scale
+            limit = 10**constraint.integer - 10**-scale
+            lower = -limit if lower is None else max(lower, -limit)
+            upper = limit if upper is None else min(upper, limit)
+
+    low, high = get_window(lower, upper)
+    if scale == 0:
+        return lambda random: round(random.uniform(low, high))
+
+    return lambda random: round(random.uniform(low, high), scale)
+
+
+def _get_temporal_factory(type_name: str, constraints: Sequence[Constraint]) -> ValueFactory:
+    """Get a factory of ISO dates and times in the range of the range constraint."""
+    lower, upper = get_bounds(constraints)
+    if isinstance(lower, time) or isinstance(upper, time) or type_name == "time":
+        low = _get_seconds(lower) if isinstance(lower, time) else 0
+        high = _get_seconds(upper) if isinstance(upper, time) else 86399
+
+        return lambda random: _get_time(random.randint(low, high)).isoformat()
+
+    start = lower if isinstance(lower, date) else upper - DATE_SPAN if isinstance(upper, date) else DATE_START
+    span = (upper - start) if isinstance(upper, date) else DATE_SPAN
+    if type_name == "date" or not isinstance(start, datetime):
+        start = start.date() if isinstance(start, datetime) else start
+        days = span.days
+
+        return lambda random: (start + timedelta(days=random.randint(0, days))).isoformat()
+
+    seconds = int(span.total_seconds())
+
+    return lambda random: (start + timedelta(seconds=random.randint(0, seconds))).isoformat()
+
+
+def _get_seconds(value: time) -> int:
+    """Get the seconds of the day."""
+    return value.hour * 3600 + value.minute * 60 + value.second
+
+
+def _get_time(seconds: int) -> time:
+    """Get the time of the seconds of the day."""
+    return time(seconds // 3600, seconds // 60 % 60, seconds % 60)
+
+
+def _get_lang_string_factory(constraints: Sequence[Constraint]) -> ValueFactory:
+    """Get a factory of language strings in the language of the language constraint."""
+    language = "en"
+    for constraint in constraints:
+        if isinstance(constraint, LanguageConstraint):
+            language = constraint.language_code
+
+    text_factory = get_text_factory(5, 12)
+
+    return lambda random: {language: text_factory(random)}
+
+
+STRING_FACTORIES: Dict[str, ValueFactory] = {
+    "anyURI": lambda random: f"https://example.com/{random.randint(0, 10**6)}",
+    "hexBinary": lambda random: random.randbytes(random.randint(1, 8)).hex(),
+    "base64Binary": lambda random: b64encode(random.randbytes(random.randint(1, 8))).decode(),
+    "gYear": lambda random: str(random.randint(2000, 2030)),
+    "gMonth": lambda random: f"--{random.randint(1, 12):02d}",
+    "gDay": lambda random: f"---{random.randint(1, 28):02d}",
+    "gYearMonth": lambda random: f"{random.randint(2000, 2030)}-{random.randint(1, 12):02d}",
+    "gMonthDay": lambda random: f"--{random.randint(1, 12):02d}-{random.randint(1, 28):02d}",
+    "duration": lambda random: f"P{random.randint(0, 30)}DT{random.randint(0, 23)}H",
+    "dayTimeDuration": lambda random: f"P{random.randint(0, 30)}DT{random.randint(0, 23)}H",
+    "yearMonthDuration": lambda random: f"P{random.randint(0, 10)}Y{random.randint(0, 11)}M",
+    "curie": lambda random: f"ex:{get_text_factory(3, 8, string.ascii_lowercase)(random)}",
+}
+TEMPORAL_TYPES = frozenset(("date", "dateTime", "dateTimeStamp", "time"))
+
+
+def _get_type_factory(type_name: str, constraints: Sequence[Constraint]) -> Optional[ValueFactory]:
+    """Get a factory of the values of the scalar data type which respects the constraints."""
+    patterns = [constraint.value for constraint in constraints if isinstance(constraint, RegularExpressionConstraint)]
+
+    if type_name == "boolean":
+        return lambda random: random.random() < 0.5
+    if type_name in INTEGER_RANGES:
+        return _get_integer_factory(type_name, constraints)
+    if type_name in NUMBER_TYPES:
+        return _get_number_factory(constraints)
+    if type_name == "langString":
+        return _get_lang_string_factory(constraints)
+    if patterns:
+        return get_pattern_factory(patterns[0])
+    if type_name in TEMPORAL_TYPES:
+        return _get_temporal_factory(type_name, constraints)
+    if type_name in STRING_FACTORIES:
+        return STRING_FACTORIES[type_name]
+    if type_name == "string":
+        return get_text_factory(*get_lengths(constraints, (5, 12)))
+
+    return None
+
+
+def get_scalar_factory(data_type_urn: str, constraints: Sequence[Constraint] = ()) -> Optional[ValueFactory]:
+    """Get a factory of the JSON values of the scalar data type.
+
+    The values are generated within the range, length, regular expression and fixed point constraints
+    and are checked with the same value checks as in the payload validator.
+
+    :param data_type_urn: URN of the scalar data type
+    :param constraints: constraints of the value
+    :return: value factory or None if the data type is unknown
+    :raises ValueError: if no valid value could be generated
+    """
+    type_name = get_type_name(data_type_urn)
+    factory = _get_type_factory(type_name, constraints)
+    if factory is None:
+        return None
+
+    checks = [check for check in (get_constraint_check(constraint) for constraint in constraints) if check]
+    scalar_check = get_scalar_check(data_type_urn)
+    if checks and scalar_check:
+        checks.insert(0, scalar_check)
+
+    return get_checked_factory(factory, checks, type_name)
+
+
+def get_enumeration_factory(values: Sequence[Any], checks: Sequence[ValueCheck] = ()) -> Optional[ValueFactory]:
+    """Get a factory which chooses one of the enumeration values.
+
+    :param values: JSON values of the enumeration
+    :param checks: checks of the constraints, values failing them are not chosen
+    :return: value factory or None if no value passes the checks
+    """
+    allowed = [value for value in values if all(check(value) is None for check in checks)]
+    if not allowed:
+        return None
+
+    return lambda random: random.choice(allowed)
@@ -9,23 +9,27 @@
 #
 #   SPDX-License-Identifier: MPL-2.0
 
-from typing import List
+from typing import List, Union
 
 from esmf_aspect_meta_model_python.base.characteristics.characteristic import Characteristic
 from esmf_aspect_meta_model_python.base.characteristics.trait import Trait
 from esmf_aspect_meta_model_python.base.contraints.constraint import Constraint
 from esmf_aspect_meta_model_python.impl.characteristics.default_characteristic import DefaultCharacteristic
+from esmf_aspect_meta_model_python.loader.lazy_value import LazyValue
 from esmf_aspect_meta_model_python.loader.meta_model_base_attributes import MetaModelBaseAttributes
 
 
 class DefaultTrait(DefaultCharacteristic, Trait):
-    """Default Trait class."""
+    """Default Trait class.
+
+    The constraints can be given as a lazy value, then they are created on first access.
+    """
 
     def __init__(
         self,
         meta_model_base_attributes: MetaModelBaseAttributes,
         base_characteristic: Characteristic,
-        constraints: List[Constraint],
+        constraints: Union[List[Constraint], LazyValue[List[Constraint]]],
     ):
         if base_characteristic is None:
             raise AttributeError(f"No base characteristic given for the trait {meta_model_base_attributes.urn}")
@@ -36,7 +40,7 @@ class DefaultTrait(DefaultCharacteristic, Trait):
         super().__init__(meta_model_base_attributes, base_characteristic.data_type)
 
         self._base_characteristic: Characteristic = base_characteristic
-        self._constraints: List[Constraint] = constraints
+        self._constraints: Union[List[Constraint], LazyValue[List[Constraint]]] = constraints
 
     @property
     def base_characteristic(self) -> Characteristic:
@@ -46,4 +50,7 @@ class DefaultTrait(DefaultCharacteristic, Trait):
     @property
     def constraints(self) -> List[Constraint]:
         """Constraints."""
+        if isinstance(self._constraints, LazyValue):
+            self._constraints = self._constraints.get()
+
         return self._constraints
@@ -9,12 +9,13 @@
 #
 #   SPDX-License-Identifier: MPL-2.0
 
-from typing import List, Optional
+from typing import List, Optional, Union
 
 from esmf_aspect_meta_model_python.base.data_types.abstract_entity import AbstractEntity
 from esmf_aspect_meta_model_python.base.data_types.complex_type import ComplexType
 from esmf_aspect_meta_model_python.base.property import Property
 from esmf_aspect_meta_model_python.impl.data_types.default_complex_type import DefaultComplexType
+from esmf_aspect_meta_model_python.loader.lazy_value import LazyValue
 from esmf_aspect_meta_model_python.loader.meta_model_base_attributes import MetaModelBaseAttributes
 
 
@@ -24,7 +25,7 @@ class DefaultAbstractEntity(DefaultComplexType, AbstractEntity):
     def __init__(
         self,
         meta_model_base_attributes: MetaModelBaseAttributes,
-        properties: List[Property],
+        properties: Union[List[Property], LazyValue[List[Property]]],
         extends: Optional[str],
         extending_elements: List[str],
     ):
@@ -9,17 +9,20 @@
 #
 #   SPDX-License-Identifier: MPL-2.0
 
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Union
 
 from esmf_aspect_meta_model_python.base.data_types.complex_type import ComplexType
 from esmf_aspect_meta_model_python.base.property import Property
 from esmf_aspect_meta_model_python.impl.base_impl import BaseImpl
+from esmf_aspect_meta_model_python.loader.lazy_value import LazyValue
 from esmf_aspect_meta_model_python.loader.meta_model_base_attributes import MetaModelBaseAttributes
 
 
 class DefaultComplexType(BaseImpl, ComplexType):
     """Default Complex Type class.
 
+    The properties can be given as a lazy value, then they are created on first access.
+
     Args:
         _instances: static field that hold all currently instantiated Complex Types (Entities)
     """
@@ -29,13 +32,14 @@ class DefaultComplexType(BaseImpl, ComplexType):
     def __init__(
         self,
         meta_model_base_attributes: MetaModelBaseAttributes,
-        properties: List[Property],
+        properties: Union[List[Property], LazyValue[List[Property]]],
         extends: Optional[str],
     ):
         super().__init__(meta_model_base_attributes)
-        for pro in properties:
-            pro.append_parent_element(self)
-        self.__properties: List[Property] = properties
+        if not isinstance(properties, LazyValue):
+            for pro in properties:
+                pro.append_parent_element(self)
+        self.__properties: Union[List[Property], LazyValue[List[Property]]] = properties
         self.__extends_urn: Optional[str] = extends
 
         # adds a reference of itself to the list of instances
@@ -78,9 +82,9 @@ class DefaultComplexType(BaseImpl, ComplexType):
     def all_properties(self) -> List[Property]:
         """All properties."""
         if self.__extends_urn is None:
-            return self.__properties
+            return self.properties
         properties: List[Property] = []
-        properties.extend(self.__properties)
+        properties.extend(self.properties)
         if self.extends is not None:
             properties.extend(self.extends.all_properties)
         return properties
@@ -98,4 +102,9 @@ class DefaultComplexType(BaseImpl, ComplexType):
     @property
     def properties(self) -> List[Property]:
         """Properties."""
+        if isinstance(self.__properties, LazyValue):
+            self.__properties = self.__properties.get()
+            for pro in self.__properties:
+                pro.append_parent_element(self)
+
         return self.__properties
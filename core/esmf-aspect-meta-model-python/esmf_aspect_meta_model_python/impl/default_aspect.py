@@ -9,25 +9,31 @@
 #
 #   SPDX-License-Identifier: MPL-2.0
 
-from typing import List
+from typing import List, Sequence, TypeVar, Union
 
 from esmf_aspect_meta_model_python.base.aspect import Aspect
 from esmf_aspect_meta_model_python.base.event import Event
 from esmf_aspect_meta_model_python.base.operation import Operation
 from esmf_aspect_meta_model_python.base.property import Property
 from esmf_aspect_meta_model_python.impl.base_impl import BaseImpl
+from esmf_aspect_meta_model_python.loader.lazy_value import LazyValue
 from esmf_aspect_meta_model_python.loader.meta_model_base_attributes import MetaModelBaseAttributes
 
+C = TypeVar("C", Property, Operation, Event)
+
 
 class DefaultAspect(Aspect, BaseImpl):
-    """Default Aspect class."""
+    """Default Aspect class.
+
+    Properties, operations and events can be given as lazy values, then they are created on first access.
+    """
 
     def __init__(
         self,
         meta_model_base_attributes: MetaModelBaseAttributes,
-        properties: List[Property],
-        operations: List[Operation],
-        events: List[Event],
+        properties: Union[List[Property], LazyValue[List[Property]]],
+        operations: Union[List[Operation], LazyValue[List[Operation]]],
+        events: Union[List[Event], LazyValue[List[Event]]],
         is_collection_aspect: bool,
     ):
         super().__init__(meta_model_base_attributes)
@@ -39,28 +45,39 @@ class DefaultAspect(Aspect, BaseImpl):
 
     def _set_parent_element_on_child_elements(self) -> None:
         """Set a parent element on child elements."""
-        for aspect_property in self._properties:
-            aspect_property.append_parent_element(self)
+        for children in (self._properties, self._operations, self._events):
+            if not isinstance(children, LazyValue):
+                self._set_parent_element(children)
+
+    def _set_parent_element(self, children: Sequence[Union[Property, Operation, Event]]) -> None:
+        """Set the aspect as a parent element of the children."""
+        for child in children:
+            child.append_parent_element(self)
 
-        for operation in self._operations:
-            operation.append_parent_element(self)
+    def _get_children(self, children: Union[List[C], LazyValue[List[C]]]) -> List[C]:
+        """Get the children, lazy children are created and get the aspect as a parent element."""
+        if isinstance(children, LazyValue):
+            children = children.get()
+            self._set_parent_element(children)
 
-        for event in self._events:
-            event.append_parent_element(self)
+        return children
 
     @property
     def operations(self) -> List[Operation]:
         """Operations."""
+        self._operations = self._get_children(self._operations)
         return self._operations
 
     @property
     def properties(self) -> List[Property]:
         """Properties."""
+        self._properties = self._get_children(self._properties)
         return self._properties
 
     @property
     def events(self) -> List[Event]:
         """Events."""
+        self._events = self._get_children(self._events)
         return self._events
 
     @property
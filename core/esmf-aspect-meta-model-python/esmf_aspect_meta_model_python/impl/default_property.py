@@ -9,21 +9,25 @@
 #
 #   SPDX-License-Identifier: MPL-2.0
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Union
 
 from esmf_aspect_meta_model_python.base.characteristics.characteristic import Characteristic
 from esmf_aspect_meta_model_python.base.property import Property
 from esmf_aspect_meta_model_python.impl.base_impl import BaseImpl
+from esmf_aspect_meta_model_python.loader.lazy_value import LazyValue
 from esmf_aspect_meta_model_python.loader.meta_model_base_attributes import MetaModelBaseAttributes
 
 
 class DefaultProperty(BaseImpl, Property):
-    """Default Property class."""
+    """Default Property class.
+
+    The characteristic can be given as a lazy value, then it is created on first access.
+    """
 
     def __init__(
         self,
         meta_model_base_attributes: MetaModelBaseAttributes,
-        characteristic: Optional[Characteristic],
+        characteristic: Union[Characteristic, LazyValue[Characteristic], None],
         example_value: Optional[Any],
         extends: Optional[Property] = None,
         abstract: bool = False,
@@ -33,7 +37,7 @@ class DefaultProperty(BaseImpl, Property):
     ):
         super().__init__(meta_model_base_attributes)
 
-        if characteristic is not None:
+        if characteristic is not None and not isinstance(characteristic, LazyValue):
             characteristic.append_parent_element(self)
         self._characteristic = characteristic
         self._example_value = example_value
@@ -46,6 +50,10 @@ class DefaultProperty(BaseImpl, Property):
     @property
     def characteristic(self) -> Optional[Characteristic]:
         """Characteristic."""
+        if isinstance(self._characteristic, LazyValue):
+            self._characteristic = self._characteristic.get()
+            self._characteristic.append_parent_element(self)
+
         return self._characteristic
 
     @property
@@ -0,0 +1,194 @@
+#  Copyright (c) 2024 Robert Bosch Manufacturing Solutions GmbH
+#
+#  See the AUTHORS file(s) distributed with this work for additional
+#  information regarding authorship.
+#
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+#
+#   SPDX-License-Identifier: MPL-2.0
+
+
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from esmf_aspect_meta_model_python.base.aspect import Aspect
+from esmf_aspect_meta_model_python.base.base import Base
+from esmf_aspect_meta_model_python.base.characteristics.characteristic import Characteristic
+from esmf_aspect_meta_model_python.base.characteristics.collection.collection import Collection
+from esmf_aspect_meta_model_python.base.characteristics.trait import Trait
+from esmf_aspect_meta_model_python.base.data_types.complex_type import ComplexType
+from esmf_aspect_meta_model_python.base.either import Either
+from esmf_aspect_meta_model_python.base.property import Property
+
+AccessPath = Tuple[str, ...]
+
+
+class AccessPathIndex:
+    """Index of the JSON access paths of the model elements.
+
+    The index is compiled once by walking the Aspects from the top: the properties, operation inputs and outputs
+    and event parameters are the roots of the paths, the properties of the Entities are followed through the
+    characteristics (including Traits, Collections and Either) of the parent properties. An element used in
+    several places gets all its paths. A Property is found by its payload name, other elements (characteristics,
+    Entities) by their name, all of them by URN, and get the paths of the values they describe.
+
+    An abstract property gets the paths of the properties which extend it. Other properties which are abstract
+    or not in the payload have no paths. An Entity which is already on the path (a recursive Entity) is not
+    followed again.
+
+    The paths are the locations of the values in the Aspect payload, so they differ from the results of
+    SAMMGraph.determine_access_path, which walks the parent elements of a single element:
+    - a property used in several Entities or in the Aspect and an Entity gets one path per location;
+    - the same path is listed once, even if the element is reached through several parents;
+    - a property of an extended Entity gets the path through the property with the extending Entity;
+    - a blank node property which extends an abstract property has the payload key of the abstract property;
+    - an element which is not in the payload of a loaded Aspect (e.g. the property of an unused Entity or
+      of a StructuredValue) has no paths.
+
+    :param elements: loaded model elements, only the Aspects are used
+    """
+
+    def __init__(self, elements: Iterable[Any]):
+        self._name_paths: Dict[str, List[AccessPath]] = {}
+        self._urn_paths: Dict[str, List[AccessPath]] = {}
+        self._element_paths: Dict[int, List[AccessPath]] = {}
+        self._elements: List[Base] = []
+
+        for element in elements:
+            if isinstance(element, Aspect):
+                self._add_properties(self.get_root_properties(element), ())
+
+    @staticmethod
+    def get_root_properties(aspect: Aspect) -> List[Property]:
+        """Get the properties of the Aspect which are the roots of the access paths.
+
+        :param aspect: Aspect
+        :return: list of the properties, operation inputs and outputs and event parameters
+        """
+        properties = list(aspect.properties)
+        for operation in aspect.operations:
+            properties.extend(operation.input_properties)
+            if operation.output_property is not None:
+                properties.append(operation.output_property)
+
+        for event in aspect.events:
+            properties.extend(event.parameters)
+
+        return properties
+
+    @staticmethod
+    def get_payload_key(prop: Property) -> str:
+        """Get the key of the property value in the JSON payload.
+
+        A property defined as a blank node which extends an abstract property has the key of the abstract property,
+        if it does not have its own payload name.
+
+        :param prop: property
+        :return: payload name of the property
+        """
+        if prop.urn is None and prop.extends is not None and prop.payload_name == prop.name:
+            return prop.extends.payload_name
+
+        return prop.payload_name
+
+    @staticmethod
+    def get_value_elements(characteristic: Optional[Characteristic]) -> List[Base]:
+        """Get the characteristics and Entities which describe the value of a property.
+
+        :param characteristic: characteristic of the property
+        :return: list of the elements
+        """
+        result: List[Base] = []
+        characteristics = [characteristic]
+
+        while characteristics:
+            current = characteristics.pop()
+            if current is None or any(current is element for element in result):
+                continue
+
+            result.append(current)
+            if isinstance(current, Trait):
+                characteristics.append(current.base_characteristic)
+            elif isinstance(current, Either):
+                characteristics.extend((current.right, current.left))
+            elif isinstance(current, Collection) and current.element_characteristic is not None:
+                characteristics.append(current.element_characteristic)
+            elif isinstance(current.data_type, ComplexType):
+                result.append(current.data_type)
+
+        return result
+
+    def _add_path(self, element: Base, path: AccessPath) -> None:
+        """Add the access path of the element to the lookups."""
+        paths = self._element_paths.get(id(element))
+        if paths is None:
+            paths = self._element_paths[id(element)] = []
+            self._elements.append(element)
+        elif path in paths:
+            return
+
+        paths.append(path)
+        name = self.get_payload_key(element) if isinstance(element, Property) else element.name
+        lookups = [self._name_paths.setdefault(name, [])]
+        if element.urn is not None:
+            lookups.append(self._urn_paths.setdefault(element.urn, []))
+
+        for lookup_paths in lookups:
+            if path not in lookup_paths:
+                lookup_paths.append(path)
+
+    def _add_properties(self, properties: List[Property], path: AccessPath) -> None:
+        """Add the paths of the properties and all their nested properties.
+
+        :param properties: properties of one JSON object
+        :param path: access path of the JSON object
+        """
+        stack: List[Tuple[Property, AccessPath, Tuple[int, ...]]] = [(prop, path, ()) for prop in reversed(properties)]
+
+        while stack:
+            prop, parent_path, entities = stack.pop()
+            if not isinstance(prop, Property) or prop.is_abstract or prop.is_not_in_payload:
+                continue
+
+            prop_path = parent_path + (self.get_payload_key(prop),)
+            self._add_path(prop, prop_path)
+            if prop.extends is not None:
+                self._add_path(prop.extends, prop_path)
+
+            nested: List[Tuple[Property, AccessPath, Tuple[int, ...]]] = []
+            for element in self.get_value_elements(prop.characteristic):
+                self._add_path(element, prop_path)
+                if isinstance(element, ComplexType) and id(element) not in entities:
+                    nested.extend((child, prop_path, entities + (id(element),)) for child in element.all_properties)
+
+            stack.extend(reversed(nested))
+
+    @staticmethod
+    def _to_lists(paths: Optional[List[AccessPath]]) -> List[List[str]]:
+        """Convert the paths to lists."""
+        return [list(path) for path in paths] if paths else []
+
+    def get_paths(self, name: str) -> List[List[str]]:
+        """Get the access paths of the elements with the name.
+
+        :param name: payload name of a property or name of another element
+        :return: list of the access paths, each path is a list of the payload names from the Aspect down
+        """
+        return self._to_lists(self._name_paths.get(name))
+
+    def get_urn_paths(self, urn: str) -> List[List[str]]:
+        """Get the access paths of the element with the URN.
+
+        :param urn: URN of the element
+        :return: list of the access paths
+        """
+        return self._to_lists(self._urn_paths.get(urn))
+
+    def get_element_paths(self, element: Base) -> List[List[str]]:
+        """Get the access paths of the element.
+
+        :param element: loaded model element
+        :return: list of the access paths
+        """
+        return self._to_lists(self._element_paths.get(id(element)))
@@ -0,0 +1,44 @@
+#  Copyright (c) 2024 Robert Bosch Manufacturing Solutions GmbH
+#
+#  See the AUTHORS file(s) distributed with this work for additional
+#  information regarding authorship.
+#
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+#
+#   SPDX-License-Identifier: MPL-2.0
+
+from typing import Any, List, Optional
+
+
+class AspectLoadResult:
+    """Result of loading one Aspect model file in a batch.
+
+    :param file_path: path to the Aspect model file
+    :param elements: loaded model elements
+    :param error: error raised while loading the model
+    :param graph: SAMM graph of the model
+    """
+
+    def __init__(
+        self,
+        file_path: str,
+        elements: Optional[List[Any]] = None,
+        error: Optional[Exception] = None,
+        graph: Any = None,
+    ):
+        self.file_path = file_path
+        self.elements = elements if elements is not None else []
+        self.error = error
+        self.graph = graph
+
+    def __repr__(self) -> str:
+        status = f"error={self.error!r}" if self.error else f"elements={len(self.elements)}"
+
+        return f"AspectLoadResult({self.file_path!r}, {status})"
+
+    @property
+    def is_loaded(self) -> bool:
+        """True if the model was loaded without errors."""
+        return self.error is None
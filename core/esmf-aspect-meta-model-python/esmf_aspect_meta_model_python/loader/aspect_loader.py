@@ -9,24 +9,65 @@
 #
 #   SPDX-License-Identifier: MPL-2.0
 
+import asyncio
+
+from concurrent.futures import Executor, ProcessPoolExecutor
+from os.path import abspath
 from pathlib import Path
-from typing import Union
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 
+from esmf_aspect_meta_model_python.base.cache_strategy import CacheStrategy
+from esmf_aspect_meta_model_python.loader.aspect_load_result import AspectLoadResult
 from esmf_aspect_meta_model_python.loader.default_element_cache import DefaultElementCache
+from esmf_aspect_meta_model_python.loader.graph_cache import AspectGraphCache
 from esmf_aspect_meta_model_python.loader.samm_graph import SAMMGraph
 
 
+def _load_aspect_model_in_worker(file_path: str, graph_cache_dir: Optional[str]) -> AspectLoadResult:
+    """Load an aspect model in a worker process of the parallel batch.
+
+    The SAMM graph is not returned to the parent process, only the model elements or the error.
+
+    :param file_path: path to the turtle file
+    :param graph_cache_dir: path to the graph cache directory
+    :return: load result
+    """
+    result = AspectLoader(graph_cache_dir)._load_batch_model(file_path)
+    result.graph = None
+
+    return result
+
+
 class AspectLoader:
     """Entry point to load an aspect model. To load an aspect model from
     a turtle file call AspectLoader.load_aspect_model(file_path)
 
     cache strategy to cache created elements to ensure uniqueness and a fast lookup of it.
     The default cache strategy ignores inline defined elements.
+
+    If graph_cache_dir is set, the resolved graphs of the loaded models are stored in this directory
+    and the next loads of an unchanged model skip the parsing of the turtle files.
+
+    If lazy is set, the child elements of the loaded elements are created on first access, see SAMMGraph.
+    The models loaded in worker processes are always created completely.
+
+    If an element cache is set (e.g. a bounded LRUElementCache), it is shared by all models loaded in the current
+    process instead of a new DefaultElementCache per loaded model. The cache keeps the first element of a URN,
+    so the models sharing it should not define the same URNs differently. The worker processes keep their own caches.
     """
 
-    def __init__(self) -> None:
-        self._cache = DefaultElementCache()
-        self._graph = SAMMGraph()
+    def __init__(
+        self,
+        graph_cache_dir: Union[str, Path, None] = None,
+        lazy: bool = False,
+        cache: Optional[CacheStrategy] = None,
+    ) -> None:
+        self._graph_cache: Optional[AspectGraphCache] = AspectGraphCache(graph_cache_dir) if graph_cache_dir else None
+        self._lazy = lazy
+        self._shared_cache = cache
+        self._cache = self._get_cache()
+        self._graph = SAMMGraph(cache=self._shared_cache, graph_cache=self._graph_cache, lazy=lazy)
+        self._loading_tasks: Dict[str, asyncio.Future] = {}
 
     def get_graph(self) -> SAMMGraph:
         """Get SAMM graph.
@@ -54,13 +95,17 @@ class AspectLoader:
 
         return file_path
 
+    def _get_cache(self) -> CacheStrategy:
+        """Get the shared element cache or a new default one."""
+        return self._shared_cache if self._shared_cache is not None else DefaultElementCache()
+
     def _reset_graph(self):
         """Reset graph and cache data."""
         if self._graph:
-            self._graph = SAMMGraph()
+            self._graph = SAMMGraph(cache=self._shared_cache, graph_cache=self._graph_cache, lazy=self._lazy)
 
         if self._cache:
-            self._cache = DefaultElementCache()
+            self._cache = self._get_cache()
 
     def load_aspect_model(self, file_path: Union[Path, str]):
         """Load aspect model to RDF GRAPH.
@@ -76,3 +121,104 @@ class AspectLoader:
         loaded_aspect_model = self._graph.to_python()
 
         return loaded_aspect_model
+
+    def _load_model(self, file_path: Union[Path, str]) -> Tuple[SAMMGraph, List[Any]]:
+        """Load an aspect model to a new SAMM graph.
+
+        :param file_path: path to the turtle file
+        :return: SAMM graph and the model elements
+        """
+        graph = SAMMGraph(cache=self._shared_cache, graph_cache=self._graph_cache, lazy=self._lazy)
+        graph.parse(self.convert_file_path(file_path))
+
+        return graph, graph.to_python()
+
+    async def load_aspect_model_async(self, file_path: Union[Path, str], executor: Optional[Executor] = None):
+        """Load aspect model without blocking the event loop.
+
+        Reading, parsing and instantiation of the model run in the executor. Concurrent loads of the same file
+        wait for the one load in progress and get the same elements. Cancelling of one waiting call does not cancel
+        the load for the other ones.
+
+        :param file_path: path to the turtle file. Can be either a string or a Path object
+        :param executor: thread pool executor, the default executor of the event loop is used if not set
+        :return: instance of the aspect
+        """
+        key = abspath(file_path)
+        loading_task = self._loading_tasks.get(key)
+
+        if loading_task is None:
+            loop = asyncio.get_running_loop()
+            loading_task = loop.run_in_executor(executor, self._load_model, file_path)
+            self._loading_tasks[key] = loading_task
+            loading_task.add_done_callback(lambda _: self._loading_tasks.pop(key, None))
+
+        graph, loaded_aspect_model = await asyncio.shield(loading_task)
+        self._graph = graph
+
+        return loaded_aspect_model
+
+    def _load_batch_model(self, file_path: Union[Path, str]) -> AspectLoadResult:
+        """Load one aspect model of the batch.
+
+        :param file_path: path to the turtle file
+        :return: load result with the model elements or the error
+        """
+        graph = SAMMGraph(cache=self._get_cache(), graph_cache=self._graph_cache, lazy=self._lazy)
+
+        try:
+            file_path = self.convert_file_path(file_path)
+            graph.parse(file_path)
+            elements = graph.to_python()
+        except Exception as error:
+            return AspectLoadResult(str(file_path), error=error, graph=graph)
+
+        return AspectLoadResult(file_path, elements, graph=graph)
+
+    def _load_aspect_models_parallel(self, file_paths: List[str], workers: int) -> List[AspectLoadResult]:
+        """Load aspect models in a pool of worker processes.
+
+        Files are sent to the workers in chunks of consecutive files, so the files of one namespace usually share
+        the dependency models parsed by the same worker.
+
+        :param file_paths: paths to the turtle files
+        :param workers: number of the worker processes
+        :return: list of the load results in the order of the files
+        """
+        graph_cache_dir = str(self._graph_cache.cache_dir) if self._graph_cache else None
+        chunk_size = max(1, len(file_paths) // (workers * 4))
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(
+                executor.map(
+                    _load_aspect_model_in_worker,
+                    file_paths,
+                    [graph_cache_dir] * len(file_paths),
+                    chunksize=chunk_size,
+                )
+            )
+
+    def load_aspect_models(
+        self,
+        file_paths: Iterable[Union[Path, str]],
+        workers: Optional[int] = None,
+    ) -> List[AspectLoadResult]:
+        """Load several aspect models in one pass.
+
+        The models share the parsed SAMM meta-model and the parsed dependency files, so every shared file is parsed
+        only once for the whole batch. Every model gets its own element cache, the same as a single load, so the models
+        of a batch may define the same URNs. An error in one model does not stop the batch, it is returned
+        in the result of the model.
+
+        Loading is CPU bound, so with more than one worker the files are loaded in a pool of processes.
+        Every worker process has its own meta-model, dependency files and element cache, the results contain
+        the model elements and errors but no SAMM graphs.
+
+        :param file_paths: paths to the turtle files
+        :param workers: number of the worker processes, the models are loaded in the current process by default
+        :return: list of the load results in the order of the files
+        """
+        if workers and workers > 1:
+            return self._load_aspect_models_parallel([str(file_path) for file_path in file_paths], workers)
+
+        return [self._load_batch_model(file_path) for file_path in file_paths]
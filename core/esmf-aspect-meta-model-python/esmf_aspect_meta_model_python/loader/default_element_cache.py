@@ -9,34 +9,90 @@
 #
 #   SPDX-License-Identifier: MPL-2.0
 
-from typing import Optional
+from typing import Optional, Type, TypeVar
 
 from esmf_aspect_meta_model_python.base.base import Base
 from esmf_aspect_meta_model_python.base.cache_strategy import CacheStrategy
 
+T = TypeVar("T", bound=Base)
+
 
 class DefaultElementCache(CacheStrategy):
+    """Element cache with secondary indexes.
+
+    Besides the elements by their keys the cache keeps indexes by the lookup name (payload name or name),
+    by URN and by the concrete element type. The indexes are updated with every added or replaced element,
+    so the lookups do not scan all cached elements.
+    """
+
     def __init__(self) -> None:
         self._instance_cache: dict[str, Base] = {}
+        self._name_index: dict[str, dict[str, Base]] = {}
+        self._urn_index: dict[str, dict[str, Base]] = {}
+        self._type_index: dict[type, dict[str, Base]] = {}
 
     def reset(self) -> None:
         self._instance_cache.clear()
+        self._name_index.clear()
+        self._urn_index.clear()
+        self._type_index.clear()
+
+    @staticmethod
+    def _get_lookup_name(model_element: Base) -> str:
+        """Get the name to find the element by: the payload name if it is set, otherwise the name."""
+        payload_name = getattr(model_element, "payload_name", None)
+
+        return model_element.name if payload_name is None else payload_name
+
+    def _index(self, key: str, model_element: Base) -> None:
+        """Add the cached element to the indexes."""
+        self._name_index.setdefault(self._get_lookup_name(model_element), {})[key] = model_element
+        if model_element.urn is not None:
+            self._urn_index.setdefault(model_element.urn, {})[key] = model_element
+        self._type_index.setdefault(type(model_element), {})[key] = model_element
+
+    def _unindex(self, key: str, model_element: Base) -> None:
+        """Remove the cached element from the indexes."""
+        for index, index_key in (
+            (self._name_index, self._get_lookup_name(model_element)),
+            (self._urn_index, model_element.urn),
+            (self._type_index, type(model_element)),
+        ):
+            elements = index.get(index_key)  # type: ignore
+            if elements is not None:
+                elements.pop(key, None)
+                if not elements:
+                    del index[index_key]  # type: ignore
+
+    def _set(self, key: str, model_element: Base) -> None:
+        """Add or replace the cached element and update the indexes."""
+        cached_element = self._instance_cache.get(key)
+        if cached_element is not None:
+            self._unindex(key, cached_element)
+
+        self._instance_cache[key] = model_element
+        self._index(key, model_element)
 
     def get(self, key: str) -> Base | None:
         return self._instance_cache.get(key)
 
+    def get_elements(self) -> list[Base]:
+        return list(self._instance_cache.values())
+
     def get_by_name(self, name: str) -> list[Base]:
-        result: list[Base] = []
-        for instance in self._instance_cache.values():
-            if hasattr(instance, "payload_name") and instance.payload_name is not None:  # type: ignore
-                if instance.payload_name == name:  # type: ignore
-                    result.append(instance)
-            elif instance.name == name:
-                result.append(instance)
-        return result
+        return list(self._name_index.get(name, {}).values())
 
     def get_by_urn(self, urn: str) -> Optional[Base]:
-        return next((x for x in self._instance_cache.values() if x.urn == urn), None)
+        elements = self._urn_index.get(urn)
+
+        return next(iter(elements.values())) if elements else None
+
+    def get_by_type(self, element_type: Type[T]) -> list[T]:
+        result: list[T] = []
+        for cached_type, elements in self._type_index.items():
+            if issubclass(cached_type, element_type):
+                result.extend(elements.values())  # type: ignore
+        return result
 
     def resolve_instance(self, model_element: Base) -> Base:
         if model_element.urn is None:
@@ -46,7 +102,7 @@ class DefaultElementCache(CacheStrategy):
         if resolved_instance is not None:
             return resolved_instance
 
-        self._instance_cache[model_element.urn] = model_element
+        self._set(model_element.urn, model_element)
         return model_element
 
     def add_element(self, name: str, model_element: Base, overwrite: bool = False) -> None:
@@ -56,4 +112,4 @@ class DefaultElementCache(CacheStrategy):
 
         if cached_element:
             print(f"Element with the name ${name} already exist. Overwrite existing element.")
-        self._instance_cache[name] = model_element
+        self._set(name, model_element)
@@ -0,0 +1,188 @@
+#  Copyright (c) 2024 Robert Bosch Manufacturing Solutions GmbH
+#
+#  See the AUTHORS file(s) distributed with this work for additional
+#  information regarding authorship.
+#
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+#
+#   SPDX-License-Identifier: MPL-2.0
+
+from hashlib import sha256
+from os.path import abspath
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple, Union
+
+from rdflib import BNode, Graph, Literal, URIRef
+from rdflib.term import Node
+
+from esmf_aspect_meta_model_python.cache_files import get_files_key, read_json, read_versioned_json, write_json
+from esmf_aspect_meta_model_python.resolver.layered_graph import GraphLayer, LayeredGraph
+
+
+class AspectGraphCache:
+    """On-disk cache of the resolved Aspect model graphs.
+
+    The cache stores the triples of the Aspect model file and of all resolved dependency model files in a compact
+    JSON form, which is loaded much faster than parsing the turtle files. The SAMM meta-model is not stored, it is
+    shared in memory by the meta-model resolver.
+
+    Every Aspect model file has a manifest with the list of the resolved model files. The cache key is a hash of
+    the content of these files, the list of the turtle files in their folders and the SAMM version. The key is
+    recalculated on each load, so the entry is not used anymore as soon as any input file is changed, removed or
+    a new file is added to one of the model folders.
+
+    :param cache_dir: path to the cache directory
+    """
+
+    cache_format = "1"
+
+    def __init__(self, cache_dir: Union[str, Path]):
+        self._cache_dir = Path(cache_dir)
+        self._cache_dir.mkdir(parents=True, exist_ok=True)
+
+    @property
+    def cache_dir(self) -> Path:
+        """Path to the cache directory."""
+        return self._cache_dir
+
+    def _get_manifest_path(self, model_file_path: str) -> Path:
+        """Get a path to the manifest of the model file."""
+        name = sha256(abspath(model_file_path).encode()).hexdigest()
+
+        return self._cache_dir / f"{name}.manifest.json"
+
+    def _get_entry_path(self, key: str) -> Path:
+        """Get a path to the cache entry."""
+        return self._cache_dir / f"{key}.graph.json"
+
+    def get_key(self, samm_version: str, file_paths: Sequence[str]) -> str:
+        """Get a cache key of the resolved model files.
+
+        :param samm_version: SAMM version of the Aspect model
+        :param file_paths: paths to the Aspect model file followed by all its dependency files
+        :return: cache key
+        """
+        return get_files_key(f"{self.cache_format}:{samm_version}:{file_paths[0]}", file_paths)
+
+    @staticmethod
+    def _encode_triples(triples: Iterable, terms: Dict[Node, int]) -> List[List[int]]:
+        """Encode triples as lists of the term indexes.
+
+        :param triples: triples to encode
+        :param terms: dictionary of the terms with their indexes, new terms are added to it
+        :return: list of the encoded triples
+        """
+        return [[terms.setdefault(term, len(terms)) for term in triple] for triple in triples]
+
+    @staticmethod
+    def _encode_term(term: Node) -> List[Optional[str]]:
+        """Encode an RDF term as a JSON list."""
+        if isinstance(term, Literal):
+            datatype = str(term.datatype) if term.datatype else None
+            return ["l", str(term), datatype, term.language]
+
+        if isinstance(term, BNode):
+            return ["b", str(term)]
+
+        return ["u", str(term)]
+
+    @staticmethod
+    def _decode_term(data: List[Optional[str]]) -> Node:
+        """Decode an RDF term from a JSON list."""
+        if data[0] == "l":
+            return Literal(data[1], datatype=data[2], lang=data[3])
+
+        if data[0] == "b":
+            return BNode(data[1])
+
+        return URIRef(data[1])  # type: ignore
+
+    def load(self, graph: Graph, model_file_path: str) -> bool:
+        """Load the resolved Aspect model from the cache.
+
+        The triples of the Aspect model file are added to the top layer of the graph, the triples of the dependency
+        files are added as a read-only layer. As for saving, only a layered graph is supported.
+
+        :param graph: layered graph to load the model into
+        :param model_file_path: path to the Aspect model file
+        :return: True if a valid cache entry was loaded, otherwise False
+        """
+        if not isinstance(graph, LayeredGraph):
+            return False
+
+        manifest = read_versioned_json(self._get_manifest_path(model_file_path), self.cache_format)
+        if not manifest:
+            return False
+
+        try:
+            key = self.get_key(manifest["samm_version"], manifest["files"])
+        except OSError:
+            return False
+
+        entry = read_json(self._get_entry_path(key)) if key == manifest["key"] else None
+        if not entry:
+            return False
+
+        terms = [self._decode_term(term) for term in entry["terms"]]
+        for prefix, namespace in entry["namespaces"]:
+            graph.bind(prefix, namespace, override=True, replace=True)
+
+        graph.addN((terms[s], terms[p], terms[o], graph) for s, p, o in entry["triples"])
+
+        dependency_graph = Graph()
+        dependency_graph.addN((terms[s], terms[p], terms[o], dependency_graph) for s, p, o in entry["dependencies"])
+        graph.add_layer(GraphLayer(dependency_graph, manifest["files"][1:]))
+
+        return True
+
+    def save(self, graph: Graph, model_file_path: str, samm_version: str) -> bool:
+        """Save the resolved Aspect model to the cache.
+
+        Only a layered graph can be saved: the top layer contains the triples of the Aspect model file and the layers
+        with the file paths contain the dependency files. Layers without file paths (the SAMM meta-model) are skipped.
+
+        :param graph: resolved Aspect model graph
+        :param model_file_path: path to the Aspect model file
+        :param samm_version: SAMM version of the Aspect model
+        :return: True if the model was saved, otherwise False
+        """
+        if not isinstance(graph, LayeredGraph):
+            return False
+
+        dependency_layers = [layer for layer in graph.layers if layer.file_paths]
+        file_paths = [abspath(model_file_path)]
+        for layer in dependency_layers:
+            file_paths.extend(abspath(file_path) for file_path in layer.file_paths)
+
+        terms: Dict[Node, int] = {}
+        dependency_triples: Set[Tuple[Node, Node, Node]] = set()
+        for layer in dependency_layers:
+            dependency_triples.update(layer.triples((None, None, None)))
+
+        key = self.get_key(samm_version, file_paths)
+        entry = {
+            "namespaces": [[prefix, str(namespace)] for prefix, namespace in graph.namespaces()],
+            "triples": self._encode_triples(graph.top_triples((None, None, None)), terms),
+            "dependencies": self._encode_triples(dependency_triples, terms),
+            "terms": [self._encode_term(term) for term in terms],
+        }
+        write_json(self._get_entry_path(key), entry)
+
+        manifest_path = self._get_manifest_path(model_file_path)
+        manifest = read_json(manifest_path)
+        write_json(
+            manifest_path,
+            {"format": self.cache_format, "key": key, "samm_version": samm_version, "files": file_paths},
+        )
+
+        if manifest and manifest.get("key") != key:
+            self._get_entry_path(manifest["key"]).unlink(missing_ok=True)
+
+        return True
+
+    def clear(self):
+        """Remove all entries from the cache."""
+        for file_path in self._cache_dir.glob("*.json"):
+            file_path.unlink(missing_ok=True)
@@ -0,0 +1,132 @@
+#  Copyright (c) 2024 Robert Bosch Manufacturing Solutions GmbH
+#
+#  See the AUTHORS file(s) distributed with this work for additional
+#  information regarding authorship.
+#
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+#
+#   SPDX-License-Identifier: MPL-2.0
+
+from typing import List, Optional, Tuple
+
+from rdflib import RDF, Graph
+from rdflib.term import Node
+
+from esmf_aspect_meta_model_python.resolver.layered_graph import (
+    GraphLayer,
+    LayeredGraph,
+    ListIndex,
+    NamedParents,
+    SubjectIndex,
+)
+
+
+class GraphIndex:
+    """Index of the Aspect model graph from subject to predicate to objects.
+
+    The index replaces the triple pattern matching of the graph with dictionary lookups for the forward queries
+    of the instantiators. It is built with one pass over the triples of the graph. The read-only layers of
+    a layered graph keep their own index, which is built once and shared by all loads that use the layer,
+    so for a layered graph only the top layer is indexed per load. The same applies to the RDF lists,
+    which are materialized once for the whole graph, and to the named parents of the blank nodes, which are
+    resolved in one sweep over a reverse index of the edges. The graph must not be changed after the index is built.
+
+    :param graph: Aspect model graph
+    """
+
+    def __init__(self, graph: Graph):
+        layers = graph.layers if isinstance(graph, LayeredGraph) else []
+        triples = graph.top_triples((None, None, None)) if isinstance(graph, LayeredGraph) else graph
+        top_index = GraphLayer.index_triples(triples)
+
+        self._indexes: List[SubjectIndex] = [top_index, *(layer.subject_index for layer in layers)]
+        self._list_indexes: List[ListIndex] = [
+            GraphLayer.index_lists(top_index),
+            *(layer.list_index for layer in layers),
+        ]
+        self._named_parents: List[NamedParents] = [
+            GraphLayer.resolve_named_parents(GraphLayer.index_parents(top_index)),
+            *(layer.named_parents for layer in layers),
+        ]
+
+    def objects(self, subject: Optional[Node], predicate: Node) -> List[Node]:
+        """Get the objects of the subject and predicate.
+
+        :param subject: subject node
+        :param predicate: predicate node
+        :return: list of the objects, an object defined in more than one layer is returned once
+        """
+        result: List[Node] = []
+        for index in self._indexes:
+            predicates = index.get(subject)  # type: ignore
+            if predicates is None:
+                continue
+
+            objects = predicates.get(predicate)
+            if objects:
+                if not result:
+                    result = list(objects)
+                else:
+                    result.extend(obj for obj in objects if obj not in result)
+
+        return result
+
+    def value(self, subject: Optional[Node], predicate: Node) -> Optional[Node]:
+        """Get one object of the subject and predicate.
+
+        :param subject: subject node
+        :param predicate: predicate node
+        :return: the first found object or None
+        """
+        for index in self._indexes:
+            predicates = index.get(subject)  # type: ignore
+            if predicates is not None:
+                objects = predicates.get(predicate)
+                if objects:
+                    return objects[0]
+
+        return None
+
+    def get_list(self, list_node: Optional[Node]) -> Tuple[Node, ...]:
+        """Get the items of an RDF list.
+
+        :param list_node: head node of the list
+        :return: tuple of the list items, empty if the node is not a list
+        """
+        if list_node is None:
+            return ()
+
+        for list_index in self._list_indexes:
+            items = list_index.get(list_node)
+            if items is not None:
+                return items
+
+        # the node is not a head of a list in one layer, e.g. the rest of a list
+        result = []
+        visited = set()
+        while list_node is not None and list_node not in visited:
+            first = self.value(list_node, RDF.first)
+            if first is None:
+                break
+
+            visited.add(list_node)
+            result.append(first)
+            list_node = self.value(list_node, RDF.rest)
+
+        return tuple(result)
+
+    def get_named_parent(self, node: Node) -> Tuple[Optional[Node], Optional[Node], int]:
+        """Get the named parent of a blank node.
+
+        :param node: blank node
+        :return: tuple with the named parent, the predicate pointing towards the child and the number of
+            blank nodes between the parent and the child, (None, None, 0) if there is no named parent
+        """
+        for named_parents in self._named_parents:
+            named_parent = named_parents.get(node)
+            if named_parent is not None:
+                return named_parent
+
+        return None, None, 0
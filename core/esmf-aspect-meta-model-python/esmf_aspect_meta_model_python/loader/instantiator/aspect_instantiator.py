@@ -9,7 +9,7 @@
 #
 #   SPDX-License-Identifier: MPL-2.0
 
-from typing import List
+from typing import List, Union
 
 import rdflib  # type: ignore
 
@@ -21,6 +21,7 @@ from esmf_aspect_meta_model_python.base.operation import Operation
 from esmf_aspect_meta_model_python.base.property import Property
 from esmf_aspect_meta_model_python.impl.default_aspect import DefaultAspect
 from esmf_aspect_meta_model_python.loader.instantiator_base import InstantiatorBase
+from esmf_aspect_meta_model_python.loader.lazy_value import LazyValue
 from esmf_aspect_meta_model_python.vocabulary.SAMM import SAMM
 
 
@@ -32,9 +33,15 @@ class AspectInstantiator(InstantiatorBase[Aspect]):
         if not isinstance(element_node, rdflib.URIRef):
             raise TypeError("An Aspect needs to be defined as a named node.")
 
-        properties: List[Property] = self._get_list_children(element_node, self._samm.get_urn(SAMM.properties))
-        operations: List[Operation] = self._get_list_children(element_node, self._samm.get_urn(SAMM.operations))
-        events: List[Event] = self._get_list_children(element_node, self._samm.get_urn(SAMM.events))
+        properties: Union[List[Property], LazyValue[List[Property]]] = self._defer(
+            lambda: self._get_list_children(element_node, self._samm.get_urn(SAMM.properties))
+        )
+        operations: Union[List[Operation], LazyValue[List[Operation]]] = self._defer(
+            lambda: self._get_list_children(element_node, self._samm.get_urn(SAMM.operations))
+        )
+        events: Union[List[Event], LazyValue[List[Event]]] = self._defer(
+            lambda: self._get_list_children(element_node, self._samm.get_urn(SAMM.events))
+        )
         is_collection_aspect = False
 
         return DefaultAspect(
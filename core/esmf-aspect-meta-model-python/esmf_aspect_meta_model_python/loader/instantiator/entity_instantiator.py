@@ -9,7 +9,7 @@
 #
 #   SPDX-License-Identifier: MPL-2.0
 
-from typing import List
+from typing import List, Union
 
 from rdflib import URIRef
 from rdflib.term import Node
@@ -18,6 +18,7 @@ from esmf_aspect_meta_model_python.base.data_types.entity import Entity
 from esmf_aspect_meta_model_python.base.property import Property
 from esmf_aspect_meta_model_python.impl.data_types.default_entity import DefaultEntity
 from esmf_aspect_meta_model_python.loader.instantiator.complex_type_instantiator import ComplexTypeInstantiator
+from esmf_aspect_meta_model_python.loader.lazy_value import LazyValue
 from esmf_aspect_meta_model_python.vocabulary.SAMM import SAMM
 
 
@@ -34,7 +35,9 @@ class EntityInstantiator(ComplexTypeInstantiator[Entity]):
 
         meta_model_base_attributes = self._get_base_attributes(element_node)
         extends_element = self.get_extended_element(element_node)
-        properties: List[Property] = self._get_list_children(element_node, self._samm.get_urn(SAMM.properties))
+        properties: Union[List[Property], LazyValue[List[Property]]] = self._defer(
+            lambda: self._get_list_children(element_node, self._samm.get_urn(SAMM.properties))
+        )
 
         self._instantiating_now.remove(element_node)
         return DefaultEntity(meta_model_base_attributes, properties, extends_element)
@@ -19,7 +19,6 @@ from esmf_aspect_meta_model_python.base.characteristics.enumeration import Enume
 from esmf_aspect_meta_model_python.impl.characteristics.default_enumeration import DefaultEnumeration
 from esmf_aspect_meta_model_python.loader.instantiator.constants import DATA_TYPE_ERROR_MSG
 from esmf_aspect_meta_model_python.loader.instantiator_base import InstantiatorBase
-from esmf_aspect_meta_model_python.loader.rdf_helper import RdfHelper
 from esmf_aspect_meta_model_python.vocabulary.SAMM import SAMM
 from esmf_aspect_meta_model_python.vocabulary.SAMMC import SAMMC
 
@@ -35,7 +34,7 @@ class EnumerationInstantiator(InstantiatorBase[Enumeration]):
             subject=element_node,
             predicate=self._sammc.get_urn(SAMMC.values),
         )
-        value_nodes = RdfHelper.get_rdf_list_values(value_collection_node, self._aspect_graph)
+        value_nodes = self._graph_index.get_list(value_collection_node)
         values = [self.__to_enum_node_value(value_node) for value_node in value_nodes]
 
         return DefaultEnumeration(meta_model_base_attributes, data_type, values)
@@ -89,7 +88,7 @@ class EnumerationInstantiator(InstantiatorBase[Enumeration]):
 
     def __instantiate_enum_collection(self, value_list) -> typing.List[typing.Dict]:
         """creates a collection as a child for enumeration characteristics"""
-        value_node_list = RdfHelper.get_rdf_list_values(value_list, self._aspect_graph)
+        value_node_list = self._graph_index.get_list(value_list)
         values = []
         for value_node in value_node_list:
             value = self.__to_enum_node_value(value_node)
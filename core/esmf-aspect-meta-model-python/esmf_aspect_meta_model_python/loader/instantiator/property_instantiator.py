@@ -9,6 +9,8 @@
 #
 #   SPDX-License-Identifier: MPL-2.0
 
+from typing import Union
+
 import rdflib  # type: ignore
 
 from rdflib.term import Node
@@ -17,6 +19,7 @@ from esmf_aspect_meta_model_python.base.characteristics.characteristic import Ch
 from esmf_aspect_meta_model_python.base.property import Property
 from esmf_aspect_meta_model_python.impl.default_property import DefaultProperty
 from esmf_aspect_meta_model_python.loader.instantiator_base import InstantiatorBase
+from esmf_aspect_meta_model_python.loader.lazy_value import LazyValue
 from esmf_aspect_meta_model_python.vocabulary.SAMM import SAMM
 
 
@@ -64,10 +67,8 @@ class PropertyInstantiator(InstantiatorBase[Property]):
         """The given node is a named node representing the property"""
         meta_model_base_attributes = self._get_base_attributes(element_node)
 
-        characteristic: Characteristic = self._get_child(
-            element_node,
-            self._samm.get_urn(SAMM.characteristic),
-            required=True,
+        characteristic: Union[Characteristic, LazyValue[Characteristic]] = self._defer(
+            lambda: self._get_child(element_node, self._samm.get_urn(SAMM.characteristic), required=True)
         )
 
         example_value = self._aspect_graph.value(subject=element_node, predicate=self._samm.get_urn(SAMM.example_value))
@@ -90,10 +91,12 @@ class PropertyInstantiator(InstantiatorBase[Property]):
 
         meta_model_base_attributes = self._get_base_attributes(property_node)  # type: ignore
 
-        characteristic: Characteristic = self._get_child(
-            property_node,  # type: ignore
-            self._samm.get_urn(SAMM.characteristic),
-            required=True,
+        characteristic: Union[Characteristic, LazyValue[Characteristic]] = self._defer(
+            lambda: self._get_child(
+                property_node,  # type: ignore
+                self._samm.get_urn(SAMM.characteristic),
+                required=True,
+            )
         )
 
         example_value = self._aspect_graph.value(
@@ -118,10 +121,8 @@ class PropertyInstantiator(InstantiatorBase[Property]):
 
         meta_model_base_attributes = self._get_base_attributes(element_node)
 
-        characteristic: Characteristic = self._get_child(
-            element_node,
-            self._samm.get_urn(SAMM.characteristic),
-            required=True,
+        characteristic: Union[Characteristic, LazyValue[Characteristic]] = self._defer(
+            lambda: self._get_child(element_node, self._samm.get_urn(SAMM.characteristic), required=True)
         )
 
         example_value = self._aspect_graph.value(subject=element_node, predicate=self._samm.get_urn(SAMM.example_value))
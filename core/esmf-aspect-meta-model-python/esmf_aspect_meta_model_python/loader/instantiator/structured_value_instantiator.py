@@ -36,7 +36,7 @@ class StructuredValueInstantiator(InstantiatorBase[StructuredValue]):
             )
         )
         element_nodes = self._aspect_graph.value(subject=element_node, predicate=self._sammc.get_urn(SAMMC.elements))
-        element_node_list = RdfHelper.get_rdf_list_values(element_nodes, self._aspect_graph)
+        element_node_list = self._graph_index.get_list(element_nodes)
         elements = [self.__to_element_node_value(element_node) for element_node in element_node_list]
 
         return DefaultStructuredValue(meta_model_base_attributes, data_type, deconstruction_rule, elements)
@@ -9,7 +9,7 @@
 #
 #   SPDX-License-Identifier: MPL-2.0
 
-from typing import List
+from typing import List, Union
 
 from rdflib.term import Node
 
@@ -17,6 +17,7 @@ from esmf_aspect_meta_model_python.base.characteristics.trait import Trait
 from esmf_aspect_meta_model_python.base.contraints.constraint import Constraint
 from esmf_aspect_meta_model_python.impl.characteristics.default_trait import DefaultTrait
 from esmf_aspect_meta_model_python.loader.instantiator_base import InstantiatorBase
+from esmf_aspect_meta_model_python.loader.lazy_value import LazyValue
 from esmf_aspect_meta_model_python.vocabulary.SAMMC import SAMMC
 
 
@@ -24,17 +25,22 @@ class TraitInstantiator(InstantiatorBase[Trait]):
     def _create_instance(self, element_node: Node) -> Trait:
         meta_model_base_attributes = self._get_base_attributes(element_node)
 
-        constraint_subjects = self._aspect_graph.objects(
-            subject=element_node,
-            predicate=self._sammc.get_urn(SAMMC.constraint),
+        constraint_subjects = list(
+            self._aspect_graph.objects(
+                subject=element_node,
+                predicate=self._sammc.get_urn(SAMMC.constraint),
+            )
         )
-
-        constraints: List[Constraint] = [
-            self._model_element_factory.create_element(constraint_subject) for constraint_subject in constraint_subjects
-        ]
-        if not constraints:
+        if not constraint_subjects:
             raise ValueError("Trait must have at least one constraint.")
 
+        constraints: Union[List[Constraint], LazyValue[List[Constraint]]] = self._defer(
+            lambda: [
+                self._model_element_factory.create_element(constraint_subject)
+                for constraint_subject in constraint_subjects
+            ]
+        )
+
         base_characteristic = self._get_child(
             element_node,
             self._sammc.get_urn(SAMMC.base_characteristic),
@@ -11,13 +11,15 @@
 
 import abc
 
-from typing import TYPE_CHECKING, Any, Dict, Generic, Optional, TypeVar
+from typing import TYPE_CHECKING, Any, Callable, Dict, Generic, Optional, TypeVar, Union
 
 import rdflib  # type: ignore
 
 from rdflib.term import Node
 
 from esmf_aspect_meta_model_python.base.data_types.data_type import DataType
+from esmf_aspect_meta_model_python.loader.graph_index import GraphIndex
+from esmf_aspect_meta_model_python.loader.lazy_value import LazyValue
 from esmf_aspect_meta_model_python.loader.meta_model_base_attributes import MetaModelBaseAttributes
 from esmf_aspect_meta_model_python.loader.rdf_helper import RdfHelper
 from esmf_aspect_meta_model_python.vocabulary.SAMM import SAMM
@@ -31,6 +33,7 @@ if TYPE_CHECKING:
     from esmf_aspect_meta_model_python.loader.model_element_factory import ModelElementFactory
 
 T = TypeVar("T")
+V = TypeVar("V")
 
 
 class InstantiatorBase(Generic[T], metaclass=abc.ABCMeta):
@@ -51,6 +54,8 @@ class InstantiatorBase(Generic[T], metaclass=abc.ABCMeta):
         self._unit = model_element_factory.get_unit()
         self._meta_model_version = model_element_factory.get_meta_model_version()
         self._aspect_graph: rdflib.Graph = model_element_factory.get_aspect_graph()
+        self._graph_index: GraphIndex = model_element_factory.get_graph_index()
+        self._lazy = model_element_factory.is_lazy()
 
         self._existing_instances: Dict[str, T] = {}
         """ A storage of all generated instances to prevent multiple
@@ -76,6 +81,7 @@ class InstantiatorBase(Generic[T], metaclass=abc.ABCMeta):
 
         new_instance = self._create_instance(element_node)
         self._existing_instances[element_urn] = new_instance
+        self._model_element_factory.notify_element_created(new_instance)
         return new_instance
 
     @abc.abstractmethod
@@ -90,6 +96,20 @@ class InstantiatorBase(Generic[T], metaclass=abc.ABCMeta):
         """
         raise NotImplementedError
 
+    def _defer(self, loader: Callable[[], V]) -> Union[V, LazyValue[V]]:
+        """Create child elements now or, in the lazy mode, on first access.
+
+        Args:
+            loader: callable that creates the child elements
+
+        Returns:
+            The created child elements or, in the lazy mode, a lazy value with the loader
+        """
+        if self._lazy:
+            return LazyValue(loader)
+
+        return loader()
+
     def _get_base_attributes(self, element_subject: Node) -> MetaModelBaseAttributes:
         """creates an object with the base information of an element
         Arguments:
@@ -103,6 +123,7 @@ class InstantiatorBase(Generic[T], metaclass=abc.ABCMeta):
             self._aspect_graph,
             self._samm,
             self._meta_model_version,
+            self._graph_index,
         )
 
     def _get_child(self, parent_subject: Node, child_predicate, required=False):
@@ -122,7 +143,7 @@ class InstantiatorBase(Generic[T], metaclass=abc.ABCMeta):
         Raises:
             ValueError: if the child is required but does not exist.
         """
-        child_subject = self._aspect_graph.value(subject=parent_subject, predicate=child_predicate)
+        child_subject = self._graph_index.value(subject=parent_subject, predicate=child_predicate)
         if child_subject is None and required:
             raise ValueError(
                 f"Child {child_predicate} is required \
@@ -146,8 +167,8 @@ class InstantiatorBase(Generic[T], metaclass=abc.ABCMeta):
             a list of the instantiated elements
         """
         children = []
-        list_node = self._aspect_graph.value(subject=element_subject, predicate=list_predicate)
-        children_nodes = RdfHelper.get_rdf_list_values(list_node, self._aspect_graph)
+        list_node = self._graph_index.value(subject=element_subject, predicate=list_predicate)
+        children_nodes = self._graph_index.get_list(list_node)
 
         for child_node in children_nodes:
             child: Any = self._model_element_factory.create_element(child_node)
@@ -166,7 +187,7 @@ class InstantiatorBase(Generic[T], metaclass=abc.ABCMeta):
         Returns:
             Data type object or none
         """
-        element_characteristic_node = self._aspect_graph.value(
+        element_characteristic_node = self._graph_index.value(
             subject=element_node,
             predicate=self._sammc.get_urn(SAMMC.element_characteristic),
         )
@@ -174,12 +195,12 @@ class InstantiatorBase(Generic[T], metaclass=abc.ABCMeta):
             # some characteristics (Collection, List, TimeSeries, etc.) may have
             # an attribute "element_characteristic". If it is given, then take
             # the data type of the element_characteristic.
-            data_type_node = self._aspect_graph.value(
+            data_type_node = self._graph_index.value(
                 subject=element_characteristic_node,
                 predicate=self._samm.get_urn(SAMM.data_type),
             )
         else:
-            data_type_node = self._aspect_graph.value(
+            data_type_node = self._graph_index.value(
                 subject=element_node,
                 predicate=self._samm.get_urn(SAMM.data_type),
             )
@@ -0,0 +1,37 @@
+#  Copyright (c) 2024 Robert Bosch Manufacturing Solutions GmbH
+#
+#  See the AUTHORS file(s) distributed with this work for additional
+#  information regarding authorship.
+#
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+#
+#   SPDX-License-Identifier: MPL-2.0
+
+from typing import Callable, Generic, TypeVar
+
+V = TypeVar("V")
+
+
+class LazyValue(Generic[V]):
+    """Attribute value of a model element which is created on first access.
+
+    Used by the lazy mode of the element factory: the element gets the loader of its child elements instead of
+    the children, the element calls the loader when the attribute is read for the first time and keeps the result.
+
+    :param loader: callable that creates the value
+    """
+
+    def __init__(self, loader: Callable[[], V]):
+        self._loader = loader
+
+    def __repr__(self) -> str:
+        return f"LazyValue({self._loader!r})"
+
+    def get(self) -> V:
+        """Create the value.
+
+        :return: created value
+        """
+        return self._loader()
@@ -0,0 +1,183 @@
+#  Copyright (c) 2024 Robert Bosch Manufacturing Solutions GmbH
+#
+#  See the AUTHORS file(s) distributed with this work for additional
+#  information regarding authorship.
+#
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+#
+#   SPDX-License-Identifier: MPL-2.0
+
+
+import sys
+
+from collections import OrderedDict
+from threading import RLock
+from typing import Callable, Optional, Type
+
+from esmf_aspect_meta_model_python.base.base import Base
+from esmf_aspect_meta_model_python.loader.default_element_cache import DefaultElementCache, T
+
+
+class LRUElementCache(DefaultElementCache):
+    """Element cache bounded by the number of elements and/or their approximate size.
+
+    The least recently used elements are evicted as soon as one of the limits is exceeded. The element that was
+    added last is always kept, even if it alone exceeds the size limit. A found element of a lookup counts as
+    a hit and becomes the most recently used one. The cache can be shared by several SAMM graphs and threads.
+
+    The size of an element is approximate: by default the size of the element object and its attributes
+    dictionary without the referenced objects.
+
+    :param max_elements: maximal number of the cached elements, not limited if None
+    :param max_bytes: maximal approximate size of the cached elements in bytes, not limited if None
+    :param on_evict: callable that gets the key and the element of every evicted element
+    :param size_of: callable that returns the approximate size of an element in bytes
+    """
+
+    def __init__(
+        self,
+        max_elements: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        on_evict: Optional[Callable[[str, Base], None]] = None,
+        size_of: Optional[Callable[[Base], int]] = None,
+    ) -> None:
+        super().__init__()
+        self._instance_cache: OrderedDict[str, Base] = OrderedDict()
+        self._max_elements = max_elements
+        self._max_bytes = max_bytes
+        self._on_evict = on_evict
+        self._size_of = size_of if size_of else self.get_element_size
+        self._sizes: dict[str, int] = {}
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = RLock()
+
+    @property
+    def hits(self) -> int:
+        """Number of the lookups that found an element."""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """Number of the lookups that found no element."""
+        return self._misses
+
+    @property
+    def evictions(self) -> int:
+        """Number of the evicted elements."""
+        return self._evictions
+
+    @property
+    def element_count(self) -> int:
+        """Number of the cached elements."""
+        return len(self._instance_cache)
+
+    @property
+    def bytes(self) -> int:
+        """Approximate size of the cached elements in bytes."""
+        return self._bytes
+
+    @staticmethod
+    def get_element_size(model_element: Base) -> int:
+        """Get the approximate size of the element.
+
+        :param model_element: model element
+        :return: size of the element object and its attributes dictionary in bytes
+        """
+        return sys.getsizeof(model_element) + sys.getsizeof(getattr(model_element, "__dict__", None))
+
+    def _count(self, found: bool) -> None:
+        """Count a hit or a miss of the lookup."""
+        if found:
+            self._hits += 1
+        else:
+            self._misses += 1
+
+    def _is_full(self) -> bool:
+        """Check whether one of the limits is exceeded."""
+        if self._max_elements is not None and len(self._instance_cache) > self._max_elements:
+            return True
+
+        return self._max_bytes is not None and self._bytes > self._max_bytes
+
+    def _set(self, key: str, model_element: Base) -> None:
+        """Add or replace the element and evict the least recently used elements if the cache is full."""
+        self._bytes -= self._sizes.pop(key, 0)
+        super()._set(key, model_element)
+        self._instance_cache.move_to_end(key)
+        self._sizes[key] = self._size_of(model_element)
+        self._bytes += self._sizes[key]
+
+        while len(self._instance_cache) > 1 and self._is_full():
+            evicted_key, evicted_element = self._instance_cache.popitem(last=False)
+            self._unindex(evicted_key, evicted_element)
+            self._bytes -= self._sizes.pop(evicted_key, 0)
+            self._evictions += 1
+
+            if self._on_evict:
+                self._on_evict(evicted_key, evicted_element)
+
+    def reset(self) -> None:
+        with self._lock:
+            super().reset()
+            self._sizes.clear()
+            self._bytes = 0
+
+    def get(self, key: str) -> Base | None:
+        with self._lock:
+            element = self._instance_cache.get(key)
+            self._count(element is not None)
+            if element is not None:
+                self._instance_cache.move_to_end(key)
+
+            return element
+
+    def get_elements(self) -> list[Base]:
+        with self._lock:
+            return list(self._instance_cache.values())
+
+    def get_by_name(self, name: str) -> list[Base]:
+        with self._lock:
+            elements = self._name_index.get(name, {})
+            self._count(bool(elements))
+            for key in elements:
+                self._instance_cache.move_to_end(key)
+
+            return list(elements.values())
+
+    def get_by_urn(self, urn: str) -> Optional[Base]:
+        with self._lock:
+            elements = self._urn_index.get(urn)
+            self._count(bool(elements))
+            if not elements:
+                return None
+
+            key, element = next(iter(elements.items()))
+            self._instance_cache.move_to_end(key)
+
+            return element
+
+    def get_by_type(self, element_type: Type[T]) -> list[T]:
+        with self._lock:
+            result: list[T] = []
+            for cached_type, elements in list(self._type_index.items()):
+                if issubclass(cached_type, element_type):
+                    result.extend(elements.values())  # type: ignore
+                    for key in elements:
+                        self._instance_cache.move_to_end(key)
+
+            self._count(bool(result))
+
+            return result
+
+    def resolve_instance(self, model_element: Base) -> Base:
+        with self._lock:
+            return super().resolve_instance(model_element)
+
+    def add_element(self, name: str, model_element: Base, overwrite: bool = False) -> None:
+        with self._lock:
+            super().add_element(name, model_element, overwrite)
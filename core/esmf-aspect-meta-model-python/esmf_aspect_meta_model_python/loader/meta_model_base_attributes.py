@@ -10,13 +10,14 @@
 #   SPDX-License-Identifier: MPL-2.0
 
 from collections.abc import Iterable
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Union
 
 import rdflib  # type: ignore
 
 from rdflib.term import Node
 
 from ..vocabulary.SAMM import SAMM
+from .graph_index import GraphIndex
 from .rdf_helper import RdfHelper
 
 
@@ -46,6 +47,7 @@ class MetaModelBaseAttributes:
         aspect_graph: rdflib.Graph,
         samm: SAMM,
         meta_model_version: str,
+        graph_index: Optional[GraphIndex] = None,
     ) -> "MetaModelBaseAttributes":
         """
         Extracts all the given base information of an element (samm_version, urn, name,
@@ -55,35 +57,37 @@ class MetaModelBaseAttributes:
             aspect_graph: graph that represents the whole aspect
             samm: namespace including samm keywords used for aspect graph navigation
             meta_model_version: version of the samm used in URNs
+            graph_index: subject index of the aspect graph, used instead of the graph for the attribute lookups
 
         Returns:
             A wrapper object with all the element attributes included
         """
+        source = aspect_graph if graph_index is None else graph_index
         preferred_names = MetaModelBaseAttributes.__get_language_strings(
             meta_model_element,
-            aspect_graph,
+            source,
             samm.get_urn(SAMM.preferred_name),
         )
         descriptions = MetaModelBaseAttributes.__get_language_strings(
             meta_model_element,
-            aspect_graph,
+            source,
             samm.get_urn(SAMM.description),
         )
         see = MetaModelBaseAttributes.__get_attribute_value_list(
             meta_model_element,
-            aspect_graph,
+            source,
             samm.get_urn(SAMM.see),
         )
         urn: Optional[str] = None
         name: str = ""
 
         if meta_model_version == "1.0.0":
-            name_result = aspect_graph.value(subject=meta_model_element, predicate=samm.get_urn(SAMM.name))
+            name_result = source.value(subject=meta_model_element, predicate=samm.get_urn(SAMM.name))
             if name_result is not None:
                 name = RdfHelper.to_python(name_result)
 
         elif isinstance(meta_model_element, rdflib.BNode):
-            name = MetaModelBaseAttributes.__create_default_name(meta_model_element, aspect_graph, samm)
+            name = MetaModelBaseAttributes.__create_default_name(meta_model_element, aspect_graph, samm, source)
 
             return MetaModelBaseAttributes(meta_model_version, None, name, preferred_names, descriptions, see)
 
@@ -100,16 +104,19 @@ class MetaModelBaseAttributes:
         )
 
     @staticmethod
-    def __create_default_name(meta_model_element: rdflib.BNode, aspect_graph, samm) -> str:
+    def __create_default_name(meta_model_element: rdflib.BNode, aspect_graph, samm, source) -> str:
         """Model elements that are defined as a blank node do not have a URI
         to identify. Therefore it is not possible to extract a name. This method
         generates an alternative name depending on the parent or the extended element.
         """
-        extends_element = aspect_graph.value(subject=meta_model_element, predicate=samm.get_urn(SAMM.extends))
+        extends_element = source.value(subject=meta_model_element, predicate=samm.get_urn(SAMM.extends))
         if isinstance(extends_element, rdflib.URIRef):
             return f"extending_{samm.get_name(extends_element)}"
 
-        parent_name, predicate_name, parent_index = RdfHelper.find_named_parent(meta_model_element, aspect_graph)
+        if isinstance(source, GraphIndex):
+            parent_name, predicate_name, parent_index = source.get_named_parent(meta_model_element)
+        else:
+            parent_name, predicate_name, parent_index = RdfHelper.find_named_parent(meta_model_element, aspect_graph)
 
         result = f"{SAMM.get_name(parent_name)}_{SAMM.get_name(predicate_name)}"
         if parent_index != 0:
@@ -139,7 +146,7 @@ class MetaModelBaseAttributes:
     @staticmethod
     def __get_language_strings(
         meta_model_element: Node,
-        aspect_graph: rdflib.Graph,
+        aspect_graph: Union[rdflib.Graph, GraphIndex],
         samm_attribute: rdflib.URIRef,
     ) -> Dict[str, str]:
         """Generates a Mapping of language codes to strings.
@@ -147,7 +154,7 @@ class MetaModelBaseAttributes:
 
         Arguments:
             meta_model_element: URI of the node in the aspect graph representing the parent element
-            aspect_graph: rdf graph that represents the whole aspect
+            aspect_graph: rdf graph that represents the whole aspect or its subject index
             samm_attribute: URN of the attribute type: e.g.
                 "urn:samm:org.eclipse.esmf.samm:meta-model:1.0.0#description"
         Returns:
@@ -167,7 +174,7 @@ class MetaModelBaseAttributes:
     @staticmethod
     def __get_attribute_value_list(
         meta_model_element: Node,
-        aspect_graph: rdflib.Graph,
+        aspect_graph: Union[rdflib.Graph, GraphIndex],
         samm_attribute: rdflib.URIRef,
     ) -> List[str]:
         """
@@ -175,7 +182,7 @@ class MetaModelBaseAttributes:
 
         Arguments:
             meta_model_element: URI of the node in the aspect graph representing the parent element
-            aspect_graph: rdf graph that represents the whole aspect
+            aspect_graph: rdf graph that represents the whole aspect or its subject index
             samm_attribute:URN of the attribute type: e.g.
                 "urn:samm:org.eclipse.esmf.samm:meta-model:1.0.0#see"
 
@@ -12,15 +12,16 @@
 import importlib
 import re
 
-from typing import Dict, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import rdflib
 
 from rdflib.term import Node
 
 from esmf_aspect_meta_model_python.base.base import Base
+from esmf_aspect_meta_model_python.base.cache_strategy import CacheStrategy
 from esmf_aspect_meta_model_python.loader import instantiator
-from esmf_aspect_meta_model_python.loader.default_element_cache import DefaultElementCache
+from esmf_aspect_meta_model_python.loader.graph_index import GraphIndex
 from esmf_aspect_meta_model_python.loader.instantiator_base import InstantiatorBase, T
 from esmf_aspect_meta_model_python.vocabulary.SAMM import SAMM
 from esmf_aspect_meta_model_python.vocabulary.SAMMC import SAMMC
@@ -33,13 +34,21 @@ class ModelElementFactory:
     Central class that handles the instantiation of model elements.
     The responsibility for different groups of model elements (e.g. aspect, characteristic)
     is delegated to instantiator classes.
+
+    Listeners added to the factory are called with every new element right after it is created. Elements are
+    created in dependency order: the children of an element are created and reported before the element itself.
+
+    In the lazy mode the properties of Aspects and Entities, the operations and events of Aspects, the constraints
+    of Traits and the characteristics of Properties are created on first access to the attribute. Elements which
+    are not accessed are never created, so they are not reported to the listeners and are not in the cache.
     """
 
     def __init__(
         self,
         meta_model_version: str,
         aspect_graph: rdflib.Graph,
-        cache: DefaultElementCache,
+        cache: CacheStrategy,
+        lazy: bool = False,
     ):
         self._samm = SAMM(meta_model_version)
         self._sammc = SAMMC(meta_model_version)
@@ -47,8 +56,26 @@ class ModelElementFactory:
         self._meta_model_version = meta_model_version
         self._aspect_graph = aspect_graph
         self._cache = cache
+        self._lazy = lazy
+        self._graph_index: Optional[GraphIndex] = None
 
         self._instantiators: Dict[str, InstantiatorBase] = {}
+        self._listeners: List[Callable[[Any], None]] = []
+
+    def add_listener(self, listener: Callable[[Any], None]):
+        """Add a listener of the element creation.
+
+        :param listener: callable that gets every new created element
+        """
+        self._listeners.append(listener)
+
+    def notify_element_created(self, element: Any):
+        """Call the listeners with the new created element.
+
+        :param element: created element
+        """
+        for listener in self._listeners:
+            listener(element)
 
     def create_all_graph_elements(self, create_nodes: list[Node]):
         """Create elements from the list of nodes.
@@ -100,20 +127,21 @@ class ModelElementFactory:
 
     def _get_element_type(self, element_node: Optional[Node]) -> str:
         """Gets the element type of a node and returns it."""
-        element_type_urn = self._aspect_graph.value(subject=element_node, predicate=rdflib.RDF.type)
-        element_type = self._samm.get_name(element_type_urn)
+        graph_index = self.get_graph_index()
+        element_type_urn = graph_index.value(subject=element_node, predicate=rdflib.RDF.type)
+        element_type = self._samm.get_name(element_type_urn)  # type: ignore
 
         if element_type is None:
             # If the node does not have a type it can be one of the following elements:
             # 1. A property that extends another property
             # 2. A property or abstract property that is defined as a blank node
             # 3. A scalar
-            if self._aspect_graph.value(subject=element_node, predicate=self._samm.get_urn(SAMM.extends)):
+            if graph_index.value(subject=element_node, predicate=self._samm.get_urn(SAMM.extends)):
                 element_type = "Property"
-            elif self._aspect_graph.value(subject=element_node, predicate=self._samm.get_urn(SAMM.property)):
+            elif graph_index.value(subject=element_node, predicate=self._samm.get_urn(SAMM.property)):
                 # property is a blank node and can either be a property or
                 # an abstract property. Therefore, get the type of the subnode.
-                property_node = self._aspect_graph.value(
+                property_node = graph_index.value(
                     subject=element_node,
                     predicate=self._samm.get_urn(SAMM.property),
                 )
@@ -169,8 +197,18 @@ class ModelElementFactory:
     def get_unit(self) -> UNIT:
         return self._unit
 
+    def is_lazy(self) -> bool:
+        return self._lazy
+
     def get_meta_model_version(self) -> str:
         return self._meta_model_version
 
     def get_aspect_graph(self) -> rdflib.Graph:
         return self._aspect_graph
+
+    def get_graph_index(self) -> GraphIndex:
+        """Get the subject index of the aspect graph, the index is built with the first call."""
+        if self._graph_index is None:
+            self._graph_index = GraphIndex(self._aspect_graph)
+
+        return self._graph_index
@@ -9,8 +9,6 @@
 #
 #   SPDX-License-Identifier: MPL-2.0
 
-import sys
-
 from typing import List, Optional, Union
 
 import rdflib  # type: ignore
@@ -25,7 +23,7 @@ class RdfHelper:
         """A collection in rdf is a binary tree. The top of the tree is a blank node.
         One predicate of the node is connected to the first element of the collection.
         The other predicate is connected to a node with the rest of the binary tree.
-        This method gets all the Nodes of the collection elements by iterating the tree recursively.
+        This method gets all the Nodes of the collection elements by iterating the tree.
 
         Arguments:
             rdf_list: Blank Node representing the collection
@@ -35,25 +33,29 @@ class RdfHelper:
             a list of all Nodes representing the collection elements
         """
         list_elements: List[term.Node] = []
+        visited = set()
+
+        while rdf_list is not None and rdf_list not in visited:
+            first_entry: Optional[term.Node] = aspect_graph.value(subject=rdf_list, predicate=rdflib.RDF.first)
+            if first_entry is None:
+                break
 
-        first_entry: Optional[term.Node] = aspect_graph.value(subject=rdf_list, predicate=rdflib.RDF.first)
+            visited.add(rdf_list)
+            list_elements.append(first_entry)
+            rdf_list = aspect_graph.value(subject=rdf_list, predicate=rdflib.RDF.rest)
 
-        if first_entry is not None:
-            list_elements = [first_entry]
-            remaining_entries: Optional[term.Node] = aspect_graph.value(subject=rdf_list, predicate=rdflib.RDF.rest)
-            list_elements.extend(RdfHelper.get_rdf_list_values(remaining_entries, aspect_graph))
         return list_elements
 
     @staticmethod
     def find_named_parent(meta_model_element: Node, aspect_graph: rdflib.Graph, counter: int = 0) -> tuple:
         """This method searches in the aspect graph for a named parent.
-        If the found parent is a blank node search recursively for the
-        grand parent.
+        If the found parent is a blank node search for the grand parent.
+        The parents are walked iteratively, a cycle of blank nodes has no named parent.
 
         Arguments:
             meta_model_element: Node in the graph representing the child
             aspect_graph: rdf graph representing the whole aspect
-            counter: indicates the recursion depth
+            counter: initial distance between parent and child
 
         Returns: a tuple with
             - The node representing the named parent
@@ -62,17 +64,24 @@ class RdfHelper:
 
             - A value that indicates the distance between parent and child
         """
-        result: tuple = (None, None, 0)
-        if counter >= sys.getrecursionlimit():
-            return result
+        visited = set()
+        node = meta_model_element
+
+        while node not in visited:
+            visited.add(node)
+            parents = list(aspect_graph.subject_predicates(object=node))
+            if not parents:
+                break
 
-        for subject, predicate in aspect_graph.subject_predicates(object=meta_model_element):
+            subject, predicate = parents[-1]
             if isinstance(subject, rdflib.URIRef) and isinstance(predicate, rdflib.URIRef):
-                result = subject, predicate, counter
-            else:
-                # search for grand parent
-                result = RdfHelper.find_named_parent(subject, aspect_graph, counter + 1)  # type: ignore
-        return result
+                return subject, predicate, counter
+
+            # search for grand parent
+            node = subject
+            counter += 1
+
+        return None, None, 0
 
     @staticmethod
     def to_python(to_be_python: Union[term.Identifier, Node, None]) -> str:
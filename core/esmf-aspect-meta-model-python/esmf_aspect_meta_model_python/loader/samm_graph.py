@@ -9,22 +9,47 @@
 #
 #   SPDX-License-Identifier: MPL-2.0
 
+import asyncio
+
+from concurrent.futures import Executor
 from pathlib import Path
-from typing import List, Optional, Union
+from queue import Empty, Queue
+from threading import Event, Thread, current_thread
+from typing import Any, Callable, Iterator, List, Optional, Tuple, Type, TypeVar, Union
 
 from rdflib import RDF, Graph, URIRef
 from rdflib.graph import Node
 
 from esmf_aspect_meta_model_python.base.base import Base
+from esmf_aspect_meta_model_python.base.cache_strategy import CacheStrategy
 from esmf_aspect_meta_model_python.base.property import Property
+from esmf_aspect_meta_model_python.loader.access_path_index import AccessPathIndex
 from esmf_aspect_meta_model_python.loader.default_element_cache import DefaultElementCache
+from esmf_aspect_meta_model_python.loader.graph_cache import AspectGraphCache
 from esmf_aspect_meta_model_python.loader.model_element_factory import ModelElementFactory
 from esmf_aspect_meta_model_python.resolver.base import AspectModelResolver, BaseResolver
+from esmf_aspect_meta_model_python.resolver.layered_graph import LayeredGraph
 from esmf_aspect_meta_model_python.vocabulary.SAMM import SAMM
 
+T = TypeVar("T", bound=Base)
+
+
+class _ElementIterationStopped(BaseException):
+    """Stops the instantiation of the closed element iterator.
+
+    Derived from BaseException to pass through the error handling of the element factory.
+    """
+
 
 class SAMMGraph:
-    """SAMM graph."""
+    """SAMM graph.
+
+    If lazy is set, the child elements (e.g. the properties of the Aspect or the characteristic of a Property) are
+    created on first access to the attribute, the graph is kept in memory until then.
+
+    The created elements are kept in the element cache, a DefaultElementCache by default. Another cache strategy,
+    e.g. a bounded LRUElementCache, can be set and shared by several graphs.
+    """
 
     samm_prefix = "urn:samm:org.eclipse.esmf.samm"
 
@@ -32,15 +57,22 @@ class SAMMGraph:
         self,
         graph: Graph | None = None,
         resolver: BaseResolver | None = None,
-        cache: DefaultElementCache | None = None,
+        cache: CacheStrategy | None = None,
+        graph_cache: AspectGraphCache | None = None,
+        lazy: bool = False,
     ):
         super().__init__()
 
-        self._graph = graph if graph else Graph()
+        self._graph = graph if graph else LayeredGraph()
         self._resolver = resolver if resolver else AspectModelResolver()
         self._cache = cache if cache else DefaultElementCache()
+        self._graph_cache = graph_cache
+        self._lazy = lazy
         self._samm_version = ""
         self._file_path: str = ""
+        self._base_types: Optional[List[Tuple[Node, Node]]] = None
+        self._elements: List[Any] = []
+        self._access_path_index: Optional[AccessPathIndex] = None
 
     def __repr__(self) -> str:
         return repr(self._graph)
@@ -77,15 +109,67 @@ class SAMMGraph:
     def parse(self, file_path: Union[Path, str]) -> Graph:
         """Parse a file to the SAMM graph.
 
+        If the graph cache is set, the resolved model is loaded from the cache or saved to it after the parsing.
+
         :param file_path: Path to the *ttl file.
         """
         self._file_path = self.convert_file_path(file_path)
-        self._graph.parse(self._file_path)
-        self._samm_version = self.get_samm_version()
-        self._resolver.resolve(self._graph, self._file_path, self._samm_version)
+
+        if self._graph_cache and self._graph_cache.load(self._graph, self._file_path):
+            self._record_base_types()
+            self._samm_version = self.get_samm_version()
+            self._resolver.resolve_meta_model(self._graph, self._samm_version)
+        else:
+            self._graph.parse(self._file_path)
+            self._record_base_types()
+            self._samm_version = self.get_samm_version()
+            self._resolver.resolve(self._graph, self._file_path, self._samm_version)
+
+            if self._graph_cache:
+                self._graph_cache.save(self._graph, self._file_path, self._samm_version)
 
         return self._graph
 
+    async def parse_async(self, file_path: Union[Path, str], executor: Optional[Executor] = None) -> Graph:
+        """Parse a file to the SAMM graph without blocking the event loop.
+
+        Reading and parsing of the files run in the executor.
+
+        :param file_path: Path to the *ttl file.
+        :param executor: thread pool executor, the default executor of the event loop is used if not set
+        """
+        loop = asyncio.get_running_loop()
+
+        return await loop.run_in_executor(executor, self.parse, file_path)
+
+    def _record_base_types(self):
+        """Record the typed subjects of the base model file.
+
+        Must be called before the dependencies are resolved, because a plain RDF graph gets their triples merged.
+        """
+        pattern = (None, RDF.type, None)
+        if isinstance(self._graph, LayeredGraph):
+            triples = self._graph.top_triples(pattern)
+        else:
+            triples = self._graph.triples(pattern)
+
+        self._base_types = list(dict.fromkeys((subject, node_type) for subject, _, node_type in triples))
+
+    def _get_base_types(self, model_file_path: str) -> List[Tuple[Node, Node]]:
+        """Get the typed subjects of the model file.
+
+        The subjects of the parsed model file are recorded while parsing, any other file is parsed.
+
+        :param model_file_path: str with path to the model
+        :return: list of the subjects with their types
+        """
+        if self._base_types is not None and model_file_path == self._file_path:
+            return self._base_types
+
+        base_graph = Graph().parse(model_file_path, format="turtle")
+
+        return list(base_graph.subject_objects(predicate=RDF.type, unique=True))
+
     def _get_model_file_path(self, model_file_path: str = "") -> str:
         """Get a model file path.
 
@@ -100,17 +184,15 @@ class SAMMGraph:
 
     def get_nodes_from_graph(self, model_file_path: str = "") -> List[Node]:
         """Get a list of URIRef to nodes from the base model file."""
-        nodes = []
-        model_file_path = self._get_model_file_path(model_file_path)
-        base_graph = Graph().parse(model_file_path, format="turtle")
+        base_types = self._get_base_types(self._get_model_file_path(model_file_path))
 
         # Search for Aspect elements
         samm = SAMM(self._samm_version)
-        for subject in base_graph.subjects(predicate=RDF.type, object=samm.get_urn(SAMM.aspect)):  # type: ignore
-            nodes.append(subject)
+        aspect_urn = samm.get_urn(SAMM.aspect)  # type: ignore
+        nodes = [subject for subject, node_type in base_types if node_type == aspect_urn]
 
         if not nodes:
-            for subject, object in base_graph.subject_objects(predicate=RDF.type, unique=True):
+            for subject, object in base_types:
                 prefix_data = str(object).replace("<", "").split(":")
                 if ":".join(prefix_data[:3]) == self.samm_prefix:
                     nodes.append(subject)
@@ -132,14 +214,113 @@ class SAMMGraph:
 
         return base_elements
 
-    def to_python(self, aspect_urn: URIRef | str = "") -> List[URIRef | None]:
-        """Convert SAMM graph to Python objects."""
+    def to_python(
+        self,
+        aspect_urn: URIRef | str = "",
+        listener: Optional[Callable[[Any], None]] = None,
+    ) -> List[URIRef | None]:
+        """Convert SAMM graph to Python objects.
+
+        :param aspect_urn: URN of the Aspect node.
+        :param listener: callable that gets every model element right after it is created, in dependency order.
+        """
         base_nodes = self.get_base_nodes(aspect_urn)
-        model_element_factory = ModelElementFactory(self._samm_version, self._graph, self._cache)
+        model_element_factory = ModelElementFactory(self._samm_version, self._graph, self._cache, self._lazy)
+        if listener:
+            model_element_factory.add_listener(listener)
+
         aspect_elements = model_element_factory.create_all_graph_elements(base_nodes)
+        self._elements = aspect_elements
+        self._access_path_index = None
 
         return aspect_elements
 
+    def _put_elements(self, aspect_urn: URIRef | str, elements: Queue, stopped: Event):
+        """Create the model elements and put them to the queue of the element iterator.
+
+        Every queue item is a tuple (is_element, value). The last item has the error of the instantiation or None.
+
+        :param aspect_urn: URN of the Aspect node.
+        :param elements: queue of the element iterator
+        :param stopped: event that is set when the iterator is closed
+        """
+
+        producer = current_thread()
+
+        def listener(element):
+            # Lazy child elements created later by the consumer or after the iteration are not streamed
+            if current_thread() is not producer:
+                return
+
+            if stopped.is_set():
+                raise _ElementIterationStopped()
+
+            elements.put((True, element))
+
+        try:
+            self.to_python(aspect_urn, listener)
+        except _ElementIterationStopped:
+            return
+        except Exception as error:
+            elements.put((False, error))
+            return
+
+        elements.put((False, None))
+
+    def iter_elements(self, aspect_urn: URIRef | str = "", buffer_size: int = 1) -> Iterator[Any]:
+        """Iterate over the model elements while they are created.
+
+        The elements are yielded in dependency order: the children of an element come before the element itself,
+        the base elements (e.g. the Aspect) come last. The instantiation runs in a background thread and waits
+        while the buffer is full, so the consumer can process the elements before the whole model is created.
+        In the lazy mode, the child elements created on a later access to an attribute are not yielded.
+
+        Closing the iterator stops the instantiation at the next created element. The elements yielded before are
+        complete. They and the elements created ahead for the buffer are already resolved in the element cache,
+        so find_by_name and the other lookups find them after the iterator is closed. The elements of the graph
+        and its access path index are only updated by a completed instantiation. A next to_python or iter_elements
+        call creates all elements with a new element factory, the element cache keeps the instances created first,
+        the same as for repeated to_python calls.
+
+        :param aspect_urn: URN of the Aspect node.
+        :param buffer_size: number of the created elements waiting for the consumer
+        """
+        elements: Queue = Queue(maxsize=buffer_size)
+        stopped = Event()
+        producer = Thread(target=self._put_elements, args=(aspect_urn, elements, stopped), daemon=True)
+        producer.start()
+
+        try:
+            while True:
+                is_element, value = elements.get()
+                if not is_element:
+                    if value is not None:
+                        raise value
+                    return
+
+                yield value
+        finally:
+            stopped.set()
+            while producer.is_alive():
+                try:
+                    elements.get(timeout=0.01)
+                except Empty:
+                    pass
+
+    async def to_python_async(
+        self,
+        aspect_urn: URIRef | str = "",
+        executor: Optional[Executor] = None,
+    ) -> List[URIRef | None]:
+        """Convert SAMM graph to Python objects without blocking the event loop.
+
+        :param aspect_urn: URN of the Aspect node.
+        :param executor: thread pool executor, the default executor of the event loop is used if not set
+        """
+        loop = asyncio.get_running_loop()
+
+        return await loop.run_in_executor(executor, self.to_python, aspect_urn)
+
     def find_by_name(self, element_name: str) -> list[Base]:
         """Find a specific model element by name, and returns the found elements
 
@@ -156,6 +337,36 @@ class SAMMGraph:
         """
         return self._cache.get_by_urn(urn)
 
+    def find_by_type(self, element_type: Type[T]) -> list[T]:
+        """Find model elements of a specific type, including its subclasses.
+
+        :param element_type: type of the elements, e.g. Property
+        :return: list of found elements
+        """
+        return self._cache.get_by_type(element_type)
+
+    def get_access_path_index(self) -> AccessPathIndex:
+        """Get the index of the JSON access paths of the elements created by the last to_python call.
+
+        The index is compiled with the first call and kept until the next to_python call.
+
+        :return: access path index
+        """
+        if self._access_path_index is None:
+            self._access_path_index = AccessPathIndex(self._elements)
+
+        return self._access_path_index
+
+    def get_access_paths(self, name_or_urn: str) -> list[list[str]]:
+        """Get the JSON access paths of the elements from the compiled access path index.
+
+        :param name_or_urn: payload name of a property, name or URN of an element
+        :return: list of the access paths
+        """
+        access_path_index = self.get_access_path_index()
+
+        return access_path_index.get_paths(name_or_urn) or access_path_index.get_urn_paths(name_or_urn)
+
     def determine_access_path(self, base_element_name: str) -> list[list[str]]:
         """Determine the access path.
 
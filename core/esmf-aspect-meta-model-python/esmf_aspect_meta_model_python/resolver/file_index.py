@@ -0,0 +1,182 @@
+#  Copyright (c) 2024 Robert Bosch Manufacturing Solutions GmbH
+#
+#  See the AUTHORS file(s) distributed with this work for additional
+#  information regarding authorship.
+#
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+#
+#   SPDX-License-Identifier: MPL-2.0
+
+from os import stat
+from os.path import abspath, join, relpath
+from pathlib import Path
+from threading import Lock
+from time import monotonic
+from typing import Any, Dict, List, Optional, Union
+
+from rdflib import Graph, URIRef
+
+from esmf_aspect_meta_model_python.cache_files import read_versioned_json, write_json
+
+
+class ModelFileIndex:
+    """Index of the model elements URNs and namespaces to the files that define them.
+
+    The index covers a models repository with the folder structure <models_root>/<namespace>/<version>/*.ttl.
+    A file is parsed only if it is new or its modification time or size was changed since the last update,
+    the entries of the removed files are dropped. The index can be persisted to a JSON file and is loaded from it
+    on the next start, so only the changed files are parsed again.
+
+    The namespace resolver does not scan the repository on every load, it calls refresh(): the index is updated
+    on the first refresh and then only if it is older than the refresh interval. Without a refresh interval
+    the index is updated once per index object and afterward only by an explicit call of update().
+
+    :param models_root: path to the root folder of the models repository
+    :param index_file_path: optional path to the JSON file to persist the index
+    :param refresh_interval: optional maximum age of the index in seconds for refresh()
+    """
+
+    index_format = "1"
+
+    def __init__(
+        self,
+        models_root: Union[str, Path],
+        index_file_path: Union[str, Path, None] = None,
+        refresh_interval: Optional[float] = None,
+    ):
+        self._models_root = abspath(models_root)
+        self._index_file_path = Path(index_file_path) if index_file_path else None
+        self.refresh_interval = refresh_interval
+        self._updated_at: Optional[float] = None
+        self._files: Dict[str, Dict[str, Any]] = {}
+        self._urn_files: Dict[str, List[str]] = {}
+        self._namespace_files: Dict[str, List[str]] = {}
+        self._lock = Lock()
+
+        if self._index_file_path:
+            self._files = self._read_index(self._index_file_path)
+            self._build_lookups()
+
+    @property
+    def models_root(self) -> str:
+        """Path to the root folder of the models repository."""
+        return self._models_root
+
+    def _read_index(self, index_file_path: Path) -> Dict[str, Dict[str, Any]]:
+        """Read the persisted index.
+
+        :param index_file_path: path to the index file
+        :return: index entries by the relative file path, empty if the file does not exist or is not valid
+        """
+        data = read_versioned_json(index_file_path, self.index_format)
+
+        return data.get("files", {}) if data else {}
+
+    def save(self):
+        """Write the index to the index file."""
+        if not self._index_file_path:
+            return
+
+        self._index_file_path.parent.mkdir(parents=True, exist_ok=True)
+        write_json(self._index_file_path, {"format": self.index_format, "files": self._files})
+
+    @staticmethod
+    def get_namespace(urn: str) -> str:
+        """Get a namespace of the element URN.
+
+        :param urn: URN of the model element
+        :return: namespace of the element, e.g. urn:samm:org.eclipse.esmf.test:1.0.0
+        """
+        return urn.split("#", 1)[0]
+
+    @staticmethod
+    def get_defined_urns(file_path: str) -> List[str]:
+        """Parse a model file and get URNs of all elements defined in it.
+
+        :param file_path: path to the model file
+        :return: sorted list of the URNs
+        """
+        graph = Graph().parse(file_path, format="turtle")
+
+        return sorted(str(subject) for subject in graph.subjects(unique=True) if isinstance(subject, URIRef))
+
+    def _build_lookups(self) -> None:
+        """Build the URN and namespace lookups from the index entries."""
+        urn_files: Dict[str, List[str]] = {}
+        namespace_files: Dict[str, List[str]] = {}
+
+        for file_path in sorted(self._files):
+            full_path = join(self._models_root, file_path)
+            for urn in self._files[file_path]["urns"]:
+                urn_files.setdefault(urn, []).append(full_path)
+
+                files = namespace_files.setdefault(self.get_namespace(urn), [])
+                if not files or files[-1] != full_path:
+                    files.append(full_path)
+
+        self._urn_files = urn_files
+        self._namespace_files = namespace_files
+
+    def update(self) -> bool:
+        """Update the index with the current state of the models repository.
+
+        :return: True if the index was changed
+        """
+        with self._lock:
+            files = {}
+            changed = False
+
+            for file_path in Path(self._models_root).glob("*/*/*.ttl"):
+                file_stat = stat(file_path)
+                relative_path = relpath(file_path, self._models_root)
+                entry = self._files.get(relative_path)
+
+                if entry is None or entry["mtime_ns"] != file_stat.st_mtime_ns or entry["size"] != file_stat.st_size:
+                    entry = {
+                        "mtime_ns": file_stat.st_mtime_ns,
+                        "size": file_stat.st_size,
+                        "urns": self.get_defined_urns(str(file_path)),
+                    }
+                    changed = True
+
+                files[relative_path] = entry
+
+            self._updated_at = monotonic()
+
+            if changed or files.keys() != self._files.keys():
+                self._files = files
+                self._build_lookups()
+                self.save()
+                return True
+
+        return False
+
+    def refresh(self) -> bool:
+        """Update the index if it was not updated yet or is older than the refresh interval.
+
+        :return: True if the index was changed
+        """
+        if self._updated_at is not None and (
+            self.refresh_interval is None or monotonic() - self._updated_at < self.refresh_interval
+        ):
+            return False
+
+        return self.update()
+
+    def get_files(self, urn: str) -> List[str]:
+        """Get files that define the model element.
+
+        :param urn: URN of the model element
+        :return: list of paths to the files
+        """
+        return list(self._urn_files.get(urn, []))
+
+    def get_namespace_files(self, namespace: str) -> List[str]:
+        """Get files that define elements of the namespace.
+
+        :param namespace: namespace, e.g. urn:samm:org.eclipse.esmf.test:1.0.0
+        :return: list of paths to the files
+        """
+        return list(self._namespace_files.get(self.get_namespace(namespace), []))
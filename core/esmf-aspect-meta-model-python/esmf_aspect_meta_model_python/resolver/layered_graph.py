@@ -0,0 +1,329 @@
+#  Copyright (c) 2024 Robert Bosch Manufacturing Solutions GmbH
+#
+#  See the AUTHORS file(s) distributed with this work for additional
+#  information regarding authorship.
+#
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+#
+#   SPDX-License-Identifier: MPL-2.0
+
+from os import stat
+from threading import Lock
+from typing import Dict, Generator, Hashable, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+
+from rdflib import RDF, BNode, Graph, URIRef
+from rdflib.paths import Path
+from rdflib.term import Node
+
+SubjectIndex = Dict[Node, Dict[Node, List[Node]]]
+ListIndex = Dict[Node, Tuple[Node, ...]]
+ParentIndex = Dict[Node, List[Tuple[Node, Node]]]
+NamedParents = Dict[Node, Tuple[Optional[Node], Optional[Node], int]]
+
+
+class GraphLayer:
+    """Read-only layer of the layered graph.
+
+    Wraps a parsed RDF graph and keeps the sets of its subjects and objects. The sets allow to skip the layer
+    without touching the triple store if the requested subject or object is not defined in it. The subject index,
+    the index of the RDF lists and the named parents of the blank nodes of the layer are built on first access and
+    are shared by all graphs that use the layer.
+
+    :param graph: parsed RDF graph
+    :param file_paths: paths to the model files the graph was parsed from
+    """
+
+    def __init__(self, graph: Graph, file_paths: Sequence[str] = ()):
+        self._graph = graph
+        self._file_paths = tuple(file_paths)
+        self._subjects = frozenset(graph.subjects(unique=True))
+        self._objects = frozenset(graph.objects(unique=True))
+        self._subject_index: Optional[SubjectIndex] = None
+        self._list_index: Optional[ListIndex] = None
+        self._named_parents: Optional[NamedParents] = None
+
+    @property
+    def graph(self) -> Graph:
+        """RDF graph of the layer."""
+        return self._graph
+
+    @property
+    def file_paths(self) -> Tuple[str, ...]:
+        """Paths to the model files of the layer."""
+        return self._file_paths
+
+    @property
+    def subject_index(self) -> SubjectIndex:
+        """Index of the layer triples from subject to predicate to objects."""
+        if self._subject_index is None:
+            self._subject_index = self.index_triples(self._graph)
+
+        return self._subject_index
+
+    @property
+    def list_index(self) -> ListIndex:
+        """Index of the RDF lists of the layer from the head node to the list items."""
+        if self._list_index is None:
+            self._list_index = self.index_lists(self.subject_index)
+
+        return self._list_index
+
+    @property
+    def named_parents(self) -> NamedParents:
+        """Named parents of the blank nodes of the layer."""
+        if self._named_parents is None:
+            self._named_parents = self.resolve_named_parents(self.index_parents(self.subject_index))
+
+        return self._named_parents
+
+    @staticmethod
+    def index_parents(subject_index: SubjectIndex) -> ParentIndex:
+        """Build a reverse index of the edges pointing to the blank nodes.
+
+        :param subject_index: index of the triples from subject to predicate to objects
+        :return: dictionary of the blank nodes with lists of the (subject, predicate) pairs pointing to them
+        """
+        index: ParentIndex = {}
+        for subject, predicates in subject_index.items():
+            for predicate, objects in predicates.items():
+                for obj in objects:
+                    if isinstance(obj, BNode):
+                        index.setdefault(obj, []).append((subject, predicate))
+
+        return index
+
+    @staticmethod
+    def resolve_named_parents(parent_index: ParentIndex) -> NamedParents:
+        """Find the named parent of every blank node of the reverse index in one sweep.
+
+        Starting from a blank node the last edge pointing to it is followed up to a named subject. The result
+        of every visited node is kept, so each chain of blank nodes is walked only once. A chain that ends
+        in a blank node without parents or in a cycle has no named parent.
+
+        :param parent_index: reverse index of the edges pointing to the blank nodes
+        :return: dictionary of the blank nodes with tuples of the named parent, the predicate of the parent
+            and the number of blank nodes between the parent and the node
+        """
+        named_parents: NamedParents = {}
+        not_found = (None, None, 0)
+
+        for node in parent_index:
+            chain: List[Node] = []
+            visited: Set[Node] = set()
+            current = node
+            while current not in named_parents:
+                parents = parent_index.get(current)
+                if not parents or current in visited:
+                    named_parents[current] = not_found
+                    break
+
+                subject, predicate = parents[-1]
+                if isinstance(subject, URIRef):
+                    named_parents[current] = (subject, predicate, 0)
+                    break
+
+                chain.append(current)
+                visited.add(current)
+                current = subject
+
+            named_parent, parent_predicate, distance = named_parents[current]
+            for child in reversed(chain):
+                if named_parent is not None:
+                    distance += 1
+                named_parents.setdefault(child, (named_parent, parent_predicate, distance))
+
+        return named_parents
+
+    @staticmethod
+    def index_lists(subject_index: SubjectIndex) -> ListIndex:
+        """Materialize all RDF lists of the subject index.
+
+        The lists are walked iteratively, so the length of a list is not limited by the recursion limit.
+        Only the head nodes, which are not the rest of another list node, are indexed.
+
+        :param subject_index: index of the triples from subject to predicate to objects
+        :return: dictionary of the head nodes with tuples of the list items
+        """
+        cells = {subject: predicates for subject, predicates in subject_index.items() if RDF.first in predicates}
+        rest_nodes = {rest for predicates in cells.values() for rest in predicates.get(RDF.rest, ())}
+        lists: ListIndex = {}
+
+        for head in cells:
+            if head in rest_nodes:
+                continue
+
+            items = []
+            visited = set()
+            cell: Optional[Node] = head
+            while cell in cells and cell not in visited:
+                visited.add(cell)
+                items.append(cells[cell][RDF.first][0])  # type: ignore
+                rest = cells[cell].get(RDF.rest)  # type: ignore
+                cell = rest[0] if rest else None
+
+            lists[head] = tuple(items)
+
+        return lists
+
+    @staticmethod
+    def index_triples(triples: Iterable) -> SubjectIndex:
+        """Build an index of the triples from subject to predicate to objects.
+
+        :param triples: triples to index
+        :return: dictionary of the subjects with the dictionaries of their predicates and lists of objects
+        """
+        index: SubjectIndex = {}
+        for subject, predicate, obj in triples:
+            index.setdefault(subject, {}).setdefault(predicate, []).append(obj)
+
+        return index
+
+    def __len__(self) -> int:
+        return len(self._graph)
+
+    def may_contain(self, triple) -> bool:
+        """Check whether the layer could contain triples matching the pattern.
+
+        :param triple: triple pattern (subject, predicate, object)
+        :return: False if the layer does not contain the subject or the object of the pattern
+        """
+        subject, _, obj = triple
+
+        if subject is not None and subject not in self._subjects:
+            return False
+
+        if obj is not None and obj not in self._objects:
+            return False
+
+        return True
+
+    def triples(self, triple) -> Iterator:
+        """Get triples of the layer that match the pattern.
+
+        :param triple: triple pattern (subject, predicate, object)
+        :return: generator of the matched triples
+        """
+        return self._graph.triples(triple)
+
+
+class LayeredGraph(Graph):
+    """RDF graph with a writable top layer over a stack of shared read-only layers.
+
+    All triples added or parsed to the graph are stored in the top layer. Read access (triples, value, objects,
+    subjects, etc.) goes through the top layer and all read-only layers, so the SAMM meta-model and the dependency
+    models are queried together with the Aspect model without copying their triples into the Aspect graph.
+    Namespace bindings belong only to the top layer.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._layers: List[GraphLayer] = []
+
+    @property
+    def layers(self) -> List[GraphLayer]:
+        """List of the read-only layers."""
+        return list(self._layers)
+
+    def add_layer(self, layer: GraphLayer):
+        """Add a read-only layer to the graph.
+
+        :param layer: graph layer
+        """
+        if not any(layer is existing_layer for existing_layer in self._layers):
+            self._layers.append(layer)
+
+    def triples(self, triple) -> Generator:
+        """Generator over the triples of the top layer and all read-only layers.
+
+        Triples defined in more than one layer are returned only once.
+        """
+        if isinstance(triple[1], Path):
+            yield from super().triples(triple)
+            return
+
+        layers = [layer for layer in self._layers if layer.may_contain(triple)]
+        if not layers:
+            yield from super().triples(triple)
+            return
+
+        seen: Set[Tuple] = set()
+        for source in [super().triples(triple), *(layer.triples(triple) for layer in layers)]:
+            for found_triple in source:
+                if found_triple not in seen:
+                    seen.add(found_triple)
+                    yield found_triple
+
+    def top_triples(self, triple) -> Generator:
+        """Generator over the triples of the top layer only.
+
+        :param triple: triple pattern (subject, predicate, object)
+        """
+        yield from super().triples(triple)
+
+    def __len__(self) -> int:
+        """Number of the triples in all layers."""
+        return super().__len__() + sum(len(layer) for layer in self._layers)
+
+
+class GraphLayerStore:
+    """Thread-safe store of parsed graph layers.
+
+    A layer is parsed from one or several turtle files and is reused until any of the files is changed.
+    """
+
+    def __init__(self) -> None:
+        self._layers: Dict[Hashable, Tuple[Tuple, GraphLayer]] = {}
+        self._lock = Lock()
+
+    @staticmethod
+    def get_files_stamp(file_paths: Sequence[str]) -> Tuple:
+        """Get a stamp of the files state.
+
+        :param file_paths: list of paths to the files
+        :return: tuple with the path, modification time and size of each file
+        """
+        stamp = []
+        for file_path in file_paths:
+            file_stat = stat(file_path)
+            stamp.append((file_path, file_stat.st_mtime_ns, file_stat.st_size))
+
+        return tuple(stamp)
+
+    @staticmethod
+    def parse_files(file_paths: Sequence[str]) -> Graph:
+        """Parse the turtle files into a new graph.
+
+        :param file_paths: list of paths to the files
+        :return: RDF graph
+        """
+        graph = Graph()
+        for file_path in file_paths:
+            graph.parse(file_path, format="turtle")
+
+        return graph
+
+    def get_layer(self, key: Hashable, file_paths: Sequence[str]) -> GraphLayer:
+        """Get a layer for the files.
+
+        The files are parsed with the first call or if one of them was changed after the last parsing.
+
+        :param key: key of the layer in the store
+        :param file_paths: list of paths to the files
+        :return: graph layer
+        """
+        stamp = self.get_files_stamp(file_paths)
+        cached = self._layers.get(key)
+
+        if cached is None or cached[0] != stamp:
+            cached = (stamp, GraphLayer(self.parse_files(file_paths), file_paths))
+            with self._lock:
+                self._layers[key] = cached
+
+        return cached[1]
+
+    def clear(self):
+        """Remove all layers from the store."""
+        with self._lock:
+            self._layers.clear()
@@ -13,10 +13,13 @@ from abc import ABC, abstractmethod
 from glob import glob
 from os.path import exists, join
 from pathlib import Path
-from typing import List
+from threading import Lock
+from typing import Dict, List, Tuple
 
 from rdflib import Graph
 
+from esmf_aspect_meta_model_python.resolver.layered_graph import GraphLayer, LayeredGraph
+
 
 class BaseMetaModelResolver(ABC):
     """Interface for meta-model resolver class."""
@@ -31,10 +34,18 @@ class BaseMetaModelResolver(ABC):
 
 
 class AspectMetaModelResolver(BaseMetaModelResolver):
-    """SAMM meta-model resolver class."""
+    """SAMM meta-model resolver class.
+
+    The SAMM turtle files of each meta-model version are parsed only once per process. The parsed graph is kept in
+    a class level store and shared between all resolver instances, so every further Aspect load reuses the
+    already parsed triples instead of reading the meta-model files again.
+    """
 
     samm_folder_path = join("esmf_aspect_meta_model_python", "samm_aspect_meta_model", "samm")
 
+    _meta_model_layers: Dict[Tuple[str, str], GraphLayer] = {}
+    _meta_model_lock = Lock()
+
     def __init__(self, base_path: str = ""):
         self._base_path = base_path if base_path else str(Path(__file__).parents[2])
 
@@ -61,10 +72,59 @@ class AspectMetaModelResolver(BaseMetaModelResolver):
                 "Try to install SAMM Meta Model using 'download-samm-release' or 'download-samm-branch' command",
             )
 
+    def _load_meta_model_graph(self, meta_model_version: str) -> Graph:
+        """Parse all SAMM files of the given version to the new graph.
+
+        :param meta_model_version: meta-model version
+        :return: RDF Graph with the SAMM meta-model data
+        """
+        meta_model_graph = Graph()
+        for file_path in self._get_samm_files_path(meta_model_version):
+            self.validate_file(file_path)
+            meta_model_graph.parse(file_path, format="turtle")
+
+        return meta_model_graph
+
+    def get_meta_model_layer(self, meta_model_version: str) -> GraphLayer:
+        """Get the shared SAMM meta-model layer of the specific version.
+
+        The layer is parsed with the first call and reused afterwards. It is shared between all loaded Aspect models
+        and must be treated as read-only.
+
+        :param meta_model_version: meta-model version
+        :return: graph layer with the SAMM meta-model data
+        """
+        key = (self._base_path, meta_model_version)
+        meta_model_layer = self._meta_model_layers.get(key)
+
+        if meta_model_layer is None:
+            with self._meta_model_lock:
+                meta_model_layer = self._meta_model_layers.get(key)
+                if meta_model_layer is None:
+                    meta_model_layer = GraphLayer(self._load_meta_model_graph(meta_model_version))
+                    self._meta_model_layers[key] = meta_model_layer
+
+        return meta_model_layer
+
+    def get_meta_model_graph(self, meta_model_version: str) -> Graph:
+        """Get the shared SAMM meta-model graph of the specific version.
+
+        :param meta_model_version: meta-model version
+        :return: RDF Graph with the SAMM meta-model data
+        """
+        return self.get_meta_model_layer(meta_model_version).graph
+
+    @classmethod
+    def clear_cache(cls):
+        """Remove all parsed SAMM meta-model graphs from the shared store."""
+        with cls._meta_model_lock:
+            cls._meta_model_layers.clear()
+
     def parse(self, aspect_graph: Graph, meta_model_version: str):
         """Resolve SAMM meta-model data.
 
-        Merges the information of the global SAMM from turtle files into the aspect graph.
+        Adds the information of the global SAMM to the aspect graph. A layered aspect graph gets the shared
+        meta-model as a read-only layer, the triples are merged into any other graph.
         The global files are located in the SAMM package in the folders:
             - meta-model
             - characteristic
@@ -74,6 +134,9 @@ class AspectMetaModelResolver(BaseMetaModelResolver):
         :param aspect_graph: RDF Graph
         :param meta_model_version: version of the meta-model to extract the right SAMM turtle files
         """
-        for file_path in self._get_samm_files_path(meta_model_version):
-            self.validate_file(file_path)
-            aspect_graph.parse(file_path, format="turtle")
+        meta_model_layer = self.get_meta_model_layer(meta_model_version)
+
+        if isinstance(aspect_graph, LayeredGraph):
+            aspect_graph.add_layer(meta_model_layer)
+        else:
+            aspect_graph += meta_model_layer.graph
@@ -10,11 +10,16 @@
 #   SPDX-License-Identifier: MPL-2.0
 
 from abc import ABC, abstractmethod
-from os.path import exists, join
+from os.path import abspath, exists, join
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from threading import Lock
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 
-from rdflib import Graph
+from rdflib import RDF, BNode, Graph, URIRef
+from rdflib.term import Node
+
+from esmf_aspect_meta_model_python.resolver.file_index import ModelFileIndex
+from esmf_aspect_meta_model_python.resolver.layered_graph import GraphLayer, GraphLayerStore, LayeredGraph
 
 
 class BaseNamespaceResolver(ABC):
@@ -33,11 +38,37 @@ class AspectNamespaceResolver(BaseNamespaceResolver):
     """Aspect model namespace dependency resolver.
 
     Recursively go through the Aspect namespaces and resolve (parse) additional models.
+
+    Every dependency model file is parsed once per process and shared between the loaded Aspect models until the file
+    is changed. A layered aspect graph gets the dependency models as read-only layers, the triples are merged into
+    any other graph.
+
+    If a model file index is set, only the files that define the elements referenced by the Aspect model and its
+    dependencies are parsed instead of all files of the referenced namespace folders. The index is refreshed
+    according to its refresh interval, not scanned on every parse.
+
+    In the selective mode only the elements reachable from the Aspect are resolved. An element file is found
+    with the model file index if it is set, otherwise by the <models_root>/<namespace>/<version>/<ElementName>.ttl
+    convention and finally by the URN map of the namespace folder. The folder is scanned once per process into
+    the map and scanned again only if its files are changed; the scanned files are not kept in memory, only
+    the files that define the resolved elements are added to the graph.
+
+    :param file_index: optional index of the models repository
+    :param selective: resolve only the elements reachable from the Aspect
     """
 
-    def __init__(self):
-        self.aspect_graph = None
-        self.file_path = None
+    samm_namespace_prefix = "urn:samm:"
+    samm_meta_model_prefix = "urn:samm:org.eclipse.esmf.samm:"
+
+    _dependency_layers = GraphLayerStore()
+    _folder_urns: Dict[str, Tuple[Tuple, Dict[str, List[str]]]] = {}
+    _folder_urns_lock = Lock()
+
+    def __init__(self, file_index: Optional[ModelFileIndex] = None, selective: bool = False):
+        self.aspect_graph: Any = None
+        self.file_path: Optional[str] = None
+        self.file_index = file_index
+        self.selective = selective
 
     @staticmethod
     def validate_file(file_path: str):
@@ -72,16 +103,17 @@ class AspectNamespaceResolver(BaseNamespaceResolver):
 
         return namespace_specific_str, version
 
-    def _get_dirs_for_advanced_loading(self, file_path: str) -> List[str]:
+    def _get_dirs_for_advanced_loading(self, graph: Graph, file_path: str) -> List[str]:
         """Get directories from graph namespaces for advanced loading.
 
+        :param graph: RDF graph of the model file
         :param file_path: str path to the main file
         :return: list of str path for further advanced files loading
         """
         paths_for_advanced_loading = []
         base_path = Path(file_path).parents[2]
 
-        for prefix, namespace in self.aspect_graph.namespace_manager.namespaces():
+        for prefix, namespace in graph.namespace_manager.namespaces():
             namespace_specific_str, version = self._parse_namespace(namespace)
             if namespace_specific_str and version:
                 paths_for_advanced_loading.append(join(base_path, namespace_specific_str, version))
@@ -94,13 +126,27 @@ class AspectNamespaceResolver(BaseNamespaceResolver):
         :param file_path: path to the model file
         :return: list of dependency folders
         """
-        if file_path != self.file_path:
-            self.aspect_graph.parse(file_path, format="turtle")
+        if file_path == self.file_path:
+            graph = self.aspect_graph
+        else:
+            dependency_layer = self._dependency_layers.get_layer(file_path, [file_path])
+            self._add_dependency_layer(dependency_layer)
+            graph = dependency_layer.graph
 
-        dependency_folders = self._get_dirs_for_advanced_loading(file_path)
+        dependency_folders = self._get_dirs_for_advanced_loading(graph, file_path)
 
         return dependency_folders
 
+    def _add_dependency_layer(self, dependency_layer: GraphLayer):
+        """Add the dependency model to the aspect graph.
+
+        :param dependency_layer: graph layer of the dependency model file
+        """
+        if isinstance(self.aspect_graph, LayeredGraph):
+            self.aspect_graph.add_layer(dependency_layer)
+        else:
+            self.aspect_graph += dependency_layer.graph
+
     @staticmethod
     def _get_additional_files_from_dir(file_path: str) -> List[str]:
         """Get additional files from specific directory.
@@ -146,6 +192,194 @@ class AspectNamespaceResolver(BaseNamespaceResolver):
 
         return file_dependencies
 
+    @classmethod
+    def _is_model_urn(cls, node) -> bool:
+        """Check whether the node is a URN of a model element and not of a SAMM meta-model element."""
+        return (
+            isinstance(node, URIRef)
+            and node.startswith(cls.samm_namespace_prefix)
+            and not node.startswith(cls.samm_meta_model_prefix)
+        )
+
+    @classmethod
+    def _get_referenced_urns(cls, triples: Iterable) -> Set[str]:
+        """Get URNs of the model elements used in the triples.
+
+        :param triples: triples of a model graph
+        :return: set of the URNs without the SAMM meta-model elements
+        """
+        urns = set()
+        for triple in triples:
+            for node in triple:
+                if cls._is_model_urn(node):
+                    urns.add(str(node))
+
+        return urns
+
+    def _get_aspect_triples(self) -> Iterable:
+        """Get triples of the Aspect model file."""
+        if isinstance(self.aspect_graph, LayeredGraph):
+            return self.aspect_graph.top_triples((None, None, None))
+
+        return self.aspect_graph.triples((None, None, None))
+
+    def _get_indexed_dependency_files(self, file_index: ModelFileIndex, aspect_file_path: str) -> List[str]:
+        """Get dependency files with the model file index.
+
+        Starting with the Aspect model, the files defining the referenced elements are parsed and added to the graph
+        until all the references are resolved. Elements that are not found in the index are skipped.
+
+        :param file_index: index of the models repository
+        :param aspect_file_path: path to the Aspect model file
+        :return: list of the dependency files
+        """
+        file_index.refresh()
+
+        loaded_files = {abspath(aspect_file_path)}
+        dependency_files = []
+        resolved_urns: Set[str] = set()
+        urns = self._get_referenced_urns(self._get_aspect_triples())
+
+        while urns:
+            urn = urns.pop()
+            resolved_urns.add(urn)
+
+            for file_path in file_index.get_files(urn):
+                if file_path not in loaded_files:
+                    loaded_files.add(file_path)
+                    dependency_files.append(file_path)
+
+                    dependency_layer = self._dependency_layers.get_layer(file_path, [file_path])
+                    self._add_dependency_layer(dependency_layer)
+                    urns.update(self._get_referenced_urns(dependency_layer.triples((None, None, None))) - resolved_urns)
+
+        return dependency_files
+
+    def _get_root_nodes(self) -> List[Node]:
+        """Get root nodes of the Aspect model file.
+
+        :return: list of the Aspects of the file or of all model elements if the file has no Aspect
+        """
+        elements = []
+        aspects = []
+
+        for subject, predicate, obj in self._get_aspect_triples():
+            if self._is_model_urn(subject):
+                elements.append(subject)
+
+                if predicate == RDF.type and obj.startswith(self.samm_meta_model_prefix) and obj.endswith("#Aspect"):
+                    aspects.append(subject)
+
+        return list(dict.fromkeys(aspects or elements))
+
+    def _defines_element(self, file_path: str, urn: str) -> bool:
+        """Check whether the model file defines the element.
+
+        :param file_path: path to the model file
+        :param urn: URN of the element
+        :return: True if the element is a subject of the file
+        """
+        dependency_layer = self._dependency_layers.get_layer(file_path, [file_path])
+
+        return dependency_layer.may_contain((URIRef(urn), None, None))
+
+    def _find_element_files(self, urn: str, models_root: Path) -> List[str]:
+        """Find files that define the model element.
+
+        :param urn: URN of the element
+        :param models_root: path to the models root folder
+        :return: list of paths to the files
+        """
+        if self.file_index:
+            return self.file_index.get_files(urn)
+
+        namespace, _, name = urn.partition("#")
+        namespace_info = namespace.split(":")
+        if len(namespace_info) != 4 or not name:
+            return []
+
+        folder = join(models_root, namespace_info[2], namespace_info[3])
+        element_file = abspath(join(folder, f"{name}.ttl"))
+        if exists(element_file) and self._defines_element(element_file, urn):
+            return [element_file]
+
+        if not exists(folder):
+            return []
+
+        return list(self._get_folder_urns(folder).get(urn, []))
+
+    @classmethod
+    def _get_folder_urns(cls, folder: str) -> Dict[str, List[str]]:
+        """Get the map of the element URNs to the files of the namespace folder.
+
+        Every file of the folder is parsed into a temporary graph to collect the defined URNs. The map is reused
+        until any file of the folder is changed, added or removed.
+
+        :param folder: path to the namespace folder
+        :return: dictionary of the files by the URNs of the elements defined in them
+        """
+        file_paths = sorted(abspath(file_path) for file_path in cls._get_additional_files_from_dir(folder))
+        stamp = GraphLayerStore.get_files_stamp(file_paths)
+        cached = cls._folder_urns.get(folder)
+
+        if cached is None or cached[0] != stamp:
+            urn_files: Dict[str, List[str]] = {}
+            for file_path in file_paths:
+                for urn in ModelFileIndex.get_defined_urns(file_path):
+                    urn_files.setdefault(urn, []).append(file_path)
+
+            cached = (stamp, urn_files)
+            with cls._folder_urns_lock:
+                cls._folder_urns[folder] = cached
+
+        return cached[1]
+
+    def _get_selective_dependency_files(self, aspect_file_path: str) -> List[str]:
+        """Get dependency files of the elements reachable from the Aspect.
+
+        The graph is traversed from the root nodes of the Aspect model file. Every model element that is not defined
+        in the graph yet is resolved to the files defining it, which are added to the graph, and the traversal goes on
+        with the element until the closure is complete. Elements that are not found are skipped.
+
+        :param aspect_file_path: path to the Aspect model file
+        :return: list of the dependency files
+        """
+        if self.file_index:
+            self.file_index.refresh()
+
+        models_root = Path(aspect_file_path).parents[2]
+        loaded_files = {abspath(aspect_file_path)}
+        dependency_files = []
+        visited: Set[Node] = set()
+        nodes = self._get_root_nodes()
+
+        while nodes:
+            node = nodes.pop()
+            if node in visited:
+                continue
+
+            visited.add(node)
+            if isinstance(node, URIRef) and (node, None, None) not in self.aspect_graph:
+                for file_path in self._find_element_files(str(node), models_root):
+                    if file_path not in loaded_files:
+                        loaded_files.add(file_path)
+                        dependency_files.append(file_path)
+                        self._add_dependency_layer(self._dependency_layers.get_layer(file_path, [file_path]))
+
+            for _, _, obj in self.aspect_graph.triples((node, None, None)):
+                if isinstance(obj, BNode) or self._is_model_urn(obj):
+                    nodes.append(obj)
+
+        return dependency_files
+
+    @classmethod
+    def clear_cache(cls):
+        """Remove all parsed dependency models from the shared store."""
+        cls._dependency_layers.clear()
+
+        with cls._folder_urns_lock:
+            cls._folder_urns.clear()
+
     def parse(self, aspect_graph, aspect_file_path: str):
         """Parse namespaces from the Aspect model.
 
@@ -155,6 +389,14 @@ class AspectNamespaceResolver(BaseNamespaceResolver):
         self.aspect_graph = aspect_graph
         self.file_path = aspect_file_path
 
+        if self.selective:
+            self._get_selective_dependency_files(aspect_file_path)
+            return
+
+        if self.file_index:
+            self._get_indexed_dependency_files(self.file_index, aspect_file_path)
+            return
+
         file_dependencies: Dict[str, List[str]] = {}
         folder_dependencies: Dict[str, List[str]] = {}
 
@@ -9,13 +9,234 @@
 #
 #   SPDX-License-Identifier: MPL-2.0
 
+import asyncio
+import json
+import shutil
 import subprocess
 
-from os.path import exists, join
+from hashlib import sha256
+from os.path import abspath, exists, join
 from pathlib import Path
+from threading import Lock
+from time import perf_counter
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
 
+from esmf_aspect_meta_model_python.cache_files import get_files_key, read_json, read_versioned_json, write_json
+from esmf_aspect_meta_model_python.generator.json_schema import JsonSchemaGenerator, get_aspect
+from esmf_aspect_meta_model_python.loader.aspect_loader import AspectLoader
+from esmf_aspect_meta_model_python.loader.samm_graph import SAMMGraph
 from scripts.download_samm_cli import download_samm_cli
 
+NATIVE_SCHEMA_FUNCTION = "native schema"
+ARTIFACT_FUNCTIONS = ("validate", "to schema", "to openapi", "to html")
+ARTIFACT_EXTENSIONS = {
+    "to schema": ".schema.json",
+    NATIVE_SCHEMA_FUNCTION: ".schema.json",
+    "to openapi": ".openapi.yaml",
+    "to json": ".json",
+    "to html": ".html",
+    "to png": ".png",
+    "to svg": ".svg",
+}
+
+
+class SammCliJob:
+    """SAMM CLI function called for one Aspect model.
+
+    The "native schema" function is not a SAMM CLI function, the JSON schema is written to the output file
+    by the Python JSON schema generator without starting the SAMM CLI.
+
+    :param function_name: name of the SAMM CLI function, e.g. "validate" or "to schema"
+    :param path_to_model: local path to the aspect model file (*.ttl)
+    :param args: flags of the function
+    :param kwargs: arguments of the function, e.g. output="Model.schema.json"
+    """
+
+    def __init__(self, function_name: str, path_to_model: Union[str, Path], *args: str, **kwargs: Any):
+        self.function_name = function_name
+        self.path_to_model = str(path_to_model)
+        self.args = args
+        self.kwargs = kwargs
+
+    def __repr__(self) -> str:
+        return f"SammCliJob({self.function_name!r}, {self.path_to_model!r})"
+
+    @property
+    def output(self) -> Optional[str]:
+        """Output file path of the job, None if the output is written to stdout."""
+        output = self.kwargs.get("output", self.kwargs.get("o"))
+
+        return str(output) if output is not None else None
+
+    def get_key(self) -> Tuple:
+        """Get a key of the job, the jobs with the same key have the same result."""
+        return (
+            self.function_name,
+            self.path_to_model,
+            self.args,
+            tuple(sorted((key, str(value)) for key, value in self.kwargs.items())),
+        )
+
+
+class SammCliResult:
+    """Result of a SAMM CLI job.
+
+    :param job: SAMM CLI job
+    :param returncode: exit code of the SAMM CLI
+    :param stdout: standard output of the SAMM CLI
+    :param stderr: standard error output of the SAMM CLI
+    :param duration: duration of the job in seconds
+    :param cached: True if the result was taken from the cache without running the SAMM CLI
+    """
+
+    def __init__(
+        self,
+        job: SammCliJob,
+        returncode: int,
+        stdout: str = "",
+        stderr: str = "",
+        duration: float = 0.0,
+        cached: bool = False,
+    ):
+        self.job = job
+        self.returncode = returncode
+        self.stdout = stdout
+        self.stderr = stderr
+        self.duration = duration
+        self.cached = cached
+
+    def __repr__(self) -> str:
+        return f"SammCliResult({self.job!r}, returncode={self.returncode}, cached={self.cached})"
+
+    @property
+    def ok(self) -> bool:
+        """True if the SAMM CLI finished successfully."""
+        return self.returncode == 0
+
+
+class SammCliCache:
+    """On-disk cache of the SAMM CLI results.
+
+    A result is stored by a hash of the model closure, the function and its arguments. The model closure is
+    the Aspect model file with all resolved dependency model files, its key is a hash of the content of these files
+    and of the list of the turtle files in their folders. The closure is resolved with the Python loader once,
+    the list of its files is kept in a manifest and only the file hashes are checked on the next runs.
+
+    Only successful results are stored, together with the output file of the job.
+
+    :param cache_dir: path to the cache directory
+    """
+
+    cache_format = "1"
+
+    def __init__(self, cache_dir: Union[str, Path]):
+        self._cache_dir = Path(cache_dir)
+        self._cache_dir.mkdir(parents=True, exist_ok=True)
+        self._lock = Lock()
+
+    @property
+    def cache_dir(self) -> Path:
+        """Path to the cache directory."""
+        return self._cache_dir
+
+    @staticmethod
+    def resolve_model_files(path_to_model: str) -> Tuple[str, List[str]]:
+        """Resolve the model closure with the Python loader.
+
+        :param path_to_model: path to the Aspect model file
+        :return: SAMM version and paths to the model file followed by all its dependency files
+        """
+        graph = SAMMGraph()
+        rdf_graph = graph.parse(path_to_model)
+        file_paths = [abspath(path_to_model)]
+        for layer in getattr(rdf_graph, "layers", []):
+            file_paths.extend(abspath(file_path) for file_path in layer.file_paths)
+
+        return graph.get_samm_version(), file_paths
+
+    def get_model_key(self, path_to_model: str) -> str:
+        """Get a key of the model closure.
+
+        The models are resolved one by one, also if the keys are requested from several threads.
+
+        :param path_to_model: path to the Aspect model file
+        :return: hex digest
+        """
+        path_to_model = abspath(path_to_model)
+        manifest_path = self._cache_dir / f"{sha256(path_to_model.encode()).hexdigest()}.closure.json"
+
+        with self._lock:
+            manifest = read_versioned_json(manifest_path, self.cache_format)
+            if manifest:
+                try:
+                    key = get_files_key(manifest["samm_version"], manifest["files"])
+                    if key == manifest["key"]:
+                        return key
+                except OSError:
+                    pass
+
+            samm_version, file_paths = self.resolve_model_files(path_to_model)
+            key = get_files_key(samm_version, file_paths)
+            write_json(
+                manifest_path,
+                {"format": self.cache_format, "key": key, "samm_version": samm_version, "files": file_paths},
+            )
+
+        return key
+
+    def get_key(self, job: SammCliJob) -> str:
+        """Get a cache key of the job.
+
+        The output path is not a part of the key, the cached output file is copied to the output path of the job.
+
+        :param job: SAMM CLI job
+        :return: hex digest
+        """
+        kwargs = {key: str(value) for key, value in job.kwargs.items() if key not in ("output", "o")}
+        data = [self.cache_format, self.get_model_key(job.path_to_model), job.function_name, job.args, kwargs]
+
+        return sha256(json.dumps(data, sort_keys=True).encode()).hexdigest()
+
+    def load(self, key: str, job: SammCliJob) -> Optional[SammCliResult]:
+        """Get the cached result of the job and copy the cached output file to the output path of the job.
+
+        :param key: cache key of the job
+        :param job: SAMM CLI job
+        :return: cached result or None if the job is not cached
+        """
+        entry = read_json(self._cache_dir / f"{key}.result.json")
+        output_path = self._cache_dir / f"{key}.output"
+        if entry is None or (job.output and not output_path.exists()):
+            return None
+
+        if job.output:
+            Path(job.output).parent.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(output_path, job.output)
+
+        return SammCliResult(job, 0, entry["stdout"], entry["stderr"], cached=True)
+
+    def save(self, key: str, result: SammCliResult) -> None:
+        """Store a successful result of the job with its output file.
+
+        :param key: cache key of the job
+        :param result: result of the job
+        """
+        if not result.ok:
+            return
+
+        if result.job.output:
+            if not exists(result.job.output):
+                return
+            shutil.copyfile(result.job.output, self._cache_dir / f"{key}.output")
+
+        write_json(self._cache_dir / f"{key}.result.json", {"stdout": result.stdout, "stderr": result.stderr})
+
+    def clear(self):
+        """Remove all entries from the cache."""
+        for pattern in ("*.result.json", "*.output", "*.closure.json"):
+            for file_path in self._cache_dir.glob(pattern):
+                file_path.unlink(missing_ok=True)
+
 
 class SammCli:
     """Class to execute SAMM CLI functions.
@@ -44,8 +265,8 @@ class SammCli:
         if not exists(self._samm):
             download_samm_cli()
 
-    def _call_function(self, function_name, path_to_model, *args, **kwargs):
-        """Run a SAMM CLI function as a subprocess."""
+    def _get_call_args(self, function_name: str, path_to_model: str, args: Sequence[str], kwargs: Dict[str, Any]):
+        """Get the command line arguments of a SAMM CLI function."""
         call_args = [self._samm, "aspect", path_to_model] + function_name.split()
 
         if args:
@@ -61,8 +282,105 @@ class SammCli:
 
                 call_args.append(arg)
 
+        return call_args
+
+    def _call_function(self, function_name, path_to_model, *args, **kwargs):
+        """Run a SAMM CLI function as a subprocess."""
+        call_args = self._get_call_args(function_name, path_to_model, args, kwargs)
+
         subprocess.run(call_args, shell=True, check=True)
 
+    @staticmethod
+    def _write_schema(job: SammCliJob, aspects: Dict[str, Any]) -> None:
+        """Write the JSON schema of the native schema job with the Python generator.
+
+        :param job: native schema job
+        :param aspects: loaded Aspects by the model path, every model is loaded only once
+        :raises ValueError: if the job has no output file
+        """
+        if not job.output:
+            raise ValueError(f"The {NATIVE_SCHEMA_FUNCTION} job of {job.path_to_model} has no output file")
+
+        if job.path_to_model not in aspects:
+            aspects[job.path_to_model] = get_aspect(AspectLoader().load_aspect_model(job.path_to_model))
+
+        language = job.kwargs.get("language", job.kwargs.get("l", "en"))
+        JsonSchemaGenerator(aspects[job.path_to_model], language).write(job.output)
+
+    def run_jobs(self, jobs: Iterable[SammCliJob]) -> None:
+        """Run a batch of SAMM CLI jobs.
+
+        The SAMM CLI handles one model per process, so every job still starts the CLI. The batch runs every
+        unique job only once and creates the output folders. The "native schema" jobs are done by the Python
+        JSON schema generator and do not start the CLI at all, their output differs from the "to schema" output
+        of the SAMM CLI in formatting.
+
+        :param jobs: SAMM CLI jobs
+        :raises CalledProcessError: if a SAMM CLI function fails
+        :raises ValueError: if a native schema job has no output file
+        """
+        done = set()
+        aspects: Dict[str, Any] = {}
+        for job in jobs:
+            key = job.get_key()
+            if key in done:
+                continue
+
+            done.add(key)
+            if job.output:
+                Path(job.output).parent.mkdir(parents=True, exist_ok=True)
+
+            if job.function_name == NATIVE_SCHEMA_FUNCTION:
+                self._write_schema(job, aspects)
+            else:
+                self._call_function(job.function_name, job.path_to_model, *job.args, **job.kwargs)
+
+    @staticmethod
+    def get_artifact_jobs(
+        models: Iterable[Union[str, Path]],
+        output_dir: Union[str, Path],
+        functions: Sequence[str] = ARTIFACT_FUNCTIONS,
+    ) -> List[SammCliJob]:
+        """Get the SAMM CLI jobs which generate the artifacts of the models.
+
+        The artifact of a model is written to the output folder as <model name><extension>,
+        e.g. Movement.schema.json.
+
+        :param models: local paths to the aspect model files (*.ttl)
+        :param output_dir: path to the output folder
+        :param functions: names of the SAMM CLI functions
+        :return: list of the jobs
+        """
+        jobs = []
+        for path_to_model in models:
+            for function_name in functions:
+                if function_name in ARTIFACT_EXTENSIONS:
+                    output = Path(output_dir) / f"{Path(path_to_model).stem}{ARTIFACT_EXTENSIONS[function_name]}"
+                    jobs.append(SammCliJob(function_name, path_to_model, output=str(output)))
+                else:
+                    jobs.append(SammCliJob(function_name, path_to_model))
+
+        return jobs
+
+    def generate_artifacts(
+        self,
+        models: Iterable[Union[str, Path]],
+        output_dir: Union[str, Path],
+        functions: Sequence[str] = ARTIFACT_FUNCTIONS,
+    ) -> List[SammCliJob]:
+        """Generate the artifacts of the models as a batch.
+
+        :param models: local paths to the aspect model files (*.ttl)
+        :param output_dir: path to the output folder
+        :param functions: names of the SAMM CLI functions, validation and JSON schema, OpenAPI and HTML by default,
+            "native schema" generates the JSON schemas without the SAMM CLI
+        :return: list of the jobs which were run
+        """
+        jobs = self.get_artifact_jobs(models, output_dir, functions)
+        self.run_jobs(jobs)
+
+        return jobs
+
     def validate(self, path_to_model, *args, **kwargs):
         """Validate Aspect Model.
 
@@ -153,3 +471,140 @@ class SammCli:
             - custom-resolver: use an external resolver for the resolution of the model elements
         """
         self._call_function("to svg", path_to_model, *args, **kwargs)
+
+    def _run_native_schema_job(self, job: SammCliJob) -> SammCliResult:
+        """Write the JSON schema of the native schema job, an error is returned in the result."""
+        start = perf_counter()
+        try:
+            self._write_schema(job, {})
+        except Exception as error:
+            return SammCliResult(job, 1, stderr=str(error), duration=perf_counter() - start)
+
+        return SammCliResult(job, 0, duration=perf_counter() - start)
+
+    async def _run_process_async(self, job: SammCliJob) -> SammCliResult:
+        """Run the SAMM CLI function of the job as a subprocess.
+
+        If the SAMM CLI cannot be started, the result has the exit code of a shell, 126 if the executable
+        is not permitted and 127 otherwise.
+        """
+        start = perf_counter()
+        try:
+            process = await asyncio.create_subprocess_exec(
+                *self._get_call_args(job.function_name, job.path_to_model, job.args, job.kwargs),
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
+        except OSError as error:
+            returncode = 126 if isinstance(error, PermissionError) else 127
+            return SammCliResult(job, returncode, stderr=str(error), duration=perf_counter() - start)
+
+        stdout, stderr = await process.communicate()
+
+        return SammCliResult(
+            job,
+            process.returncode if process.returncode is not None else -1,
+            stdout.decode(errors="replace"),
+            stderr.decode(errors="replace"),
+            perf_counter() - start,
+        )
+
+    @staticmethod
+    def _get_cache_key(cache: SammCliCache, job: SammCliJob) -> Optional[str]:
+        """Get the cache key of the job, None if the model closure cannot be resolved by the Python loader."""
+        try:
+            return cache.get_key(job)
+        except Exception:
+            return None
+
+    async def run_job_async(self, job: SammCliJob, cache: Optional[SammCliCache] = None) -> SammCliResult:
+        """Run a SAMM CLI job as a subprocess without blocking the event loop.
+
+        The job does not raise an error if the SAMM CLI fails or cannot be started, the exit code and the output
+        are returned in the result instead. A native schema job is run by the Python JSON schema generator
+        in a worker thread. If the cache key cannot be computed, e.g. the model is not valid turtle or is not
+        in a namespace and version folder, the job is run without the cache and the SAMM CLI reports the error.
+
+        :param job: SAMM CLI job
+        :param cache: optional cache of the results
+        :return: result of the job
+        """
+        loop = asyncio.get_running_loop()
+        key = None
+        if cache is not None:
+            key = await loop.run_in_executor(None, self._get_cache_key, cache, job)
+            result = cache.load(key, job) if key is not None else None
+            if result is not None:
+                return result
+
+        if job.output:
+            Path(job.output).parent.mkdir(parents=True, exist_ok=True)
+
+        if job.function_name == NATIVE_SCHEMA_FUNCTION:
+            result = await loop.run_in_executor(None, self._run_native_schema_job, job)
+        else:
+            result = await self._run_process_async(job)
+
+        if cache is not None and key is not None:
+            cache.save(key, result)
+
+        return result
+
+    @staticmethod
+    def _get_job_result(job: SammCliJob, result: SammCliResult) -> SammCliResult:
+        """Get the result of the job from the result of the job with the same key."""
+        if result.job is job:
+            return result
+
+        return SammCliResult(job, result.returncode, result.stdout, result.stderr, result.duration, result.cached)
+
+    async def run_jobs_async(
+        self,
+        jobs: Iterable[SammCliJob],
+        max_workers: int = 4,
+        cache_dir: Union[str, Path, None] = None,
+    ) -> List[SammCliResult]:
+        """Run SAMM CLI jobs concurrently with at most max_workers SAMM CLI processes at once.
+
+        Every unique job is run only once, the jobs with the same key get the same result. If cache_dir is set,
+        the results are cached by the model closure, the function and its arguments, so a job of an unchanged model
+        does not start the SAMM CLI again.
+
+        :param jobs: SAMM CLI jobs
+        :param max_workers: maximum number of the concurrent SAMM CLI processes
+        :param cache_dir: optional path to the cache directory
+        :return: results in the order of the jobs
+        """
+        if max_workers < 1:
+            raise ValueError("The number of workers must be a positive number")
+
+        cache = SammCliCache(cache_dir) if cache_dir is not None else None
+        semaphore = asyncio.Semaphore(max_workers)
+
+        async def run(job: SammCliJob) -> SammCliResult:
+            async with semaphore:
+                return await self.run_job_async(job, cache)
+
+        jobs = list(jobs)
+        unique_jobs: Dict[Tuple, SammCliJob] = {}
+        for job in jobs:
+            unique_jobs.setdefault(job.get_key(), job)
+
+        results = dict(zip(unique_jobs, await asyncio.gather(*(run(job) for job in unique_jobs.values()))))
+
+        return [self._get_job_result(job, results[job.get_key()]) for job in jobs]
+
+    def run_jobs_concurrently(
+        self,
+        jobs: Iterable[SammCliJob],
+        max_workers: int = 4,
+        cache_dir: Union[str, Path, None] = None,
+    ) -> List[SammCliResult]:
+        """Run SAMM CLI jobs concurrently from synchronous code.
+
+        :param jobs: SAMM CLI jobs
+        :param max_workers: maximum number of the concurrent SAMM CLI processes
+        :param cache_dir: optional path to the cache directory
+        :return: results in the order of the jobs
+        """
+        return asyncio.run(self.run_jobs_async(jobs, max_workers, cache_dir))
@@ -11,27 +11,47 @@
 
 from os.path import exists, join
 from pathlib import Path
-from string import Template
-from typing import Dict, Union
+from threading import Lock
+from typing import Any, Dict, List, Optional, Set, Union
 
 import rdflib
 
+from esmf_aspect_meta_model_python.cache_files import get_files_key, read_versioned_json, write_json
+
 
 class SammUnitsGraph:
-    """Model units graph."""
+    """Model units graph.
+
+    The units.ttl file is parsed on the first lookup and not on the import of the module. The units and the quantity
+    kinds are indexed by their name, symbol, common code and quantity kind in one pass over the triples, so a lookup
+    does not query the graph.
+
+    With a catalog path, the indexed units are stored in a compact JSON file, which is loaded instead of parsing
+    the units.ttl file as long as the units.ttl file is not changed.
+
+    :param catalog_path: optional path to the precompiled units catalog
+    """
 
     SAMM_VERSION = "2.1.0"
     UNIT_FILE_PATH = f"samm_aspect_meta_model/samm/unit/{SAMM_VERSION}/units.ttl"
-    QUERY_TEMPLATE = Template("SELECT ?key ?value WHERE {$unit ?key ?value .}")
+    catalog_format = "1"
 
-    def __init__(self):
+    def __init__(self, catalog_path: Optional[Union[str, Path]] = None):
         self.unit_file_path = self._get_file_path()
         self._validate_path()
-        self._graph = self._get_units()
+        self.catalog_path = Path(catalog_path) if catalog_path else None
+        self._graph: Optional[rdflib.Graph] = None
+        self._elements: Optional[Dict[str, Dict[str, Any]]] = None
+        self._indexes: Dict[str, Dict[str, List[str]]] = {}
+        self._literals: Dict[str, Dict[str, rdflib.Literal]] = {}
+        self._lock = Lock()
 
     @property
     def graph(self) -> rdflib.Graph:
-        """Getter for the units graph."""
+        """Getter for the units graph, the units.ttl file is parsed on the first access."""
+        if self._graph is None:
+            self._graph = self._get_units()
+
         return self._graph
 
     def _get_file_path(self) -> str:
@@ -53,34 +73,189 @@ class SammUnitsGraph:
 
         return graph
 
-    def _get_nested_data(self, value: str) -> tuple[str, Union[str, Dict]]:
-        """Get data of the nested node."""
-        node_type = value.split("#")[1]
-        node_value: Union[str, Dict] = value
+    @staticmethod
+    def get_name(unit: str) -> str:
+        """Get a name of the unit or quantity kind.
 
-        if node_type != "Unit":
-            node_value = self.get_info(f"unit:{node_type}")
+        :param unit: prefixed name (unit:volt), URN or name of the unit
+        :return: name of the unit
+        """
+        if "#" in unit:
+            return unit.split("#")[1]
 
-        return node_type, node_value
+        return unit[5:] if unit.startswith("unit:") else unit
 
-    def get_info(self, unit: str) -> Dict:
-        """Get a description of the unit."""
-        unit_data: Dict = {}
-        query = self.QUERY_TEMPLATE.substitute(unit=unit)
-        res = self._graph.query(query)
-
-        for row in res:
-            key = row.key.split("#")[1]
-            value = row.value
-            if isinstance(value, rdflib.term.URIRef):
-                sub_key, value = self._get_nested_data(value)
-                if key != "type":
-                    unit_data.setdefault(key, []).append({sub_key: value})
+    def _get_key(self) -> str:
+        """Get a key of the units.ttl file for the catalog."""
+        return get_files_key(f"{self.catalog_format}:{self.SAMM_VERSION}", [self.unit_file_path])
+
+    def _get_elements(self) -> Dict[str, Dict[str, Any]]:
+        """Get the units and the quantity kinds from the graph.
+
+        Every element has its type name, the literals encoded as [value, datatype, language] and the names
+        of the referenced elements.
+
+        :return: dictionary of the elements by their name
+        """
+        elements: Dict[str, Dict[str, Any]] = {}
+
+        for subject, predicate, value in self.graph:
+            element = elements.setdefault(self.get_name(str(subject)), {"type": None, "literals": {}, "references": {}})
+            key = self.get_name(str(predicate))
+
+            if isinstance(value, rdflib.Literal):
+                datatype = str(value.datatype) if value.datatype else None
+                element["literals"][key] = [str(value), datatype, value.language]
+            elif key == "type":
+                element["type"] = self.get_name(str(value))
             else:
-                unit_data[key] = value
+                element["references"].setdefault(key, []).append(self.get_name(str(value)))
+
+        for element in elements.values():
+            for references in element["references"].values():
+                references.sort()
+
+        return elements
+
+    def _read_catalog(self) -> Optional[Dict[str, Dict[str, Any]]]:
+        """Read the elements from the catalog file.
+
+        :return: elements or None if there is no valid catalog for the current units.ttl file
+        """
+        catalog = read_versioned_json(self.catalog_path, self.catalog_format, self._get_key())  # type: ignore
+
+        return catalog["elements"] if catalog else None
+
+    def _write_catalog(self, elements: Dict[str, Dict[str, Any]]):
+        """Write the elements to the catalog file atomically.
+
+        :param elements: elements of the units graph
+        """
+        self.catalog_path.parent.mkdir(parents=True, exist_ok=True)  # type: ignore
+        write_json(
+            self.catalog_path,  # type: ignore
+            {"format": self.catalog_format, "key": self._get_key(), "elements": elements},
+        )
+
+    def _build_indexes(self, elements: Dict[str, Dict[str, Any]]):
+        """Index the units by their symbol, common code and quantity kind.
+
+        :param elements: elements of the units graph
+        """
+        indexes: Dict[str, Dict[str, List[str]]] = {"symbol": {}, "commonCode": {}, "quantityKind": {}}
+
+        for name, element in sorted(elements.items()):
+            if element["type"] != "Unit":
+                continue
+
+            for key in ("symbol", "commonCode"):
+                if key in element["literals"]:
+                    indexes[key].setdefault(element["literals"][key][0], []).append(f"unit:{name}")
+
+            for quantity_kind in element["references"].get("quantityKind", []):
+                indexes["quantityKind"].setdefault(quantity_kind, []).append(f"unit:{name}")
+
+        self._indexes = indexes
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        """Load the indexed units from the catalog or from the units.ttl file on the first lookup.
+
+        :return: elements of the units graph
+        """
+        with self._lock:
+            if self._elements is None:
+                elements = self._read_catalog() if self.catalog_path else None
+
+                if elements is None:
+                    elements = self._get_elements()
+                    if self.catalog_path:
+                        self._write_catalog(elements)
+
+                self._build_indexes(elements)
+                self._elements = elements
+
+        return self._elements
+
+    def _get_nested_data(self, name: str, parents: Set[str]) -> Union[str, Dict]:
+        """Get data of the nested node.
+
+        :param name: name of the referenced element
+        :param parents: names of the elements which are already being described, to stop on cyclic references
+        :return: description of the referenced element or its prefixed name
+        """
+        if name in parents:
+            return f"unit:{name}"
+
+        return self._get_info(name, parents)
+
+    def _get_literals(self, name: str, element: Dict[str, Any]) -> Dict[str, rdflib.Literal]:
+        """Get the decoded literals of the element, the literals are decoded once and shared by all lookups."""
+        literals = self._literals.get(name)
+
+        if literals is None:
+            literals = {
+                key: rdflib.Literal(value, datatype=datatype, lang=language)
+                for key, (value, datatype, language) in element["literals"].items()
+            }
+            self._literals[name] = literals
+
+        return literals
+
+    def _get_info(self, name: str, parents: Set[str]) -> Dict:
+        """Get a description of the element by its name."""
+        element = self._load().get(name)
+        if element is None:
+            return {}
+
+        unit_data: Dict = {}
+        parents = parents | {name}
+
+        for key, references in element["references"].items():
+            unit_data[key] = [{reference: self._get_nested_data(reference, parents)} for reference in references]
+
+        unit_data.update(self._get_literals(name, element))
 
         return unit_data
 
+    def get_info(self, unit: str) -> Dict:
+        """Get a description of the unit.
+
+        :param unit: prefixed name (unit:volt), URN or name of the unit or quantity kind
+        :return: properties of the unit with the descriptions of the referenced quantity kinds and units,
+            an empty dictionary for an unknown unit
+        """
+        return self._get_info(self.get_name(unit), set())
+
+    def _find(self, index: str, value: str) -> List[str]:
+        """Find the units in the index."""
+        self._load()
+
+        return list(self._indexes[index].get(value, []))
+
+    def get_units_by_symbol(self, symbol: str) -> List[str]:
+        """Get the units with the symbol.
+
+        :param symbol: symbol of the unit, e.g. "V"
+        :return: prefixed names of the units
+        """
+        return self._find("symbol", symbol)
+
+    def get_units_by_common_code(self, common_code: str) -> List[str]:
+        """Get the units with the common code.
+
+        :param common_code: common code of the unit, e.g. "VLT"
+        :return: prefixed names of the units
+        """
+        return self._find("commonCode", common_code)
+
+    def get_units_by_quantity_kind(self, quantity_kind: str) -> List[str]:
+        """Get the units of the quantity kind.
+
+        :param quantity_kind: prefixed name, URN or name of the quantity kind, e.g. "unit:voltage"
+        :return: prefixed names of the units
+        """
+        return self._find("quantityKind", self.get_name(quantity_kind))
+
     def print_info(self, unit_data: Dict, tabs: int = 0):
         """Pretty print a unit data."""
         for key, value in unit_data.items():
@@ -91,8 +266,11 @@ class SammUnitsGraph:
                 print("\t" * tabs + f"{key}:")
                 for node in value:
                     for key, sub_value in node.items():
-                        print("\t" * (tabs + 1) + f"{key}:")
-                        self.print_info(sub_value, tabs + 2)
+                        if isinstance(sub_value, dict):
+                            print("\t" * (tabs + 1) + f"{key}:")
+                            self.print_info(sub_value, tabs + 2)
+                        else:
+                            print("\t" * (tabs + 1) + f"{key}: {sub_value}")
             else:
                 print("\t" * tabs + f"{key}: {value}")
 
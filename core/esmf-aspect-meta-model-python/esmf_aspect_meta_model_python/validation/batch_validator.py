@@ -0,0 +1,387 @@
+#  Copyright (c) 2024 Robert Bosch Manufacturing Solutions GmbH
+#
+#  See the AUTHORS file(s) distributed with this work for additional
+#  information regarding authorship.
+#
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+#
+#   SPDX-License-Identifier: MPL-2.0
+
+
+import json
+
+from itertools import islice, repeat
+from operator import attrgetter
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+from esmf_aspect_meta_model_python.base.aspect import Aspect
+from esmf_aspect_meta_model_python.base.characteristics.characteristic import Characteristic
+from esmf_aspect_meta_model_python.base.characteristics.collection.collection import Collection
+from esmf_aspect_meta_model_python.base.characteristics.enumeration import Enumeration
+from esmf_aspect_meta_model_python.base.characteristics.structured_value import StructuredValue
+from esmf_aspect_meta_model_python.base.characteristics.trait import Trait
+from esmf_aspect_meta_model_python.base.data_types.complex_type import ComplexType
+from esmf_aspect_meta_model_python.base.data_types.scalar import Scalar
+from esmf_aspect_meta_model_python.base.either import Either
+from esmf_aspect_meta_model_python.base.property import Property
+from esmf_aspect_meta_model_python.loader.access_path_index import AccessPath, AccessPathIndex
+from esmf_aspect_meta_model_python.validation.payload_validator import (
+    NodeCheck,
+    PayloadValidatorCompiler,
+    PayloadViolation,
+)
+from esmf_aspect_meta_model_python.validation.value_checks import (
+    ValueCheck,
+    get_constraint_check,
+    get_enumeration_check,
+    get_scalar_check,
+)
+
+ABSENT = object()
+"""Value of a column in a row without the parent object, it is neither checked nor reported."""
+
+INVALID_JSON = object()
+"""Row of a JSON lines file which could not be parsed."""
+
+
+def get_scalar_value_checks(characteristic: Optional[Characteristic]) -> Optional[List[ValueCheck]]:
+    """Get the checks of a scalar value of the characteristic.
+
+    The checks are ordered as in the payload validator: the data type, the enumeration values or the deconstruction
+    rule and the constraints of the Traits from the innermost to the outermost one.
+
+    :param characteristic: characteristic of a property
+    :return: list of the value checks or None if the value of the characteristic is not a scalar
+    """
+    traits: List[Trait] = []
+    while isinstance(characteristic, Trait):
+        traits.append(characteristic)
+        characteristic = characteristic.base_characteristic
+
+    if characteristic is None or isinstance(characteristic, (Either, Collection)):
+        return None
+
+    data_type = characteristic.data_type
+    if not isinstance(data_type, Scalar):
+        return None
+
+    checks = [get_scalar_check(data_type.urn) if data_type.urn else None]
+    if isinstance(characteristic, Enumeration):
+        checks.append(get_enumeration_check(characteristic.values))
+    if isinstance(characteristic, StructuredValue):
+        checks.append(PayloadValidatorCompiler.get_deconstruction_check(characteristic.deconstruction_rule))
+    for trait in reversed(traits):
+        checks.extend(get_constraint_check(constraint) for constraint in trait.constraints)
+
+    return [check for check in checks if check is not None]
+
+
+class PayloadColumn:
+    """Column of the values of one property in a batch of payloads.
+
+    A column of a scalar property has the value checks, a column of an Entity has the columns of the Entity
+    properties. Other values (collections, Either, recursive Entities) are checked row by row with the node check.
+
+    :param key: payload key of the property
+    :param path: access path of the property
+    :param is_optional: True if the property may be missing in the payload
+    """
+
+    def __init__(self, key: str, path: AccessPath, is_optional: bool):
+        self.key = key
+        self.path = path
+        self.is_optional = is_optional
+        self.value_checks: List[ValueCheck] = []
+        self.children: Optional[List["PayloadColumn"]] = None
+        self.node_check: Optional[NodeCheck] = None
+
+
+class BatchValidatorCompiler:
+    """Compiler of the Aspect model to the columns of the batch validator."""
+
+    def __init__(self) -> None:
+        self._node_compiler = PayloadValidatorCompiler()
+
+    def compile_columns(
+        self,
+        properties: List[Property],
+        path: AccessPath = (),
+        entities: Tuple[int, ...] = (),
+    ) -> List[PayloadColumn]:
+        """Compile the columns of the properties.
+
+        :param properties: properties of an Aspect or an Entity
+        :param path: access path of the object with the properties
+        :param entities: ids of the Entities on the path, a recursive Entity is checked row by row
+        :return: list of the columns
+        """
+        columns = []
+        for prop in properties:
+            if isinstance(prop, Property) and not prop.is_abstract and not prop.is_not_in_payload:
+                key = AccessPathIndex.get_payload_key(prop)
+                column = PayloadColumn(key, path + (key,), prop.is_optional)
+                self._compile_values(column, prop.characteristic, entities)
+                columns.append(column)
+
+        return columns
+
+    def _compile_values(self, column: PayloadColumn, characteristic: Optional[Characteristic], entities: Tuple) -> None:
+        """Compile the checks of the column values."""
+        value_checks = get_scalar_value_checks(characteristic)
+        if value_checks is not None:
+            column.value_checks = value_checks
+            return
+
+        data_type = getattr(characteristic, "data_type", None)
+        if (
+            isinstance(data_type, ComplexType)
+            and not isinstance(characteristic, (Trait, Either, Collection))
+            and id(data_type) not in entities
+        ):
+            column.children = self.compile_columns(data_type.all_properties, column.path, entities + (id(data_type),))
+        else:
+            column.node_check = self._node_compiler.compile_characteristic(characteristic)
+
+
+class BatchPayloadValidator:
+    """Validator of large batches of the JSON payloads of an Aspect.
+
+    The payloads are flattened into columns, one per property. The values of an Entity column are the objects
+    the columns of the Entity properties are taken from. The checks of a scalar column (data type, range, length,
+    regular expression, enumeration, etc.) run once for every distinct value of the column, so repeated values
+    of a stream cost a dictionary lookup. The batch is processed in chunks to limit the memory used by the columns.
+
+    The violations are the same as of the payload validator, with the row index of the payload.
+
+    :param aspect: loaded Aspect
+    :param batch_size: number of the payloads flattened at once
+    """
+
+    def __init__(self, aspect: Aspect, batch_size: int = 10000):
+        if batch_size < 1:
+            raise ValueError("The batch size must be a positive number")
+
+        self._aspect = aspect
+        self._batch_size = batch_size
+        self._columns = BatchValidatorCompiler().compile_columns(aspect.properties)
+
+    @property
+    def aspect(self) -> Aspect:
+        """Validated Aspect."""
+        return self._aspect
+
+    @property
+    def batch_size(self) -> int:
+        """Number of the payloads flattened at once."""
+        return self._batch_size
+
+    def iter_violations(self, payloads: Iterable[Any]) -> Iterator[PayloadViolation]:
+        """Validate the payloads chunk by chunk.
+
+        :param payloads: parsed JSON payloads of the Aspect
+        :return: generator of the violations ordered by the row index
+        """
+        rows = iter(payloads)
+        offset = 0
+        chunk = list(islice(rows, self._batch_size))
+        while chunk:
+            yield from self.validate_chunk(chunk, offset)
+            offset += len(chunk)
+            chunk = list(islice(rows, self._batch_size))
+
+    def validate(self, payloads: Iterable[Any]) -> List[PayloadViolation]:
+        """Validate the payloads.
+
+        :param payloads: parsed JSON payloads of the Aspect
+        :return: list of the violations ordered by the row index, empty if all payloads are valid
+        """
+        return list(self.iter_violations(payloads))
+
+    def validate_json_lines(self, file_path: Union[str, Path]) -> List[PayloadViolation]:
+        """Validate the payloads of a JSON lines file.
+
+        The row index of a payload is the index of its line, empty lines are skipped.
+
+        :param file_path: path to the file with one JSON payload per line
+        :return: list of the violations ordered by the row index
+        """
+        with open(file_path, encoding="utf-8") as file:
+            return list(self.iter_violations(self._read_json_lines(file)))
+
+    @staticmethod
+    def _read_json_lines(lines: Iterable[str]) -> Iterator[Any]:
+        """Parse the JSON lines, an empty line is absent and a broken line is invalid JSON."""
+        for line in lines:
+            if not line.strip():
+                yield ABSENT
+                continue
+
+            try:
+                yield json.loads(line)
+            except ValueError:
+                yield INVALID_JSON
+
+    def validate_chunk(self, payloads: Sequence[Any], offset: int = 0) -> List[PayloadViolation]:
+        """Validate a chunk of the payloads at once.
+
+        :param payloads: parsed JSON payloads of the Aspect
+        :param offset: row index of the first payload of the chunk
+        :return: list of the violations ordered by the row index
+        """
+        violations: List[PayloadViolation] = []
+        for row, payload in _iter_not_objects(payloads, offset):
+            if payload is INVALID_JSON:
+                violations.append(PayloadViolation((), "invalid JSON", row=row))
+            elif payload is not ABSENT:
+                violations.append(PayloadViolation((), "expected an object", payload, row))
+
+        self._check_columns(self._columns, payloads, offset, violations)
+        violations.sort(key=attrgetter("row"))
+
+        return violations
+
+    def _check_columns(
+        self,
+        columns: List[PayloadColumn],
+        parents: Sequence[Any],
+        offset: int,
+        violations: List[PayloadViolation],
+    ) -> None:
+        """Flatten the columns of the parent objects and check them."""
+        for column in columns:
+            values = self._get_values(parents, column.key)
+
+            if not column.is_optional and None in values:
+                for row, value in enumerate(values, offset):
+                    if value is None:
+                        violations.append(PayloadViolation(column.path, "missing mandatory property", row=row))
+
+            if column.children is not None:
+                self._check_objects(column, values, offset, violations)
+            elif column.node_check is not None:
+                self._check_rows(column, values, offset, violations)
+            elif column.value_checks:
+                self._check_values(column, values, offset, violations)
+
+    @staticmethod
+    def _get_values(parents: Sequence[Any], key: str) -> List[Any]:
+        """Get the column values of the parent objects, the value of a row without an object is absent."""
+        try:
+            return list(map(dict.get, parents, repeat(key)))
+        except TypeError:
+            return [parent.get(key) if isinstance(parent, dict) else ABSENT for parent in parents]
+
+    def _check_objects(
+        self,
+        column: PayloadColumn,
+        values: List[Any],
+        offset: int,
+        violations: List[PayloadViolation],
+    ) -> None:
+        """Check the objects of an Entity column and the columns of the Entity properties."""
+        for row, value in _iter_not_objects(values, offset):
+            if value is not None and value is not ABSENT:
+                violations.append(PayloadViolation(column.path, "expected an object", value, row))
+
+        self._check_columns(column.children or [], values, offset, violations)
+
+    @staticmethod
+    def _check_rows(
+        column: PayloadColumn,
+        values: List[Any],
+        offset: int,
+        violations: List[PayloadViolation],
+    ) -> None:
+        """Check the values of a column row by row with the node check."""
+        node_check = column.node_check
+        if node_check is None:
+            return
+
+        for row, value in enumerate(values, offset):
+            if value is None or value is ABSENT:
+                continue
+
+            row_violations: List[PayloadViolation] = []
+            node_check(value, column.path, row_violations)
+            for violation in row_violations:
+                violation.row = row
+            violations.extend(row_violations)
+
+    def _check_values(
+        self,
+        column: PayloadColumn,
+        values: List[Any],
+        offset: int,
+        violations: List[PayloadViolation],
+    ) -> None:
+        """Check the distinct values of a scalar column once.
+
+        The values are distinguished by their type as well, because e.g. True, 1 and 1.0 are equal in Python
+        but not in JSON. Only the rows with the invalid values are visited, a column without unhashable values
+        and violations is checked without a loop over the rows.
+        """
+        keys = list(zip(map(type, values), values))
+        try:
+            distinct_keys = set(keys)
+        except TypeError:
+            self._check_each_value(column, values, offset, violations)
+            return
+
+        invalid: Dict[Tuple[type, Any], List[str]] = {}
+        for value_key in distinct_keys:
+            if value_key[1] is not None and value_key[1] is not ABSENT:
+                messages = _get_messages(column.value_checks, value_key[1])
+                if messages:
+                    invalid[value_key] = messages
+
+        if invalid:
+            for row, value_key in enumerate(keys, offset):
+                for message in invalid.get(value_key, ()):
+                    violations.append(PayloadViolation(column.path, message, value_key[1], row))
+
+    @staticmethod
+    def _check_each_value(
+        column: PayloadColumn,
+        values: List[Any],
+        offset: int,
+        violations: List[PayloadViolation],
+    ) -> None:
+        """Check the values of a scalar column with unhashable values one by one."""
+        for row, value in enumerate(values, offset):
+            if value is not None and value is not ABSENT:
+                for message in _get_messages(column.value_checks, value):
+                    violations.append(PayloadViolation(column.path, message, value, row))
+
+
+def _iter_not_objects(values: Sequence[Any], offset: int) -> Iterator[Tuple[int, Any]]:
+    """Iterate over the rows with the values which are not JSON objects, a column of objects is not iterated."""
+    if set(map(type, values)) <= {dict}:
+        return
+
+    for row, value in enumerate(values, offset):
+        if not isinstance(value, dict):
+            yield row, value
+
+
+def _get_messages(value_checks: List[ValueCheck], value: Any) -> List[str]:
+    """Get the messages of all violated checks of the value."""
+    messages = []
+    for value_check in value_checks:
+        message = value_check(value)
+        if message is not None:
+            messages.append(message)
+
+    return messages
+
+
+def compile_batch_validator(aspect: Aspect, batch_size: int = 10000) -> BatchPayloadValidator:
+    """Compile a validator of large batches of the JSON payloads of the Aspect.
+
+    :param aspect: loaded Aspect
+    :param batch_size: number of the payloads flattened at once
+    :return: batch payload validator
+    """
+    return BatchPayloadValidator(aspect, batch_size)
@@ -0,0 +1,331 @@
+#  Copyright (c) 2024 Robert Bosch Manufacturing Solutions GmbH
+#
+#  See the AUTHORS file(s) distributed with this work for additional
+#  information regarding authorship.
+#
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+#
+#   SPDX-License-Identifier: MPL-2.0
+
+
+import re
+
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from esmf_aspect_meta_model_python.base.aspect import Aspect
+from esmf_aspect_meta_model_python.base.characteristics.characteristic import Characteristic
+from esmf_aspect_meta_model_python.base.characteristics.collection.collection import Collection
+from esmf_aspect_meta_model_python.base.characteristics.collection.set import Set
+from esmf_aspect_meta_model_python.base.characteristics.collection.sorted_set import SortedSet
+from esmf_aspect_meta_model_python.base.characteristics.enumeration import Enumeration
+from esmf_aspect_meta_model_python.base.characteristics.structured_value import StructuredValue
+from esmf_aspect_meta_model_python.base.characteristics.trait import Trait
+from esmf_aspect_meta_model_python.base.contraints.length_constraint import LengthConstraint
+from esmf_aspect_meta_model_python.base.data_types.complex_type import ComplexType
+from esmf_aspect_meta_model_python.base.data_types.data_type import DataType
+from esmf_aspect_meta_model_python.base.data_types.scalar import Scalar
+from esmf_aspect_meta_model_python.base.either import Either
+from esmf_aspect_meta_model_python.base.property import Property
+from esmf_aspect_meta_model_python.loader.access_path_index import AccessPath, AccessPathIndex
+from esmf_aspect_meta_model_python.validation.value_checks import (
+    ValueCheck,
+    get_constraint_check,
+    get_enumeration_check,
+    get_scalar_check,
+)
+
+
+class PayloadViolation:
+    """Violation of the Aspect model found in a JSON payload.
+
+    :param path: access path of the invalid value, list items are addressed by their index
+    :param message: description of the violation
+    :param value: invalid value
+    :param row: index of the payload in a batch, None for a single payload
+    """
+
+    def __init__(self, path: Sequence[str], message: str, value: Any = None, row: Optional[int] = None):
+        self.path = list(path)
+        self.message = message
+        self.value = value
+        self.row = row
+
+    def __repr__(self) -> str:
+        row = f", row={self.row}" if self.row is not None else ""
+
+        return f"PayloadViolation({'.'.join(self.path)!r}, {self.message!r}{row})"
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, PayloadViolation):
+            return NotImplemented
+
+        return (self.row, self.path, self.message, self.value) == (other.row, other.path, other.message, other.value)
+
+
+NodeCheck = Callable[[Any, AccessPath, List[PayloadViolation]], None]
+"""Check of a JSON value and all its nested values, adds the found violations to the list."""
+
+
+def _skip(value: Any, path: AccessPath, violations: List[PayloadViolation]) -> None:
+    """Check of a value without restrictions."""
+
+
+def _get_node_check(value_check: ValueCheck) -> NodeCheck:
+    """Get a node check which reports the violation of the value check."""
+
+    def check(value: Any, path: AccessPath, violations: List[PayloadViolation]) -> None:
+        message = value_check(value)
+        if message is not None:
+            violations.append(PayloadViolation(path, message, value))
+
+    return check
+
+
+def _get_all_check(checks: List[NodeCheck]) -> NodeCheck:
+    """Get a node check which runs all the checks."""
+    if not checks:
+        return _skip
+    if len(checks) == 1:
+        return checks[0]
+
+    def check(value: Any, path: AccessPath, violations: List[PayloadViolation]) -> None:
+        for node_check in checks:
+            node_check(value, path, violations)
+
+    return check
+
+
+class PayloadValidatorCompiler:
+    """Compiler of the Aspect model to a tree of the node checks.
+
+    Every check is a closure with the pre-bound data of the model element: the properties of Entities,
+    the checks of the data types and constraints, the compiled regular expressions and the enumeration values.
+    An Entity is compiled once, so recursive Entities are supported.
+    """
+
+    def __init__(self) -> None:
+        self._complex_type_checks: Dict[int, NodeCheck] = {}
+
+    def compile_properties(self, properties: List[Property]) -> NodeCheck:
+        """Compile the check of a JSON object with the properties.
+
+        :param properties: properties of an Aspect or an Entity
+        :return: node check
+        """
+        entries: List[Tuple[str, bool, NodeCheck]] = []
+        for prop in properties:
+            if isinstance(prop, Property) and not prop.is_abstract and not prop.is_not_in_payload:
+                key = AccessPathIndex.get_payload_key(prop)
+                entries.append((key, prop.is_optional, self.compile_characteristic(prop.characteristic)))
+
+        def check(value: Any, path: AccessPath, violations: List[PayloadViolation]) -> None:
+            if not isinstance(value, dict):
+                violations.append(PayloadViolation(path, "expected an object", value))
+                return
+
+            for key, optional, value_check in entries:
+                item = value.get(key)
+                if item is not None:
+                    value_check(item, path + (key,), violations)
+                elif not optional:
+                    violations.append(PayloadViolation(path + (key,), "missing mandatory property"))
+
+        return check
+
+    def compile_data_type(self, data_type: Optional[DataType]) -> NodeCheck:
+        """Compile the check of a value of the data type.
+
+        :param data_type: scalar data type or Entity
+        :return: node check
+        """
+        if isinstance(data_type, ComplexType):
+            return self._compile_complex_type(data_type)
+
+        if isinstance(data_type, Scalar) and data_type.urn:
+            value_check = get_scalar_check(data_type.urn)
+            if value_check is not None:
+                return _get_node_check(value_check)
+
+        return _skip
+
+    def _compile_complex_type(self, complex_type: ComplexType) -> NodeCheck:
+        """Compile the check of an Entity once, a recursive Entity uses the check which is being compiled."""
+        key = id(complex_type)
+        if key not in self._complex_type_checks:
+            compiled: List[NodeCheck] = []
+            self._complex_type_checks[key] = lambda value, path, violations: compiled[0](value, path, violations)
+            compiled.append(self.compile_properties(complex_type.all_properties))
+            self._complex_type_checks[key] = compiled[0]
+
+        return self._complex_type_checks[key]
+
+    def compile_characteristic(self, characteristic: Optional[Characteristic]) -> NodeCheck:
+        """Compile the check of a value of the characteristic.
+
+        :param characteristic: characteristic of a property
+        :return: node check
+        """
+        if characteristic is None:
+            return _skip
+
+        if isinstance(characteristic, Trait):
+            return self._compile_trait(characteristic)
+
+        if isinstance(characteristic, Either):
+            return self._compile_either(characteristic)
+
+        if isinstance(characteristic, Collection):
+            return self._compile_collection(characteristic)
+
+        checks = [self.compile_data_type(characteristic.data_type)]
+        if isinstance(characteristic, Enumeration):
+            value_check = get_enumeration_check(characteristic.values)
+            if value_check is not None:
+                checks.append(_get_node_check(value_check))
+
+        if isinstance(characteristic, StructuredValue):
+            checks.append(_get_node_check(self.get_deconstruction_check(characteristic.deconstruction_rule)))
+
+        return _get_all_check(checks)
+
+    def _compile_trait(self, trait: Trait) -> NodeCheck:
+        """Compile the check of a Trait: the base characteristic and the constraints.
+
+        The length constraint of a collection limits the number of its items, other constraints of a collection
+        are checked for each item.
+        """
+        base_characteristic = trait.base_characteristic
+        is_collection = isinstance(base_characteristic, Collection)
+        checks: List[NodeCheck] = []
+        item_checks: List[NodeCheck] = []
+        for constraint in trait.constraints:
+            value_check = get_constraint_check(constraint)
+            if value_check is None:
+                continue
+
+            if is_collection and not isinstance(constraint, LengthConstraint):
+                item_checks.append(_get_node_check(value_check))
+            else:
+                checks.append(_get_node_check(value_check))
+
+        if isinstance(base_characteristic, Collection):
+            checks.insert(0, self._compile_collection(base_characteristic, item_checks))
+        else:
+            checks.insert(0, self.compile_characteristic(base_characteristic))
+
+        return _get_all_check(checks)
+
+    @staticmethod
+    def get_deconstruction_check(deconstruction_rule: str) -> ValueCheck:
+        """Get a check of the structured value, it has to match the deconstruction rule completely.
+
+        :param deconstruction_rule: regular expression of the structured value
+        :return: value check
+        """
+        pattern = re.compile(deconstruction_rule)
+        message = f"value does not match the deconstruction rule {deconstruction_rule}"
+
+        return lambda value: message if isinstance(value, str) and pattern.fullmatch(value) is None else None
+
+    def _compile_either(self, characteristic: Either) -> NodeCheck:
+        """Compile the check of an Either value: an object with either the left or the right value."""
+        left_check = self.compile_characteristic(characteristic.left)
+        right_check = self.compile_characteristic(characteristic.right)
+
+        def check(value: Any, path: AccessPath, violations: List[PayloadViolation]) -> None:
+            if not isinstance(value, dict) or ("left" in value) == ("right" in value):
+                violations.append(PayloadViolation(path, "expected an object with either left or right", value))
+            elif "left" in value:
+                left_check(value["left"], path + ("left",), violations)
+            else:
+                right_check(value["right"], path + ("right",), violations)
+
+        return check
+
+    def _compile_collection(self, characteristic: Collection, item_checks: Sequence[NodeCheck] = ()) -> NodeCheck:
+        """Compile the check of a collection: a list of the values of the element characteristic or data type.
+
+        :param characteristic: collection characteristic
+        :param item_checks: additional checks of each item, e.g. the constraints of a Trait
+        :return: node check
+        """
+        if characteristic.element_characteristic is not None:
+            element_check = self.compile_characteristic(characteristic.element_characteristic)
+        else:
+            element_check = self.compile_data_type(characteristic.data_type)
+        item_check = _get_all_check([element_check, *item_checks])
+        unique = isinstance(characteristic, (Set, SortedSet))
+
+        def check(value: Any, path: AccessPath, violations: List[PayloadViolation]) -> None:
+            if not isinstance(value, list):
+                violations.append(PayloadViolation(path, "expected a list", value))
+                return
+
+            for index, item in enumerate(value):
+                item_check(item, path + (str(index),), violations)
+
+            if unique and not _has_unique_items(value):
+                violations.append(PayloadViolation(path, "expected unique values", value))
+
+        return check
+
+
+def _has_unique_items(items: List[Any]) -> bool:
+    """Check whether the list has no duplicate values."""
+    try:
+        return len(set(items)) == len(items)
+    except TypeError:
+        return all(item not in items[:index] for index, item in enumerate(items))
+
+
+class PayloadValidator:
+    """Validator of the JSON payloads of an Aspect.
+
+    The Aspect is compiled once to a tree of closures, a payload is validated in a single pass over its values.
+    The mandatory properties, the JSON types of the scalar data types, the Entities, collections, Either,
+    enumeration values, structured values and the range, length, regular expression, encoding, language and
+    fixed point constraints are checked.
+
+    :param aspect: loaded Aspect
+    """
+
+    def __init__(self, aspect: Aspect):
+        self._aspect = aspect
+        self._check = PayloadValidatorCompiler().compile_properties(aspect.properties)
+
+    @property
+    def aspect(self) -> Aspect:
+        """Validated Aspect."""
+        return self._aspect
+
+    def validate(self, payload: Any) -> List[PayloadViolation]:
+        """Validate a JSON payload.
+
+        :param payload: parsed JSON payload of the Aspect
+        :return: list of the violations, empty if the payload is valid
+        """
+        violations: List[PayloadViolation] = []
+        self._check(payload, (), violations)
+
+        return violations
+
+    def is_valid(self, payload: Any) -> bool:
+        """Check whether the JSON payload is valid.
+
+        :param payload: parsed JSON payload of the Aspect
+        :return: True if the payload has no violations
+        """
+        return not self.validate(payload)
+
+    __call__ = validate
+
+
+def compile_validator(aspect: Aspect) -> PayloadValidator:
+    """Compile a validator of the JSON payloads of the Aspect.
+
+    :param aspect: loaded Aspect
+    :return: payload validator
+    """
+    return PayloadValidator(aspect)
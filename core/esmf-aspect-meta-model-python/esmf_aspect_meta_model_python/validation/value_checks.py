@@ -0,0 +1,386 @@
+#  Copyright (c) 2024 Robert Bosch Manufacturing Solutions GmbH
+#
+#  See the AUTHORS file(s) distributed with this work for additional
+#  information regarding authorship.
+#
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+#
+#   SPDX-License-Identifier: MPL-2.0
+
+
+import re
+
+from datetime import date, datetime, time
+from decimal import Decimal, InvalidOperation
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from esmf_aspect_meta_model_python.base.bound_definition import BoundDefinition
+from esmf_aspect_meta_model_python.base.contraints.constraint import Constraint
+from esmf_aspect_meta_model_python.base.contraints.encoding_constraint import EncodingConstraint
+from esmf_aspect_meta_model_python.base.contraints.fixed_point_constraint import FixedPointConstraint
+from esmf_aspect_meta_model_python.base.contraints.language_constraint import LanguageConstraint
+from esmf_aspect_meta_model_python.base.contraints.length_constraint import LengthConstraint
+from esmf_aspect_meta_model_python.base.contraints.range_constraint import RangeConstraint
+from esmf_aspect_meta_model_python.base.contraints.regular_expression_constraint import RegularExpressionConstraint
+
+ValueCheck = Callable[[Any], Optional[str]]
+"""Check of one JSON value, returns the violation message or None if the value is valid."""
+
+STRING_TYPES = frozenset(
+    (
+        "string",
+        "anyURI",
+        "hexBinary",
+        "base64Binary",
+        "date",
+        "time",
+        "dateTime",
+        "dateTimeStamp",
+        "gYear",
+        "gMonth",
+        "gDay",
+        "gYearMonth",
+        "gMonthDay",
+        "duration",
+        "dayTimeDuration",
+        "yearMonthDuration",
+        "curie",
+    )
+)
+NUMBER_TYPES = frozenset(("decimal", "float", "double"))
+INTEGER_RANGES: Dict[str, Tuple[Optional[int], Optional[int]]] = {
+    "integer": (None, None),
+    "long": (-(2**63), 2**63 - 1),
+    "int": (-(2**31), 2**31 - 1),
+    "short": (-(2**15), 2**15 - 1),
+    "byte": (-(2**7), 2**7 - 1),
+    "unsignedLong": (0, 2**64 - 1),
+    "unsignedInt": (0, 2**32 - 1),
+    "unsignedShort": (0, 2**16 - 1),
+    "unsignedByte": (0, 2**8 - 1),
+    "positiveInteger": (1, None),
+    "nonNegativeInteger": (0, None),
+    "negativeInteger": (None, -1),
+    "nonPositiveInteger": (None, 0),
+}
+ENCODINGS = {
+    "US-ASCII": "ascii",
+    "ISO-8859-1": "latin-1",
+    "UTF-8": "utf-8",
+    "UTF-16": "utf-16",
+    "UTF-16BE": "utf-16-be",
+    "UTF-16LE": "utf-16-le",
+}
+
+
+def get_type_name(data_type_urn: str) -> str:
+    """Get the local name of the data type, e.g. int for http://www.w3.org/2001/XMLSchema#int.
+
+    :param data_type_urn: URN of the scalar data type
+    :return: name of the data type
+    """
+    return data_type_urn.rsplit("#", 1)[-1]
+
+
+def is_integer(value: Any) -> bool:
+    """Check whether the JSON value is an integer number."""
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def is_number(value: Any) -> bool:
+    """Check whether the JSON value is a number."""
+    return isinstance(value, (int, float, Decimal)) and not isinstance(value, bool)
+
+
+def get_scalar_check(data_type_urn: str) -> Optional[ValueCheck]:
+    """Get a check of the JSON value of the scalar data type.
+
+    :param data_type_urn: URN of the scalar data type
+    :return: value check or None if the data type is not checked
+    """
+    type_name = get_type_name(data_type_urn)
+
+    if type_name in STRING_TYPES:
+        message = f"expected a string ({type_name})"
+        return lambda value: None if isinstance(value, str) else message
+
+    if type_name == "boolean":
+        return lambda value: None if isinstance(value, bool) else "expected a boolean"
+
+    if type_name in NUMBER_TYPES:
+        message = f"expected a number ({type_name})"
+        return lambda value: None if is_number(value) else message
+
+    if type_name == "langString":
+        return _check_lang_string
+
+    if type_name in INTEGER_RANGES:
+        return _get_integer_check(type_name, *INTEGER_RANGES[type_name])
+
+    return None
+
+
+def _check_lang_string(value: Any) -> Optional[str]:
+    """Check the JSON value of a language string: an object with the language codes and the texts."""
+    if not isinstance(value, dict) or not all(isinstance(text, str) for text in value.values()):
+        return "expected an object with texts by language"
+
+    return None
+
+
+def _get_integer_check(type_name: str, min_value: Optional[int], max_value: Optional[int]) -> ValueCheck:
+    """Get a check of the integer value and the range of its data type."""
+    type_message = f"expected an integer ({type_name})"
+    range_message = f"value is out of the range of {type_name}"
+
+    def check(value: Any) -> Optional[str]:
+        if not is_integer(value):
+            return type_message
+        if (min_value is not None and value < min_value) or (max_value is not None and value > max_value):
+            return range_message
+        return None
+
+    return check
+
+
+def to_comparable(value: Any, bound: Any) -> Any:
+    """Convert the JSON value to the type of the range bound.
+
+    Dates and times are written as ISO strings in the payload and are parsed to be compared with the bound.
+    The UTC designator Z is replaced by +00:00, which fromisoformat accepts before Python 3.11 as well.
+
+    :param value: JSON value
+    :param bound: bound of the range
+    :return: value to compare with the bound
+    """
+    if isinstance(value, str) and isinstance(bound, (datetime, date, time)):
+        if value.endswith("Z"):
+            value = value[:-1] + "+00:00"
+        return type(bound).fromisoformat(value)
+
+    return value
+
+
+def get_range_check(constraint: RangeConstraint) -> Optional[ValueCheck]:
+    """Get a check of the range constraint.
+
+    :param constraint: range constraint
+    :return: value check or None if both bounds are open
+    """
+    lower = constraint.min_value if constraint.lower_bound_definition != BoundDefinition.OPEN else None
+    upper = constraint.max_value if constraint.upper_bound_definition != BoundDefinition.OPEN else None
+    lower_exclusive = constraint.lower_bound_definition == BoundDefinition.GREATER_THAN
+    upper_exclusive = constraint.upper_bound_definition == BoundDefinition.LESS_THAN
+    if lower is None and upper is None:
+        return None
+
+    lower_message = f"value must be {'greater than' if lower_exclusive else 'at least'} {lower}"
+    upper_message = f"value must be {'less than' if upper_exclusive else 'at most'} {upper}"
+    bound = lower if lower is not None else upper
+
+    def check(value: Any) -> Optional[str]:
+        try:
+            comparable = to_comparable(value, bound)
+            if lower is not None and (comparable <= lower if lower_exclusive else comparable < lower):
+                return lower_message
+            if upper is not None and (comparable >= upper if upper_exclusive else comparable > upper):
+                return upper_message
+        except (TypeError, ValueError):
+            return f"value can not be compared with {bound}"
+
+        return None
+
+    return check
+
+
+def get_length_check(constraint: LengthConstraint) -> Optional[ValueCheck]:
+    """Get a check of the length constraint of a string or a collection.
+
+    :param constraint: length constraint
+    :return: value check or None if the length is not limited
+    """
+    min_length = constraint.min_value
+    max_length = constraint.max_value
+    if min_length is None and max_length is None:
+        return None
+
+    def check(value: Any) -> Optional[str]:
+        if not isinstance(value, (str, list, dict)):
+            return None
+        if min_length is not None and len(value) < min_length:
+            return f"length must be at least {min_length}"
+        if max_length is not None and len(value) > max_length:
+            return f"length must be at most {max_length}"
+        return None
+
+    return check
+
+
+def get_regular_expression_check(constraint: RegularExpressionConstraint) -> ValueCheck:
+    """Get a check of the regular expression constraint.
+
+    The pattern is compiled once. As in XPath fn:matches, the pattern has to match a part of the value,
+    a complete match is required with ^ and $ in the pattern.
+
+    :param constraint: regular expression constraint
+    :return: value check
+    """
+    pattern = re.compile(constraint.value)
+    message = f"value does not match the pattern {constraint.value}"
+
+    def check(value: Any) -> Optional[str]:
+        if isinstance(value, str) and pattern.search(value) is None:
+            return message
+        return None
+
+    return check
+
+
+def get_encoding_check(constraint: EncodingConstraint) -> Optional[ValueCheck]:
+    """Get a check of the encoding constraint.
+
+    :param constraint: encoding constraint
+    :return: value check or None if the encoding is unknown
+    """
+    encoding = ENCODINGS.get(constraint.value.rsplit("#", 1)[-1])
+    if encoding is None:
+        return None
+
+    message = f"value can not be encoded in {constraint.value}"
+
+    def check(value: Any) -> Optional[str]:
+        try:
+            if isinstance(value, str):
+                value.encode(encoding)
+        except UnicodeEncodeError:
+            return message
+        return None
+
+    return check
+
+
+def get_language_check(constraint: LanguageConstraint) -> ValueCheck:
+    """Get a check of the language constraint of a language string.
+
+    :param constraint: language constraint
+    :return: value check
+    """
+    language_code = constraint.language_code
+    message = f"language must be {language_code}"
+
+    def check(value: Any) -> Optional[str]:
+        if isinstance(value, dict) and any(language != language_code for language in value):
+            return message
+        return None
+
+    return check
+
+
+def get_fixed_point_check(constraint: FixedPointConstraint) -> ValueCheck:
+    """Get a check of the fixed point constraint of a decimal value.
+
+    :param constraint: fixed point constraint
+    :return: value check
+    """
+    integer_digits = constraint.integer
+    scale = constraint.scale
+    message = f"value must have at most {integer_digits} integer and {scale} fraction digits"
+
+    def check(value: Any) -> Optional[str]:
+        if not is_number(value):
+            return None
+        try:
+            _, digits, exponent = Decimal(str(value)).as_tuple()
+        except InvalidOperation:
+            return message
+        if not isinstance(exponent, int):
+            return message
+        if len(digits) + min(exponent, 0) > integer_digits or -min(exponent, 0) > scale:
+            return message
+        return None
+
+    return check
+
+
+def get_constraint_check(constraint: Constraint) -> Optional[ValueCheck]:
+    """Get a check of the constraint.
+
+    :param constraint: constraint of a Trait
+    :return: value check or None if the constraint is not checked (e.g. a locale constraint)
+    """
+    if isinstance(constraint, RangeConstraint):
+        return get_range_check(constraint)
+    if isinstance(constraint, LengthConstraint):
+        return get_length_check(constraint)
+    if isinstance(constraint, RegularExpressionConstraint):
+        return get_regular_expression_check(constraint)
+    if isinstance(constraint, EncodingConstraint):
+        return get_encoding_check(constraint)
+    if isinstance(constraint, LanguageConstraint):
+        return get_language_check(constraint)
+    if isinstance(constraint, FixedPointConstraint):
+        return get_fixed_point_check(constraint)
+
+    return None
+
+
+def get_json_type(value: Any) -> str:
+    """Get the JSON type of the value.
+
+    Booleans are not numbers in JSON, although True == 1 in Python.
+
+    :param value: JSON value
+    :return: name of the JSON type or of the Python type for other values
+    """
+    if isinstance(value, bool):
+        return "boolean"
+    if isinstance(value, (int, float, Decimal)):
+        return "number"
+    if isinstance(value, str):
+        return "string"
+
+    return type(value).__name__
+
+
+def get_enumeration_values(values: List[Any]) -> frozenset:
+    """Get the allowed JSON values of an enumeration of scalar values.
+
+    Every value is keyed by its JSON type, so a boolean does not match a number. Values of dates and times
+    are allowed in their ISO form as well. Values of Entities are skipped.
+
+    :param values: values of the enumeration
+    :return: set of the allowed values as (JSON type, value) tuples
+    """
+    allowed = set()
+    for value in values:
+        if isinstance(value, dict):
+            continue
+
+        allowed.add((get_json_type(value), value))
+        if isinstance(value, (datetime, date, time)):
+            allowed.add(("string", value.isoformat()))
+
+    return frozenset(allowed)
+
+
+def get_enumeration_check(values: List[Any]) -> Optional[ValueCheck]:
+    """Get a check of the enumeration values.
+
+    :param values: values of the enumeration
+    :return: value check or None for an enumeration of Entities
+    """
+    allowed = get_enumeration_values(values)
+    if not allowed:
+        return None
+
+    message = "value is not one of the enumeration values"
+
+    def check(value: Any) -> Optional[str]:
+        try:
+            return None if (get_json_type(value), value) in allowed else message
+        except TypeError:
+            return message
+
+    return check
@@ -3,9 +3,10 @@
 import csv
 
 from glob import glob
-from os import listdir
+from os import cpu_count, listdir
 from os.path import exists, join
 from pathlib import Path
+from typing import Optional
 
 from esmf_aspect_meta_model_python.loader.aspect_loader import AspectLoader
 from scripts.constants import TestModelConstants
@@ -38,47 +39,38 @@ def get_test_files():
     return test_model_files
 
 
-def load_test_models():
-    """Test for loading Aspect models."""
+def load_test_models(workers: Optional[int] = None):
+    """Test for loading Aspect models.
+
+    :param workers: number of the worker processes, all CPU cores are used by default
+    """
     test_files = get_test_files()
     if not test_files:
         check_resources_folder()
         test_files = get_test_files()
 
     result = []
-    all_test_files = len(test_files)
-    i = 0
-    step = 10
-    print("Loading test Aspect models...")
-
-    for test_file in test_files:
-        i += 1
-        if i % step == 0:
-            print(f"{i}/{all_test_files}")
+    print(f"Loading {len(test_files)} test Aspect models...")
 
-        test_file_path = Path(test_file)
+    load_results = AspectLoader().load_aspect_models(test_files, workers=workers or cpu_count())
+    for load_result in load_results:
+        test_file_path = Path(load_result.file_path)
         data = {
             "file_name": test_file_path.name,
             "folder_name": join(test_file_path.parents[1].name, test_file_path.parents[0].name),
-            "status": "initializing",
+            "status": "success",
             "error": None,
         }
 
-        try:
-            loader = AspectLoader()
-            model_elements = loader.load_aspect_model(test_file)
-            if not model_elements:
-                raise Exception("No elements loaded")
-        except Exception as error:
-            data["error"] = str(error)
+        if not load_result.is_loaded:
+            data["error"] = str(load_result.error)
+            data["status"] = "exception"
+        elif not load_result.elements:
+            data["error"] = "No elements loaded"
             data["status"] = "exception"
-        else:
-            data["status"] = "success"
 
         result.append(data)
 
-    print(f"{i}/{all_test_files}")
-
     return result
 
 
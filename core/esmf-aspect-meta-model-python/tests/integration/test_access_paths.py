@@ -0,0 +1,84 @@
+#  Copyright (c) 2024 Robert Bosch Manufacturing Solutions GmbH
+#
+#  See the AUTHORS file(s) distributed with this work for additional
+#  information regarding authorship.
+#
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+#
+#   SPDX-License-Identifier: MPL-2.0
+
+from os import getcwd
+from pathlib import Path
+
+from esmf_aspect_meta_model_python import AspectLoader
+
+RESOURCE_PATH = getcwd() / Path("tests/integration/resources")
+
+
+def load_graph(namespace, file_name):
+    aspect_loader = AspectLoader()
+    aspect_loader.load_aspect_model(RESOURCE_PATH / namespace / "2.0.0" / file_name)
+
+    return aspect_loader.get_graph()
+
+
+def test_same_paths_as_determine_access_path():
+    graph = load_graph("org.eclipse.esmf.test.general", "Movement.ttl")
+
+    for name in ("isMoving", "position", "x", "y", "z", "speed", "speedLimitWarning"):
+        assert graph.get_access_paths(name) == graph.determine_access_path(name)
+
+
+def test_property_used_in_several_entities():
+    graph = load_graph("org.eclipse.esmf.test.entity", "AspectWithEntityEnum.ttl")
+
+    assert graph.determine_access_path("entityPropertyOne") == [
+        ["testPropertyOne", "entityPropertyThree", "entityPropertyOne"],
+        ["testPropertyOne", "entityPropertyThree", "entityPropertyOne"],
+    ]
+    assert graph.get_access_paths("entityPropertyOne") == [
+        ["testPropertyOne", "entityPropertyOne"],
+        ["testPropertyOne", "entityPropertyThree", "entityPropertyOne"],
+    ]
+
+
+def test_property_used_in_aspect_and_entity():
+    graph = load_graph("org.eclipse.esmf.test.general", "AspectWithPropertyMultipleReferences.ttl")
+
+    assert graph.determine_access_path("testPropertyOne") == [["testPropertyOne"]]
+    assert graph.get_access_paths("testPropertyOne") == [["testPropertyOne"], ["testPropertyTwo", "testPropertyOne"]]
+
+
+def test_duplicate_paths():
+    graph = load_graph("org.eclipse.esmf.test.general", "AspectWithOperation.ttl")
+
+    assert graph.determine_access_path("input") == [["input"], ["input"]]
+    assert graph.get_access_paths("input") == [["input"]]
+
+
+def test_property_of_extended_entity():
+    graph = load_graph("org.eclipse.esmf.test.entity", "AspectWithUnusedExtendingEntity.ttl")
+
+    assert graph.determine_access_path("testProperty2") == [["testProperty2"], ["testProperty2"]]
+    assert graph.get_access_paths("testProperty2") == [["testProperty", "testProperty2"]]
+
+
+def test_extending_blank_node_property():
+    graph = load_graph("org.eclipse.esmf.test.entity", "AspectWithTimeSeriesWithComplexType.ttl")
+
+    assert graph.determine_access_path("testProperty2") == [["testProperty1", "extending_value", "testProperty2"]]
+    assert graph.get_access_paths("testProperty2") == [["testProperty1", "value", "testProperty2"]]
+    assert graph.determine_access_path("timestamp") == [["timestamp"]]
+    assert graph.get_access_paths("timestamp") == [["testProperty1", "timestamp"]]
+
+
+def test_property_not_in_payload():
+    entity_graph = load_graph("org.eclipse.esmf.test.entity", "AspectWithUnusedExtendingEntity.ttl")
+    structured_value_graph = load_graph("org.eclipse.esmf.test.characteristics", "AspectWithStructuredValue.ttl")
+
+    assert entity_graph.determine_access_path("testProperty3") == [["testProperty3"]]
+    assert entity_graph.get_access_paths("testProperty3") == []
+    assert structured_value_graph.determine_access_path("year") == [["year"]]
+    assert structured_value_graph.get_access_paths("year") == []
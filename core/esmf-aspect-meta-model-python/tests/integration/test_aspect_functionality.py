@@ -54,6 +54,21 @@ def test_get_access_path_input_property():
     assert path[0][0] == "input"
 
 
+def test_get_access_paths():
+    file_path = RESOURCE_PATH / "Movement.ttl"
+    aspect_loader = AspectLoader()
+    model_elements = aspect_loader.load_aspect_model(file_path)
+    aspect = model_elements[0]
+    graph = aspect_loader.get_graph()
+    access_path_index = graph.get_access_path_index()
+
+    assert graph.get_access_paths("z") == [["position", "z"]]
+    assert graph.get_access_paths("isMoving") == [["isMoving"]]
+    assert graph.get_access_paths("urn:samm:org.eclipse.esmf.test.general:2.0.0#y") == [["position", "y"]]
+    assert access_path_index.get_element_paths(aspect.properties[2].data_type) == [["position"]]  # type: ignore
+    assert graph.get_access_path_index() is access_path_index
+
+
 def test_find_properties_by_name() -> None:
     file_path = RESOURCE_PATH / "AspectWithProperties.ttl"
     aspect_loader = AspectLoader()
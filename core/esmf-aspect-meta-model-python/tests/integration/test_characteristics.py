@@ -218,3 +218,15 @@ def test_loading_aspect_with_blank_node() -> None:
     either_characteristic = first_property.characteristic
     assert either_characteristic is not None
     assert either_characteristic.name == "list_characteristic"
+
+
+def test_loading_aspect_models_with_same_urns():
+    file_paths = [RESOURCE_PATH / "AspectWithCollection.ttl", RESOURCE_PATH / "AspectWithList.ttl"]
+    results = AspectLoader().load_aspect_models(file_paths)
+
+    for result, characteristic_type in zip(results, ("DefaultCollection", "DefaultList")):
+        prop = result.elements[0].properties[0]
+        found = result.graph.find_by_urn(prop.urn)
+
+        assert type(prop.characteristic).__name__ == characteristic_type
+        assert found is prop
@@ -78,6 +78,26 @@ def test_loading_aspect_with_entity():
     entity_property = properties[0]  # noqa: F841
 
 
+def test_loading_aspect_with_entity_lazy():
+    file_path = RESOURCE_PATH / "AspectWithEntity.ttl"
+    aspect_loader = AspectLoader(lazy=True)
+    model_elements = aspect_loader.load_aspect_model(file_path)
+    aspect = model_elements[0]
+
+    assert aspect_loader.get_graph().find_by_name("EntityCharacteristic") == []
+
+    property = aspect.properties[0]
+    single_entity_characteristic = property.characteristic
+    assert single_entity_characteristic.name == "EntityCharacteristic"
+    assert single_entity_characteristic.parent_elements == [property]
+
+    entity = single_entity_characteristic.data_type
+    assert isinstance(entity, ComplexType)
+    assert entity.name == "TestEntity"
+    assert len(entity.properties) == 1
+    assert entity.properties[0].parent_elements == [entity]
+
+
 def test_aspect_with_abstract_entity():
     file_path = RESOURCE_PATH / "AspectWithAbstractEntity.ttl"
     aspect_loader = AspectLoader()
@@ -0,0 +1,63 @@
+#  Copyright (c) 2024 Robert Bosch Manufacturing Solutions GmbH
+#
+#  See the AUTHORS file(s) distributed with this work for additional
+#  information regarding authorship.
+#
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+#
+#   SPDX-License-Identifier: MPL-2.0
+
+
+from os import getcwd
+from pathlib import Path
+
+from esmf_aspect_meta_model_python import AspectLoader, ExamplePayloadGenerator, PayloadValidator
+
+RESOURCE_PATH = getcwd() / Path("tests/integration/resources")
+# Models which can only be loaded lazily, e.g. with a recursive Entity, are kept apart from the shared resources
+LAZY_RESOURCE_PATH = getcwd() / Path("tests/integration/lazy_resources")
+
+
+def load_aspect(file_path):
+    return AspectLoader().load_aspect_model(file_path)[0]
+
+
+def test_movement_example_payloads():
+    aspect = load_aspect(RESOURCE_PATH / "org.eclipse.esmf.test.general/2.0.0/Movement.ttl")
+    validator = PayloadValidator(aspect)
+    payloads = list(ExamplePayloadGenerator(aspect, seed=1).iter_payloads(100))
+
+    assert all(validator.is_valid(payload) for payload in payloads)
+    assert {payload["speedLimitWarning"] for payload in payloads} == {"green", "yellow", "red"}
+    assert all(set(payload["position"]) >= {"x", "y"} for payload in payloads)
+
+
+def test_constrained_example_payloads():
+    aspect = load_aspect(RESOURCE_PATH / "org.eclipse.esmf.test.constraints/2.0.0/AspectWithConstrainedCollection.ttl")
+    validator = PayloadValidator(aspect)
+    payloads = list(ExamplePayloadGenerator(aspect, seed=1).iter_payloads(100))
+
+    assert all(validator.is_valid(payload) for payload in payloads)
+    assert all(2 <= value <= 10 for payload in payloads for value in payload["testCollection"])
+
+
+def test_example_value_payload():
+    aspect = load_aspect(RESOURCE_PATH / "org.eclipse.esmf.test.general/2.0.0/AspectWithProperty.ttl")
+    payload = ExamplePayloadGenerator(aspect).generate()
+
+    assert payload == {"testProperty": "Example Value"}
+
+
+def test_recursive_entity_example_payloads():
+    file_path = LAZY_RESOURCE_PATH / "org.eclipse.esmf.test.entity/2.0.0/AspectWithRecursiveEntity.ttl"
+    aspect = AspectLoader(lazy=True).load_aspect_model(file_path)[0]
+    validator = PayloadValidator(aspect)
+    payloads = list(ExamplePayloadGenerator(aspect, seed=1, max_depth=2).iter_payloads(20))
+
+    def get_depth(node):
+        return 1 + max((get_depth(child) for child in node["children"]), default=0)
+
+    assert all(validator.is_valid(payload) for payload in payloads)
+    assert max(get_depth(payload["tree"]) for payload in payloads) <= 3
@@ -390,3 +390,37 @@ def test_loading_aspect_with_either():
     right = either_characteristic.right
     assert right.name == "Boolean"
     assert right.parent_elements[0].urn == "urn:samm:org.eclipse.esmf.test.general:2.0.0#TestEither"
+
+
+def test_iter_elements_close():
+    file_path = RESOURCE_PATH / "AspectWithProperties.ttl"
+    graph = AspectLoader().get_graph()
+    graph.parse(file_path)
+    elements = graph.iter_elements()
+    for element in elements:
+        if getattr(element, "name", None) == "testPropertyOne":
+            break
+    elements.close()
+
+    assert graph.find_by_name("testPropertyOne") == [element]
+    assert graph.find_by_name("TestAspect") == []
+    assert graph.get_access_paths("testPropertyOne") == []
+
+    aspect = graph.to_python()[0]
+
+    assert aspect.name == "TestAspect"
+    assert graph.find_by_name("testPropertyOne") == [element]
+    assert [prop.name for prop in graph.find_by_name("testPropertyTwo")] == ["testPropertyTwo"]
+    assert graph.get_access_paths("testPropertyOne") == [["testPropertyOne"]]
+
+
+def test_iter_elements_lazy():
+    file_path = RESOURCE_PATH / "AspectWithProperties.ttl"
+    graph = AspectLoader(lazy=True).get_graph()
+    graph.parse(file_path)
+    result = list(graph.iter_elements())
+    aspect = result[-1]
+
+    assert aspect.name == "TestAspect"
+    assert [prop.name for prop in aspect.properties] == ["testPropertyOne", "testPropertyTwo"]
+    assert aspect.properties[0].characteristic is not None
@@ -0,0 +1,64 @@
+#  Copyright (c) 2024 Robert Bosch Manufacturing Solutions GmbH
+#
+#  See the AUTHORS file(s) distributed with this work for additional
+#  information regarding authorship.
+#
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+#
+#   SPDX-License-Identifier: MPL-2.0
+
+
+from os import getcwd
+from pathlib import Path
+from unittest import mock
+
+from esmf_aspect_meta_model_python import AspectLoader, JsonSchemaCache, generate_json_schema
+
+RESOURCE_PATH = getcwd() / Path("tests/integration/resources")
+
+
+def load_aspect(file_path):
+    return AspectLoader().load_aspect_model(file_path)[0]
+
+
+def test_movement_json_schema():
+    aspect = load_aspect(RESOURCE_PATH / "org.eclipse.esmf.test.general/2.0.0/Movement.ttl")
+    schema = generate_json_schema(aspect)
+    position_name = "urn_samm_org.eclipse.esmf.test.general_2.0.0_SpatialPosition"
+    position = schema["components"]["schemas"][position_name]
+
+    assert schema["$schema"] == "http://json-schema.org/draft-04/schema"
+    assert schema["description"] == "Aspect for movement information"
+    assert schema["required"] == ["isMoving", "speedLimitWarning", "position"]
+    assert schema["properties"]["isMoving"] == {
+        "description": "Flag indicating whether the asset is currently moving",
+        "type": "boolean",
+    }
+    assert schema["properties"]["speedLimitWarning"]["enum"] == ["green", "yellow", "red"]
+    assert schema["properties"]["position"]["allOf"] == [{"$ref": f"#/components/schemas/{position_name}"}]
+    assert position["required"] == ["x", "y"]
+    assert position["properties"]["z"] == {"description": "z coordinate in space", "type": "number"}
+
+
+def test_constrained_collection_json_schema():
+    aspect = load_aspect(RESOURCE_PATH / "org.eclipse.esmf.test.constraints/2.0.0/AspectWithConstrainedCollection.ttl")
+    schema = generate_json_schema(aspect)
+
+    assert schema["properties"]["testCollection"] == {
+        "type": "array",
+        "items": {"type": "integer", "minimum": 2, "maximum": 10},
+    }
+
+
+def test_json_schema_cache(tmp_path):
+    file_path = RESOURCE_PATH / "org.eclipse.esmf.test.general/2.0.0/Movement.ttl"
+    schema = JsonSchemaCache(tmp_path).get_schema(file_path)
+
+    with mock.patch("esmf_aspect_meta_model_python.generator.json_schema.AspectLoader") as aspect_loader_mock:
+        result = JsonSchemaCache(tmp_path).get_schema(file_path)
+
+    assert result == schema
+    aspect_loader_mock.assert_not_called()
+    assert len(list(tmp_path.glob("*.schema.json"))) == 1
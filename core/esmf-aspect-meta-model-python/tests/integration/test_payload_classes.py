@@ -0,0 +1,51 @@
+#  Copyright (c) 2024 Robert Bosch Manufacturing Solutions GmbH
+#
+#  See the AUTHORS file(s) distributed with this work for additional
+#  information regarding authorship.
+#
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+#
+#   SPDX-License-Identifier: MPL-2.0
+
+
+from os import getcwd
+from pathlib import Path
+
+from esmf_aspect_meta_model_python import AspectLoader, load_payload_classes
+
+RESOURCE_PATH = getcwd() / Path("tests/integration/resources")
+
+
+def load_aspect(file_path):
+    return AspectLoader().load_aspect_model(file_path)[0]
+
+
+def test_movement_payload_classes(tmp_path):
+    aspect = load_aspect(RESOURCE_PATH / "org.eclipse.esmf.test.general/2.0.0/Movement.ttl")
+    module = load_payload_classes(aspect, tmp_path)
+    payload = {"isMoving": True, "speedLimitWarning": "red", "position": {"x": 1.0, "y": 2.0}}
+    movement = module.from_json(payload)
+
+    assert module.ASPECT_URN == "urn:samm:org.eclipse.esmf.test.general:2.0.0#Movement"
+    assert movement.speedLimitWarning is module.TrafficLight.RED
+    assert movement.position == module.SpatialPosition(x=1.0, y=2.0)
+    assert movement.position.z is None
+    assert module.to_json(movement) == payload
+    assert len(list(tmp_path.glob("*.py"))) == 1
+
+
+def test_extending_entity_payload_classes():
+    aspect = load_aspect(RESOURCE_PATH / "org.eclipse.esmf.test.entity/2.0.0/AspectWithTimeSeriesWithComplexType.ttl")
+    module = load_payload_classes(aspect)
+    payload = {
+        "testProperty1": [
+            {"timestamp": "2024-01-01T00:00:00", "value": {"testProperty2": "value", "testProperty3": "value"}},
+        ],
+    }
+    result = module.from_json(payload)
+
+    assert isinstance(result.testProperty1[0], module.TimeSeriesEntity)
+    assert result.testProperty1[0].value.testProperty2 == "value"
+    assert module.to_json(result) == payload
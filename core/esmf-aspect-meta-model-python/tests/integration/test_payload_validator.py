@@ -0,0 +1,88 @@
+#  Copyright (c) 2024 Robert Bosch Manufacturing Solutions GmbH
+#
+#  See the AUTHORS file(s) distributed with this work for additional
+#  information regarding authorship.
+#
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+#
+#   SPDX-License-Identifier: MPL-2.0
+
+
+from os import getcwd
+from pathlib import Path
+
+from esmf_aspect_meta_model_python import AspectLoader, PayloadViolation, compile_batch_validator, compile_validator
+
+RESOURCE_PATH = getcwd() / Path("tests/integration/resources")
+
+
+def load_aspect(file_path):
+    return AspectLoader().load_aspect_model(file_path)[0]
+
+
+def test_validate_movement_payload():
+    validator = compile_validator(load_aspect(RESOURCE_PATH / "org.eclipse.esmf.test.general/2.0.0/Movement.ttl"))
+
+    assert validator.validate({"isMoving": True, "speedLimitWarning": "green", "position": {"x": 1.0, "y": 2}}) == []
+    assert validator.validate({"isMoving": "yes", "speedLimitWarning": "blue", "position": {"x": "1", "z": 1}}) == [
+        PayloadViolation(["isMoving"], "expected a boolean", "yes"),
+        PayloadViolation(["speedLimitWarning"], "value is not one of the enumeration values", "blue"),
+        PayloadViolation(["position", "x"], "expected a number (float)", "1"),
+        PayloadViolation(["position", "y"], "missing mandatory property"),
+    ]
+
+
+def test_validate_constraints():
+    constraints_path = RESOURCE_PATH / "org.eclipse.esmf.test.constraints/2.0.0"
+    cases = [
+        ("AspectWithRangeConstraint.ttl", 3.0, 11, "value must be at most 10.5"),
+        ("AspectWithLengthConstraint.ttl", "abcdef", "abc", "length must be at least 5"),
+        ("AspectWithRegularExpressionConstraint.ttl", "123", "12a", "value does not match the pattern ^[0-9]*$"),
+    ]
+
+    for file_name, valid_value, invalid_value, message in cases:
+        validator = compile_validator(load_aspect(constraints_path / file_name))
+
+        assert validator.validate({"testProperty": valid_value}) == []
+        assert validator.validate({"testProperty": invalid_value}) == [
+            PayloadViolation(["testProperty"], message, invalid_value)
+        ]
+
+
+def test_validate_constrained_collection():
+    file_path = RESOURCE_PATH / "org.eclipse.esmf.test.constraints/2.0.0/AspectWithConstrainedCollection.ttl"
+    validator = compile_validator(load_aspect(file_path))
+
+    assert validator.is_valid({"testCollection": [2, 5, 10]})
+    assert validator.validate({"testCollection": [1, 5]}) == [
+        PayloadViolation(["testCollection", "0"], "value must be at least 2", 1)
+    ]
+
+
+def test_validate_either():
+    file_path = RESOURCE_PATH / "org.eclipse.esmf.test.general/2.0.0/AspectWithEither.ttl"
+    validator = compile_validator(load_aspect(file_path))
+
+    assert validator.is_valid({"testProperty": {"left": "value"}})
+    assert validator.validate({"testProperty": {"right": "value"}}) == [
+        PayloadViolation(["testProperty", "right"], "expected a boolean", "value")
+    ]
+
+
+def test_validate_movement_batch():
+    aspect = load_aspect(RESOURCE_PATH / "org.eclipse.esmf.test.general/2.0.0/Movement.ttl")
+    validator = compile_batch_validator(aspect, batch_size=2)
+    payloads = [
+        {"isMoving": True, "speedLimitWarning": "green", "position": {"x": 1.0, "y": 2.0}},
+        {"isMoving": False, "speedLimitWarning": "blue", "position": {"x": 1.0, "y": 2.0}},
+        {"isMoving": False, "speedLimitWarning": "red", "position": {"x": 1.0, "y": 2.0}},
+        {"isMoving": False, "speedLimitWarning": "blue", "position": {"x": "1", "y": 2.0, "z": 3.0}},
+    ]
+
+    assert validator.validate(payloads) == [
+        PayloadViolation(["speedLimitWarning"], "value is not one of the enumeration values", "blue", 1),
+        PayloadViolation(["speedLimitWarning"], "value is not one of the enumeration values", "blue", 3),
+        PayloadViolation(["position", "x"], "expected a number (float)", "1", 3),
+    ]
@@ -0,0 +1,244 @@
+"""Example payloads generator test suite."""
+
+import json
+import re
+
+from random import Random
+from unittest import mock
+
+import pytest
+
+from rdflib import Literal
+
+from esmf_aspect_meta_model_python.base.aspect import Aspect
+from esmf_aspect_meta_model_python.base.characteristics.characteristic import Characteristic
+from esmf_aspect_meta_model_python.base.characteristics.collection.collection import Collection
+from esmf_aspect_meta_model_python.base.characteristics.collection.set import Set
+from esmf_aspect_meta_model_python.base.characteristics.enumeration import Enumeration
+from esmf_aspect_meta_model_python.base.characteristics.structured_value import StructuredValue
+from esmf_aspect_meta_model_python.base.characteristics.trait import Trait
+from esmf_aspect_meta_model_python.base.contraints.length_constraint import LengthConstraint
+from esmf_aspect_meta_model_python.base.data_types.complex_type import ComplexType
+from esmf_aspect_meta_model_python.base.data_types.scalar import Scalar
+from esmf_aspect_meta_model_python.base.either import Either
+from esmf_aspect_meta_model_python.base.property import Property
+from esmf_aspect_meta_model_python.generator.example_payloads import (
+    ExamplePayloadCompiler,
+    ExamplePayloadGenerator,
+    generate_example_payloads,
+    get_example_value,
+)
+from esmf_aspect_meta_model_python.validation.payload_validator import PayloadValidator
+
+XSD = "http://www.w3.org/2001/XMLSchema#"
+
+
+def get_scalar_characteristic(type_name, spec=Characteristic, **kwargs):
+    return mock.MagicMock(spec=spec, data_type=mock.MagicMock(spec=Scalar, urn=XSD + type_name), **kwargs)
+
+
+def get_property(name, characteristic, is_optional=False, example_value=None):
+    prop = mock.MagicMock(
+        spec=Property,
+        characteristic=characteristic,
+        payload_name=name,
+        is_optional=is_optional,
+        is_abstract=False,
+        is_not_in_payload=False,
+        extends=None,
+        example_value=example_value,
+    )
+    prop.name = name
+
+    return prop
+
+
+def get_aspect():
+    entity = mock.MagicMock(spec=ComplexType)
+    entity.all_properties = [
+        get_property("x", get_scalar_characteristic("float")),
+        get_property("child", mock.MagicMock(spec=Characteristic, data_type=entity), is_optional=True),
+    ]
+    either = mock.MagicMock(
+        spec=Either,
+        left=get_scalar_characteristic("string"),
+        right=get_scalar_characteristic("boolean"),
+    )
+
+    return mock.MagicMock(
+        spec=Aspect,
+        properties=[
+            get_property("state", get_scalar_characteristic("string", Enumeration, values=["on", "off"])),
+            get_property("position", mock.MagicMock(spec=Characteristic, data_type=entity)),
+            get_property("values", get_scalar_characteristic("int", Set, element_characteristic=None), True),
+            get_property("either", either, is_optional=True),
+            get_property("name", get_scalar_characteristic("string"), example_value="Example"),
+        ],
+    )
+
+
+class TestGetExampleValue:
+    """Example value test suite."""
+
+    def test_get_example_value(self):
+        entity_value = {"urn:samm:org.eclipse.esmf.samm:meta-model:2.1.0#name": "Instance", "value": [Literal(1)]}
+
+        assert get_example_value(Literal("text", lang="de")) == {"de": "text"}
+        assert get_example_value(entity_value) == {"value": [1]}
+        assert get_example_value("text") == "text"
+
+
+class TestExamplePayloadCompiler:
+    """Example payload compiler test suite."""
+
+    @staticmethod
+    def get_values(factory, count=200):
+        random = Random(1)
+
+        return [factory(random, 0) for _ in range(count)]
+
+    def test_compile_properties(self):
+        factory = ExamplePayloadCompiler().compile_properties(get_aspect().properties)
+        values = self.get_values(factory)
+
+        assert all(value["name"] == "Example" for value in values)
+        assert {value["state"] for value in values} == {"on", "off"}
+        assert any("values" in value for value in values)
+        assert any("values" not in value for value in values)
+
+    def test_invalid_example_value(self):
+        prop = get_property("value", get_scalar_characteristic("int"), example_value="text")
+        values = self.get_values(ExamplePayloadCompiler().compile_properties([prop]))
+
+        assert all(isinstance(value["value"], int) for value in values)
+
+    def test_max_depth(self):
+        aspect = get_aspect()
+        factory = ExamplePayloadCompiler(max_depth=1).compile_properties(aspect.properties)
+
+        assert all("child" not in value["position"] for value in self.get_values(factory))
+
+    def test_compile_recursive_collection(self):
+        entity = mock.MagicMock(spec=ComplexType)
+        children = mock.MagicMock(spec=Collection, element_characteristic=None, data_type=entity)
+        entity.all_properties = [
+            get_property("id", get_scalar_characteristic("int")),
+            get_property("children", children),
+        ]
+        factory = ExamplePayloadCompiler(max_depth=2).compile_properties(entity.all_properties)
+
+        def get_depth(value):
+            return 1 + max((get_depth(child) for child in value["children"]), default=0)
+
+        values = self.get_values(factory)
+
+        assert max(get_depth(value) for value in values) == 3
+        assert any(value["children"] for value in values)
+
+    def test_compile_constrained_collection(self):
+        collection = get_scalar_characteristic("boolean", Collection, element_characteristic=None)
+        constraint = mock.MagicMock(spec=LengthConstraint, min_value=4, max_value=5)
+        trait = mock.MagicMock(spec=Trait, base_characteristic=collection, constraints=[constraint])
+        values = self.get_values(ExamplePayloadCompiler().compile_characteristic(trait))
+
+        assert {len(value) for value in values} == {4, 5}
+
+    def test_compile_set(self):
+        characteristic = get_scalar_characteristic("boolean", Set, element_characteristic=None)
+        values = self.get_values(ExamplePayloadCompiler(max_items=5).compile_characteristic(characteristic))
+
+        assert all(len(value) == len(set(value)) for value in values)
+
+    def test_compile_set_without_enough_unique_items(self):
+        characteristic = get_scalar_characteristic("boolean", Set, element_characteristic=None)
+        characteristic.name = "Flags"
+        constraint = mock.MagicMock(spec=LengthConstraint, min_value=3, max_value=3)
+        trait = mock.MagicMock(spec=Trait, base_characteristic=characteristic, constraints=[constraint])
+
+        factory = ExamplePayloadCompiler().compile_characteristic(trait)
+
+        with pytest.raises(ValueError) as error:
+            factory(Random(1), 0)
+
+        assert str(error.value) == "Could not generate 3 unique items of Flags"
+
+    def test_compile_set_of_example_values(self):
+        entity = mock.MagicMock(spec=ComplexType)
+        entity.all_properties = [get_property("name", get_scalar_characteristic("string"), example_value="Example")]
+        characteristic = mock.MagicMock(spec=Set, element_characteristic=None, data_type=entity)
+        characteristic.name = "Entities"
+        constraint = mock.MagicMock(spec=LengthConstraint, min_value=2, max_value=None)
+        trait = mock.MagicMock(spec=Trait, base_characteristic=characteristic, constraints=[constraint])
+
+        factory = ExamplePayloadCompiler().compile_characteristic(trait)
+
+        with pytest.raises(ValueError) as error:
+            factory(Random(1), 0)
+
+        assert str(error.value) == "Could not generate 2 unique items of Entities"
+
+    def test_compile_structured_value(self):
+        characteristic = get_scalar_characteristic("string", StructuredValue, deconstruction_rule="([0-9]+)-([a-z]+)")
+        characteristic.name = "Value"
+        values = self.get_values(ExamplePayloadCompiler().compile_characteristic(characteristic))
+
+        assert all(re.fullmatch("([0-9]+)-([a-z]+)", value) for value in values)
+
+    def test_compile_enumeration_without_valid_value(self):
+        characteristic = get_scalar_characteristic("string", Enumeration, values=["on", "off"])
+        characteristic.name = "State"
+        constraint = mock.MagicMock(spec=LengthConstraint, min_value=5, max_value=None)
+        trait = mock.MagicMock(spec=Trait, base_characteristic=characteristic, constraints=[constraint])
+
+        with pytest.raises(ValueError) as error:
+            ExamplePayloadCompiler().compile_characteristic(trait)
+
+        assert str(error.value) == "No value of the enumeration State is valid"
+
+
+class TestExamplePayloadGenerator:
+    """Example payload generator test suite."""
+
+    def test_init(self):
+        aspect = get_aspect()
+        result = ExamplePayloadGenerator(aspect)
+
+        assert result.aspect is aspect
+
+    def test_init_with_invalid_max_items(self):
+        with pytest.raises(ValueError) as error:
+            ExamplePayloadGenerator(get_aspect(), max_items=0)
+
+        assert str(error.value) == "The maximum number of items must be a positive number"
+
+    def test_payloads_are_valid(self):
+        aspect = get_aspect()
+        validator = PayloadValidator(aspect)
+        payloads = list(ExamplePayloadGenerator(aspect, seed=1).iter_payloads(500))
+
+        assert all(validator.is_valid(payload) for payload in payloads)
+        assert len({json.dumps(payload, sort_keys=True) for payload in payloads}) == 500
+
+    def test_seed(self):
+        aspect = get_aspect()
+
+        assert ExamplePayloadGenerator(aspect, seed=1).generate() == ExamplePayloadGenerator(aspect, seed=1).generate()
+
+    def test_iter(self):
+        generator = ExamplePayloadGenerator(get_aspect())
+        payloads = iter(generator)
+
+        assert [next(payloads) for _ in range(3)]
+
+    def test_write_json_lines(self, tmp_path):
+        ExamplePayloadGenerator(get_aspect(), seed=1).write_json_lines(tmp_path / "payloads.jsonl", 3)
+        lines = (tmp_path / "payloads.jsonl").read_text().splitlines()
+
+        assert [json.loads(line) for line in lines] == list(
+            ExamplePayloadGenerator(get_aspect(), seed=1).iter_payloads(3)
+        )
+
+    def test_generate_example_payloads(self):
+        result = list(generate_example_payloads(get_aspect(), count=2, seed=1))
+
+        assert result == list(ExamplePayloadGenerator(get_aspect(), seed=1).iter_payloads(2))
@@ -0,0 +1,339 @@
+"""JSON schema generator test suite."""
+
+import json
+
+from datetime import date
+from decimal import Decimal
+from unittest import mock
+
+import pytest
+
+from esmf_aspect_meta_model_python.base.aspect import Aspect
+from esmf_aspect_meta_model_python.base.bound_definition import BoundDefinition
+from esmf_aspect_meta_model_python.base.characteristics.characteristic import Characteristic
+from esmf_aspect_meta_model_python.base.characteristics.collection.collection import Collection
+from esmf_aspect_meta_model_python.base.characteristics.collection.set import Set
+from esmf_aspect_meta_model_python.base.characteristics.enumeration import Enumeration
+from esmf_aspect_meta_model_python.base.characteristics.state import State
+from esmf_aspect_meta_model_python.base.characteristics.structured_value import StructuredValue
+from esmf_aspect_meta_model_python.base.characteristics.trait import Trait
+from esmf_aspect_meta_model_python.base.contraints.encoding_constraint import EncodingConstraint
+from esmf_aspect_meta_model_python.base.contraints.language_constraint import LanguageConstraint
+from esmf_aspect_meta_model_python.base.contraints.length_constraint import LengthConstraint
+from esmf_aspect_meta_model_python.base.contraints.range_constraint import RangeConstraint
+from esmf_aspect_meta_model_python.base.contraints.regular_expression_constraint import RegularExpressionConstraint
+from esmf_aspect_meta_model_python.base.data_types.complex_type import ComplexType
+from esmf_aspect_meta_model_python.base.data_types.scalar import Scalar
+from esmf_aspect_meta_model_python.base.either import Either
+from esmf_aspect_meta_model_python.base.property import Property
+from esmf_aspect_meta_model_python.generator.json_schema import (
+    JsonSchemaCache,
+    JsonSchemaGenerator,
+    generate_json_schema,
+    get_aspect,
+    get_constraint_keywords,
+    get_json_value,
+    get_model_fingerprint,
+    get_scalar_schema,
+)
+
+XSD = "http://www.w3.org/2001/XMLSchema#"
+
+
+def get_element(spec, name, description=None, **kwargs):
+    element = mock.MagicMock(spec=spec, **kwargs)
+    element.name = name
+    element.get_description.return_value = description
+
+    return element
+
+
+def get_scalar_characteristic(type_name, spec=Characteristic, **kwargs):
+    return get_element(spec, type_name, data_type=mock.MagicMock(spec=Scalar, urn=XSD + type_name), **kwargs)
+
+
+def get_property(name, characteristic, is_optional=False, description=None):
+    return get_element(
+        Property,
+        name,
+        description,
+        characteristic=characteristic,
+        payload_name=name,
+        is_optional=is_optional,
+        is_abstract=False,
+        is_not_in_payload=False,
+        extends=None,
+    )
+
+
+def get_range_constraint(min_value, max_value, lower=BoundDefinition.AT_LEAST, upper=BoundDefinition.AT_MOST):
+    return mock.MagicMock(
+        spec=RangeConstraint,
+        min_value=min_value,
+        max_value=max_value,
+        lower_bound_definition=lower,
+        upper_bound_definition=upper,
+    )
+
+
+def get_aspect_mock():
+    entity = get_element(ComplexType, "Point", "A point.", urn="urn:samm:org.eclipse.esmf.test:1.0.0#Point")
+    entity.all_properties = [
+        get_property("x", get_scalar_characteristic("float"), description="x coordinate"),
+        get_property("child", get_element(Characteristic, "Child", data_type=entity), is_optional=True),
+    ]
+
+    return get_element(
+        Aspect,
+        "Aspect",
+        "An aspect.",
+        properties=[
+            get_property("state", get_scalar_characteristic("string", Enumeration, values=["on", "off"])),
+            get_property("point", get_element(Characteristic, "Point", data_type=entity), is_optional=True),
+        ],
+    )
+
+
+class TestHelpers:
+    """JSON schema helpers test suite."""
+
+    def test_get_json_value(self):
+        assert get_json_value(date(2024, 1, 1)) == "2024-01-01"
+        assert get_json_value(Decimal("2")) == 2
+        assert get_json_value(Decimal("2.5")) == 2.5
+        assert get_json_value({"values": [Decimal("1")]}) == {"values": [1]}
+        assert get_json_value("value") == "value"
+
+    def test_get_scalar_schema(self):
+        assert get_scalar_schema(XSD + "string") == {"type": "string"}
+        assert get_scalar_schema(XSD + "dateTime") == {"type": "string", "format": "date-time"}
+        assert get_scalar_schema(XSD + "boolean") == {"type": "boolean"}
+        assert get_scalar_schema(XSD + "double") == {"type": "number"}
+        assert get_scalar_schema(XSD + "unsignedByte") == {"type": "integer", "minimum": 0, "maximum": 255}
+        assert get_scalar_schema(XSD + "integer") == {"type": "integer"}
+        assert get_scalar_schema("http://www.w3.org/1999/02/22-rdf-syntax-ns#langString") == {
+            "type": "object",
+            "additionalProperties": {"type": "string"},
+        }
+        assert get_scalar_schema(XSD + "unknown") == {}
+
+    def test_get_range_keywords(self):
+        closed = get_range_constraint(Decimal("1.5"), 10)
+        exclusive = get_range_constraint(0, 10, BoundDefinition.GREATER_THAN, BoundDefinition.LESS_THAN)
+        open_lower = get_range_constraint(None, 10, BoundDefinition.OPEN)
+        dates = get_range_constraint(date(2024, 1, 1), None, upper=BoundDefinition.OPEN)
+
+        assert get_constraint_keywords(closed) == {"minimum": 1.5, "maximum": 10}
+        assert get_constraint_keywords(exclusive) == {
+            "minimum": 0,
+            "exclusiveMinimum": True,
+            "maximum": 10,
+            "exclusiveMaximum": True,
+        }
+        assert get_constraint_keywords(open_lower) == {"maximum": 10}
+        assert get_constraint_keywords(dates) == {}
+
+    def test_get_constraint_keywords(self):
+        length = mock.MagicMock(spec=LengthConstraint, min_value=1, max_value=None)
+        regular_expression = mock.MagicMock(spec=RegularExpressionConstraint, value="^[a-z]+$")
+        language = mock.MagicMock(spec=LanguageConstraint, language_code="de")
+
+        assert get_constraint_keywords(length) == {"minLength": 1}
+        assert get_constraint_keywords(length, is_collection=True) == {"minItems": 1}
+        assert get_constraint_keywords(regular_expression) == {"pattern": "^[a-z]+$"}
+        assert get_constraint_keywords(language) == {
+            "properties": {"de": {"type": "string"}},
+            "additionalProperties": False,
+        }
+        assert get_constraint_keywords(mock.MagicMock(spec=EncodingConstraint)) == {}
+
+    def test_get_aspect(self):
+        aspect = mock.MagicMock(spec=Aspect)
+
+        assert get_aspect(["element", aspect]) is aspect
+
+    def test_get_aspect_without_aspect(self):
+        with pytest.raises(ValueError) as error:
+            get_aspect(["element"])
+
+        assert str(error.value) == "The model does not contain an Aspect"
+
+    def test_get_model_fingerprint(self, tmp_path):
+        file_path = tmp_path / "Aspect.ttl"
+        file_path.write_text("content")
+        result = get_model_fingerprint("2.1.0", [str(file_path)], "en")
+
+        assert result == get_model_fingerprint("2.1.0", [str(file_path)], "en")
+        assert result != get_model_fingerprint("2.1.0", [str(file_path)], "de")
+        file_path.write_text("other content")
+        assert result != get_model_fingerprint("2.1.0", [str(file_path)], "en")
+
+
+class TestJsonSchemaGenerator:
+    """JSON schema generator test suite."""
+
+    @staticmethod
+    def get_schema(characteristic):
+        aspect = get_element(Aspect, "Aspect", properties=[get_property("value", characteristic)])
+
+        return JsonSchemaGenerator(aspect).generate()["properties"]["value"]
+
+    def test_init(self):
+        aspect = get_aspect_mock()
+        result = JsonSchemaGenerator(aspect, "de")
+
+        assert result.aspect is aspect
+        assert result.language == "de"
+
+    def test_generate(self):
+        result = JsonSchemaGenerator(get_aspect_mock()).generate()
+        name = "urn_samm_org.eclipse.esmf.test_1.0.0_Point"
+
+        assert result == {
+            "$schema": "http://json-schema.org/draft-04/schema",
+            "description": "An aspect.",
+            "type": "object",
+            "properties": {
+                "state": {"type": "string", "enum": ["on", "off"]},
+                "point": {"$ref": f"#/components/schemas/{name}"},
+            },
+            "required": ["state"],
+            "components": {
+                "schemas": {
+                    name: {
+                        "description": "A point.",
+                        "type": "object",
+                        "properties": {
+                            "x": {"description": "x coordinate", "type": "number"},
+                            "child": {"$ref": f"#/components/schemas/{name}"},
+                        },
+                        "required": ["x"],
+                    }
+                }
+            },
+        }
+
+    def test_collection(self):
+        result = self.get_schema(get_scalar_characteristic("int", Set, element_characteristic=None))
+
+        assert result == {
+            "type": "array",
+            "items": {"type": "integer", "minimum": -(2**31), "maximum": 2**31 - 1},
+            "uniqueItems": True,
+        }
+
+    def test_constrained_collection(self):
+        collection = get_scalar_characteristic("string", Collection, element_characteristic=None)
+        constraints = [
+            mock.MagicMock(spec=LengthConstraint, min_value=None, max_value=2),
+            mock.MagicMock(spec=RegularExpressionConstraint, value="^[a-z]+$"),
+        ]
+        result = self.get_schema(mock.MagicMock(spec=Trait, base_characteristic=collection, constraints=constraints))
+
+        assert result == {"type": "array", "items": {"type": "string", "pattern": "^[a-z]+$"}, "maxItems": 2}
+
+    def test_constrained_entity(self):
+        entity = get_element(ComplexType, "Entity", urn="urn:samm:org.eclipse.esmf.test:1.0.0#Entity")
+        entity.all_properties = []
+        base_characteristic = get_element(Characteristic, "Entity", data_type=entity)
+        constraint = mock.MagicMock(spec=LengthConstraint, min_value=1, max_value=None)
+        result = self.get_schema(
+            mock.MagicMock(spec=Trait, base_characteristic=base_characteristic, constraints=[constraint])
+        )
+
+        assert result == {
+            "allOf": [{"$ref": "#/components/schemas/urn_samm_org.eclipse.esmf.test_1.0.0_Entity"}, {"minLength": 1}]
+        }
+
+    def test_either(self):
+        either = mock.MagicMock(
+            spec=Either,
+            left=get_scalar_characteristic("string"),
+            right=get_scalar_characteristic("boolean"),
+        )
+        result = self.get_schema(either)
+
+        assert result["oneOf"][1] == {
+            "type": "object",
+            "properties": {"right": {"type": "boolean"}},
+            "required": ["right"],
+            "additionalProperties": False,
+        }
+
+    def test_state(self):
+        state = get_scalar_characteristic("date", State, values=[date(2024, 1, 1)], default_value=date(2024, 1, 1))
+        result = self.get_schema(state)
+
+        assert result == {"type": "string", "format": "date", "enum": ["2024-01-01"], "default": "2024-01-01"}
+
+    def test_structured_value(self):
+        result = self.get_schema(
+            get_scalar_characteristic("string", StructuredValue, deconstruction_rule="([0-9]+)-([0-9]+)")
+        )
+
+        assert result == {"type": "string", "pattern": "^(?:([0-9]+)-([0-9]+))$"}
+
+    def test_write(self, tmp_path):
+        generator = JsonSchemaGenerator(get_aspect_mock())
+        generator.write(tmp_path / "schema.json")
+
+        assert json.loads((tmp_path / "schema.json").read_text()) == generator.generate()
+
+    @mock.patch("esmf_aspect_meta_model_python.generator.json_schema.JsonSchemaGenerator")
+    def test_generate_json_schema(self, generator_mock):
+        generator_mock.return_value.generate.return_value = "schema"
+        result = generate_json_schema("aspect", "de")
+
+        assert result == "schema"
+        generator_mock.assert_called_once_with("aspect", "de")
+
+
+class TestJsonSchemaCache:
+    """JSON schema cache test suite."""
+
+    @staticmethod
+    def get_loader_mock(aspect_loader_mock, file_paths):
+        loader = aspect_loader_mock.return_value
+        loader.load_aspect_model.return_value = [get_aspect_mock()]
+        loader.get_samm_version.return_value = "2.1.0"
+        loader.get_graph.return_value.get_rdf_graph.return_value.layers = [
+            mock.MagicMock(file_paths=file_paths),
+        ]
+
+        return loader
+
+    def test_init(self, tmp_path):
+        result = JsonSchemaCache(tmp_path / "cache")
+
+        assert result.cache_dir == tmp_path / "cache"
+        assert result.cache_dir.is_dir()
+
+    @mock.patch("esmf_aspect_meta_model_python.generator.json_schema.AspectLoader")
+    def test_get_schema(self, aspect_loader_mock, tmp_path):
+        model_file_path = tmp_path / "Aspect.ttl"
+        model_file_path.write_text("aspect")
+        dependency_file_path = tmp_path / "Point.ttl"
+        dependency_file_path.write_text("point")
+        loader = self.get_loader_mock(aspect_loader_mock, [str(dependency_file_path)])
+        cache = JsonSchemaCache(tmp_path / "cache")
+        schema = cache.get_schema(model_file_path)
+
+        assert schema["description"] == "An aspect."
+        assert cache.get_schema(model_file_path) == schema
+        loader.load_aspect_model.assert_called_once_with(str(model_file_path))
+
+        dependency_file_path.write_text("changed point")
+        assert cache.get_schema(model_file_path) == schema
+        assert loader.load_aspect_model.call_count == 2
+        assert len(list(cache.cache_dir.glob("*.schema.json"))) == 1
+
+    @mock.patch("esmf_aspect_meta_model_python.generator.json_schema.AspectLoader")
+    def test_clear(self, aspect_loader_mock, tmp_path):
+        model_file_path = tmp_path / "Aspect.ttl"
+        model_file_path.write_text("aspect")
+        self.get_loader_mock(aspect_loader_mock, [])
+        cache = JsonSchemaCache(tmp_path / "cache")
+        cache.get_schema(model_file_path)
+        cache.clear()
+
+        assert list(cache.cache_dir.iterdir()) == []
@@ -0,0 +1,205 @@
+"""Payload classes generator test suite."""
+
+from datetime import date
+from unittest import mock
+
+from esmf_aspect_meta_model_python.base.aspect import Aspect
+from esmf_aspect_meta_model_python.base.characteristics.characteristic import Characteristic
+from esmf_aspect_meta_model_python.base.characteristics.collection.collection import Collection
+from esmf_aspect_meta_model_python.base.characteristics.enumeration import Enumeration
+from esmf_aspect_meta_model_python.base.data_types.complex_type import ComplexType
+from esmf_aspect_meta_model_python.base.data_types.scalar import Scalar
+from esmf_aspect_meta_model_python.base.property import Property
+from esmf_aspect_meta_model_python.generator.payload_classes import (
+    PayloadClassCache,
+    PayloadClassGenerator,
+    get_docstring,
+    get_enumeration_literal,
+    get_identifier,
+    get_unique_name,
+    load_payload_classes,
+)
+
+XSD = "http://www.w3.org/2001/XMLSchema#"
+
+
+def get_element(spec, name, description=None, **kwargs):
+    element = mock.MagicMock(spec=spec, **kwargs)
+    element.name = name
+    element.get_description.return_value = description
+
+    return element
+
+
+def get_scalar_characteristic(type_name, spec=Characteristic, **kwargs):
+    return get_element(spec, type_name, data_type=mock.MagicMock(spec=Scalar, urn=XSD + type_name), **kwargs)
+
+
+def get_property(name, characteristic, is_optional=False):
+    return get_element(
+        Property,
+        name,
+        characteristic=characteristic,
+        payload_name=name,
+        is_optional=is_optional,
+        is_abstract=False,
+        is_not_in_payload=False,
+        extends=None,
+    )
+
+
+def get_aspect():
+    entity = get_element(ComplexType, "Point", "A point.", extends=None)
+    entity.properties = entity.all_properties = [
+        get_property("x", get_scalar_characteristic("float")),
+        get_property("class", get_scalar_characteristic("int"), is_optional=True),
+    ]
+    state = get_scalar_characteristic("string", Enumeration, values=["on", "off"])
+    state.name = "State"
+    points = get_element(
+        Collection,
+        "Points",
+        data_type=entity,
+        element_characteristic=None,
+    )
+
+    return get_element(
+        Aspect,
+        "Aspect",
+        urn="urn:samm:org.eclipse.esmf.test:1.0.0#Aspect",
+        properties=[
+            get_property("state", state),
+            get_property("points", points, is_optional=True),
+        ],
+    )
+
+
+class TestHelpers:
+    """Generator helpers test suite."""
+
+    def test_get_identifier(self):
+        assert get_identifier("name") == "name"
+        assert get_identifier("some-name") == "some_name"
+        assert get_identifier("1name") == "_1name"
+        assert get_identifier("1name", "VALUE_") == "VALUE_1name"
+        assert get_identifier("class") == "class_"
+        assert get_identifier("data") == "data_"
+        assert get_identifier("") == "_"
+
+    def test_get_unique_name(self):
+        used_names = {"name"}
+
+        assert get_unique_name("name", used_names) == "name2"
+        assert get_unique_name("name", used_names) == "name3"
+        assert get_unique_name("other", used_names) == "other"
+        assert used_names == {"name", "name2", "name3", "other"}
+
+    def test_get_docstring(self):
+        element = get_element(Characteristic, "name", 'A "quoted"\n  description.')
+
+        assert get_docstring(element) == '"""A \\"quoted\\" description."""'
+        assert get_docstring(get_element(Characteristic, "name")) is None
+        assert get_docstring("element") is None
+
+    def test_get_enumeration_literal(self):
+        assert get_enumeration_literal("green") == '"green"'
+        assert get_enumeration_literal(1) == "1"
+        assert get_enumeration_literal(date(2024, 1, 1)) == '"2024-01-01"'
+        assert get_enumeration_literal({"entity": "value"}) is None
+
+
+class TestPayloadClassGenerator:
+    """Payload class generator test suite."""
+
+    def test_init(self):
+        aspect = get_aspect()
+        result = PayloadClassGenerator(aspect)
+
+        assert result.aspect is aspect
+
+    def test_generate(self):
+        result = PayloadClassGenerator(get_aspect()).generate()
+
+        assert 'ASPECT_URN = "urn:samm:org.eclipse.esmf.test:1.0.0#Aspect"' in result
+        assert 'class State(Enum):\n    ON = "on"\n    OFF = "off"\n' in result
+        assert '@dataclass(slots=True, kw_only=True)\nclass Point:\n    """A point."""\n' in result
+        assert "    x: float\n    class_: Optional[int] = None\n" in result
+        assert "    state: State\n    points: Optional[List[Point]] = None\n" in result
+        assert '            state=State(data["state"]),' in result
+        assert "            points=None if value1 is None else [Point.from_json(item0) for item0 in value1]," in result
+        assert '            data["points"] = [item0.to_json() for item0 in self.points]' in result
+
+    def test_generated_module(self):
+        namespace = {}
+        exec(PayloadClassGenerator(get_aspect()).generate(), namespace)
+        payload = {"state": "on", "points": [{"x": 1.5, "class": 1}, {"x": 2.5}]}
+        result = namespace["from_json"](payload)
+
+        assert result.state is namespace["State"].ON
+        assert result.points[1].class_ is None
+        assert namespace["to_json"](result) == payload
+        assert not hasattr(result, "__dict__")
+
+    def test_write(self, tmp_path):
+        generator = PayloadClassGenerator(get_aspect())
+        generator.write(tmp_path / "aspect.py")
+
+        assert (tmp_path / "aspect.py").read_text() == generator.generate()
+
+
+class TestPayloadClassCache:
+    """Payload class cache test suite."""
+
+    def test_init(self, tmp_path):
+        result = PayloadClassCache(tmp_path / "cache")
+
+        assert result.cache_dir == tmp_path / "cache"
+        assert result.cache_dir.is_dir()
+
+    def test_get_module_name(self):
+        result = PayloadClassCache.get_module_name("source")
+
+        assert result.startswith("samm_payload_")
+        assert result == PayloadClassCache.get_module_name("source")
+        assert result != PayloadClassCache.get_module_name("other source")
+
+    @mock.patch("esmf_aspect_meta_model_python.generator.payload_classes.PayloadClassGenerator")
+    def test_load(self, generator_mock, tmp_path):
+        generator_mock.return_value.generate.return_value = f"VALUE = {tmp_path.name!r}\n"
+        cache = PayloadClassCache(tmp_path)
+        module = cache.load("aspect")
+
+        assert module.VALUE == tmp_path.name
+        assert cache.load("aspect") is module
+        assert PayloadClassCache(tmp_path).load("aspect") is module
+        assert len(list(tmp_path.glob("samm_payload_*.py"))) == 1
+        generator_mock.assert_called_with("aspect")
+
+    @mock.patch("esmf_aspect_meta_model_python.generator.payload_classes.PayloadClassGenerator")
+    def test_clear(self, generator_mock, tmp_path):
+        generator_mock.return_value.generate.return_value = "VALUE = 1\n"
+        cache = PayloadClassCache(tmp_path)
+        cache.load("aspect")
+        cache.clear()
+
+        assert list(tmp_path.glob("samm_payload_*.py")) == []
+
+
+class TestLoadPayloadClasses:
+    """Load payload classes test suite."""
+
+    @mock.patch("esmf_aspect_meta_model_python.generator.payload_classes.PayloadClassCache")
+    def test_load_with_cache_dir(self, cache_mock):
+        cache_mock.return_value.load.return_value = "module"
+        result = load_payload_classes("aspect", "cache_dir")
+
+        assert result == "module"
+        cache_mock.assert_called_once_with("cache_dir")
+        cache_mock.return_value.load.assert_called_once_with("aspect")
+
+    def test_load_without_cache_dir(self):
+        module = load_payload_classes(get_aspect())
+        result = module.from_json({"state": "off"})
+
+        assert result.state is module.State.OFF
+        assert load_payload_classes(get_aspect()) is module
@@ -0,0 +1,184 @@
+"""Value factories test suite."""
+
+import re
+
+from datetime import date, time
+from random import Random
+from unittest import mock
+
+import pytest
+
+from esmf_aspect_meta_model_python.base.bound_definition import BoundDefinition
+from esmf_aspect_meta_model_python.base.contraints.fixed_point_constraint import FixedPointConstraint
+from esmf_aspect_meta_model_python.base.contraints.language_constraint import LanguageConstraint
+from esmf_aspect_meta_model_python.base.contraints.length_constraint import LengthConstraint
+from esmf_aspect_meta_model_python.base.contraints.range_constraint import RangeConstraint
+from esmf_aspect_meta_model_python.base.contraints.regular_expression_constraint import RegularExpressionConstraint
+from esmf_aspect_meta_model_python.generator.value_factories import (
+    get_bounds,
+    get_checked_factory,
+    get_enumeration_factory,
+    get_lengths,
+    get_pattern_factory,
+    get_scalar_factory,
+    get_window,
+)
+
+XSD = "http://www.w3.org/2001/XMLSchema#"
+
+
+def get_range_constraint(min_value, max_value, lower=BoundDefinition.AT_LEAST, upper=BoundDefinition.AT_MOST):
+    return mock.MagicMock(
+        spec=RangeConstraint,
+        min_value=min_value,
+        max_value=max_value,
+        lower_bound_definition=lower,
+        upper_bound_definition=upper,
+    )
+
+
+def get_values(factory, count=200):
+    random = Random(1)
+
+    return [factory(random) for _ in range(count)]
+
+
+class TestHelpers:
+    """Value factory helpers test suite."""
+
+    def test_get_lengths(self):
+        length = mock.MagicMock(spec=LengthConstraint, min_value=None, max_value=3)
+
+        assert get_lengths([], (5, 12)) == (5, 12)
+        assert get_lengths([length], (5, 12)) == (3, 3)
+        assert get_lengths([mock.MagicMock(spec=LengthConstraint, min_value=20, max_value=None)], (5, 12)) == (20, 20)
+
+    def test_get_bounds(self):
+        constraints = [get_range_constraint(0, 100), get_range_constraint(10, None, upper=BoundDefinition.OPEN)]
+
+        assert get_bounds(constraints) == (10, 100)
+        assert get_bounds([]) == (None, None)
+
+    def test_get_window(self):
+        assert get_window(None, None) == (0, 1000)
+        assert get_window(5, 10) == (5, 10)
+        assert get_window(None, -1) == (-1001, -1)
+        assert get_window(2000, None) == (2000, 3000)
+
+
+class TestGetPatternFactory:
+    """Pattern factory test suite."""
+
+    @pytest.mark.parametrize(
+        "pattern",
+        [
+            "^[A-Z]{2}-[0-9]+$",
+            "(foo|bar)\\d{3}\\.txt",
+            "[^a-z]+x?",
+            "(ab)c\\1",
+            "^\\w+@\\w+\\.(com|org)$",
+            "a.b*",
+        ],
+    )
+    def test_pattern(self, pattern):
+        factory = get_pattern_factory(pattern)
+
+        assert all(re.search(pattern, value) for value in get_values(factory))
+
+
+class TestGetCheckedFactory:
+    """Checked factory test suite."""
+
+    def test_without_checks(self):
+        factory = mock.MagicMock()
+
+        assert get_checked_factory(factory, [], "name") is factory
+
+    def test_checked_values(self):
+        factory = get_checked_factory(
+            lambda random: random.randint(0, 9), [lambda value: "odd" if value % 2 else None], "int"
+        )
+
+        assert set(get_values(factory)) == {0, 2, 4, 6, 8}
+
+    def test_no_valid_value(self):
+        with pytest.raises(ValueError) as error:
+            get_checked_factory(lambda random: 1, [lambda value: "invalid"], "int")
+
+        assert str(error.value) == "Could not generate a valid value of int"
+
+
+class TestGetScalarFactory:
+    """Scalar factory test suite."""
+
+    def test_integer(self):
+        values = get_values(
+            get_scalar_factory(XSD + "int", [get_range_constraint(5, 10, BoundDefinition.GREATER_THAN)])
+        )
+
+        assert set(values) == {6, 7, 8, 9, 10}
+
+    def test_unsigned_integer(self):
+        values = get_values(get_scalar_factory(XSD + "unsignedByte"))
+
+        assert all(isinstance(value, int) and 0 <= value <= 255 for value in values)
+
+    def test_number_with_fixed_point(self):
+        constraint = mock.MagicMock(spec=FixedPointConstraint, integer=2, scale=1)
+        values = get_values(get_scalar_factory(XSD + "decimal", [constraint]))
+
+        assert all(-100 < value < 100 and round(value, 1) == value for value in values)
+
+    def test_string_with_length(self):
+        constraint = mock.MagicMock(spec=LengthConstraint, min_value=2, max_value=3)
+        values = get_values(get_scalar_factory(XSD + "string", [constraint]))
+
+        assert {len(value) for value in values} == {2, 3}
+
+    def test_string_with_pattern(self):
+        constraint = mock.MagicMock(spec=RegularExpressionConstraint, value="^[0-9]{4}$")
+        values = get_values(get_scalar_factory(XSD + "string", [constraint]))
+
+        assert all(re.fullmatch("[0-9]{4}", value) for value in values)
+
+    def test_date_with_range(self):
+        constraint = get_range_constraint(date(2024, 1, 1), date(2024, 1, 3))
+        values = get_values(get_scalar_factory(XSD + "date", [constraint]))
+
+        assert set(values) == {"2024-01-01", "2024-01-02", "2024-01-03"}
+
+    def test_time_with_range(self):
+        constraint = get_range_constraint(time(10, 0), time(11, 0))
+        values = get_values(get_scalar_factory(XSD + "time", [constraint]))
+
+        assert all("10:00:00" <= value <= "11:00:00" for value in values)
+
+    def test_lang_string(self):
+        constraint = mock.MagicMock(spec=LanguageConstraint, language_code="de")
+        values = get_values(get_scalar_factory("http://www.w3.org/1999/02/22-rdf-syntax-ns#langString", [constraint]))
+
+        assert all(list(value) == ["de"] for value in values)
+
+    def test_other_types(self):
+        for type_name in ("boolean", "anyURI", "dateTime", "hexBinary", "base64Binary", "gYear", "duration", "curie"):
+            assert get_values(get_scalar_factory(XSD + type_name), 1)
+
+    def test_unknown_type(self):
+        assert get_scalar_factory(XSD + "unknown") is None
+
+
+class TestGetEnumerationFactory:
+    """Enumeration factory test suite."""
+
+    def test_values(self):
+        factory = get_enumeration_factory(["on", "off"])
+
+        assert set(get_values(factory)) == {"on", "off"}
+
+    def test_checked_values(self):
+        factory = get_enumeration_factory([1, 2, 3], [lambda value: None if value > 1 else "value must be at least 2"])
+
+        assert set(get_values(factory)) == {2, 3}
+
+    def test_no_allowed_value(self):
+        assert get_enumeration_factory([1], [lambda value: "invalid"]) is None
@@ -5,6 +5,7 @@ from unittest import mock
 import pytest
 
 from esmf_aspect_meta_model_python.impl import DefaultTrait
+from esmf_aspect_meta_model_python.loader.lazy_value import LazyValue
 
 
 class TestDefaultTrait:
@@ -55,3 +56,15 @@ class TestDefaultTrait:
         result = trait.constraints
 
         assert result == [self.constraint_mock]
+
+    @mock.patch(
+        "esmf_aspect_meta_model_python.impl.characteristics.default_structured_value.DefaultCharacteristic.__init__"
+    )
+    def test_lazy_constraints(self, _):
+        constraints_loader = mock.MagicMock(name="constraints_loader", return_value=[self.constraint_mock])
+        trait = DefaultTrait(self.meta_model_mock, self.characteristic_mock, LazyValue(constraints_loader))
+
+        constraints_loader.assert_not_called()
+        assert trait.constraints == [self.constraint_mock]
+        assert trait.constraints == [self.constraint_mock]
+        constraints_loader.assert_called_once_with()
@@ -3,6 +3,7 @@
 from unittest import mock
 
 from esmf_aspect_meta_model_python.impl import DefaultComplexType
+from esmf_aspect_meta_model_python.loader.lazy_value import LazyValue
 
 
 class TestComplexType:
@@ -148,3 +149,16 @@ class TestComplexType:
         result = complex_type.properties
 
         assert result == [self.property_mock]
+
+    @mock.patch("esmf_aspect_meta_model_python.impl.data_types.default_complex_type.BaseImpl.__init__")
+    def test_lazy_properties(self, _):
+        DefaultComplexType.urn = None
+        property_mock = mock.MagicMock(name="property")
+        properties_loader = mock.MagicMock(name="properties_loader", return_value=[property_mock])
+        complex_type = DefaultComplexType(self.meta_model_mock, LazyValue(properties_loader), None)
+
+        properties_loader.assert_not_called()
+        assert complex_type.all_properties == [property_mock]
+        assert complex_type.properties == [property_mock]
+        properties_loader.assert_called_once_with()
+        property_mock.append_parent_element.assert_called_once_with(complex_type)
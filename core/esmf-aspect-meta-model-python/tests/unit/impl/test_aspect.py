@@ -3,6 +3,7 @@
 from unittest import mock
 
 from esmf_aspect_meta_model_python.impl import DefaultAspect
+from esmf_aspect_meta_model_python.loader.lazy_value import LazyValue
 
 
 class TestDefaultAspect:
@@ -97,3 +98,23 @@ class TestDefaultAspect:
         result = aspect.is_collection_aspect
 
         assert result == self.is_collection_aspect
+
+    @mock.patch("esmf_aspect_meta_model_python.impl.default_aspect.BaseImpl.__init__")
+    def test_lazy_children(self, _):
+        property_mock = mock.MagicMock(name="property")
+        properties_loader = mock.MagicMock(name="properties_loader", return_value=[property_mock])
+        aspect = DefaultAspect(
+            self.meta_model_mock,
+            LazyValue(properties_loader),
+            LazyValue(lambda: []),
+            LazyValue(lambda: []),
+            self.is_collection_aspect,
+        )
+
+        properties_loader.assert_not_called()
+        assert aspect.properties == [property_mock]
+        assert aspect.properties == [property_mock]
+        assert aspect.operations == []
+        assert aspect.events == []
+        properties_loader.assert_called_once_with()
+        property_mock.append_parent_element.assert_called_once_with(aspect)
@@ -3,6 +3,7 @@
 from unittest import mock
 
 from esmf_aspect_meta_model_python.impl import DefaultProperty
+from esmf_aspect_meta_model_python.loader.lazy_value import LazyValue
 
 
 class TestDefaultProperty:
@@ -188,3 +189,19 @@ class TestDefaultProperty:
 
         assert "property_preferred_names" in result
         assert "base_preferred_names" in result
+
+    @mock.patch("esmf_aspect_meta_model_python.impl.default_property.BaseImpl.__init__")
+    def test_lazy_characteristic(self, _):
+        characteristic_mock = mock.MagicMock(name="characteristic")
+        characteristic_loader = mock.MagicMock(name="characteristic_loader", return_value=characteristic_mock)
+        property_cls = DefaultProperty(
+            meta_model_base_attributes=self.meta_model_mock,
+            characteristic=LazyValue(characteristic_loader),
+            example_value=self.example_value,
+        )
+
+        characteristic_loader.assert_not_called()
+        assert property_cls.characteristic == characteristic_mock
+        assert property_cls.characteristic == characteristic_mock
+        characteristic_loader.assert_called_once_with()
+        characteristic_mock.append_parent_element.assert_called_once_with(property_cls)
@@ -15,6 +15,7 @@ class TestAbstractEntityInstantiator:
     @mock.patch("esmf_aspect_meta_model_python.loader.instantiator.abstract_entity_instantiator.isinstance")
     def test_create_instance(self, isinstance_mock, default_abstract_entity_mock):
         base_class_mock = mock.MagicMock(name="AbstractEntityInstantiator_class")
+        base_class_mock._defer.side_effect = lambda loader: loader()
         base_class_mock._instantiating_now = []
         base_class_mock._get_base_attributes = mock.MagicMock(return_value="meta_model_base_attributes")
         base_class_mock.get_extended_element = mock.MagicMock(return_value="extends_element")
@@ -15,6 +15,7 @@ class TestAspectInstantiator:
     @mock.patch("esmf_aspect_meta_model_python.loader.instantiator.aspect_instantiator.isinstance")
     def test_create_instance(self, isinstance_mock, default_aspect_mock):
         base_class_mock = mock.MagicMock(name="AspectInstantiator_class")
+        base_class_mock._defer.side_effect = lambda loader: loader()
         base_class_mock._get_base_attributes = mock.MagicMock(return_value="meta_model_base_attributes")
         base_class_mock._get_list_children = mock.MagicMock(side_effect=("properties", "operations", "events"))
         samm_mock = mock.MagicMock(name="SAMM_class")
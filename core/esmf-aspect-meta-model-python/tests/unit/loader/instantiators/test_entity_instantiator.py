@@ -16,6 +16,7 @@ class TestEntityInstantiator:
     def test_create_instance(self, isinstance_mock, default_entity_mock):
         isinstance_mock.return_value = True
         base_class_mock = mock.MagicMock(name="EntityInstantiator_class")
+        base_class_mock._defer.side_effect = lambda loader: loader()
         base_class_mock._instantiating_now = []
         base_class_mock._get_base_attributes.return_value = "meta_model_base_attributes"
         base_class_mock.get_extended_element.return_value = "extends_element"
@@ -15,10 +15,7 @@ class TestEnumerationInstantiator:
     """EnumerationInstantiator unit tests class."""
 
     @mock.patch("esmf_aspect_meta_model_python.loader.instantiator.enumeration_instantiator.DefaultEnumeration")
-    @mock.patch(
-        "esmf_aspect_meta_model_python.loader.instantiator.enumeration_instantiator.RdfHelper.get_rdf_list_values"
-    )
-    def test_create_instance(self, get_rdf_list_values_mock, default_enumeration_mock):
+    def test_create_instance(self, default_enumeration_mock):
         base_class_mock = mock.MagicMock(name="EnumerationInstantiator_class")
         base_class_mock._get_data_type.return_value = "data_type"
         base_class_mock._get_base_attributes.return_value = "meta_model_base_attributes"
@@ -30,7 +27,7 @@ class TestEnumerationInstantiator:
         sammc_mock = mock.MagicMock(name="SAMMC")
         sammc_mock.get_urn.return_value = "predicate"
         base_class_mock._sammc = sammc_mock
-        get_rdf_list_values_mock.return_value = ["value_node"]
+        base_class_mock._graph_index.get_list.return_value = ("value_node",)
         default_enumeration_mock.return_value = "instance"
         result = EnumerationInstantiator._create_instance(base_class_mock, "element_node")
 
@@ -40,7 +37,7 @@ class TestEnumerationInstantiator:
         base_class_mock._EnumerationInstantiator__to_enum_node_value.assert_called_once_with("value_node")
         sammc_mock.get_urn.assert_called_once_with(SAMMC.values)
         aspect_graph_mock.value.assert_called_once_with(subject="element_node", predicate="predicate")
-        get_rdf_list_values_mock.assert_called_once_with("value_collection_node", aspect_graph_mock)
+        base_class_mock._graph_index.get_list.assert_called_once_with("value_collection_node")
         default_enumeration_mock.assert_called_once_with("meta_model_base_attributes", "data_type", ["value"])
 
     def test_create_instance_with_exception(self):
@@ -172,13 +169,9 @@ class TestEnumerationInstantiator:
         samm_mock.get_urn.assert_called_once_with(SAMM.characteristic)
         sammc_mock.collections_urns.assert_called_once()
 
-    @mock.patch(
-        "esmf_aspect_meta_model_python.loader.instantiator.enumeration_instantiator.RdfHelper.get_rdf_list_values"
-    )
-    def test_instantiate_enum_collection(self, get_rdf_list_values_mock):
-        get_rdf_list_values_mock.return_value = ["value_node"]
+    def test_instantiate_enum_collection(self):
         base_class_mock = mock.MagicMock(name="EnumerationInstantiator_class")
-        base_class_mock._aspect_graph = "aspect_graph"
+        base_class_mock._graph_index.get_list.return_value = ("value_node",)
         base_class_mock._EnumerationInstantiator__to_enum_node_value.return_value = "value"
         result = EnumerationInstantiator._EnumerationInstantiator__instantiate_enum_collection(
             base_class_mock,
@@ -186,5 +179,5 @@ class TestEnumerationInstantiator:
         )
 
         assert result == ["value"]
-        get_rdf_list_values_mock.assert_called_once_with("value_list", "aspect_graph")
+        base_class_mock._graph_index.get_list.assert_called_once_with("value_list")
         base_class_mock._EnumerationInstantiator__to_enum_node_value.assert_called_once_with("value_node")
@@ -75,6 +75,7 @@ class TestPropertyInstantiator:
     @mock.patch("esmf_aspect_meta_model_python.loader.instantiator.property_instantiator.DefaultProperty")
     def test_create_property_direct_reference(self, default_property_mock):
         base_class_mock = mock.MagicMock(name="PropertyInstantiator_class")
+        base_class_mock._defer.side_effect = lambda loader: loader()
         base_class_mock._get_base_attributes.return_value = "meta_model_base_attributes"
         base_class_mock._get_child.return_value = "characteristic"
         samm_mock = mock.MagicMock(name="SAMM")
@@ -105,6 +106,7 @@ class TestPropertyInstantiator:
     @mock.patch("esmf_aspect_meta_model_python.loader.instantiator.property_instantiator.DefaultProperty")
     def test_create_property_blank_node(self, default_property_mock):
         base_class_mock = mock.MagicMock(name="PropertyInstantiator_class")
+        base_class_mock._defer.side_effect = lambda loader: loader()
         base_class_mock._get_base_attributes.return_value = "meta_model_base_attributes"
         base_class_mock._get_child.return_value = "characteristic"
         samm_mock = mock.MagicMock(name="SAMM")
@@ -155,6 +157,7 @@ class TestPropertyInstantiator:
     @mock.patch("esmf_aspect_meta_model_python.loader.instantiator.property_instantiator.DefaultProperty")
     def test_create_property_with_extends(self, default_property_mock):
         base_class_mock = mock.MagicMock(name="PropertyInstantiator_class")
+        base_class_mock._defer.side_effect = lambda loader: loader()
         base_class_mock._get_child.side_effect = ("payload_name", "extends", "characteristic")
         base_class_mock._get_base_attributes.return_value = "meta_model_base_attributes"
         samm_mock = mock.MagicMock(name="SAMM")
@@ -12,14 +12,11 @@ from esmf_aspect_meta_model_python.vocabulary.SAMMC import SAMMC
 class TestStructuredValueInstantiator:
     """StructuredValueInstantiator unit tests class."""
 
-    @mock.patch(
-        "esmf_aspect_meta_model_python.loader.instantiator.structured_value_instantiator.RdfHelper.get_rdf_list_values"
-    )
     @mock.patch("esmf_aspect_meta_model_python.loader.instantiator.structured_value_instantiator.RdfHelper.to_python")
     @mock.patch(
         "esmf_aspect_meta_model_python.loader.instantiator.structured_value_instantiator.DefaultStructuredValue"
     )
-    def test_create_instance(self, default_structured_value_mock, to_python_mock, get_rdf_list_values_mock):
+    def test_create_instance(self, default_structured_value_mock, to_python_mock):
         base_class_mock = mock.MagicMock(name="StructuredValueInstantiator_class")
         base_class_mock._get_data_type.return_value = "data_type"
         base_class_mock._get_base_attributes.return_value = "meta_model_base_attributes"
@@ -32,7 +29,7 @@ class TestStructuredValueInstantiator:
         sammc_mock.get_urn.return_value = "predicate"
         base_class_mock._sammc = sammc_mock
         to_python_mock.return_value = "deconstruction_rule"
-        get_rdf_list_values_mock.return_value = ["element_node"]
+        base_class_mock._graph_index.get_list.return_value = ("element_node",)
         default_structured_value_mock.return_value = "instance"
         result = StructuredValueInstantiator._create_instance(base_class_mock, "element_node")
 
@@ -52,7 +49,7 @@ class TestStructuredValueInstantiator:
         )
         assert aspect_graph_mock.value.call_count == 2
         to_python_mock.assert_called_once_with("deconstruction_rule_value")
-        get_rdf_list_values_mock.assert_called_once_with("element_nodes", aspect_graph_mock)
+        base_class_mock._graph_index.get_list.assert_called_once_with("element_nodes")
         base_class_mock._StructuredValueInstantiator__to_element_node_value.assert_called_once_with("element_node")
         default_structured_value_mock.assert_called_once_with(
             "meta_model_base_attributes",
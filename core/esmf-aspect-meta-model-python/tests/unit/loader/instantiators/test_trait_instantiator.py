@@ -14,6 +14,7 @@ class TestTraitInstantiator:
     @mock.patch("esmf_aspect_meta_model_python.loader.instantiator.trait_instantiator.DefaultTrait")
     def test_create_instance(self, default_trait_mock):
         base_class_mock = mock.MagicMock(name="TraitInstantiator_class")
+        base_class_mock._defer.side_effect = lambda loader: loader()
         base_class_mock._get_base_attributes.return_value = "meta_model_base_attributes"
         base_class_mock._model_element_factory.create_element.return_value = "element"
         base_class_mock._get_child.return_value = "base_characteristic"
@@ -0,0 +1,133 @@
+"""Access path index test suite."""
+
+from unittest import mock
+
+from esmf_aspect_meta_model_python.base.aspect import Aspect
+from esmf_aspect_meta_model_python.base.characteristics.characteristic import Characteristic
+from esmf_aspect_meta_model_python.base.characteristics.collection.collection import Collection
+from esmf_aspect_meta_model_python.base.characteristics.trait import Trait
+from esmf_aspect_meta_model_python.base.data_types.complex_type import ComplexType
+from esmf_aspect_meta_model_python.base.either import Either
+from esmf_aspect_meta_model_python.base.event import Event
+from esmf_aspect_meta_model_python.base.operation import Operation
+from esmf_aspect_meta_model_python.base.property import Property
+from esmf_aspect_meta_model_python.loader.access_path_index import AccessPathIndex
+
+NAMESPACE = "urn:samm:org.eclipse.esmf.test:1.0.0#"
+
+
+def get_element(spec, name, **kwargs):
+    element = mock.MagicMock(spec=spec, urn=NAMESPACE + name, **kwargs)
+    element.name = name
+
+    return element
+
+
+def get_property(name, characteristic=None, payload_name=None, **kwargs):
+    kwargs.setdefault("is_abstract", False)
+    kwargs.setdefault("is_not_in_payload", False)
+    kwargs.setdefault("extends", None)
+
+    return get_element(
+        Property,
+        name,
+        characteristic=characteristic,
+        payload_name=payload_name if payload_name else name,
+        **kwargs,
+    )
+
+
+def get_entity_characteristic(name, properties):
+    entity = get_element(ComplexType, name + "Entity", all_properties=properties)
+
+    return get_element(Characteristic, name, data_type=entity), entity
+
+
+def get_aspect(properties, operations=(), events=()):
+    return get_element(Aspect, "Aspect", properties=properties, operations=list(operations), events=list(events))
+
+
+class TestAccessPathIndex:
+    """Access path index test suite."""
+
+    def test_get_root_properties(self):
+        input_property = get_property("input")
+        output_property = get_property("output")
+        parameter = get_property("parameter")
+        aspect = get_aspect(
+            [get_property("property")],
+            [get_element(Operation, "operation", input_properties=[input_property], output_property=output_property)],
+            [get_element(Event, "event", parameters=[parameter])],
+        )
+        result = AccessPathIndex.get_root_properties(aspect)
+
+        assert result == [aspect.properties[0], input_property, output_property, parameter]
+
+    def test_get_payload_key(self):
+        abstract_property = get_property("abstract", payload_name="abstract_payload")
+        extending_property = get_property("extending_abstract", extends=abstract_property)
+        extending_property.urn = None
+
+        assert AccessPathIndex.get_payload_key(get_property("name", payload_name="payload")) == "payload"
+        assert AccessPathIndex.get_payload_key(extending_property) == "abstract_payload"
+
+    def test_get_value_elements(self):
+        left, entity = get_entity_characteristic("Left", [])
+        right = get_element(Characteristic, "Right", data_type="scalar")
+        either = get_element(Either, "Either", left=left, right=right)
+        collection = get_element(Collection, "Collection", element_characteristic=either)
+        trait = get_element(Trait, "Trait", base_characteristic=collection)
+        result = AccessPathIndex.get_value_elements(trait)
+
+        assert result == [trait, collection, either, left, entity, right]
+
+    def test_get_paths(self):
+        position_x = get_property("x")
+        position_y = get_property("y")
+        characteristic, entity = get_entity_characteristic("Position", [position_x, position_y])
+        position = get_property("position", characteristic, payload_name="pos")
+        index = AccessPathIndex([get_aspect([position]), "other element"])
+
+        assert index.get_paths("pos") == [["pos"]]
+        assert index.get_paths("position") == []
+        assert index.get_paths("x") == [["pos", "x"]]
+        assert index.get_paths("PositionEntity") == [["pos"]]
+        assert index.get_urn_paths(NAMESPACE + "y") == [["pos", "y"]]
+        assert index.get_element_paths(entity) == [["pos"]]
+        assert index.get_element_paths(get_property("unknown")) == []
+
+    def test_get_paths_multiple_parents(self):
+        value = get_property("value")
+        first_characteristic, _ = get_entity_characteristic("First", [value])
+        second_characteristic, _ = get_entity_characteristic("Second", [value])
+        index = AccessPathIndex(
+            [get_aspect([get_property("first", first_characteristic), get_property("second", second_characteristic)])]
+        )
+
+        assert index.get_element_paths(value) == [["first", "value"], ["second", "value"]]
+        assert index.get_paths("value") == [["first", "value"], ["second", "value"]]
+
+    def test_get_paths_extending_property(self):
+        abstract_property = get_property("abstract", is_abstract=True)
+        extending_property = get_property("extending_abstract", extends=abstract_property)
+        extending_property.urn = None
+        characteristic, _ = get_entity_characteristic("Extending", [extending_property, abstract_property])
+        index = AccessPathIndex([get_aspect([get_property("property", characteristic)])])
+
+        assert index.get_element_paths(extending_property) == [["property", "abstract"]]
+        assert index.get_element_paths(abstract_property) == [["property", "abstract"]]
+        assert index.get_paths("abstract") == [["property", "abstract"]]
+
+    def test_get_paths_recursive_entity(self):
+        child = get_property("child")
+        characteristic, entity = get_entity_characteristic("Node", [child])
+        child.characteristic = characteristic
+        index = AccessPathIndex([get_aspect([get_property("root", characteristic)])])
+
+        assert index.get_element_paths(child) == [["root", "child"]]
+        assert index.get_element_paths(entity) == [["root"], ["root", "child"]]
+
+    def test_get_paths_not_in_payload(self):
+        index = AccessPathIndex([get_aspect([get_property("hidden", is_not_in_payload=True)])])
+
+        assert index.get_paths("hidden") == []
@@ -0,0 +1,26 @@
+"""Aspect load result test suite."""
+
+from esmf_aspect_meta_model_python.loader.aspect_load_result import AspectLoadResult
+
+
+class TestAspectLoadResult:
+    """Aspect load result test suite."""
+
+    def test_init(self):
+        result = AspectLoadResult("file_path", ["element"], graph="graph")
+
+        assert result.file_path == "file_path"
+        assert result.elements == ["element"]
+        assert result.error is None
+        assert result.graph == "graph"
+        assert result.is_loaded is True
+        assert repr(result) == "AspectLoadResult('file_path', elements=1)"
+
+    def test_init_with_error(self):
+        error = ValueError("error")
+        result = AspectLoadResult("file_path", error=error)
+
+        assert result.elements == []
+        assert result.error is error
+        assert result.is_loaded is False
+        assert repr(result) == "AspectLoadResult('file_path', error=ValueError('error'))"
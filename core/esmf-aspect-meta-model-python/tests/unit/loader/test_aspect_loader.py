@@ -1,8 +1,15 @@
 """Aspect model Loader test suite."""
 
+import asyncio
+import threading
+
+from pathlib import Path
 from unittest import mock
 
-from esmf_aspect_meta_model_python.loader.aspect_loader import AspectLoader
+import pytest
+
+from esmf_aspect_meta_model_python.loader.aspect_load_result import AspectLoadResult
+from esmf_aspect_meta_model_python.loader.aspect_loader import AspectLoader, _load_aspect_model_in_worker
 
 
 class TestAspectLoader:
@@ -28,7 +35,34 @@ class TestAspectLoader:
         assert result._cache == "cache"
         assert result._graph == "graph"
         default_element_cache_mock.assert_called_once()
-        samm_graph_mock.assert_called_once_with()
+        samm_graph_mock.assert_called_once_with(cache=None, graph_cache=None, lazy=False)
+
+    @mock.patch("esmf_aspect_meta_model_python.loader.aspect_loader.SAMMGraph")
+    def test_init_lazy(self, samm_graph_mock):
+        result = AspectLoader(lazy=True)
+
+        assert result._lazy is True
+        samm_graph_mock.assert_called_once_with(cache=None, graph_cache=None, lazy=True)
+
+    @mock.patch("esmf_aspect_meta_model_python.loader.aspect_loader.SAMMGraph")
+    @mock.patch("esmf_aspect_meta_model_python.loader.aspect_loader.DefaultElementCache")
+    def test_init_with_cache(self, default_element_cache_mock, samm_graph_mock):
+        result = AspectLoader(cache="shared_cache")
+        result._reset_graph()
+
+        assert result._cache == "shared_cache"
+        default_element_cache_mock.assert_not_called()
+        samm_graph_mock.assert_called_with(cache="shared_cache", graph_cache=None, lazy=False)
+
+    @mock.patch("esmf_aspect_meta_model_python.loader.aspect_loader.SAMMGraph")
+    @mock.patch("esmf_aspect_meta_model_python.loader.aspect_loader.AspectGraphCache")
+    def test_init_with_graph_cache_dir(self, aspect_graph_cache_mock, samm_graph_mock):
+        aspect_graph_cache_mock.return_value = "graph_cache"
+        result = AspectLoader("cache_dir")
+
+        assert result._graph_cache == "graph_cache"
+        aspect_graph_cache_mock.assert_called_once_with("cache_dir")
+        samm_graph_mock.assert_called_once_with(cache=None, graph_cache="graph_cache", lazy=False)
 
     @mock.patch("esmf_aspect_meta_model_python.loader.aspect_loader.SAMMGraph")
     @mock.patch("esmf_aspect_meta_model_python.loader.aspect_loader.DefaultElementCache")
@@ -92,3 +126,120 @@ class TestAspectLoader:
         reset_graph_mock.assert_called_once()
         graph_mock.parse.assert_called_once_with("converted_file_path")
         graph_mock.to_python.assert_called_once()
+
+    @mock.patch("esmf_aspect_meta_model_python.loader.aspect_loader.AspectLoader.convert_file_path")
+    @mock.patch("esmf_aspect_meta_model_python.loader.aspect_loader.SAMMGraph")
+    @mock.patch("esmf_aspect_meta_model_python.loader.aspect_loader.DefaultElementCache")
+    def test_load_aspect_models(self, default_element_cache_mock, samm_graph_mock, convert_file_path_mock):
+        default_element_cache_mock.side_effect = ("cache", "first_cache", "second_cache")
+        graph_mock = mock.MagicMock(name="graph")
+        graph_mock.to_python.side_effect = (["first_aspect"], ValueError("error"))
+        samm_graph_mock.return_value = graph_mock
+        convert_file_path_mock.side_effect = lambda file_path: file_path
+        loader = AspectLoader()
+        result = loader.load_aspect_models(["first_file_path", "second_file_path"])
+
+        assert [load_result.file_path for load_result in result] == ["first_file_path", "second_file_path"]
+        assert result[0].elements == ["first_aspect"]
+        assert result[0].is_loaded is True
+        assert result[0].graph == graph_mock
+        assert result[1].elements == []
+        assert str(result[1].error) == "error"
+        assert loader._cache == "cache"
+        assert samm_graph_mock.call_args_list[1:] == [
+            mock.call(cache="first_cache", graph_cache=None, lazy=False),
+            mock.call(cache="second_cache", graph_cache=None, lazy=False),
+        ]
+        graph_mock.parse.assert_has_calls([mock.call("first_file_path"), mock.call("second_file_path")])
+
+    @mock.patch("esmf_aspect_meta_model_python.loader.aspect_loader.AspectLoader.convert_file_path")
+    @mock.patch("esmf_aspect_meta_model_python.loader.aspect_loader.SAMMGraph")
+    def test_load_aspect_models_file_not_found(self, samm_graph_mock, convert_file_path_mock):
+        convert_file_path_mock.side_effect = FileNotFoundError("not found")
+        loader = AspectLoader()
+        result = loader.load_aspect_models([Path("file_path")])
+
+        assert result[0].file_path == "file_path"
+        assert isinstance(result[0].error, FileNotFoundError)
+
+    @mock.patch("esmf_aspect_meta_model_python.loader.aspect_loader.ProcessPoolExecutor")
+    @mock.patch("esmf_aspect_meta_model_python.loader.aspect_loader.AspectLoader._load_batch_model")
+    def test_load_aspect_models_parallel(self, load_batch_model_mock, process_pool_executor_mock):
+        executor_mock = mock.MagicMock(name="executor")
+        executor_mock.map.return_value = iter(["first_result", "second_result"])
+        process_pool_executor_mock.return_value.__enter__.return_value = executor_mock
+        loader = AspectLoader()
+        result = loader.load_aspect_models([Path("first_file_path"), "second_file_path"], workers=2)
+
+        assert result == ["first_result", "second_result"]
+        load_batch_model_mock.assert_not_called()
+        process_pool_executor_mock.assert_called_once_with(max_workers=2)
+        executor_mock.map.assert_called_once_with(
+            _load_aspect_model_in_worker,
+            ["first_file_path", "second_file_path"],
+            [None, None],
+            chunksize=1,
+        )
+
+    @mock.patch("esmf_aspect_meta_model_python.loader.aspect_loader.AspectLoader")
+    def test_load_aspect_model_in_worker(self, aspect_loader_mock):
+        load_result = AspectLoadResult("file_path", ["aspect"], graph="graph")
+        aspect_loader_mock.return_value._load_batch_model.return_value = load_result
+        result = _load_aspect_model_in_worker("file_path", "graph_cache_dir")
+
+        assert result is load_result
+        assert result.graph is None
+        aspect_loader_mock.assert_called_once_with("graph_cache_dir")
+        aspect_loader_mock.return_value._load_batch_model.assert_called_once_with("file_path")
+
+    @mock.patch("esmf_aspect_meta_model_python.loader.aspect_loader.AspectLoader.convert_file_path")
+    @mock.patch("esmf_aspect_meta_model_python.loader.aspect_loader.SAMMGraph")
+    def test_load_model(self, samm_graph_mock, convert_file_path_mock):
+        graph_mock = mock.MagicMock(name="graph")
+        graph_mock.to_python.return_value = ["aspect"]
+        samm_graph_mock.return_value = graph_mock
+        convert_file_path_mock.return_value = "converted_file_path"
+        loader = AspectLoader()
+        result = loader._load_model("file_path")
+
+        assert result == (graph_mock, ["aspect"])
+        graph_mock.parse.assert_called_once_with("converted_file_path")
+
+    @mock.patch("esmf_aspect_meta_model_python.loader.aspect_loader.AspectLoader._load_model")
+    def test_load_aspect_model_async(self, load_model_mock):
+        release = threading.Event()
+
+        def load_model(file_path):
+            release.wait(5)
+            return "graph", ["aspect"]
+
+        load_model_mock.side_effect = load_model
+        loader = AspectLoader()
+
+        async def load_models():
+            loads = [asyncio.ensure_future(loader.load_aspect_model_async("file_path")) for _ in range(3)]
+            await asyncio.sleep(0.01)
+            in_flight = list(loader._loading_tasks)
+            release.set()
+
+            return await asyncio.gather(*loads), in_flight
+
+        result, in_flight = asyncio.run(load_models())
+
+        assert result == [["aspect"], ["aspect"], ["aspect"]]
+        assert result[0] is result[1] is result[2]
+        assert len(in_flight) == 1
+        assert loader._loading_tasks == {}
+        assert loader._graph == "graph"
+        load_model_mock.assert_called_once_with("file_path")
+
+    @mock.patch("esmf_aspect_meta_model_python.loader.aspect_loader.AspectLoader._load_model")
+    def test_load_aspect_model_async_error(self, load_model_mock):
+        load_model_mock.side_effect = FileNotFoundError("not found")
+        loader = AspectLoader()
+
+        with pytest.raises(FileNotFoundError) as error:
+            asyncio.run(loader.load_aspect_model_async("file_path"))
+
+        assert str(error.value) == "not found"
+        assert loader._loading_tasks == {}
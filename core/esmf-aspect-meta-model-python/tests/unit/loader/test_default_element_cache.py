@@ -0,0 +1,167 @@
+"""Default element cache test suite."""
+
+import pytest
+
+from esmf_aspect_meta_model_python.base.cache_strategy import CacheStrategy
+from esmf_aspect_meta_model_python.base.property import Property
+from esmf_aspect_meta_model_python.impl.base_impl import BaseImpl
+from esmf_aspect_meta_model_python.impl.default_property import DefaultProperty
+from esmf_aspect_meta_model_python.impl.default_quantity_kind import DefaultQuantityKind
+from esmf_aspect_meta_model_python.loader.default_element_cache import DefaultElementCache
+from esmf_aspect_meta_model_python.loader.meta_model_base_attributes import MetaModelBaseAttributes
+
+NAMESPACE = "urn:samm:org.eclipse.esmf.test:1.0.0#"
+
+
+def get_attributes(name, urn=None) -> MetaModelBaseAttributes:
+    return MetaModelBaseAttributes("2.1.0", urn, name, {}, {}, [])
+
+
+def get_property(name, payload_name=None) -> DefaultProperty:
+    return DefaultProperty(get_attributes(name, NAMESPACE + name), None, None, payload_name=payload_name)
+
+
+class DictElementCache(CacheStrategy):
+    """Cache strategy which implements only the original abstract methods."""
+
+    def __init__(self):
+        self.elements = {}
+
+    def reset(self):
+        self.elements.clear()
+
+    def get(self, key):
+        return self.elements.get(key)
+
+    def get_by_name(self, name):
+        return [element for element in self.elements.values() if element.name == name]
+
+    def resolve_instance(self, model_element):
+        return self.elements.setdefault(model_element.urn, model_element)
+
+    def add_element(self, name, model_element, overwrite=False):
+        self.elements[name] = model_element
+
+
+class ListedElementCache(DictElementCache):
+    """Cache strategy which provides the cached elements for the default lookups."""
+
+    def get_elements(self):
+        return list(self.elements.values())
+
+
+class TestCacheStrategy:
+    """Cache strategy interface test suite."""
+
+    def test_subclass_without_lookups(self):
+        cache = DictElementCache()
+        element = get_property("property")
+
+        assert cache.resolve_instance(element) is element
+        with pytest.raises(NotImplementedError) as error:
+            cache.get_by_urn(NAMESPACE + "property")
+
+        assert str(error.value) == "DictElementCache does not provide the cached elements"
+
+    def test_default_lookups(self):
+        cache = ListedElementCache()
+        element = get_property("property")
+        quantity_kind = DefaultQuantityKind(get_attributes("quantity_kind", NAMESPACE + "quantity_kind"))
+        cache.resolve_instance(element)
+        cache.add_element("name", quantity_kind)
+
+        assert cache.get_by_urn(NAMESPACE + "quantity_kind") is quantity_kind
+        assert cache.get_by_urn(NAMESPACE + "unknown") is None
+        assert cache.get_by_type(Property) == [element]
+        assert cache.get_by_type(BaseImpl) == [element, quantity_kind]
+
+
+class TestDefaultElementCache:
+    """Default element cache test suite."""
+
+    def test_resolve_instance(self):
+        cache = DefaultElementCache()
+        element = get_property("property")
+        result = cache.resolve_instance(element)
+
+        assert result is element
+        assert cache.get(NAMESPACE + "property") is element
+        assert cache.resolve_instance(get_property("property")) is element
+
+    def test_resolve_instance_without_urn(self):
+        cache = DefaultElementCache()
+        element = DefaultQuantityKind(get_attributes("quantity_kind"))
+        result = cache.resolve_instance(element)
+
+        assert result is element
+        assert cache.get_by_name("quantity_kind") == []
+
+    def test_get_by_name(self):
+        cache = DefaultElementCache()
+        element = get_property("property")
+        payload_element = get_property("other_property", payload_name="property")
+        hidden_element = get_property("payload_property", payload_name="payload")
+        for model_element in (element, payload_element, hidden_element):
+            cache.resolve_instance(model_element)
+
+        assert cache.get_by_name("property") == [element, payload_element]
+        assert cache.get_by_name("payload") == [hidden_element]
+        assert cache.get_by_name("payload_property") == []
+
+    def test_get_by_urn(self):
+        cache = DefaultElementCache()
+        element = get_property("property")
+        cache.add_element("name", element)
+
+        assert cache.get_by_urn(NAMESPACE + "property") is element
+        assert cache.get_by_urn(NAMESPACE + "unknown") is None
+
+    def test_get_by_type(self):
+        cache = DefaultElementCache()
+        element = get_property("property")
+        quantity_kind = DefaultQuantityKind(get_attributes("quantity_kind", NAMESPACE + "quantity_kind"))
+        cache.resolve_instance(element)
+        cache.resolve_instance(quantity_kind)
+
+        assert cache.get_by_type(Property) == [element]
+        assert cache.get_by_type(DefaultQuantityKind) == [quantity_kind]
+        assert cache.get_by_type(BaseImpl) == [element, quantity_kind]
+
+    def test_get_elements(self):
+        cache = DefaultElementCache()
+        element = get_property("property")
+        cache.resolve_instance(element)
+
+        assert cache.get_elements() == [element]
+
+    def test_add_element(self):
+        cache = DefaultElementCache()
+        element = get_property("property")
+        cache.add_element("name", element)
+        cache.add_element("name", get_property("other_property"))
+
+        assert cache.get("name") is element
+        assert cache.get_by_name("other_property") == []
+
+    def test_add_element_overwrite(self):
+        cache = DefaultElementCache()
+        element = get_property("property")
+        other_element = get_property("other_property")
+        cache.add_element("name", element)
+        cache.add_element("name", other_element, overwrite=True)
+
+        assert cache.get("name") is other_element
+        assert cache.get_by_name("property") == []
+        assert cache.get_by_urn(NAMESPACE + "property") is None
+        assert cache.get_by_name("other_property") == [other_element]
+        assert cache.get_by_type(Property) == [other_element]
+
+    def test_reset(self):
+        cache = DefaultElementCache()
+        cache.resolve_instance(get_property("property"))
+        cache.reset()
+
+        assert cache.get(NAMESPACE + "property") is None
+        assert cache.get_by_name("property") == []
+        assert cache.get_by_urn(NAMESPACE + "property") is None
+        assert cache.get_by_type(Property) == []
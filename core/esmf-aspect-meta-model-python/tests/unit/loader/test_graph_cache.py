@@ -0,0 +1,139 @@
+"""Aspect graph cache test suite."""
+
+from rdflib import RDF, XSD, BNode, Graph, Literal, URIRef
+
+from esmf_aspect_meta_model_python.loader.graph_cache import AspectGraphCache
+from esmf_aspect_meta_model_python.resolver.layered_graph import GraphLayer, LayeredGraph
+
+ASPECT = URIRef("urn:samm:org.eclipse.esmf.test:1.0.0#Aspect")
+PROPERTY = URIRef("urn:samm:org.eclipse.esmf.test:1.0.0#property")
+ASPECT_TYPE = URIRef("urn:samm:org.eclipse.esmf.samm:meta-model:2.1.0#Aspect")
+SAMM_NAMESPACE = "urn:samm:org.eclipse.esmf.samm:meta-model:2.1.0#"
+
+
+def get_resolved_graph(model_file_path, dependency_file_path) -> LayeredGraph:
+    graph = LayeredGraph()
+    graph.bind("samm", SAMM_NAMESPACE)
+    graph.add((ASPECT, RDF.type, ASPECT_TYPE))
+    graph.add((ASPECT, PROPERTY, Literal("value", lang="en")))
+
+    dependency_graph = Graph()
+    dependency_graph.add((PROPERTY, RDF.value, Literal("1", datatype=XSD.int)))
+    dependency_graph.add((PROPERTY, RDF.rest, BNode("node")))
+    graph.add_layer(GraphLayer(dependency_graph, [str(dependency_file_path)]))
+    graph.add_layer(GraphLayer(Graph()))
+
+    return graph
+
+
+class TestAspectGraphCache:
+    """Aspect graph cache test suite."""
+
+    def setup_files(self, tmp_path):
+        model_folder = tmp_path / "model"
+        model_folder.mkdir()
+        model_file_path = model_folder / "Aspect.ttl"
+        model_file_path.write_text("aspect")
+        dependency_file_path = model_folder / "Dependency.ttl"
+        dependency_file_path.write_text("dependency")
+
+        return str(model_file_path), str(dependency_file_path)
+
+    def test_init(self, tmp_path):
+        result = AspectGraphCache(tmp_path / "cache")
+
+        assert result.cache_dir == tmp_path / "cache"
+        assert result.cache_dir.is_dir()
+
+    def test_get_key(self, tmp_path):
+        model_file_path, dependency_file_path = self.setup_files(tmp_path)
+        cache = AspectGraphCache(tmp_path / "cache")
+        key = cache.get_key("2.1.0", [model_file_path, dependency_file_path])
+
+        assert key == cache.get_key("2.1.0", [model_file_path, dependency_file_path])
+        assert key != cache.get_key("2.1.0", [dependency_file_path, model_file_path])
+        assert key != cache.get_key("2.0.0", [model_file_path, dependency_file_path])
+
+        (tmp_path / "model" / "New.ttl").write_text("new")
+        assert key != cache.get_key("2.1.0", [model_file_path, dependency_file_path])
+
+    def test_save_and_load(self, tmp_path):
+        model_file_path, dependency_file_path = self.setup_files(tmp_path)
+        cache = AspectGraphCache(tmp_path / "cache")
+        resolved_graph = get_resolved_graph(model_file_path, dependency_file_path)
+        saved = cache.save(resolved_graph, model_file_path, "2.1.0")
+        graph = LayeredGraph()
+        loaded = cache.load(graph, model_file_path)
+
+        assert saved is True
+        assert loaded is True
+        assert set(graph.top_triples((None, None, None))) == set(resolved_graph.top_triples((None, None, None)))
+        assert set(graph) == set(resolved_graph)
+        assert len(graph.layers) == 1
+        assert graph.layers[0].file_paths == (dependency_file_path,)
+        assert ("samm", URIRef(SAMM_NAMESPACE)) in list(graph.namespaces())
+
+    def test_load_to_plain_graph(self, tmp_path):
+        model_file_path, dependency_file_path = self.setup_files(tmp_path)
+        cache = AspectGraphCache(tmp_path / "cache")
+        resolved_graph = get_resolved_graph(model_file_path, dependency_file_path)
+        cache.save(resolved_graph, model_file_path, "2.1.0")
+        graph = Graph()
+        result = cache.load(graph, model_file_path)
+
+        assert result is False
+        assert len(graph) == 0
+
+    def test_load_changed_file(self, tmp_path):
+        model_file_path, dependency_file_path = self.setup_files(tmp_path)
+        cache = AspectGraphCache(tmp_path / "cache")
+        cache.save(get_resolved_graph(model_file_path, dependency_file_path), model_file_path, "2.1.0")
+
+        with open(dependency_file_path, "a") as file:
+            file.write(" changed")
+
+        result = cache.load(LayeredGraph(), model_file_path)
+
+        assert result is False
+
+    def test_load_removed_file(self, tmp_path):
+        model_file_path, dependency_file_path = self.setup_files(tmp_path)
+        cache = AspectGraphCache(tmp_path / "cache")
+        cache.save(get_resolved_graph(model_file_path, dependency_file_path), model_file_path, "2.1.0")
+        tmp_path.joinpath("model", "Dependency.ttl").unlink()
+        result = cache.load(LayeredGraph(), model_file_path)
+
+        assert result is False
+
+    def test_load_not_cached(self, tmp_path):
+        model_file_path, _ = self.setup_files(tmp_path)
+        cache = AspectGraphCache(tmp_path / "cache")
+        result = cache.load(LayeredGraph(), model_file_path)
+
+        assert result is False
+
+    def test_save_replaces_outdated_entry(self, tmp_path):
+        model_file_path, dependency_file_path = self.setup_files(tmp_path)
+        cache = AspectGraphCache(tmp_path / "cache")
+        cache.save(get_resolved_graph(model_file_path, dependency_file_path), model_file_path, "2.1.0")
+        cache.save(get_resolved_graph(model_file_path, dependency_file_path), model_file_path, "2.0.0")
+
+        assert len(list(cache.cache_dir.glob("*.graph.json"))) == 1
+        assert len(list(cache.cache_dir.glob("*.manifest.json"))) == 1
+
+    def test_save_plain_graph(self, tmp_path):
+        model_file_path, _ = self.setup_files(tmp_path)
+        cache = AspectGraphCache(tmp_path / "cache")
+        result = cache.save(Graph(), model_file_path, "2.1.0")
+
+        assert result is False
+        assert list(cache.cache_dir.iterdir()) == []
+
+    def test_clear(self, tmp_path):
+        model_file_path, dependency_file_path = self.setup_files(tmp_path)
+        cache = AspectGraphCache(tmp_path / "cache")
+        cache.save(get_resolved_graph(model_file_path, dependency_file_path), model_file_path, "2.1.0")
+        cache.clear()
+
+        assert list(cache.cache_dir.iterdir()) == []
+        assert cache.load(LayeredGraph(), model_file_path) is False
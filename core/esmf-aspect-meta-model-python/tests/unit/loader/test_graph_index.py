@@ -0,0 +1,123 @@
+"""Graph index test suite."""
+
+import sys
+
+from rdflib import RDF, RDFS, BNode, Graph, Literal, URIRef
+from rdflib.collection import Collection
+
+from esmf_aspect_meta_model_python.loader.graph_index import GraphIndex
+from esmf_aspect_meta_model_python.resolver.layered_graph import GraphLayer, LayeredGraph
+
+ASPECT = URIRef("urn:samm:org.eclipse.esmf.test:1.0.0#Aspect")
+PROPERTY = URIRef("urn:samm:org.eclipse.esmf.test:1.0.0#property")
+ASPECT_TYPE = URIRef("urn:samm:org.eclipse.esmf.samm:meta-model:2.1.0#Aspect")
+
+
+def get_graph(*triples) -> Graph:
+    graph = Graph()
+    for triple in triples:
+        graph.add(triple)
+
+    return graph
+
+
+class TestGraphIndex:
+    """Graph index test suite."""
+
+    def test_plain_graph(self):
+        graph = get_graph(
+            (ASPECT, RDF.type, ASPECT_TYPE),
+            (ASPECT, RDFS.label, Literal("first")),
+            (ASPECT, RDFS.label, Literal("second")),
+        )
+        index = GraphIndex(graph)
+
+        assert index.value(ASPECT, RDF.type) == ASPECT_TYPE
+        assert sorted(index.objects(ASPECT, RDFS.label)) == [Literal("first"), Literal("second")]
+        assert index.value(ASPECT, RDF.value) is None
+        assert index.value(PROPERTY, RDF.type) is None
+        assert index.value(None, RDF.type) is None
+        assert index.objects(PROPERTY, RDF.type) == []
+
+    def test_layered_graph(self):
+        layer = GraphLayer(get_graph((ASPECT, RDFS.label, Literal("label")), (PROPERTY, RDF.type, RDF.Property)))
+        graph = LayeredGraph()
+        graph.add((ASPECT, RDF.type, ASPECT_TYPE))
+        graph.add((ASPECT, RDFS.label, Literal("label")))
+        graph.add_layer(layer)
+        index = GraphIndex(graph)
+
+        assert index.value(ASPECT, RDF.type) == ASPECT_TYPE
+        assert index.value(PROPERTY, RDF.type) == RDF.Property
+        assert index.objects(ASPECT, RDFS.label) == [Literal("label")]
+
+    def test_layer_index_is_shared(self):
+        layer = GraphLayer(get_graph((PROPERTY, RDF.type, RDF.Property)))
+        first_graph = LayeredGraph()
+        first_graph.add_layer(layer)
+        second_graph = LayeredGraph()
+        second_graph.add_layer(layer)
+        GraphIndex(first_graph)
+        layer_index = layer.subject_index
+        GraphIndex(second_graph)
+
+        assert layer.subject_index is layer_index
+
+    def test_get_list(self):
+        graph = Graph()
+        head = BNode()
+        Collection(graph, head, [Literal(1), Literal(2), Literal(3)])
+        index = GraphIndex(graph)
+
+        assert index.get_list(head) == (Literal(1), Literal(2), Literal(3))
+        assert index.get_list(graph.value(head, RDF.rest)) == (Literal(2), Literal(3))
+        assert index.get_list(RDF.nil) == ()
+        assert index.get_list(None) == ()
+
+    def test_get_long_list(self):
+        graph = Graph()
+        head = BNode()
+        items = [Literal(number) for number in range(sys.getrecursionlimit() + 100)]
+        Collection(graph, head, items)
+
+        assert GraphIndex(graph).get_list(head) == tuple(items)
+
+    def test_get_list_of_layer(self):
+        layer_graph = Graph()
+        head = BNode()
+        Collection(layer_graph, head, [ASPECT, PROPERTY])
+        graph = LayeredGraph()
+        graph.add_layer(GraphLayer(layer_graph))
+
+        assert GraphIndex(graph).get_list(head) == (ASPECT, PROPERTY)
+
+    def test_get_cyclic_list(self):
+        graph = get_graph(
+            (ASPECT, RDF.first, Literal(1)),
+            (ASPECT, RDF.rest, PROPERTY),
+            (PROPERTY, RDF.first, Literal(2)),
+            (PROPERTY, RDF.rest, ASPECT),
+        )
+
+        assert GraphIndex(graph).get_list(ASPECT) == (Literal(1), Literal(2))
+
+    def test_get_named_parent(self):
+        layer_node = BNode()
+        layer_graph = get_graph((PROPERTY, RDF.value, layer_node))
+        node = BNode()
+        graph = LayeredGraph()
+        graph.add((ASPECT, RDF.value, node))
+        graph.add_layer(GraphLayer(layer_graph))
+        index = GraphIndex(graph)
+
+        assert index.get_named_parent(node) == (ASPECT, RDF.value, 0)
+        assert index.get_named_parent(layer_node) == (PROPERTY, RDF.value, 0)
+        assert index.get_named_parent(BNode()) == (None, None, 0)
+
+    def test_get_named_parent_of_long_chain(self):
+        nodes = [BNode() for _ in range(sys.getrecursionlimit() + 100)]
+        graph = get_graph((ASPECT, RDF.value, nodes[0]))
+        for parent, child in zip(nodes, nodes[1:]):
+            graph.add((parent, RDF.rest, child))
+
+        assert GraphIndex(graph).get_named_parent(nodes[-1]) == (ASPECT, RDF.value, len(nodes) - 1)
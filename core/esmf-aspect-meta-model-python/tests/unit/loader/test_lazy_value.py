@@ -0,0 +1,22 @@
+"""Lazy value test suite."""
+
+from unittest import mock
+
+from esmf_aspect_meta_model_python.loader.lazy_value import LazyValue
+
+
+class TestLazyValue:
+    """Lazy value test suite."""
+
+    def test_init(self):
+        loader = mock.MagicMock(name="loader")
+        LazyValue(loader)
+
+        loader.assert_not_called()
+
+    def test_get(self):
+        loader = mock.MagicMock(name="loader", return_value="value")
+        result = LazyValue(loader).get()
+
+        assert result == "value"
+        loader.assert_called_once_with()
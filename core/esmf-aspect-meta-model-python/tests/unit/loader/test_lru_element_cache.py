@@ -0,0 +1,97 @@
+"""LRU element cache test suite."""
+
+from unittest import mock
+
+from esmf_aspect_meta_model_python.base.property import Property
+from esmf_aspect_meta_model_python.impl.default_property import DefaultProperty
+from esmf_aspect_meta_model_python.loader.lru_element_cache import LRUElementCache
+from esmf_aspect_meta_model_python.loader.meta_model_base_attributes import MetaModelBaseAttributes
+
+NAMESPACE = "urn:samm:org.eclipse.esmf.test:1.0.0#"
+
+
+def get_property(name) -> DefaultProperty:
+    return DefaultProperty(MetaModelBaseAttributes("2.1.0", NAMESPACE + name, name, {}, {}, []), None, None)
+
+
+class TestLRUElementCache:
+    """LRU element cache test suite."""
+
+    def test_init(self):
+        result = LRUElementCache()
+
+        assert result.hits == 0
+        assert result.misses == 0
+        assert result.evictions == 0
+        assert result.element_count == 0
+        assert result.bytes == 0
+
+    def test_get_element_size(self):
+        result = LRUElementCache.get_element_size(get_property("property"))
+
+        assert result > 0
+
+    def test_evict_by_max_elements(self):
+        on_evict_mock = mock.MagicMock(name="on_evict")
+        cache = LRUElementCache(max_elements=2, on_evict=on_evict_mock)
+        first, second, third = get_property("first"), get_property("second"), get_property("third")
+        cache.resolve_instance(first)
+        cache.resolve_instance(second)
+        cache.get(NAMESPACE + "first")
+        cache.resolve_instance(third)
+
+        assert cache.element_count == 2
+        assert cache.evictions == 1
+        assert cache.get(NAMESPACE + "second") is None
+        assert cache.get_by_name("second") == []
+        assert cache.get_by_urn(NAMESPACE + "first") is first
+        assert cache.get_by_type(Property) == [first, third]
+        on_evict_mock.assert_called_once_with(NAMESPACE + "second", second)
+
+    def test_evict_by_max_bytes(self):
+        cache = LRUElementCache(max_bytes=25, size_of=lambda element: 10)
+        for name in ("first", "second", "third"):
+            cache.resolve_instance(get_property(name))
+
+        assert cache.element_count == 2
+        assert cache.bytes == 20
+        assert cache.evictions == 1
+        assert cache.get(NAMESPACE + "first") is None
+
+    def test_keep_last_element(self):
+        cache = LRUElementCache(max_bytes=5, size_of=lambda element: 10)
+        element = get_property("property")
+        cache.resolve_instance(get_property("first"))
+        cache.resolve_instance(element)
+
+        assert cache.element_count == 1
+        assert cache.get(NAMESPACE + "property") is element
+
+    def test_lookup_counters(self):
+        cache = LRUElementCache()
+        element = get_property("property")
+        cache.resolve_instance(element)
+        cache.resolve_instance(get_property("property"))
+        cache.get_by_name("property")
+        cache.get_by_urn(NAMESPACE + "unknown")
+
+        assert cache.hits == 2
+        assert cache.misses == 2
+
+    def test_add_element_overwrite(self):
+        cache = LRUElementCache(size_of=lambda element: 10)
+        cache.add_element("name", get_property("property"))
+        cache.add_element("name", get_property("other_property"), overwrite=True)
+
+        assert cache.element_count == 1
+        assert cache.bytes == 10
+        assert cache.evictions == 0
+
+    def test_reset(self):
+        cache = LRUElementCache(size_of=lambda element: 10)
+        cache.resolve_instance(get_property("property"))
+        cache.reset()
+
+        assert cache.element_count == 0
+        assert cache.bytes == 0
+        assert cache.get_by_name("property") == []
@@ -0,0 +1,41 @@
+"""Model element factory test suite."""
+
+from unittest import mock
+
+from rdflib import RDF, Graph, URIRef
+
+from esmf_aspect_meta_model_python.loader.model_element_factory import ModelElementFactory
+
+
+class TestModelElementFactory:
+    """Model element factory test suite."""
+
+    def test_notify_element_created(self):
+        first_listener = mock.MagicMock(name="first_listener")
+        second_listener = mock.MagicMock(name="second_listener")
+        factory = ModelElementFactory("2.1.0", "aspect_graph", "cache")
+        factory.add_listener(first_listener)
+        factory.add_listener(second_listener)
+        factory.notify_element_created("element")
+
+        first_listener.assert_called_once_with("element")
+        second_listener.assert_called_once_with("element")
+
+    def test_notify_element_created_no_listeners(self):
+        factory = ModelElementFactory("2.1.0", "aspect_graph", "cache")
+
+        assert factory.notify_element_created("element") is None
+
+    def test_is_lazy(self):
+        assert ModelElementFactory("2.1.0", "aspect_graph", "cache").is_lazy() is False
+        assert ModelElementFactory("2.1.0", "aspect_graph", "cache", lazy=True).is_lazy() is True
+
+    def test_get_graph_index(self):
+        aspect = URIRef("urn:samm:org.eclipse.esmf.test:1.0.0#Aspect")
+        graph = Graph()
+        graph.add((aspect, RDF.type, RDF.Property))
+        factory = ModelElementFactory("2.1.0", graph, "cache")
+        result = factory.get_graph_index()
+
+        assert result.value(aspect, RDF.type) == RDF.Property
+        assert factory.get_graph_index() is result
@@ -1,11 +1,17 @@
 """SAMM Graph test suite."""
 
+import asyncio
+
 from pathlib import Path
 from unittest import mock
 
 import pytest
 
+from rdflib import RDF, Graph, URIRef
+
+from esmf_aspect_meta_model_python.base.property import Property
 from esmf_aspect_meta_model_python.loader.samm_graph import SAMMGraph
+from esmf_aspect_meta_model_python.resolver.layered_graph import GraphLayer, LayeredGraph
 
 
 class TestSAMMGraph:
@@ -17,8 +23,11 @@ class TestSAMMGraph:
         assert result._graph == "graph"
         assert result._resolver == "resolver"
         assert result._cache == "cache"
+        assert result._graph_cache is None
+        assert result._lazy is False
         assert result._samm_version == ""
         assert result._file_path == ""
+        assert result._base_types is None
 
     def test_get_rdf_graph(self):
         samm_graph = SAMMGraph("graph", "resolver", "cache")
@@ -61,9 +70,43 @@ class TestSAMMGraph:
         assert result == graph_mock
         assert samm_graph._file_path == "file_path"
         graph_mock.parse.assert_called_once_with("file_path")
+        assert samm_graph._base_types == []
         assert samm_graph._samm_version == "samm_version"
         resolver_mock.resolve.assert_called_once_with(graph_mock, "file_path", "samm_version")
 
+    @mock.patch("esmf_aspect_meta_model_python.loader.samm_graph.SAMMGraph.get_samm_version")
+    def test_parse_save_to_graph_cache(self, get_samm_version_mock):
+        graph_mock = mock.MagicMock(name="graph")
+        get_samm_version_mock.return_value = "samm_version"
+        resolver_mock = mock.MagicMock(name="resolver")
+        graph_cache_mock = mock.MagicMock(name="graph_cache")
+        graph_cache_mock.load.return_value = False
+        samm_graph = SAMMGraph(graph_mock, resolver_mock, "cache", graph_cache_mock)
+        result = samm_graph.parse("file_path")
+
+        assert result == graph_mock
+        graph_cache_mock.load.assert_called_once_with(graph_mock, "file_path")
+        graph_mock.parse.assert_called_once_with("file_path")
+        resolver_mock.resolve.assert_called_once_with(graph_mock, "file_path", "samm_version")
+        graph_cache_mock.save.assert_called_once_with(graph_mock, "file_path", "samm_version")
+
+    @mock.patch("esmf_aspect_meta_model_python.loader.samm_graph.SAMMGraph.get_samm_version")
+    def test_parse_load_from_graph_cache(self, get_samm_version_mock):
+        graph_mock = mock.MagicMock(name="graph")
+        get_samm_version_mock.return_value = "samm_version"
+        resolver_mock = mock.MagicMock(name="resolver")
+        graph_cache_mock = mock.MagicMock(name="graph_cache")
+        graph_cache_mock.load.return_value = True
+        samm_graph = SAMMGraph(graph_mock, resolver_mock, "cache", graph_cache_mock)
+        result = samm_graph.parse("file_path")
+
+        assert result == graph_mock
+        assert samm_graph._samm_version == "samm_version"
+        graph_mock.parse.assert_not_called()
+        resolver_mock.resolve.assert_not_called()
+        resolver_mock.resolve_meta_model.assert_called_once_with(graph_mock, "samm_version")
+        graph_cache_mock.save.assert_not_called()
+
     def test_get_model_file_path(self):
         samm_graph = SAMMGraph("graph", "resolver", "cache")
         samm_graph._file_path = "file_path"
@@ -78,16 +121,62 @@ class TestSAMMGraph:
 
         assert str(error.value) == "Path to the model is empty"
 
+    def test_record_base_types(self):
+        graph_mock = mock.MagicMock(name="graph")
+        graph_mock.triples.return_value = [
+            ("aspect", "type", "aspect_type"),
+            ("property", "type", "property_type"),
+            ("aspect", "type", "aspect_type"),
+        ]
+        samm_graph = SAMMGraph(graph_mock, "resolver", "cache")
+        samm_graph._record_base_types()
+
+        assert samm_graph._base_types == [("aspect", "aspect_type"), ("property", "property_type")]
+        graph_mock.triples.assert_called_once_with((None, RDF.type, None))
+
+    def test_record_base_types_layered_graph(self):
+        graph = LayeredGraph()
+        graph.add((URIRef("urn:test#aspect"), RDF.type, URIRef("urn:test#Aspect")))
+        layer_graph = Graph()
+        layer_graph.add((URIRef("urn:test#property"), RDF.type, URIRef("urn:test#Property")))
+        graph.add_layer(GraphLayer(layer_graph))
+        samm_graph = SAMMGraph(graph, "resolver", "cache")
+        samm_graph._record_base_types()
+
+        assert samm_graph._base_types == [(URIRef("urn:test#aspect"), URIRef("urn:test#Aspect"))]
+
+    @mock.patch("esmf_aspect_meta_model_python.loader.samm_graph.Graph")
+    def test_get_base_types_recorded(self, rdf_graph_mock):
+        samm_graph = SAMMGraph("graph", "resolver", "cache")
+        samm_graph._file_path = "model_file_path"
+        samm_graph._base_types = [("aspect", "aspect_type")]
+        result = samm_graph._get_base_types("model_file_path")
+
+        assert result == [("aspect", "aspect_type")]
+        rdf_graph_mock.assert_not_called()
+
     @mock.patch("esmf_aspect_meta_model_python.loader.samm_graph.RDF.type")
-    @mock.patch("esmf_aspect_meta_model_python.loader.samm_graph.SAMM")
     @mock.patch("esmf_aspect_meta_model_python.loader.samm_graph.Graph")
-    @mock.patch("esmf_aspect_meta_model_python.loader.samm_graph.SAMMGraph._get_model_file_path")
-    def test_get_nodes_from_graph_with_aspect(self, get_model_file_path_mock, rdf_graph_mock, samm_mock, rdf_type_mock):
-        get_model_file_path_mock.return_value = "model_file_path"
+    def test_get_base_types_other_file(self, rdf_graph_mock, rdf_type_mock):
         base_graph_mock = mock.MagicMock(name="base_graph")
-        base_graph_mock.subjects.return_value = ["aspect_node"]
+        base_graph_mock.subject_objects.return_value = [("aspect", "aspect_type")]
         rdf_graph_mock.return_value = rdf_graph_mock
         rdf_graph_mock.parse.return_value = base_graph_mock
+        samm_graph = SAMMGraph("graph", "resolver", "cache")
+        samm_graph._file_path = "model_file_path"
+        samm_graph._base_types = [("recorded", "recorded_type")]
+        result = samm_graph._get_base_types("other_file_path")
+
+        assert result == [("aspect", "aspect_type")]
+        rdf_graph_mock.parse.assert_called_once_with("other_file_path", format="turtle")
+        base_graph_mock.subject_objects.assert_called_once_with(predicate=rdf_type_mock, unique=True)
+
+    @mock.patch("esmf_aspect_meta_model_python.loader.samm_graph.SAMM")
+    @mock.patch("esmf_aspect_meta_model_python.loader.samm_graph.SAMMGraph._get_base_types")
+    @mock.patch("esmf_aspect_meta_model_python.loader.samm_graph.SAMMGraph._get_model_file_path")
+    def test_get_nodes_from_graph_with_aspect(self, get_model_file_path_mock, get_base_types_mock, samm_mock):
+        get_model_file_path_mock.return_value = "model_file_path"
+        get_base_types_mock.return_value = [("property_node", "property_urn"), ("aspect_node", "aspect_urn")]
         samm_mock.return_value = samm_mock
         samm_mock.aspect = "aspect_node_name"
         samm_mock.get_urn.return_value = "aspect_urn"
@@ -97,25 +186,19 @@ class TestSAMMGraph:
 
         assert result == ["aspect_node"]
         get_model_file_path_mock.assert_called_once_with("")
-        rdf_graph_mock.assert_called_once()
-        rdf_graph_mock.parse.assert_called_once_with("model_file_path", format="turtle")
+        get_base_types_mock.assert_called_once_with("model_file_path")
         samm_mock.assert_called_once_with("samm_version")
         samm_mock.get_urn.assert_called_once_with("aspect_node_name")
-        base_graph_mock.subjects.assert_called_once_with(predicate=rdf_type_mock, object="aspect_urn")
 
-    @mock.patch("esmf_aspect_meta_model_python.loader.samm_graph.RDF.type")
     @mock.patch("esmf_aspect_meta_model_python.loader.samm_graph.SAMM")
-    @mock.patch("esmf_aspect_meta_model_python.loader.samm_graph.Graph")
+    @mock.patch("esmf_aspect_meta_model_python.loader.samm_graph.SAMMGraph._get_base_types")
     @mock.patch("esmf_aspect_meta_model_python.loader.samm_graph.SAMMGraph._get_model_file_path")
-    def test_get_nodes_from_graph_no_aspect(self, get_model_file_path_mock, rdf_graph_mock, samm_mock, rdf_type_mock):
+    def test_get_nodes_from_graph_no_aspect(self, get_model_file_path_mock, get_base_types_mock, samm_mock):
         get_model_file_path_mock.return_value = "model_file_path"
-        base_graph_mock = mock.MagicMock(name="base_graph")
-        base_graph_mock.subjects.return_value = []
-        base_graph_mock.subject_objects.return_value = [
+        get_base_types_mock.return_value = [
             ("base_node_name", "<urn:samm:org.eclipse.esmf.samm:2.1.0#nodeName>"),
+            ("other_node_name", "<urn:samm:org.eclipse.esmf.test:1.0.0#nodeName>"),
         ]
-        rdf_graph_mock.return_value = rdf_graph_mock
-        rdf_graph_mock.parse.return_value = base_graph_mock
         samm_mock.return_value = samm_mock
         samm_mock.aspect = "aspect_node_name"
         samm_mock.get_urn.return_value = "aspect_urn"
@@ -124,7 +207,6 @@ class TestSAMMGraph:
         result = samm_graph.get_nodes_from_graph()
 
         assert result == ["base_node_name"]
-        base_graph_mock.subject_objects.assert_called_once_with(predicate=rdf_type_mock, unique=True)
 
     @mock.patch("esmf_aspect_meta_model_python.loader.samm_graph.URIRef")
     @mock.patch("esmf_aspect_meta_model_python.loader.samm_graph.isinstance")
@@ -159,9 +241,99 @@ class TestSAMMGraph:
 
         assert result == ["aspect_elements"]
         get_base_nodes_mock.assert_called_once_with("aspect_urn")
-        model_element_factory_mock.assert_called_once_with("samm_version", "graph", "cache")
+        model_element_factory_mock.assert_called_once_with("samm_version", "graph", "cache", False)
         model_element_factory_mock.create_all_graph_elements.assert_called_once_with("base_nodes")
 
+    @mock.patch("esmf_aspect_meta_model_python.loader.samm_graph.ModelElementFactory")
+    @mock.patch("esmf_aspect_meta_model_python.loader.samm_graph.SAMMGraph.get_base_nodes")
+    def test_to_python_lazy(self, get_base_nodes_mock, model_element_factory_mock):
+        get_base_nodes_mock.return_value = "base_nodes"
+        model_element_factory_mock.return_value = model_element_factory_mock
+        samm_graph = SAMMGraph("graph", "resolver", "cache", lazy=True)
+        samm_graph._samm_version = "samm_version"
+        samm_graph.to_python()
+
+        model_element_factory_mock.assert_called_once_with("samm_version", "graph", "cache", True)
+
+    @mock.patch("esmf_aspect_meta_model_python.loader.samm_graph.ModelElementFactory")
+    @mock.patch("esmf_aspect_meta_model_python.loader.samm_graph.SAMMGraph.get_base_nodes")
+    def test_to_python_with_listener(self, get_base_nodes_mock, model_element_factory_mock):
+        get_base_nodes_mock.return_value = "base_nodes"
+        model_element_factory_mock.return_value = model_element_factory_mock
+        model_element_factory_mock.create_all_graph_elements.return_value = ["aspect_elements"]
+        samm_graph = SAMMGraph("graph", "resolver", "cache")
+        result = samm_graph.to_python("aspect_urn", "listener")
+
+        assert result == ["aspect_elements"]
+        model_element_factory_mock.add_listener.assert_called_once_with("listener")
+
+    @mock.patch("esmf_aspect_meta_model_python.loader.samm_graph.SAMMGraph.to_python")
+    def test_iter_elements(self, to_python_mock):
+        def to_python(aspect_urn, listener):
+            for element in ("property", "aspect"):
+                listener(element)
+
+            return ["aspect"]
+
+        to_python_mock.side_effect = to_python
+        samm_graph = SAMMGraph("graph", "resolver", "cache")
+        result = list(samm_graph.iter_elements("aspect_urn"))
+
+        assert result == ["property", "aspect"]
+        to_python_mock.assert_called_once_with("aspect_urn", mock.ANY)
+
+    @mock.patch("esmf_aspect_meta_model_python.loader.samm_graph.SAMMGraph.to_python")
+    def test_iter_elements_raise_exception(self, to_python_mock):
+        def to_python(aspect_urn, listener):
+            listener("property")
+            raise ValueError("error")
+
+        to_python_mock.side_effect = to_python
+        samm_graph = SAMMGraph("graph", "resolver", "cache")
+        elements = samm_graph.iter_elements()
+
+        assert next(elements) == "property"
+        with pytest.raises(ValueError) as error:
+            next(elements)
+
+        assert str(error.value) == "error"
+
+    @mock.patch("esmf_aspect_meta_model_python.loader.samm_graph.SAMMGraph.to_python")
+    def test_iter_elements_close(self, to_python_mock):
+        created = []
+
+        def to_python(aspect_urn, listener):
+            for element in range(100):
+                listener(element)
+                created.append(element)
+
+        to_python_mock.side_effect = to_python
+        samm_graph = SAMMGraph("graph", "resolver", "cache")
+        elements = samm_graph.iter_elements()
+        first = next(elements)
+        elements.close()
+
+        assert first == 0
+        assert len(created) < 100
+
+    @mock.patch("esmf_aspect_meta_model_python.loader.samm_graph.SAMMGraph.parse")
+    def test_parse_async(self, parse_mock):
+        parse_mock.return_value = "graph"
+        samm_graph = SAMMGraph("graph", "resolver", "cache")
+        result = asyncio.run(samm_graph.parse_async("file_path"))
+
+        assert result == "graph"
+        parse_mock.assert_called_once_with("file_path")
+
+    @mock.patch("esmf_aspect_meta_model_python.loader.samm_graph.SAMMGraph.to_python")
+    def test_to_python_async(self, to_python_mock):
+        to_python_mock.return_value = ["aspect"]
+        samm_graph = SAMMGraph("graph", "resolver", "cache")
+        result = asyncio.run(samm_graph.to_python_async("aspect_urn"))
+
+        assert result == ["aspect"]
+        to_python_mock.assert_called_once_with("aspect_urn")
+
     @mock.patch("esmf_aspect_meta_model_python.loader.samm_graph.DefaultElementCache")
     def test_find_by_name(self, default_element_cache_mock):
         cache_mock = mock.MagicMock(name="cache")
@@ -184,6 +356,50 @@ class TestSAMMGraph:
         assert result == "graph_node"
         cache_mock.get_by_urn.assert_called_once_with("urn")
 
+    @mock.patch("esmf_aspect_meta_model_python.loader.samm_graph.DefaultElementCache")
+    def test_find_by_type(self, default_element_cache_mock):
+        cache_mock = mock.MagicMock(name="cache")
+        cache_mock.get_by_type.return_value = ["property"]
+        default_element_cache_mock.return_value = cache_mock
+        samm_graph = SAMMGraph("graph", "resolver")
+        result = samm_graph.find_by_type(Property)
+
+        assert result == ["property"]
+        cache_mock.get_by_type.assert_called_once_with(Property)
+
+    @mock.patch("esmf_aspect_meta_model_python.loader.samm_graph.AccessPathIndex")
+    def test_get_access_path_index(self, access_path_index_mock):
+        access_path_index_mock.return_value = "access_path_index"
+        samm_graph = SAMMGraph("graph", "resolver", "cache")
+        samm_graph._elements = ["aspect"]
+        result = samm_graph.get_access_path_index()
+
+        assert result == "access_path_index"
+        assert samm_graph.get_access_path_index() == "access_path_index"
+        access_path_index_mock.assert_called_once_with(["aspect"])
+
+    @mock.patch("esmf_aspect_meta_model_python.loader.samm_graph.ModelElementFactory")
+    @mock.patch("esmf_aspect_meta_model_python.loader.samm_graph.SAMMGraph.get_base_nodes")
+    def test_to_python_resets_access_path_index(self, _, model_element_factory_mock):
+        model_element_factory_mock.return_value.create_all_graph_elements.return_value = ["aspect"]
+        samm_graph = SAMMGraph("graph", "resolver", "cache")
+        samm_graph._access_path_index = "access_path_index"
+        samm_graph.to_python()
+
+        assert samm_graph._elements == ["aspect"]
+        assert samm_graph._access_path_index is None
+
+    @mock.patch("esmf_aspect_meta_model_python.loader.samm_graph.SAMMGraph.get_access_path_index")
+    def test_get_access_paths(self, get_access_path_index_mock):
+        access_path_index_mock = get_access_path_index_mock.return_value
+        access_path_index_mock.get_paths.side_effect = ([["name"]], [])
+        access_path_index_mock.get_urn_paths.return_value = [["urn"]]
+        samm_graph = SAMMGraph("graph", "resolver", "cache")
+
+        assert samm_graph.get_access_paths("name") == [["name"]]
+        assert samm_graph.get_access_paths("urn") == [["urn"]]
+        access_path_index_mock.get_urn_paths.assert_called_once_with("urn")
+
     @mock.patch("esmf_aspect_meta_model_python.loader.samm_graph.SAMMGraph.determine_element_access_path")
     @mock.patch("esmf_aspect_meta_model_python.loader.samm_graph.SAMMGraph.find_by_name")
     def test_determine_access_path(
@@ -0,0 +1,118 @@
+"""Model file index test suite."""
+
+from os import utime
+from unittest import mock
+
+from esmf_aspect_meta_model_python.resolver.file_index import ModelFileIndex
+
+MODEL = """@prefix : <urn:samm:org.eclipse.esmf.test:1.0.0#> .
+@prefix samm: <urn:samm:org.eclipse.esmf.samm:meta-model:2.1.0#> .
+
+:{name} a samm:Property .
+"""
+
+
+def write_model(models_root, file_name, name, version="1.0.0"):
+    folder = models_root / "org.eclipse.esmf.test" / version
+    folder.mkdir(parents=True, exist_ok=True)
+    file_path = folder / file_name
+    file_path.write_text(MODEL.format(name=name))
+
+    return str(file_path)
+
+
+class TestModelFileIndex:
+    """Model file index test suite."""
+
+    def test_init(self, tmp_path):
+        result = ModelFileIndex(tmp_path)
+
+        assert result.models_root == str(tmp_path)
+        assert result.get_files("urn:samm:org.eclipse.esmf.test:1.0.0#property") == []
+
+    def test_get_namespace(self):
+        result = ModelFileIndex.get_namespace("urn:samm:org.eclipse.esmf.test:1.0.0#property")
+
+        assert result == "urn:samm:org.eclipse.esmf.test:1.0.0"
+
+    def test_update(self, tmp_path):
+        first_file = write_model(tmp_path, "First.ttl", "first")
+        second_file = write_model(tmp_path, "Second.ttl", "second")
+        index = ModelFileIndex(tmp_path)
+        result = index.update()
+
+        assert result is True
+        assert index.get_files("urn:samm:org.eclipse.esmf.test:1.0.0#first") == [first_file]
+        assert index.get_files("urn:samm:org.eclipse.esmf.test:1.0.0#second") == [second_file]
+        assert index.get_namespace_files("urn:samm:org.eclipse.esmf.test:1.0.0#") == [first_file, second_file]
+        assert index.update() is False
+
+    @mock.patch("esmf_aspect_meta_model_python.resolver.file_index.ModelFileIndex.get_defined_urns")
+    def test_update_changed_files_only(self, get_defined_urns_mock, tmp_path):
+        get_defined_urns_mock.return_value = []
+        write_model(tmp_path, "First.ttl", "first")
+        second_file = write_model(tmp_path, "Second.ttl", "second")
+        index = ModelFileIndex(tmp_path)
+        index.update()
+        get_defined_urns_mock.reset_mock()
+        utime(second_file, ns=(1, 1))
+        result = index.update()
+
+        assert result is True
+        get_defined_urns_mock.assert_called_once_with(second_file)
+
+    def test_update_removed_file(self, tmp_path):
+        first_file = write_model(tmp_path, "First.ttl", "first")
+        index = ModelFileIndex(tmp_path)
+        index.update()
+        tmp_path.joinpath(first_file).unlink()
+        result = index.update()
+
+        assert result is True
+        assert index.get_files("urn:samm:org.eclipse.esmf.test:1.0.0#first") == []
+
+    @mock.patch("esmf_aspect_meta_model_python.resolver.file_index.ModelFileIndex.get_defined_urns")
+    def test_persist(self, get_defined_urns_mock, tmp_path):
+        get_defined_urns_mock.return_value = ["urn:samm:org.eclipse.esmf.test:1.0.0#first"]
+        first_file = write_model(tmp_path / "models", "First.ttl", "first")
+        index_file_path = tmp_path / "index" / "index.json"
+        ModelFileIndex(tmp_path / "models", index_file_path).update()
+        get_defined_urns_mock.reset_mock()
+        index = ModelFileIndex(tmp_path / "models", index_file_path)
+
+        assert index.get_files("urn:samm:org.eclipse.esmf.test:1.0.0#first") == [first_file]
+        assert index.update() is False
+        get_defined_urns_mock.assert_not_called()
+
+    def test_persist_broken_index_file(self, tmp_path):
+        index_file_path = tmp_path / "index.json"
+        index_file_path.write_text("{")
+        index = ModelFileIndex(tmp_path / "models", index_file_path)
+
+        assert index.get_files("urn:samm:org.eclipse.esmf.test:1.0.0#first") == []
+
+    @mock.patch("esmf_aspect_meta_model_python.resolver.file_index.ModelFileIndex.update")
+    def test_refresh_once(self, update_mock, tmp_path):
+        index = ModelFileIndex(tmp_path)
+        index.refresh()
+        index._updated_at = 0.0
+        result = index.refresh()
+
+        assert result is False
+        update_mock.assert_called_once()
+
+    @mock.patch("esmf_aspect_meta_model_python.resolver.file_index.monotonic")
+    def test_refresh_interval(self, monotonic_mock, tmp_path):
+        monotonic_mock.return_value = 100.0
+        index = ModelFileIndex(tmp_path, refresh_interval=10)
+        index.refresh()
+        write_model(tmp_path, "First.ttl", "first")
+        monotonic_mock.return_value = 105.0
+
+        assert index.refresh() is False
+        assert index.get_files("urn:samm:org.eclipse.esmf.test:1.0.0#first") == []
+
+        monotonic_mock.return_value = 111.0
+
+        assert index.refresh() is True
+        assert len(index.get_files("urn:samm:org.eclipse.esmf.test:1.0.0#first")) == 1
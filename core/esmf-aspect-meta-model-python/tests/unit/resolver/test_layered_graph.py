@@ -0,0 +1,227 @@
+"""Layered graph test suite."""
+
+from unittest import mock
+
+from rdflib import RDF, BNode, Graph, Literal, URIRef
+
+from esmf_aspect_meta_model_python.resolver.layered_graph import GraphLayer, GraphLayerStore, LayeredGraph
+
+ASPECT = URIRef("urn:samm:org.eclipse.esmf.test:1.0.0#Aspect")
+PROPERTY = URIRef("urn:samm:org.eclipse.esmf.test:1.0.0#property")
+NAME = URIRef("urn:samm:org.eclipse.esmf.test:1.0.0#name")
+ASPECT_TYPE = URIRef("urn:samm:org.eclipse.esmf.samm:meta-model:2.1.0#Aspect")
+
+
+def get_graph(*triples) -> Graph:
+    graph = Graph()
+    for triple in triples:
+        graph.add(triple)
+
+    return graph
+
+
+class TestGraphLayer:
+    """Graph layer test suite."""
+
+    def test_init(self):
+        graph = get_graph((ASPECT, RDF.type, ASPECT_TYPE))
+        result = GraphLayer(graph)
+
+        assert result.graph is graph
+        assert result.file_paths == ()
+        assert len(result) == 1
+
+    def test_init_with_file_paths(self):
+        result = GraphLayer(get_graph(), ["file_path"])
+
+        assert result.file_paths == ("file_path",)
+
+    def test_may_contain(self):
+        layer = GraphLayer(get_graph((ASPECT, RDF.type, ASPECT_TYPE)))
+
+        assert layer.may_contain((ASPECT, None, None)) is True
+        assert layer.may_contain((None, RDF.type, ASPECT_TYPE)) is True
+        assert layer.may_contain((None, RDF.type, None)) is True
+        assert layer.may_contain((PROPERTY, None, None)) is False
+        assert layer.may_contain((None, None, PROPERTY)) is False
+
+    def test_triples(self):
+        layer = GraphLayer(get_graph((ASPECT, RDF.type, ASPECT_TYPE)))
+        result = list(layer.triples((ASPECT, None, None)))
+
+        assert result == [(ASPECT, RDF.type, ASPECT_TYPE)]
+
+    def test_subject_index(self):
+        layer = GraphLayer(get_graph((ASPECT, RDF.type, ASPECT_TYPE), (ASPECT, PROPERTY, NAME)))
+        result = layer.subject_index
+
+        assert result == {ASPECT: {RDF.type: [ASPECT_TYPE], PROPERTY: [NAME]}}
+        assert layer.subject_index is result
+
+    def test_index_triples(self):
+        result = GraphLayer.index_triples([(ASPECT, PROPERTY, NAME), (ASPECT, PROPERTY, ASPECT_TYPE)])
+
+        assert result == {ASPECT: {PROPERTY: [NAME, ASPECT_TYPE]}}
+
+    def test_list_index(self):
+        head = BNode("head")
+        rest = BNode("rest")
+        layer = GraphLayer(
+            get_graph(
+                (head, RDF.first, ASPECT),
+                (head, RDF.rest, rest),
+                (rest, RDF.first, PROPERTY),
+                (rest, RDF.rest, RDF.nil),
+            )
+        )
+        result = layer.list_index
+
+        assert result == {head: (ASPECT, PROPERTY)}
+        assert layer.list_index is result
+
+    def test_index_parents(self):
+        node = BNode("node")
+        result = GraphLayer.index_parents({ASPECT: {PROPERTY: [node, NAME]}, node: {RDF.type: [ASPECT_TYPE]}})
+
+        assert result == {node: [(ASPECT, PROPERTY)]}
+
+    def test_resolve_named_parents(self):
+        child = BNode("child")
+        grandchild = BNode("grandchild")
+        orphan_child = BNode("orphan_child")
+        orphan = BNode("orphan")
+        result = GraphLayer.resolve_named_parents(
+            {
+                grandchild: [(child, RDF.first)],
+                child: [(NAME, PROPERTY), (ASPECT, PROPERTY)],
+                orphan_child: [(orphan, PROPERTY)],
+            }
+        )
+
+        assert result == {
+            grandchild: (ASPECT, PROPERTY, 1),
+            child: (ASPECT, PROPERTY, 0),
+            orphan_child: (None, None, 0),
+            orphan: (None, None, 0),
+        }
+
+    def test_resolve_named_parents_cycle(self):
+        first = BNode("first")
+        second = BNode("second")
+        result = GraphLayer.resolve_named_parents({first: [(second, PROPERTY)], second: [(first, PROPERTY)]})
+
+        assert result == {first: (None, None, 0), second: (None, None, 0)}
+
+    def test_named_parents(self):
+        node = BNode("node")
+        layer = GraphLayer(get_graph((ASPECT, PROPERTY, node)))
+        result = layer.named_parents
+
+        assert result == {node: (ASPECT, PROPERTY, 0)}
+        assert layer.named_parents is result
+
+
+class TestLayeredGraph:
+    """Layered graph test suite."""
+
+    def test_init(self):
+        result = LayeredGraph()
+
+        assert result.layers == []
+        assert len(result) == 0
+
+    def test_add_layer(self):
+        layer = GraphLayer(get_graph())
+        graph = LayeredGraph()
+        graph.add_layer(layer)
+        graph.add_layer(layer)
+
+        assert graph.layers == [layer]
+
+    def test_query_through_layers(self):
+        graph = LayeredGraph()
+        graph.add((ASPECT, RDF.type, ASPECT_TYPE))
+        graph.add_layer(GraphLayer(get_graph((ASPECT, PROPERTY, NAME))))
+        graph.add_layer(GraphLayer(get_graph((NAME, RDF.type, Literal("name")))))
+
+        assert len(graph) == 3
+        assert graph.value(subject=ASPECT, predicate=PROPERTY) == NAME
+        assert graph.value(subject=NAME, predicate=RDF.type) == Literal("name")
+        assert (ASPECT, PROPERTY, NAME) in graph
+        assert sorted(graph.objects(predicate=RDF.type)) == sorted([ASPECT_TYPE, Literal("name")])
+
+    def test_add_writes_top_layer(self):
+        layer_graph = get_graph()
+        graph = LayeredGraph()
+        graph.add_layer(GraphLayer(layer_graph))
+        graph.add((ASPECT, RDF.type, ASPECT_TYPE))
+
+        assert len(layer_graph) == 0
+        assert list(graph.triples((None, None, None))) == [(ASPECT, RDF.type, ASPECT_TYPE)]
+
+    def test_triples_without_duplicates(self):
+        graph = LayeredGraph()
+        graph.add((ASPECT, RDF.type, ASPECT_TYPE))
+        graph.add_layer(GraphLayer(get_graph((ASPECT, RDF.type, ASPECT_TYPE))))
+        result = list(graph.objects(subject=ASPECT, predicate=RDF.type))
+
+        assert result == [ASPECT_TYPE]
+
+    def test_top_triples(self):
+        graph = LayeredGraph()
+        graph.add((ASPECT, RDF.type, ASPECT_TYPE))
+        graph.add_layer(GraphLayer(get_graph((ASPECT, PROPERTY, NAME))))
+        result = list(graph.top_triples((ASPECT, None, None)))
+
+        assert result == [(ASPECT, RDF.type, ASPECT_TYPE)]
+
+
+class TestGraphLayerStore:
+    """Graph layer store test suite."""
+
+    @mock.patch("esmf_aspect_meta_model_python.resolver.layered_graph.stat")
+    def test_get_files_stamp(self, stat_mock):
+        stat_mock.return_value = mock.MagicMock(st_mtime_ns=1, st_size=2)
+        result = GraphLayerStore.get_files_stamp(["file_path"])
+
+        assert result == (("file_path", 1, 2),)
+        stat_mock.assert_called_once_with("file_path")
+
+    @mock.patch("esmf_aspect_meta_model_python.resolver.layered_graph.Graph")
+    def test_parse_files(self, graph_mock):
+        graph_mock.return_value = graph_mock
+        result = GraphLayerStore.parse_files(["file_path"])
+
+        assert result == graph_mock
+        graph_mock.parse.assert_called_once_with("file_path", format="turtle")
+
+    @mock.patch("esmf_aspect_meta_model_python.resolver.layered_graph.GraphLayer")
+    @mock.patch("esmf_aspect_meta_model_python.resolver.layered_graph.GraphLayerStore.parse_files")
+    @mock.patch("esmf_aspect_meta_model_python.resolver.layered_graph.GraphLayerStore.get_files_stamp")
+    def test_get_layer(self, get_files_stamp_mock, parse_files_mock, graph_layer_mock):
+        get_files_stamp_mock.side_effect = ("stamp", "stamp", "new_stamp")
+        parse_files_mock.side_effect = ("graph", "new_graph")
+        graph_layer_mock.side_effect = lambda graph, file_paths: f"{graph}_layer"
+        store = GraphLayerStore()
+        first = store.get_layer("key", ["file_path"])
+        second = store.get_layer("key", ["file_path"])
+        changed = store.get_layer("key", ["file_path"])
+
+        assert first == "graph_layer"
+        assert second == "graph_layer"
+        assert changed == "new_graph_layer"
+        assert parse_files_mock.call_count == 2
+        graph_layer_mock.assert_called_with("new_graph", ["file_path"])
+
+    @mock.patch("esmf_aspect_meta_model_python.resolver.layered_graph.GraphLayer")
+    @mock.patch("esmf_aspect_meta_model_python.resolver.layered_graph.GraphLayerStore.parse_files")
+    @mock.patch("esmf_aspect_meta_model_python.resolver.layered_graph.GraphLayerStore.get_files_stamp")
+    def test_clear(self, get_files_stamp_mock, parse_files_mock, graph_layer_mock):
+        get_files_stamp_mock.return_value = "stamp"
+        parse_files_mock.return_value = "graph"
+        store = GraphLayerStore()
+        store.get_layer("key", ["file_path"])
+        store.clear()
+        store.get_layer("key", ["file_path"])
+
+        assert parse_files_mock.call_count == 2
@@ -4,6 +4,7 @@ from unittest import mock
 
 import pytest
 
+from esmf_aspect_meta_model_python.resolver.layered_graph import LayeredGraph
 from esmf_aspect_meta_model_python.resolver.meta_model import AspectMetaModelResolver
 
 
@@ -36,15 +37,78 @@ class TestAspectMetaModelResolver:
         )
         exists_mock.assert_called_once_with("file_path")
 
+    @mock.patch("esmf_aspect_meta_model_python.resolver.meta_model.Graph")
     @mock.patch("esmf_aspect_meta_model_python.resolver.meta_model.AspectMetaModelResolver.validate_file")
     @mock.patch("esmf_aspect_meta_model_python.resolver.meta_model.AspectMetaModelResolver._get_samm_files_path")
-    def test_parse(self, get_samm_files_path_mock, validate_file_mock):
+    def test_load_meta_model_graph(self, get_samm_files_path_mock, validate_file_mock, graph_mock):
         get_samm_files_path_mock.return_value = ["samm_file_path"]
+        graph_mock.return_value = graph_mock
+        aspect_resolver = AspectMetaModelResolver("base_path")
+        result = aspect_resolver._load_meta_model_graph("meta_model_version")
+
+        assert result == graph_mock
+        get_samm_files_path_mock.assert_called_once_with("meta_model_version")
+        validate_file_mock.assert_called_once_with("samm_file_path")
+        graph_mock.parse.assert_called_once_with("samm_file_path", format="turtle")
+
+    @mock.patch("esmf_aspect_meta_model_python.resolver.meta_model.GraphLayer")
+    @mock.patch("esmf_aspect_meta_model_python.resolver.meta_model.AspectMetaModelResolver._load_meta_model_graph")
+    def test_get_meta_model_layer(self, load_meta_model_graph_mock, graph_layer_mock):
+        load_meta_model_graph_mock.return_value = "meta_model_graph"
+        graph_layer_mock.return_value = "meta_model_layer"
+        AspectMetaModelResolver.clear_cache()
+        result = AspectMetaModelResolver("base_path").get_meta_model_layer("meta_model_version")
+        AspectMetaModelResolver.clear_cache()
+
+        assert result == "meta_model_layer"
+        load_meta_model_graph_mock.assert_called_once_with("meta_model_version")
+        graph_layer_mock.assert_called_once_with("meta_model_graph")
+
+    @mock.patch("esmf_aspect_meta_model_python.resolver.meta_model.GraphLayer")
+    @mock.patch("esmf_aspect_meta_model_python.resolver.meta_model.AspectMetaModelResolver._load_meta_model_graph")
+    def test_get_meta_model_layer_shared(self, load_meta_model_graph_mock, graph_layer_mock):
+        load_meta_model_graph_mock.side_effect = ("graph_1", "graph_2")
+        graph_layer_mock.side_effect = lambda graph: f"layer_{graph}"
+        AspectMetaModelResolver.clear_cache()
+        first = AspectMetaModelResolver("base_path").get_meta_model_layer("meta_model_version")
+        second = AspectMetaModelResolver("base_path").get_meta_model_layer("meta_model_version")
+        other_version = AspectMetaModelResolver("base_path").get_meta_model_layer("other_version")
+        AspectMetaModelResolver.clear_cache()
+
+        assert first == "layer_graph_1"
+        assert second == "layer_graph_1"
+        assert other_version == "layer_graph_2"
+        load_meta_model_graph_mock.assert_has_calls([mock.call("meta_model_version"), mock.call("other_version")])
+
+    @mock.patch("esmf_aspect_meta_model_python.resolver.meta_model.AspectMetaModelResolver.get_meta_model_layer")
+    def test_get_meta_model_graph(self, get_meta_model_layer_mock):
+        layer_mock = mock.MagicMock(name="meta_model_layer")
+        layer_mock.graph = "meta_model_graph"
+        get_meta_model_layer_mock.return_value = layer_mock
+        result = AspectMetaModelResolver("base_path").get_meta_model_graph("meta_model_version")
+
+        assert result == "meta_model_graph"
+        get_meta_model_layer_mock.assert_called_once_with("meta_model_version")
+
+    @mock.patch("esmf_aspect_meta_model_python.resolver.meta_model.AspectMetaModelResolver.get_meta_model_layer")
+    def test_parse(self, get_meta_model_layer_mock):
+        layer_mock = mock.MagicMock(name="meta_model_layer")
+        layer_mock.graph = "meta_model_graph"
+        get_meta_model_layer_mock.return_value = layer_mock
         aspect_graph_mock = mock.MagicMock(name="graph")
         aspect_resolver = AspectMetaModelResolver("base_path")
         result = aspect_resolver.parse(aspect_graph_mock, "meta_model_version")
 
         assert result is None
-        get_samm_files_path_mock.assert_called_once_with("meta_model_version")
-        validate_file_mock.assert_called_once_with("samm_file_path")
-        aspect_graph_mock.parse.assert_called_once_with("samm_file_path", format="turtle")
+        get_meta_model_layer_mock.assert_called_once_with("meta_model_version")
+        aspect_graph_mock.__iadd__.assert_called_once_with("meta_model_graph")
+
+    @mock.patch("esmf_aspect_meta_model_python.resolver.meta_model.AspectMetaModelResolver.get_meta_model_layer")
+    def test_parse_layered_graph(self, get_meta_model_layer_mock):
+        get_meta_model_layer_mock.return_value = "meta_model_layer"
+        aspect_graph_mock = mock.MagicMock(name="graph", spec=LayeredGraph)
+        aspect_resolver = AspectMetaModelResolver("base_path")
+        result = aspect_resolver.parse(aspect_graph_mock, "meta_model_version")
+
+        assert result is None
+        aspect_graph_mock.add_layer.assert_called_once_with("meta_model_layer")
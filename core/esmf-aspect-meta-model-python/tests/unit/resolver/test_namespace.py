@@ -4,8 +4,56 @@ from unittest import mock
 
 import pytest
 
+from rdflib import RDF, Graph, URIRef
+
+from esmf_aspect_meta_model_python.resolver.file_index import ModelFileIndex
+from esmf_aspect_meta_model_python.resolver.layered_graph import GraphLayer, GraphLayerStore, LayeredGraph
 from esmf_aspect_meta_model_python.resolver.namespace import AspectNamespaceResolver
 
+ASPECT_MODEL = """@prefix : <urn:samm:org.eclipse.esmf.test:1.0.0#> .
+@prefix shared: <urn:samm:org.eclipse.esmf.shared:1.0.0#> .
+@prefix unused: <urn:samm:org.eclipse.esmf.unused:1.0.0#> .
+@prefix samm: <urn:samm:org.eclipse.esmf.samm:meta-model:2.1.0#> .
+
+:Aspect a samm:Aspect ;
+   samm:properties ( shared:property ) .
+
+:unusedProperty a samm:Property ;
+   samm:characteristic unused:Characteristic .
+"""
+
+PROPERTY_MODEL = """@prefix shared: <urn:samm:org.eclipse.esmf.shared:1.0.0#> .
+@prefix samm: <urn:samm:org.eclipse.esmf.samm:meta-model:2.1.0#> .
+
+shared:property a samm:Property ;
+   samm:characteristic shared:Characteristic .
+"""
+
+CHARACTERISTIC_MODEL = """@prefix shared: <urn:samm:org.eclipse.esmf.shared:1.0.0#> .
+@prefix samm: <urn:samm:org.eclipse.esmf.samm:meta-model:2.1.0#> .
+
+shared:Characteristic a samm:Characteristic .
+"""
+
+
+def write_model(folder, file_name, content) -> str:
+    folder.mkdir(parents=True, exist_ok=True)
+    file_path = folder / file_name
+    file_path.write_text(content)
+
+    return str(file_path)
+
+
+def write_models(models_root):
+    shared_folder = models_root / "org.eclipse.esmf.shared" / "1.0.0"
+    unused_folder = models_root / "org.eclipse.esmf.unused" / "1.0.0"
+    aspect_file = write_model(models_root / "org.eclipse.esmf.test" / "1.0.0", "Aspect.ttl", ASPECT_MODEL)
+    property_file = write_model(shared_folder, "property.ttl", PROPERTY_MODEL)
+    characteristic_file = write_model(shared_folder, "SharedCharacteristics.ttl", CHARACTERISTIC_MODEL)
+    write_model(unused_folder, "Characteristic.ttl", CHARACTERISTIC_MODEL.replace("shared", "unused"))
+
+    return aspect_file, property_file, characteristic_file
+
 
 class TestAspectNamespaceResolver:
     """Aspect namespace resolver test suite."""
@@ -14,6 +62,8 @@ class TestAspectNamespaceResolver:
         result = AspectNamespaceResolver()
 
         assert result.aspect_graph is None
+        assert result.file_index is None
+        assert result.selective is False
 
     @mock.patch("esmf_aspect_meta_model_python.resolver.namespace.exists")
     def test_validate_file(self, exists_mock):
@@ -51,8 +101,7 @@ class TestAspectNamespaceResolver:
         parse_namespace_mock.return_value = ("namespace_specific_str", "version")
         join_mock.return_value = "paths_for_advanced_loading"
         resolver = AspectNamespaceResolver()
-        resolver.aspect_graph = aspect_graph_mock
-        result = resolver._get_dirs_for_advanced_loading("file_path")
+        result = resolver._get_dirs_for_advanced_loading(aspect_graph_mock, "file_path")
 
         assert result == ["paths_for_advanced_loading"]
         path_mock.assert_called_once_with("file_path")
@@ -63,16 +112,57 @@ class TestAspectNamespaceResolver:
     @mock.patch(
         "esmf_aspect_meta_model_python.resolver.namespace.AspectNamespaceResolver._get_dirs_for_advanced_loading"
     )
-    def test_get_dependency_folders(self, get_dirs_for_advanced_loading_mock):
+    def test_get_dependency_folders_base_file(self, get_dirs_for_advanced_loading_mock):
         get_dirs_for_advanced_loading_mock.return_value = "dependency_folders"
         resolver = AspectNamespaceResolver()
-        graph_mock = mock.MagicMock(name="graph")
-        resolver.aspect_graph = graph_mock
+        resolver.aspect_graph = "aspect_graph"
+        resolver.file_path = "file_path"
         result = resolver._get_dependency_folders("file_path")
 
         assert result == "dependency_folders"
-        graph_mock.parse.assert_called_once_with("file_path", format="turtle")
-        get_dirs_for_advanced_loading_mock.assert_called_once_with("file_path")
+        get_dirs_for_advanced_loading_mock.assert_called_once_with("aspect_graph", "file_path")
+
+    @mock.patch("esmf_aspect_meta_model_python.resolver.namespace.AspectNamespaceResolver._add_dependency_layer")
+    @mock.patch("esmf_aspect_meta_model_python.resolver.namespace.AspectNamespaceResolver._dependency_layers")
+    @mock.patch(
+        "esmf_aspect_meta_model_python.resolver.namespace.AspectNamespaceResolver._get_dirs_for_advanced_loading"
+    )
+    def test_get_dependency_folders(
+        self,
+        get_dirs_for_advanced_loading_mock,
+        dependency_layers_mock,
+        add_dependency_layer_mock,
+    ):
+        get_dirs_for_advanced_loading_mock.return_value = "dependency_folders"
+        layer_mock = mock.MagicMock(name="dependency_layer")
+        layer_mock.graph = "dependency_graph"
+        dependency_layers_mock.get_layer.return_value = layer_mock
+        resolver = AspectNamespaceResolver()
+        resolver.file_path = "base_file_path"
+        result = resolver._get_dependency_folders("file_path")
+
+        assert result == "dependency_folders"
+        dependency_layers_mock.get_layer.assert_called_once_with("file_path", ["file_path"])
+        add_dependency_layer_mock.assert_called_once_with(layer_mock)
+        get_dirs_for_advanced_loading_mock.assert_called_once_with("dependency_graph", "file_path")
+
+    def test_add_dependency_layer(self):
+        layer_mock = mock.MagicMock(name="dependency_layer")
+        layer_mock.graph = "dependency_graph"
+        aspect_graph_mock = mock.MagicMock(name="aspect_graph")
+        resolver = AspectNamespaceResolver()
+        resolver.aspect_graph = aspect_graph_mock
+        resolver._add_dependency_layer(layer_mock)
+
+        aspect_graph_mock.__iadd__.assert_called_once_with("dependency_graph")
+
+    def test_add_dependency_layer_layered_graph(self):
+        aspect_graph_mock = mock.MagicMock(name="aspect_graph", spec=LayeredGraph)
+        resolver = AspectNamespaceResolver()
+        resolver.aspect_graph = aspect_graph_mock
+        resolver._add_dependency_layer("dependency_layer")
+
+        aspect_graph_mock.add_layer.assert_called_once_with("dependency_layer")
 
     @mock.patch("esmf_aspect_meta_model_python.resolver.namespace.Path")
     @mock.patch("esmf_aspect_meta_model_python.resolver.namespace.exists")
@@ -127,5 +217,217 @@ class TestAspectNamespaceResolver:
             ]
         )
 
-    def test_parse(self):
-        pass
+    def test_get_referenced_urns(self):
+        result = AspectNamespaceResolver._get_referenced_urns(
+            [
+                (
+                    URIRef("urn:samm:org.eclipse.esmf.test:1.0.0#property"),
+                    RDF.type,
+                    URIRef("urn:samm:org.eclipse.esmf.samm:meta-model:2.1.0#Property"),
+                ),
+                (URIRef("urn:samm:org.eclipse.esmf.test:1.0.0#aspect"), RDF.value, "urn:samm:not.a.node:1.0.0#name"),
+            ]
+        )
+
+        assert result == {
+            "urn:samm:org.eclipse.esmf.test:1.0.0#property",
+            "urn:samm:org.eclipse.esmf.test:1.0.0#aspect",
+        }
+
+    @mock.patch("esmf_aspect_meta_model_python.resolver.namespace.AspectNamespaceResolver._dependency_layers")
+    def test_get_indexed_dependency_files(self, dependency_layers_mock):
+        aspect = URIRef("urn:samm:org.eclipse.esmf.test:1.0.0#Aspect")
+        property_urn = URIRef("urn:samm:org.eclipse.esmf.test:1.0.0#property")
+        characteristic = URIRef("urn:samm:org.eclipse.esmf.test:1.0.0#Characteristic")
+        property_graph = Graph()
+        property_graph.add((property_urn, RDF.value, characteristic))
+        characteristic_graph = Graph()
+        characteristic_graph.add((characteristic, RDF.value, property_urn))
+        layers = {
+            "/models/property.ttl": GraphLayer(property_graph),
+            "/models/characteristic.ttl": GraphLayer(characteristic_graph),
+        }
+        dependency_layers_mock.get_layer.side_effect = lambda key, file_paths: layers[key]
+        file_index_mock = mock.MagicMock(name="file_index")
+        file_index_mock.get_files.side_effect = lambda urn: {
+            str(aspect): ["/models/aspect.ttl"],
+            str(property_urn): ["/models/property.ttl"],
+            str(characteristic): ["/models/characteristic.ttl"],
+        }.get(urn, [])
+        aspect_graph = LayeredGraph()
+        aspect_graph.add((aspect, RDF.value, property_urn))
+        resolver = AspectNamespaceResolver(file_index_mock)
+        resolver.aspect_graph = aspect_graph
+        result = resolver._get_indexed_dependency_files(file_index_mock, "/models/aspect.ttl")
+
+        assert sorted(result) == ["/models/characteristic.ttl", "/models/property.ttl"]
+        assert aspect_graph.layers == [layers[file_path] for file_path in result]
+        file_index_mock.refresh.assert_called_once()
+        assert file_index_mock.get_files.call_count == 3
+
+    def test_is_model_urn(self):
+        assert AspectNamespaceResolver._is_model_urn(URIRef("urn:samm:org.eclipse.esmf.test:1.0.0#property")) is True
+        assert AspectNamespaceResolver._is_model_urn(URIRef("urn:samm:org.eclipse.esmf.samm:unit:2.1.0#metre")) is False
+        assert AspectNamespaceResolver._is_model_urn("urn:samm:org.eclipse.esmf.test:1.0.0#property") is False
+
+    def test_get_root_nodes(self):
+        aspect = URIRef("urn:samm:org.eclipse.esmf.test:1.0.0#Aspect")
+        aspect_graph = LayeredGraph()
+        aspect_graph.add((aspect, RDF.type, URIRef("urn:samm:org.eclipse.esmf.samm:meta-model:2.1.0#Aspect")))
+        aspect_graph.add((aspect, RDF.value, URIRef("urn:samm:org.eclipse.esmf.test:1.0.0#property")))
+        aspect_graph.add(
+            (
+                URIRef("urn:samm:org.eclipse.esmf.test:1.0.0#property"),
+                RDF.type,
+                URIRef("urn:samm:org.eclipse.esmf.samm:meta-model:2.1.0#Property"),
+            )
+        )
+        resolver = AspectNamespaceResolver()
+        resolver.aspect_graph = aspect_graph
+        result = resolver._get_root_nodes()
+
+        assert result == [aspect]
+
+    def test_get_root_nodes_no_aspect(self):
+        property_urn = URIRef("urn:samm:org.eclipse.esmf.test:1.0.0#property")
+        aspect_graph = LayeredGraph()
+        aspect_graph.add((property_urn, RDF.type, URIRef("urn:samm:org.eclipse.esmf.samm:meta-model:2.1.0#Property")))
+        aspect_graph.add((property_urn, RDF.value, URIRef("urn:samm:org.eclipse.esmf.test:1.0.0#Characteristic")))
+        resolver = AspectNamespaceResolver()
+        resolver.aspect_graph = aspect_graph
+        result = resolver._get_root_nodes()
+
+        assert result == [property_urn]
+
+    def test_find_element_files_with_index(self):
+        file_index_mock = mock.MagicMock(name="file_index")
+        file_index_mock.get_files.return_value = ["file_path"]
+        resolver = AspectNamespaceResolver(file_index_mock, selective=True)
+        result = resolver._find_element_files("urn", "models_root")
+
+        assert result == ["file_path"]
+        file_index_mock.get_files.assert_called_once_with("urn")
+
+    def test_find_element_files_by_convention(self, tmp_path):
+        _, property_file, _ = write_models(tmp_path)
+        resolver = AspectNamespaceResolver(selective=True)
+        result = resolver._find_element_files("urn:samm:org.eclipse.esmf.shared:1.0.0#property", tmp_path)
+
+        assert result == [property_file]
+
+    def test_find_element_files_by_folder_scan(self, tmp_path):
+        _, _, characteristic_file = write_models(tmp_path)
+        resolver = AspectNamespaceResolver(selective=True)
+        result = resolver._find_element_files("urn:samm:org.eclipse.esmf.shared:1.0.0#Characteristic", tmp_path)
+
+        assert result == [characteristic_file]
+
+    def test_find_element_files_scans_folder_once(self, tmp_path):
+        _, _, characteristic_file = write_models(tmp_path)
+        shared_folder = tmp_path / "org.eclipse.esmf.shared" / "1.0.0"
+        for index in range(3):
+            write_model(shared_folder, f"Unrelated{index}.ttl", PROPERTY_MODEL.replace("property", f"unrelated{index}"))
+        AspectNamespaceResolver.clear_cache()
+
+        with (
+            mock.patch(
+                "esmf_aspect_meta_model_python.resolver.namespace.ModelFileIndex.get_defined_urns",
+                wraps=ModelFileIndex.get_defined_urns,
+            ) as get_defined_urns_mock,
+            mock.patch.object(
+                GraphLayerStore,
+                "parse_files",
+                wraps=GraphLayerStore.parse_files,
+            ) as parse_files_mock,
+        ):
+            for urn in ("Characteristic", "unrelated0", "Characteristic"):
+                resolver = AspectNamespaceResolver(selective=True)
+                resolver.aspect_graph = LayeredGraph()
+                for file_path in resolver._find_element_files(
+                    f"urn:samm:org.eclipse.esmf.shared:1.0.0#{urn}", tmp_path
+                ):
+                    resolver._add_dependency_layer(resolver._dependency_layers.get_layer(file_path, [file_path]))
+
+        assert get_defined_urns_mock.call_count == 5
+        assert [call.args[0] for call in parse_files_mock.call_args_list] == [
+            [characteristic_file],
+            [str(shared_folder / "Unrelated0.ttl")],
+        ]
+        AspectNamespaceResolver.clear_cache()
+
+    def test_find_element_files_rescans_changed_folder(self, tmp_path):
+        write_models(tmp_path)
+        AspectNamespaceResolver.clear_cache()
+        resolver = AspectNamespaceResolver(selective=True)
+        urn = "urn:samm:org.eclipse.esmf.shared:1.0.0#added"
+
+        assert resolver._find_element_files(urn, tmp_path) == []
+
+        added_file = write_model(
+            tmp_path / "org.eclipse.esmf.shared" / "1.0.0",
+            "Other.ttl",
+            PROPERTY_MODEL.replace("property", "added"),
+        )
+
+        assert resolver._find_element_files(urn, tmp_path) == [added_file]
+        AspectNamespaceResolver.clear_cache()
+
+    def test_find_element_files_not_found(self, tmp_path):
+        write_models(tmp_path)
+        resolver = AspectNamespaceResolver(selective=True)
+
+        assert resolver._find_element_files("urn:samm:org.eclipse.esmf.shared:1.0.0#unknown", tmp_path) == []
+        assert resolver._find_element_files("urn:samm:org.eclipse.esmf.missing:1.0.0#unknown", tmp_path) == []
+        assert resolver._find_element_files("urn:samm:not.valid", tmp_path) == []
+
+    def test_get_selective_dependency_files(self, tmp_path):
+        aspect_file, property_file, characteristic_file = write_models(tmp_path)
+        aspect_graph = LayeredGraph()
+        aspect_graph.parse(aspect_file)
+        resolver = AspectNamespaceResolver(selective=True)
+        resolver.aspect_graph = aspect_graph
+        result = resolver._get_selective_dependency_files(aspect_file)
+
+        assert result == [property_file, characteristic_file]
+        assert [layer.file_paths for layer in aspect_graph.layers] == [(property_file,), (characteristic_file,)]
+
+    @mock.patch("esmf_aspect_meta_model_python.resolver.namespace.AspectNamespaceResolver._get_root_nodes")
+    def test_get_selective_dependency_files_refreshes_index(self, get_root_nodes_mock):
+        get_root_nodes_mock.return_value = []
+        file_index_mock = mock.MagicMock(name="file_index")
+        resolver = AspectNamespaceResolver(file_index_mock, selective=True)
+        result = resolver._get_selective_dependency_files("root/namespace/version/aspect.ttl")
+
+        assert result == []
+        file_index_mock.refresh.assert_called_once()
+
+    @mock.patch("esmf_aspect_meta_model_python.resolver.namespace.AspectNamespaceResolver._get_dependency_files")
+    def test_parse(self, get_dependency_files_mock):
+        resolver = AspectNamespaceResolver()
+        resolver.parse("aspect_graph", "aspect_file_path")
+
+        assert resolver.aspect_graph == "aspect_graph"
+        assert resolver.file_path == "aspect_file_path"
+        get_dependency_files_mock.assert_called_once_with({}, {}, "aspect_file_path")
+
+    @mock.patch(
+        "esmf_aspect_meta_model_python.resolver.namespace.AspectNamespaceResolver._get_indexed_dependency_files"
+    )
+    @mock.patch("esmf_aspect_meta_model_python.resolver.namespace.AspectNamespaceResolver._get_dependency_files")
+    def test_parse_with_file_index(self, get_dependency_files_mock, get_indexed_dependency_files_mock):
+        resolver = AspectNamespaceResolver("file_index")
+        resolver.parse("aspect_graph", "aspect_file_path")
+
+        get_indexed_dependency_files_mock.assert_called_once_with("file_index", "aspect_file_path")
+        get_dependency_files_mock.assert_not_called()
+
+    @mock.patch(
+        "esmf_aspect_meta_model_python.resolver.namespace.AspectNamespaceResolver._get_selective_dependency_files"
+    )
+    @mock.patch("esmf_aspect_meta_model_python.resolver.namespace.AspectNamespaceResolver._get_dependency_files")
+    def test_parse_selective(self, get_dependency_files_mock, get_selective_dependency_files_mock):
+        resolver = AspectNamespaceResolver(selective=True)
+        resolver.parse("aspect_graph", "aspect_file_path")
+
+        get_selective_dependency_files_mock.assert_called_once_with("aspect_file_path")
+        get_dependency_files_mock.assert_not_called()
@@ -0,0 +1,73 @@
+"""Cache files test suite."""
+
+from esmf_aspect_meta_model_python.cache_files import (
+    get_files_key,
+    read_json,
+    read_versioned_json,
+    write_json,
+    write_text,
+)
+
+
+class TestCacheFiles:
+    """Cache files test suite."""
+
+    def test_get_files_key(self, tmp_path):
+        file_path = tmp_path / "Aspect.ttl"
+        file_path.write_text("content")
+
+        result = get_files_key("prefix", [str(file_path)])
+
+        assert result == get_files_key("prefix", [str(file_path)])
+        assert result != get_files_key("other", [str(file_path)])
+
+        (tmp_path / "Other.ttl").write_text("other")
+
+        assert get_files_key("prefix", [str(file_path)]) != result
+
+    def test_read_json_missing(self, tmp_path):
+        assert read_json(tmp_path / "missing.json") is None
+
+    def test_read_json_broken(self, tmp_path):
+        file_path = tmp_path / "broken.json"
+        file_path.write_text("{broken")
+
+        assert read_json(file_path) is None
+
+    def test_write_json(self, tmp_path):
+        file_path = tmp_path / "data.json"
+
+        write_json(file_path, {"name": "Änderung", "values": [1, 2]})
+
+        assert file_path.read_text(encoding="utf-8") == '{"name":"Änderung","values":[1,2]}'
+        assert read_json(file_path) == {"name": "Änderung", "values": [1, 2]}
+        assert [path.name for path in tmp_path.iterdir()] == ["data.json"]
+
+    def test_write_text_replaces_file(self, tmp_path):
+        file_path = tmp_path / "module.py"
+        file_path.write_text("old")
+
+        write_text(str(file_path), "new")
+
+        assert file_path.read_text(encoding="utf-8") == "new"
+        assert [path.name for path in tmp_path.iterdir()] == ["module.py"]
+
+    def test_read_versioned_json(self, tmp_path):
+        file_path = tmp_path / "manifest.json"
+        write_json(file_path, {"format": "1", "key": "abc", "elements": []})
+
+        assert read_versioned_json(file_path, "1") == {"format": "1", "key": "abc", "elements": []}
+        assert read_versioned_json(file_path, "1", "abc") == {"format": "1", "key": "abc", "elements": []}
+
+    def test_read_versioned_json_outdated(self, tmp_path):
+        file_path = tmp_path / "manifest.json"
+        write_json(file_path, {"format": "1", "key": "abc"})
+
+        assert read_versioned_json(file_path, "2") is None
+        assert read_versioned_json(file_path, "1", "def") is None
+
+    def test_read_versioned_json_not_object(self, tmp_path):
+        file_path = tmp_path / "manifest.json"
+        write_json(file_path, ["format"])
+
+        assert read_versioned_json(file_path, "1") is None
@@ -1,8 +1,126 @@
 """SAMM client functions test suite."""
 
+import asyncio
+
+from pathlib import Path
 from unittest import mock
 
-from esmf_aspect_meta_model_python.samm_cli_functions import SammCli
+import pytest
+
+from esmf_aspect_meta_model_python.base.aspect import Aspect
+from esmf_aspect_meta_model_python.samm_cli_functions import SammCli, SammCliCache, SammCliJob, SammCliResult
+
+
+class TestSammCliJob:
+    """SAMM CLI job tests."""
+
+    def test_init(self):
+        result = SammCliJob("to schema", "Model.ttl", "flag", output="Model.schema.json")
+
+        assert result.function_name == "to schema"
+        assert result.path_to_model == "Model.ttl"
+        assert result.args == ("flag",)
+        assert result.kwargs == {"output": "Model.schema.json"}
+        assert repr(result) == "SammCliJob('to schema', 'Model.ttl')"
+
+    def test_output(self):
+        assert SammCliJob("to html", "Model.ttl", output="Model.html").output == "Model.html"
+        assert SammCliJob("to html", "Model.ttl", o="Model.html").output == "Model.html"
+        assert SammCliJob("validate", "Model.ttl").output is None
+
+    def test_get_key(self):
+        job = SammCliJob("to html", "Model.ttl", language="en", output="Model.html")
+
+        assert job.get_key() == SammCliJob("to html", "Model.ttl", output="Model.html", language="en").get_key()
+        assert job.get_key() != SammCliJob("to html", "Model.ttl", output="Model.html").get_key()
+
+
+class TestSammCliResult:
+    """SAMM CLI result tests."""
+
+    def test_init(self):
+        job = SammCliJob("validate", "Model.ttl")
+        result = SammCliResult(job, 1, "stdout", "stderr", 1.5)
+
+        assert result.job is job
+        assert result.returncode == 1
+        assert result.stdout == "stdout"
+        assert result.stderr == "stderr"
+        assert result.duration == 1.5
+        assert result.cached is False
+        assert result.ok is False
+        assert repr(result) == "SammCliResult(SammCliJob('validate', 'Model.ttl'), returncode=1, cached=False)"
+
+    def test_ok(self):
+        assert SammCliResult(SammCliJob("validate", "Model.ttl"), 0).ok is True
+
+
+class TestSammCliCache:
+    """SAMM CLI cache tests."""
+
+    @pytest.fixture
+    def model_file_path(self, tmp_path):
+        model_file_path = tmp_path / "models" / "Model.ttl"
+        model_file_path.parent.mkdir()
+        model_file_path.write_text("model")
+
+        return model_file_path
+
+    def test_init(self, tmp_path):
+        result = SammCliCache(tmp_path / "cache")
+
+        assert result.cache_dir == tmp_path / "cache"
+        assert result.cache_dir.is_dir()
+
+    @mock.patch("esmf_aspect_meta_model_python.samm_cli_functions.SammCliCache.resolve_model_files")
+    def test_get_model_key(self, resolve_model_files_mock, tmp_path, model_file_path):
+        resolve_model_files_mock.return_value = ("2.1.0", [str(model_file_path)])
+        cache = SammCliCache(tmp_path / "cache")
+        key = cache.get_model_key(str(model_file_path))
+
+        assert cache.get_model_key(str(model_file_path)) == key
+        resolve_model_files_mock.assert_called_once_with(str(model_file_path))
+
+        model_file_path.write_text("changed model")
+        assert cache.get_model_key(str(model_file_path)) != key
+        assert resolve_model_files_mock.call_count == 2
+
+    @mock.patch("esmf_aspect_meta_model_python.samm_cli_functions.SammCliCache.get_model_key")
+    def test_get_key(self, get_model_key_mock, tmp_path):
+        get_model_key_mock.return_value = "model_key"
+        cache = SammCliCache(tmp_path)
+        key = cache.get_key(SammCliJob("to html", "Model.ttl", language="de", output="Model.html"))
+
+        assert key == cache.get_key(SammCliJob("to html", "Model.ttl", language="de", o="Other.html"))
+        assert key != cache.get_key(SammCliJob("to html", "Model.ttl", language="en", output="Model.html"))
+        assert key != cache.get_key(SammCliJob("to svg", "Model.ttl", language="de", output="Model.html"))
+
+    def test_save_and_load(self, tmp_path):
+        cache = SammCliCache(tmp_path / "cache")
+        output = tmp_path / "Model.html"
+        output.write_text("html")
+        cache.save("key", SammCliResult(SammCliJob("to html", "Model.ttl", output=str(output)), 0, "stdout"))
+        other_output = tmp_path / "other" / "Model.html"
+        result = cache.load("key", SammCliJob("to html", "Model.ttl", output=str(other_output)))
+
+        assert result.cached is True
+        assert result.ok is True
+        assert result.stdout == "stdout"
+        assert other_output.read_text() == "html"
+        assert cache.load("other_key", SammCliJob("to html", "Model.ttl")) is None
+
+    def test_save_failed_result(self, tmp_path):
+        cache = SammCliCache(tmp_path)
+        cache.save("key", SammCliResult(SammCliJob("validate", "Model.ttl"), 1))
+
+        assert cache.load("key", SammCliJob("validate", "Model.ttl")) is None
+
+    def test_clear(self, tmp_path):
+        cache = SammCliCache(tmp_path)
+        cache.save("key", SammCliResult(SammCliJob("validate", "Model.ttl"), 0))
+        cache.clear()
+
+        assert list(tmp_path.iterdir()) == []
 
 
 class TestSammCli:
@@ -150,3 +268,268 @@ class TestSammCli:
 
         assert result is None
         call_function_mock.assert_called_once_with("to svg", "path_to_ttl_model", "flag", arg_key="value")
+
+    @mock.patch("esmf_aspect_meta_model_python.samm_cli_functions.SammCli._call_function")
+    @mock.patch("esmf_aspect_meta_model_python.samm_cli_functions.SammCli._validate_client")
+    @mock.patch("esmf_aspect_meta_model_python.samm_cli_functions.SammCli._get_client_path")
+    def test_run_jobs(self, get_client_path_mock, _, call_function_mock, tmp_path):
+        get_client_path_mock.return_value = "samm"
+        output = tmp_path / "output" / "Model.html"
+        jobs = [
+            SammCliJob("validate", "Model.ttl"),
+            SammCliJob("to html", "Model.ttl", "flag", output=str(output)),
+            SammCliJob("validate", "Model.ttl"),
+        ]
+        result = SammCli().run_jobs(jobs)
+
+        assert result is None
+        assert output.parent.is_dir()
+        assert call_function_mock.call_args_list == [
+            mock.call("validate", "Model.ttl"),
+            mock.call("to html", "Model.ttl", "flag", output=str(output)),
+        ]
+
+    @mock.patch("esmf_aspect_meta_model_python.samm_cli_functions.JsonSchemaGenerator")
+    @mock.patch("esmf_aspect_meta_model_python.samm_cli_functions.AspectLoader")
+    @mock.patch("esmf_aspect_meta_model_python.samm_cli_functions.SammCli._call_function")
+    @mock.patch("esmf_aspect_meta_model_python.samm_cli_functions.SammCli._validate_client")
+    @mock.patch("esmf_aspect_meta_model_python.samm_cli_functions.SammCli._get_client_path")
+    def test_run_jobs_with_native_schema(
+        self,
+        get_client_path_mock,
+        _,
+        call_function_mock,
+        aspect_loader_mock,
+        json_schema_generator_mock,
+        tmp_path,
+    ):
+        get_client_path_mock.return_value = "samm"
+        aspect = mock.MagicMock(spec=Aspect)
+        aspect_loader_mock.return_value.load_aspect_model.return_value = [aspect]
+        jobs = [
+            SammCliJob("native schema", "Model.ttl", output=str(tmp_path / "Model.schema.json")),
+            SammCliJob("native schema", "Model.ttl", language="de", output=str(tmp_path / "Model.de.schema.json")),
+            SammCliJob("to schema", "Model.ttl", output=str(tmp_path / "Model.cli.schema.json")),
+        ]
+        SammCli().run_jobs(jobs)
+
+        aspect_loader_mock.return_value.load_aspect_model.assert_called_once_with("Model.ttl")
+        assert json_schema_generator_mock.call_args_list == [mock.call(aspect, "en"), mock.call(aspect, "de")]
+        assert json_schema_generator_mock.return_value.write.call_args_list == [
+            mock.call(str(tmp_path / "Model.schema.json")),
+            mock.call(str(tmp_path / "Model.de.schema.json")),
+        ]
+        call_function_mock.assert_called_once_with(
+            "to schema", "Model.ttl", output=str(tmp_path / "Model.cli.schema.json")
+        )
+
+    @mock.patch("esmf_aspect_meta_model_python.samm_cli_functions.SammCli._validate_client")
+    @mock.patch("esmf_aspect_meta_model_python.samm_cli_functions.SammCli._get_client_path")
+    def test_run_jobs_with_native_schema_without_output(self, get_client_path_mock, _):
+        get_client_path_mock.return_value = "samm"
+
+        with pytest.raises(ValueError) as error:
+            SammCli().run_jobs([SammCliJob("native schema", "Model.ttl")])
+
+        assert str(error.value) == "The native schema job of Model.ttl has no output file"
+
+    def test_get_artifact_jobs(self):
+        result = SammCli.get_artifact_jobs(["models/Model.ttl"], "output", ["validate", "to schema", "native schema"])
+
+        assert [(job.function_name, job.path_to_model, job.output) for job in result] == [
+            ("validate", "models/Model.ttl", None),
+            ("to schema", "models/Model.ttl", str(Path("output") / "Model.schema.json")),
+            ("native schema", "models/Model.ttl", str(Path("output") / "Model.schema.json")),
+        ]
+
+    @mock.patch("esmf_aspect_meta_model_python.samm_cli_functions.SammCli.run_jobs")
+    @mock.patch("esmf_aspect_meta_model_python.samm_cli_functions.SammCli._validate_client")
+    @mock.patch("esmf_aspect_meta_model_python.samm_cli_functions.SammCli._get_client_path")
+    def test_generate_artifacts(self, get_client_path_mock, _, run_jobs_mock):
+        get_client_path_mock.return_value = "samm"
+        result = SammCli().generate_artifacts(["Model.ttl", "Other.ttl"], "output")
+
+        assert len(result) == 8
+        assert {job.function_name for job in result} == {"validate", "to schema", "to openapi", "to html"}
+        run_jobs_mock.assert_called_once_with(result)
+
+    @staticmethod
+    def get_process_mock(returncode=0, stdout=b"stdout", stderr=b""):
+        process = mock.MagicMock(returncode=returncode)
+        process.communicate = mock.AsyncMock(return_value=(stdout, stderr))
+
+        return process
+
+    @mock.patch("esmf_aspect_meta_model_python.samm_cli_functions.asyncio.create_subprocess_exec")
+    @mock.patch("esmf_aspect_meta_model_python.samm_cli_functions.SammCli._validate_client")
+    @mock.patch("esmf_aspect_meta_model_python.samm_cli_functions.SammCli._get_client_path")
+    def test_run_job_async(self, get_client_path_mock, _, create_subprocess_exec_mock):
+        get_client_path_mock.return_value = "samm"
+        create_subprocess_exec_mock.return_value = self.get_process_mock(1, b"out", b"error")
+        job = SammCliJob("validate", "Model.ttl", "flag")
+        result = asyncio.run(SammCli().run_job_async(job))
+
+        assert result.job is job
+        assert result.returncode == 1
+        assert result.stdout == "out"
+        assert result.stderr == "error"
+        assert result.duration >= 0
+        assert result.cached is False
+        create_subprocess_exec_mock.assert_called_once_with(
+            "samm",
+            "aspect",
+            "Model.ttl",
+            "validate",
+            "-flag",
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+
+    @mock.patch("esmf_aspect_meta_model_python.samm_cli_functions.asyncio.create_subprocess_exec")
+    @mock.patch("esmf_aspect_meta_model_python.samm_cli_functions.SammCli._validate_client")
+    @mock.patch("esmf_aspect_meta_model_python.samm_cli_functions.SammCli._get_client_path")
+    def test_run_job_async_start_error(self, get_client_path_mock, _, create_subprocess_exec_mock):
+        get_client_path_mock.return_value = "samm"
+        create_subprocess_exec_mock.side_effect = [FileNotFoundError("not found"), PermissionError("not permitted")]
+        jobs = [SammCliJob("validate", "Model.ttl"), SammCliJob("validate", "Other.ttl")]
+        result = SammCli().run_jobs_concurrently(jobs)
+
+        assert [(item.job, item.returncode, item.stderr) for item in result] == [
+            (jobs[0], 127, "not found"),
+            (jobs[1], 126, "not permitted"),
+        ]
+        assert all(not item.ok for item in result)
+
+    @mock.patch("esmf_aspect_meta_model_python.samm_cli_functions.asyncio.create_subprocess_exec")
+    @mock.patch("esmf_aspect_meta_model_python.samm_cli_functions.SammCli._validate_client")
+    @mock.patch("esmf_aspect_meta_model_python.samm_cli_functions.SammCli._get_client_path")
+    def test_run_jobs_async_duplicate_jobs(self, get_client_path_mock, _, create_subprocess_exec_mock, tmp_path):
+        get_client_path_mock.return_value = "samm"
+        create_subprocess_exec_mock.return_value = self.get_process_mock()
+        output = str(tmp_path / "Model.html")
+        jobs = [
+            SammCliJob("to html", "Model.ttl", output=output),
+            SammCliJob("validate", "Model.ttl"),
+            SammCliJob("to html", "Model.ttl", output=output),
+        ]
+        result = SammCli().run_jobs_concurrently(jobs)
+
+        assert [item.job for item in result] == jobs
+        assert [item.stdout for item in result] == ["stdout", "stdout", "stdout"]
+        assert create_subprocess_exec_mock.call_count == 2
+
+    @mock.patch("esmf_aspect_meta_model_python.samm_cli_functions.SammCli._write_schema")
+    @mock.patch("esmf_aspect_meta_model_python.samm_cli_functions.asyncio.create_subprocess_exec")
+    @mock.patch("esmf_aspect_meta_model_python.samm_cli_functions.SammCli._validate_client")
+    @mock.patch("esmf_aspect_meta_model_python.samm_cli_functions.SammCli._get_client_path")
+    def test_run_jobs_async_with_native_schema(
+        self,
+        get_client_path_mock,
+        _,
+        create_subprocess_exec_mock,
+        write_schema_mock,
+    ):
+        get_client_path_mock.return_value = "samm"
+        write_schema_mock.side_effect = [None, ValueError("error")]
+        jobs = [
+            SammCliJob("native schema", "Model.ttl", output="Model.schema.json"),
+            SammCliJob("native schema", "Other.ttl"),
+        ]
+        result = SammCli().run_jobs_concurrently(jobs)
+
+        assert [(item.job, item.returncode, item.stderr) for item in result] == [
+            (jobs[0], 0, ""),
+            (jobs[1], 1, "error"),
+        ]
+        create_subprocess_exec_mock.assert_not_called()
+
+    @mock.patch("esmf_aspect_meta_model_python.samm_cli_functions.asyncio.create_subprocess_exec")
+    @mock.patch("esmf_aspect_meta_model_python.samm_cli_functions.SammCliCache.get_model_key")
+    @mock.patch("esmf_aspect_meta_model_python.samm_cli_functions.SammCli._validate_client")
+    @mock.patch("esmf_aspect_meta_model_python.samm_cli_functions.SammCli._get_client_path")
+    def test_run_jobs_async_with_cache(
+        self,
+        get_client_path_mock,
+        _,
+        get_model_key_mock,
+        create_subprocess_exec_mock,
+        tmp_path,
+    ):
+        get_client_path_mock.return_value = "samm"
+        get_model_key_mock.return_value = "model_key"
+        create_subprocess_exec_mock.return_value = self.get_process_mock()
+        jobs = [SammCliJob("validate", "Model.ttl"), SammCliJob("validate", "Other.ttl", "flag")]
+        samm_cli = SammCli()
+        result = samm_cli.run_jobs_concurrently(jobs, 2, tmp_path)
+
+        assert [item.job for item in result] == jobs
+        assert [item.cached for item in result] == [False, False]
+        assert create_subprocess_exec_mock.call_count == 2
+
+        result = samm_cli.run_jobs_concurrently(jobs, 2, tmp_path)
+
+        assert [item.cached for item in result] == [True, True]
+        assert result[0].stdout == "stdout"
+        assert create_subprocess_exec_mock.call_count == 2
+
+    @mock.patch("esmf_aspect_meta_model_python.samm_cli_functions.asyncio.create_subprocess_exec")
+    @mock.patch("esmf_aspect_meta_model_python.samm_cli_functions.SammCli._validate_client")
+    @mock.patch("esmf_aspect_meta_model_python.samm_cli_functions.SammCli._get_client_path")
+    def test_run_jobs_async_with_cache_and_unresolved_models(
+        self,
+        get_client_path_mock,
+        _,
+        create_subprocess_exec_mock,
+        tmp_path,
+    ):
+        get_client_path_mock.return_value = "samm"
+        create_subprocess_exec_mock.return_value = self.get_process_mock(1, b"", b"error")
+        broken_model = tmp_path / "Broken.ttl"
+        broken_model.write_text("not turtle {")
+        misplaced_model = tmp_path / "Model.ttl"
+        misplaced_model.write_text(
+            "@prefix : <urn:samm:org.eclipse.esmf.test:1.0.0#> .\n"
+            "@prefix samm: <urn:samm:org.eclipse.esmf.samm:meta-model:2.1.0#> .\n"
+            ":Model a samm:Aspect ; samm:properties ( ) ; samm:operations ( ) .\n"
+        )
+        jobs = [SammCliJob("validate", broken_model), SammCliJob("validate", misplaced_model)]
+        result = SammCli().run_jobs_concurrently(jobs, cache_dir=tmp_path / "cache")
+
+        assert [(item.job, item.returncode, item.stderr, item.cached) for item in result] == [
+            (jobs[0], 1, "error", False),
+            (jobs[1], 1, "error", False),
+        ]
+        assert create_subprocess_exec_mock.call_count == 2
+
+    @mock.patch("esmf_aspect_meta_model_python.samm_cli_functions.asyncio.create_subprocess_exec")
+    @mock.patch("esmf_aspect_meta_model_python.samm_cli_functions.SammCli._validate_client")
+    @mock.patch("esmf_aspect_meta_model_python.samm_cli_functions.SammCli._get_client_path")
+    def test_run_jobs_async_max_workers(self, get_client_path_mock, _, create_subprocess_exec_mock):
+        get_client_path_mock.return_value = "samm"
+        running = []
+        max_running = []
+
+        async def communicate():
+            running.append(1)
+            max_running.append(len(running))
+            await asyncio.sleep(0.01)
+            running.pop()
+            return b"", b""
+
+        process = mock.MagicMock(returncode=0, communicate=communicate)
+        create_subprocess_exec_mock.return_value = process
+        jobs = [SammCliJob("validate", f"Model{index}.ttl") for index in range(6)]
+        result = asyncio.run(SammCli().run_jobs_async(jobs, max_workers=2))
+
+        assert len(result) == 6
+        assert max(max_running) == 2
+
+    @mock.patch("esmf_aspect_meta_model_python.samm_cli_functions.SammCli._validate_client")
+    @mock.patch("esmf_aspect_meta_model_python.samm_cli_functions.SammCli._get_client_path")
+    def test_run_jobs_async_with_invalid_max_workers(self, get_client_path_mock, _):
+        get_client_path_mock.return_value = "samm"
+
+        with pytest.raises(ValueError) as error:
+            SammCli().run_jobs_concurrently([], 0)
+
+        assert str(error.value) == "The number of workers must be a positive number"
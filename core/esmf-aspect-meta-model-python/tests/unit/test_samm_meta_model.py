@@ -4,12 +4,12 @@ from unittest import mock
 
 import pytest
 
-from rdflib.term import URIRef
+from rdflib.term import Literal
 
 from esmf_aspect_meta_model_python.samm_meta_model import SammUnitsGraph
 
 
-class TestSammCli:
+class TestSammUnitsGraph:
     """SAMM Units Graph tests."""
 
     @mock.patch("esmf_aspect_meta_model_python.samm_meta_model.SammUnitsGraph._get_units")
@@ -75,71 +75,132 @@ class TestSammCli:
         rdflib_graph_mock.return_value = graph_mock
         result = SammUnitsGraph()
 
-        assert result._graph == graph_mock
+        rdflib_graph_mock.assert_not_called()
+        assert result.graph == graph_mock
+        assert result.graph == graph_mock
         rdflib_graph_mock.assert_called_once()
         graph_mock.parse.assert_called_once_with("unit_file_path", format="turtle")
 
-    @mock.patch("esmf_aspect_meta_model_python.samm_meta_model.SammUnitsGraph._get_units")
-    @mock.patch("esmf_aspect_meta_model_python.samm_meta_model.SammUnitsGraph._validate_path")
-    @mock.patch("esmf_aspect_meta_model_python.samm_meta_model.SammUnitsGraph._get_file_path")
-    def test_get_nested_data_unit(self, get_file_path_mock, _, get_units_mock):
-        get_file_path_mock.return_value = "unit_file_path"
-        get_units_mock.return_value = "graph"
-        units_graph = SammUnitsGraph()
-        result = units_graph._get_nested_data("prefix#Unit")
 
-        assert result == ("Unit", "prefix#Unit")
+UNITS = """
+@prefix samm: <urn:samm:org.eclipse.esmf.samm:meta-model:2.1.0#> .
+@prefix unit: <urn:samm:org.eclipse.esmf.samm:unit:2.1.0#> .
 
-    @mock.patch("esmf_aspect_meta_model_python.samm_meta_model.SammUnitsGraph.get_info")
-    @mock.patch("esmf_aspect_meta_model_python.samm_meta_model.SammUnitsGraph._get_units")
-    @mock.patch("esmf_aspect_meta_model_python.samm_meta_model.SammUnitsGraph._validate_path")
-    @mock.patch("esmf_aspect_meta_model_python.samm_meta_model.SammUnitsGraph._get_file_path")
-    def test_get_nested_data_not_unit(self, get_file_path_mock, _, get_units_mock, get_info_mock):
-        get_file_path_mock.return_value = "unit_file_path"
-        get_units_mock.return_value = "graph"
-        get_info_mock.return_value = "nested_value"
-        units_graph = SammUnitsGraph()
-        result = units_graph._get_nested_data("prefix#unitType")
+unit:voltage a samm:QuantityKind ;
+   samm:preferredName "voltage"@en .
+
+unit:volt a samm:Unit ;
+   samm:preferredName "volt"@en ;
+   samm:commonCode "VLT" ;
+   samm:quantityKind unit:voltage ;
+   samm:symbol "V" .
 
-        assert result == ("unitType", "nested_value")
-        get_info_mock.assert_called_once_with("unit:unitType")
+unit:millivolt a samm:Unit ;
+   samm:preferredName "millivolt"@en ;
+   samm:commonCode "2Z" ;
+   samm:numericConversionFactor "1.0E-3"^^<http://www.w3.org/2001/XMLSchema#double> ;
+   samm:quantityKind unit:voltage ;
+   samm:referenceUnit unit:volt ;
+   samm:symbol "mV" .
 
-    @mock.patch("esmf_aspect_meta_model_python.samm_meta_model.SammUnitsGraph._get_nested_data")
-    @mock.patch("esmf_aspect_meta_model_python.samm_meta_model.isinstance")
-    @mock.patch("esmf_aspect_meta_model_python.samm_meta_model.SammUnitsGraph._get_units")
-    @mock.patch("esmf_aspect_meta_model_python.samm_meta_model.SammUnitsGraph._validate_path")
-    @mock.patch("esmf_aspect_meta_model_python.samm_meta_model.SammUnitsGraph._get_file_path")
-    def test_get_info(self, get_file_path_mock, _, get_units_mock, isinstance_mock, get_nested_data_mock):
-        get_file_path_mock.return_value = "unit_file_path"
-        isinstance_mock.side_effect = (False, URIRef, URIRef)
-        get_nested_data_mock.side_effect = [("type_key", "type_description"), ("sub_unit", "sub_unit_description")]
-        row_1_mock = mock.MagicMock()
-        row_1_mock.key = "prefix#unitType"
-        row_1_mock.value = "unit_1"
-        row_2_mock = mock.MagicMock()
-        row_2_mock.key = "prefix#type"
-        row_2_mock.value = "unit_2"
-        row_3_mock = mock.MagicMock()
-        row_3_mock.key = "prefix#otherUnit"
-        row_3_mock.value = "unit_3"
-        graph_mock = mock.MagicMock()
-        graph_mock.query.return_value = [row_1_mock, row_2_mock, row_3_mock]
-        get_units_mock.return_value = graph_mock
-        units_graph = SammUnitsGraph()
-        result = units_graph.get_info("unit:unit_name")
-
-        assert "unitType" in result
-        assert result["unitType"] == "unit_1"
-        assert "otherUnit" in result
-        assert len(result["otherUnit"]) == 1
-        assert "sub_unit" in result["otherUnit"][0]
-        assert result["otherUnit"][0]["sub_unit"] == "sub_unit_description"
-        graph_mock.query.assert_called_once_with("SELECT ?key ?value WHERE {unit:unit_name ?key ?value .}")
-        isinstance_mock.assert_has_calls(
-            [
-                mock.call("unit_1", URIRef),
-                mock.call("unit_2", URIRef),
-                mock.call("unit_3", URIRef),
-            ]
-        )
-        get_nested_data_mock.assert_has_calls([mock.call("unit_2"), mock.call("unit_3")])
+unit:voltAc a samm:Unit ;
+   samm:preferredName "volt AC"@en ;
+   samm:referenceUnit unit:voltAc ;
+   samm:symbol "V" .
+"""
+
+
+class TestSammUnitsCatalog:
+    """SAMM Units catalog tests."""
+
+    @pytest.fixture
+    def units_graph(self, tmp_path):
+        unit_file_path = tmp_path / "units.ttl"
+        unit_file_path.write_text(UNITS)
+
+        with mock.patch(
+            "esmf_aspect_meta_model_python.samm_meta_model.SammUnitsGraph._get_file_path",
+            return_value=str(unit_file_path),
+        ):
+            yield SammUnitsGraph
+
+    def test_get_name(self):
+        assert SammUnitsGraph.get_name("unit:volt") == "volt"
+        assert SammUnitsGraph.get_name("urn:samm:org.eclipse.esmf.samm:unit:2.1.0#volt") == "volt"
+        assert SammUnitsGraph.get_name("volt") == "volt"
+
+    def test_get_info(self, units_graph):
+        result = units_graph().get_info("unit:millivolt")
+
+        assert result == {
+            "preferredName": Literal("millivolt", lang="en"),
+            "commonCode": Literal("2Z"),
+            "numericConversionFactor": Literal("1.0E-3", datatype="http://www.w3.org/2001/XMLSchema#double"),
+            "quantityKind": [{"voltage": {"preferredName": Literal("voltage", lang="en")}}],
+            "referenceUnit": [
+                {
+                    "volt": {
+                        "preferredName": Literal("volt", lang="en"),
+                        "commonCode": Literal("VLT"),
+                        "quantityKind": [{"voltage": {"preferredName": Literal("voltage", lang="en")}}],
+                        "symbol": Literal("V"),
+                    }
+                }
+            ],
+            "symbol": Literal("mV"),
+        }
+
+    def test_get_info_with_cyclic_reference(self, units_graph):
+        result = units_graph().get_info("voltAc")
+
+        assert result["referenceUnit"] == [{"voltAc": "unit:voltAc"}]
+
+    def test_get_info_unknown_unit(self, units_graph):
+        assert units_graph().get_info("unit:unknown") == {}
+
+    def test_get_info_is_lazy(self, units_graph):
+        with mock.patch("esmf_aspect_meta_model_python.samm_meta_model.SammUnitsGraph._get_units") as get_units_mock:
+            units_graph()
+
+        get_units_mock.assert_not_called()
+
+    def test_get_units(self, units_graph):
+        result = units_graph()
+
+        assert result.get_units_by_symbol("V") == ["unit:volt", "unit:voltAc"]
+        assert result.get_units_by_symbol("kV") == []
+        assert result.get_units_by_common_code("VLT") == ["unit:volt"]
+        assert result.get_units_by_quantity_kind("unit:voltage") == ["unit:millivolt", "unit:volt"]
+
+    def test_catalog(self, units_graph, tmp_path):
+        catalog_path = tmp_path / "catalog" / "units.json"
+        info = units_graph(catalog_path).get_info("unit:millivolt")
+
+        assert catalog_path.exists()
+
+        with mock.patch("esmf_aspect_meta_model_python.samm_meta_model.SammUnitsGraph._get_units") as get_units_mock:
+            result = units_graph(catalog_path)
+
+            assert result.get_info("unit:millivolt") == info
+            assert result.get_units_by_symbol("mV") == ["unit:millivolt"]
+
+        get_units_mock.assert_not_called()
+
+    def test_catalog_of_changed_units(self, units_graph, tmp_path):
+        catalog_path = tmp_path / "units.json"
+        units_graph(catalog_path).get_info("unit:volt")
+        (tmp_path / "units.ttl").write_text(UNITS.replace('"VLT"', '"VOLT"'))
+        result = units_graph(catalog_path)
+
+        assert result.get_units_by_common_code("VOLT") == ["unit:volt"]
+        assert result.get_units_by_common_code("VLT") == []
+
+    def test_print_info(self, units_graph, capsys):
+        units = units_graph()
+        units.print_info(units.get_info("unit:voltAc"))
+
+        result = capsys.readouterr().out
+
+        assert result.startswith("referenceUnit:\n\tvoltAc: unit:voltAc\n")
+        assert "preferredName: volt AC\n" in result
+        assert "symbol: V\n" in result
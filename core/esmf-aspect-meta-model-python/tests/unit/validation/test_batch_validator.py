@@ -0,0 +1,198 @@
+"""Batch payload validator test suite."""
+
+from unittest import mock
+
+import pytest
+
+from esmf_aspect_meta_model_python.base.aspect import Aspect
+from esmf_aspect_meta_model_python.base.bound_definition import BoundDefinition
+from esmf_aspect_meta_model_python.base.characteristics.characteristic import Characteristic
+from esmf_aspect_meta_model_python.base.characteristics.collection.collection import Collection
+from esmf_aspect_meta_model_python.base.characteristics.enumeration import Enumeration
+from esmf_aspect_meta_model_python.base.characteristics.trait import Trait
+from esmf_aspect_meta_model_python.base.contraints.range_constraint import RangeConstraint
+from esmf_aspect_meta_model_python.base.data_types.complex_type import ComplexType
+from esmf_aspect_meta_model_python.base.data_types.scalar import Scalar
+from esmf_aspect_meta_model_python.base.property import Property
+from esmf_aspect_meta_model_python.validation.batch_validator import (
+    BatchPayloadValidator,
+    BatchValidatorCompiler,
+    compile_batch_validator,
+    get_scalar_value_checks,
+)
+from esmf_aspect_meta_model_python.validation.payload_validator import PayloadValidator, PayloadViolation
+
+XSD = "http://www.w3.org/2001/XMLSchema#"
+
+
+def get_scalar_characteristic(type_name, spec=Characteristic, **kwargs):
+    return mock.MagicMock(spec=spec, data_type=mock.MagicMock(spec=Scalar, urn=XSD + type_name), **kwargs)
+
+
+def get_property(name, characteristic, is_optional=False):
+    prop = mock.MagicMock(
+        spec=Property,
+        characteristic=characteristic,
+        payload_name=name,
+        is_optional=is_optional,
+        is_abstract=False,
+        is_not_in_payload=False,
+        extends=None,
+    )
+    prop.name = name
+
+    return prop
+
+
+def get_range_trait(base_characteristic, min_value, max_value):
+    constraint = mock.MagicMock(
+        spec=RangeConstraint,
+        min_value=min_value,
+        max_value=max_value,
+        lower_bound_definition=BoundDefinition.AT_LEAST,
+        upper_bound_definition=BoundDefinition.AT_MOST,
+    )
+
+    return mock.MagicMock(spec=Trait, base_characteristic=base_characteristic, constraints=[constraint])
+
+
+def get_aspect():
+    entity = mock.MagicMock(spec=ComplexType)
+    entity.all_properties = [
+        get_property("x", get_range_trait(get_scalar_characteristic("int"), 0, 10)),
+        get_property("child", mock.MagicMock(spec=Characteristic, data_type=entity), is_optional=True),
+    ]
+
+    return mock.MagicMock(
+        spec=Aspect,
+        properties=[
+            get_property("state", get_scalar_characteristic("string", Enumeration, values=["on", "off"])),
+            get_property("position", mock.MagicMock(spec=Characteristic, data_type=entity)),
+            get_property(
+                "values",
+                get_scalar_characteristic("int", Collection, element_characteristic=None),
+                is_optional=True,
+            ),
+        ],
+    )
+
+
+class TestGetScalarValueChecks:
+    """Scalar value checks test suite."""
+
+    def test_trait(self):
+        result = get_scalar_value_checks(get_range_trait(get_scalar_characteristic("int"), 0, 10))
+
+        assert [check(11) for check in result] == [None, "value must be at most 10"]
+        assert [check("1") for check in result] == ["expected an integer (int)", "value can not be compared with 0"]
+
+    def test_enumeration(self):
+        result = get_scalar_value_checks(get_scalar_characteristic("string", Enumeration, values=["on"]))
+
+        assert [check("off") for check in result] == [None, "value is not one of the enumeration values"]
+
+    def test_not_scalar(self):
+        entity_characteristic = mock.MagicMock(spec=Characteristic, data_type=mock.MagicMock(spec=ComplexType))
+        collection = get_scalar_characteristic("int", Collection)
+
+        assert get_scalar_value_checks(entity_characteristic) is None
+        assert get_scalar_value_checks(get_range_trait(collection, 0, 10)) is None
+        assert get_scalar_value_checks(None) is None
+
+
+class TestBatchValidatorCompiler:
+    """Batch validator compiler test suite."""
+
+    def test_compile_columns(self):
+        state, position, values = BatchValidatorCompiler().compile_columns(get_aspect().properties)
+
+        assert state.path == ("state",)
+        assert len(state.value_checks) == 2
+        assert [column.path for column in position.children] == [("position", "x"), ("position", "child")]
+        assert values.node_check is not None
+
+    def test_compile_recursive_entity(self):
+        _, position, _ = BatchValidatorCompiler().compile_columns(get_aspect().properties)
+        child = position.children[1]
+
+        assert child.path == ("position", "child")
+        assert child.children is None
+        assert child.node_check is not None
+
+
+class TestBatchPayloadValidator:
+    """Batch payload validator test suite."""
+
+    def test_init(self):
+        aspect = get_aspect()
+        result = BatchPayloadValidator(aspect, 10)
+
+        assert result.aspect is aspect
+        assert result.batch_size == 10
+
+    def test_init_with_invalid_batch_size(self):
+        with pytest.raises(ValueError) as error:
+            BatchPayloadValidator(get_aspect(), 0)
+
+        assert str(error.value) == "The batch size must be a positive number"
+
+    def test_validate(self):
+        validator = BatchPayloadValidator(get_aspect(), batch_size=2)
+        result = validator.validate(
+            [
+                {"state": "on", "position": {"x": 1}},
+                {"state": "up", "position": {"x": 11, "child": {"x": "1"}}, "values": [1, "2"]},
+                {"position": 1},
+                "payload",
+                {"state": "up", "position": {"x": 1, "child": {"child": {"x": 12}}}},
+            ]
+        )
+
+        assert result == [
+            PayloadViolation(["state"], "value is not one of the enumeration values", "up", 1),
+            PayloadViolation(["position", "x"], "value must be at most 10", 11, 1),
+            PayloadViolation(["position", "child", "x"], "expected an integer (int)", "1", 1),
+            PayloadViolation(["position", "child", "x"], "value can not be compared with 0", "1", 1),
+            PayloadViolation(["values", "1"], "expected an integer (int)", "2", 1),
+            PayloadViolation(["state"], "missing mandatory property", row=2),
+            PayloadViolation(["position"], "expected an object", 1, 2),
+            PayloadViolation([], "expected an object", "payload", 3),
+            PayloadViolation(["state"], "value is not one of the enumeration values", "up", 4),
+            PayloadViolation(["position", "child", "x"], "missing mandatory property", row=4),
+            PayloadViolation(["position", "child", "child", "x"], "value must be at most 10", 12, 4),
+        ]
+
+    def test_validate_as_payload_validator(self):
+        aspect = get_aspect()
+        payloads = [
+            {"state": ["on"], "position": {"x": True, "child": []}},
+            {"state": {"on": 1}, "position": {"x": None}, "values": {}},
+            None,
+        ]
+        expected = []
+        for row, payload in enumerate(payloads):
+            for violation in PayloadValidator(aspect).validate(payload):
+                violation.row = row
+                expected.append(violation)
+
+        assert BatchPayloadValidator(aspect).validate(payloads) == expected
+
+    def test_validate_json_lines(self, tmp_path):
+        file_path = tmp_path / "payloads.jsonl"
+        file_path.write_text(
+            '{"state": "on", "position": {"x": 1}}\n\n{"state": "up", "position": {"x": 1}}\n{"state"\n'
+        )
+        result = BatchPayloadValidator(get_aspect()).validate_json_lines(file_path)
+
+        assert result == [
+            PayloadViolation(["state"], "value is not one of the enumeration values", "up", 2),
+            PayloadViolation([], "invalid JSON", row=3),
+        ]
+
+    @mock.patch("esmf_aspect_meta_model_python.validation.batch_validator.BatchPayloadValidator")
+    def test_compile_batch_validator(self, batch_payload_validator_mock):
+        batch_payload_validator_mock.return_value = "validator"
+        result = compile_batch_validator("aspect", 10)
+
+        assert result == "validator"
+        batch_payload_validator_mock.assert_called_once_with("aspect", 10)
@@ -0,0 +1,224 @@
+"""Payload validator test suite."""
+
+from unittest import mock
+
+from esmf_aspect_meta_model_python.base.aspect import Aspect
+from esmf_aspect_meta_model_python.base.bound_definition import BoundDefinition
+from esmf_aspect_meta_model_python.base.characteristics.characteristic import Characteristic
+from esmf_aspect_meta_model_python.base.characteristics.collection.collection import Collection
+from esmf_aspect_meta_model_python.base.characteristics.collection.set import Set
+from esmf_aspect_meta_model_python.base.characteristics.enumeration import Enumeration
+from esmf_aspect_meta_model_python.base.characteristics.structured_value import StructuredValue
+from esmf_aspect_meta_model_python.base.characteristics.trait import Trait
+from esmf_aspect_meta_model_python.base.contraints.length_constraint import LengthConstraint
+from esmf_aspect_meta_model_python.base.contraints.range_constraint import RangeConstraint
+from esmf_aspect_meta_model_python.base.data_types.complex_type import ComplexType
+from esmf_aspect_meta_model_python.base.data_types.scalar import Scalar
+from esmf_aspect_meta_model_python.base.either import Either
+from esmf_aspect_meta_model_python.base.property import Property
+from esmf_aspect_meta_model_python.validation.payload_validator import (
+    PayloadValidator,
+    PayloadValidatorCompiler,
+    PayloadViolation,
+    compile_validator,
+)
+
+XSD = "http://www.w3.org/2001/XMLSchema#"
+
+
+def get_scalar_characteristic(type_name, spec=Characteristic, **kwargs):
+    return mock.MagicMock(spec=spec, data_type=mock.MagicMock(spec=Scalar, urn=XSD + type_name), **kwargs)
+
+
+def get_property(name, characteristic, is_optional=False, **kwargs):
+    kwargs.setdefault("is_abstract", False)
+    kwargs.setdefault("is_not_in_payload", False)
+    kwargs.setdefault("extends", None)
+    prop = mock.MagicMock(
+        spec=Property,
+        characteristic=characteristic,
+        payload_name=name,
+        is_optional=is_optional,
+        **kwargs,
+    )
+    prop.name = name
+
+    return prop
+
+
+def get_range_trait(base_characteristic, min_value, max_value):
+    constraint = mock.MagicMock(
+        spec=RangeConstraint,
+        min_value=min_value,
+        max_value=max_value,
+        lower_bound_definition=BoundDefinition.AT_LEAST,
+        upper_bound_definition=BoundDefinition.AT_MOST,
+    )
+
+    return mock.MagicMock(spec=Trait, base_characteristic=base_characteristic, constraints=[constraint])
+
+
+class TestPayloadViolation:
+    """Payload violation test suite."""
+
+    def test_init(self):
+        result = PayloadViolation(("entity", "property"), "message", "value")
+
+        assert result.path == ["entity", "property"]
+        assert result.message == "message"
+        assert result.value == "value"
+        assert result.row is None
+
+    def test_repr(self):
+        result = repr(PayloadViolation(("entity", "property"), "message"))
+
+        assert result == "PayloadViolation('entity.property', 'message')"
+
+    def test_repr_with_row(self):
+        result = repr(PayloadViolation(("property",), "message", row=1))
+
+        assert result == "PayloadViolation('property', 'message', row=1)"
+
+    def test_eq(self):
+        violation = PayloadViolation(("property",), "message", 1)
+
+        assert violation == PayloadViolation(["property"], "message", 1)
+        assert violation != PayloadViolation(["property"], "message", 2)
+        assert violation != PayloadViolation(["property"], "message", 1, 0)
+        assert violation != "message"
+
+
+class TestPayloadValidatorCompiler:
+    """Payload validator compiler test suite."""
+
+    @staticmethod
+    def validate(check, value):
+        violations = []
+        check(value, (), violations)
+
+        return violations
+
+    def test_compile_properties(self):
+        check = PayloadValidatorCompiler().compile_properties(
+            [
+                get_property("mandatory", get_scalar_characteristic("int")),
+                get_property("optional", get_scalar_characteristic("int"), is_optional=True),
+                get_property("abstract", get_scalar_characteristic("int"), is_abstract=True),
+                get_property("notInPayload", get_scalar_characteristic("int"), is_not_in_payload=True),
+            ]
+        )
+
+        assert self.validate(check, {"mandatory": 1, "other": "value"}) == []
+        assert self.validate(check, {"optional": "1"}) == [
+            PayloadViolation(["mandatory"], "missing mandatory property"),
+            PayloadViolation(["optional"], "expected an integer (int)", "1"),
+        ]
+        assert self.validate(check, []) == [PayloadViolation([], "expected an object", [])]
+
+    def test_compile_recursive_entity(self):
+        entity = mock.MagicMock(spec=ComplexType)
+        child_property = get_property("child", mock.MagicMock(spec=Characteristic, data_type=entity), is_optional=True)
+        entity.all_properties = [get_property("value", get_scalar_characteristic("boolean")), child_property]
+        check = PayloadValidatorCompiler().compile_data_type(entity)
+
+        assert self.validate(check, {"value": True, "child": {"value": False}}) == []
+        assert self.validate(check, {"value": True, "child": {"value": 1}}) == [
+            PayloadViolation(["child", "value"], "expected a boolean", 1)
+        ]
+
+    def test_compile_trait(self):
+        check = PayloadValidatorCompiler().compile_characteristic(
+            get_range_trait(get_scalar_characteristic("int"), 2, 10)
+        )
+
+        assert self.validate(check, 5) == []
+        assert self.validate(check, 11) == [PayloadViolation([], "value must be at most 10", 11)]
+
+    def test_compile_enumeration(self):
+        characteristic = get_scalar_characteristic("string", Enumeration, values=["green", "red"])
+        check = PayloadValidatorCompiler().compile_characteristic(characteristic)
+
+        assert self.validate(check, "green") == []
+        assert self.validate(check, "blue") == [
+            PayloadViolation([], "value is not one of the enumeration values", "blue")
+        ]
+
+    def test_compile_structured_value(self):
+        characteristic = get_scalar_characteristic("string", StructuredValue, deconstruction_rule="([0-9]+)-([0-9]+)")
+        check = PayloadValidatorCompiler().compile_characteristic(characteristic)
+
+        assert self.validate(check, "1-2") == []
+        assert self.validate(check, "1-2-3") == [
+            PayloadViolation([], "value does not match the deconstruction rule ([0-9]+)-([0-9]+)", "1-2-3")
+        ]
+
+    def test_compile_either(self):
+        characteristic = mock.MagicMock(
+            spec=Either,
+            left=get_scalar_characteristic("string"),
+            right=get_scalar_characteristic("boolean"),
+        )
+        check = PayloadValidatorCompiler().compile_characteristic(characteristic)
+
+        assert self.validate(check, {"left": "value"}) == []
+        assert self.validate(check, {"right": "value"}) == [PayloadViolation(["right"], "expected a boolean", "value")]
+        assert self.validate(check, {"left": "value", "right": True}) == [
+            PayloadViolation([], "expected an object with either left or right", {"left": "value", "right": True})
+        ]
+
+    def test_compile_collection(self):
+        characteristic = get_scalar_characteristic("int", Collection, element_characteristic=None)
+        check = PayloadValidatorCompiler().compile_characteristic(characteristic)
+
+        assert self.validate(check, [1, 2]) == []
+        assert self.validate(check, [1, "2"]) == [PayloadViolation(["1"], "expected an integer (int)", "2")]
+        assert self.validate(check, 1) == [PayloadViolation([], "expected a list", 1)]
+
+    def test_compile_set(self):
+        characteristic = get_scalar_characteristic("int", Set, element_characteristic=None)
+        check = PayloadValidatorCompiler().compile_characteristic(characteristic)
+
+        assert self.validate(check, [1, 2]) == []
+        assert self.validate(check, [1, 1]) == [PayloadViolation([], "expected unique values", [1, 1])]
+        assert self.validate(check, [{"a": 1}, {"a": 1}]) == [
+            PayloadViolation(["0"], "expected an integer (int)", {"a": 1}),
+            PayloadViolation(["1"], "expected an integer (int)", {"a": 1}),
+            PayloadViolation([], "expected unique values", [{"a": 1}, {"a": 1}]),
+        ]
+
+    def test_compile_constrained_collection(self):
+        collection = get_scalar_characteristic("int", Collection, element_characteristic=None)
+        trait = get_range_trait(collection, 2, 10)
+        trait.constraints.append(mock.MagicMock(spec=LengthConstraint, min_value=None, max_value=2))
+        check = PayloadValidatorCompiler().compile_characteristic(trait)
+
+        assert self.validate(check, [2, 10]) == []
+        assert self.validate(check, [1, 5, 11]) == [
+            PayloadViolation(["0"], "value must be at least 2", 1),
+            PayloadViolation(["2"], "value must be at most 10", 11),
+            PayloadViolation([], "length must be at most 2", [1, 5, 11]),
+        ]
+
+
+class TestPayloadValidator:
+    """Payload validator test suite."""
+
+    def test_validate(self):
+        aspect = mock.MagicMock(
+            spec=Aspect, properties=[get_property("isMoving", get_scalar_characteristic("boolean"))]
+        )
+        validator = PayloadValidator(aspect)
+
+        assert validator.aspect is aspect
+        assert validator.validate({"isMoving": True}) == []
+        assert validator({"isMoving": "yes"}) == [PayloadViolation(["isMoving"], "expected a boolean", "yes")]
+        assert validator.is_valid({"isMoving": True}) is True
+        assert validator.is_valid({}) is False
+
+    @mock.patch("esmf_aspect_meta_model_python.validation.payload_validator.PayloadValidator")
+    def test_compile_validator(self, payload_validator_mock):
+        payload_validator_mock.return_value = "validator"
+        result = compile_validator("aspect")
+
+        assert result == "validator"
+        payload_validator_mock.assert_called_once_with("aspect")
@@ -0,0 +1,226 @@
+"""Value checks test suite."""
+
+from datetime import date, datetime, time, timezone
+from decimal import Decimal
+from unittest import mock
+
+from esmf_aspect_meta_model_python.base.bound_definition import BoundDefinition
+from esmf_aspect_meta_model_python.base.contraints.encoding_constraint import EncodingConstraint
+from esmf_aspect_meta_model_python.base.contraints.fixed_point_constraint import FixedPointConstraint
+from esmf_aspect_meta_model_python.base.contraints.language_constraint import LanguageConstraint
+from esmf_aspect_meta_model_python.base.contraints.length_constraint import LengthConstraint
+from esmf_aspect_meta_model_python.base.contraints.locale_constraint import LocaleConstraint
+from esmf_aspect_meta_model_python.base.contraints.range_constraint import RangeConstraint
+from esmf_aspect_meta_model_python.base.contraints.regular_expression_constraint import RegularExpressionConstraint
+from esmf_aspect_meta_model_python.validation.value_checks import (
+    get_constraint_check,
+    get_encoding_check,
+    get_enumeration_check,
+    get_enumeration_values,
+    get_fixed_point_check,
+    get_json_type,
+    get_language_check,
+    get_length_check,
+    get_range_check,
+    get_regular_expression_check,
+    get_scalar_check,
+    get_type_name,
+    to_comparable,
+)
+
+XSD = "http://www.w3.org/2001/XMLSchema#"
+
+
+def get_range_constraint(min_value, max_value, lower=BoundDefinition.AT_LEAST, upper=BoundDefinition.AT_MOST):
+    return mock.MagicMock(
+        spec=RangeConstraint,
+        min_value=min_value,
+        max_value=max_value,
+        lower_bound_definition=lower,
+        upper_bound_definition=upper,
+    )
+
+
+class TestScalarChecks:
+    """Scalar data type checks test suite."""
+
+    def test_get_type_name(self):
+        assert get_type_name(XSD + "int") == "int"
+        assert get_type_name("int") == "int"
+
+    def test_string(self):
+        check = get_scalar_check(XSD + "dateTime")
+
+        assert check("2024-01-01T00:00:00") is None
+        assert check(1) == "expected a string (dateTime)"
+
+    def test_boolean(self):
+        check = get_scalar_check(XSD + "boolean")
+
+        assert check(True) is None
+        assert check(1) == "expected a boolean"
+
+    def test_number(self):
+        check = get_scalar_check(XSD + "float")
+
+        assert check(1) is None
+        assert check(1.5) is None
+        assert check(True) == "expected a number (float)"
+        assert check("1.5") == "expected a number (float)"
+
+    def test_integer(self):
+        check = get_scalar_check(XSD + "unsignedByte")
+
+        assert check(255) is None
+        assert check(256) == "value is out of the range of unsignedByte"
+        assert check(-1) == "value is out of the range of unsignedByte"
+        assert check(1.0) == "expected an integer (unsignedByte)"
+        assert check(False) == "expected an integer (unsignedByte)"
+
+    def test_lang_string(self):
+        check = get_scalar_check("http://www.w3.org/1999/02/22-rdf-syntax-ns#langString")
+
+        assert check({"en": "text"}) is None
+        assert check("text") == "expected an object with texts by language"
+        assert check({"en": 1}) == "expected an object with texts by language"
+
+    def test_unknown_type(self):
+        assert get_scalar_check(XSD + "unknown") is None
+
+
+class TestConstraintChecks:
+    """Constraint checks test suite."""
+
+    def test_to_comparable(self):
+        assert to_comparable("2024-01-02", date(2024, 1, 1)) == date(2024, 1, 2)
+        assert to_comparable(1, 2) == 1
+
+    def test_to_comparable_utc_designator(self):
+        bound = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+        assert to_comparable("2024-01-02T00:00:00Z", bound) == datetime(2024, 1, 2, tzinfo=timezone.utc)
+        assert to_comparable("12:00:00Z", time(tzinfo=timezone.utc)) == time(12, tzinfo=timezone.utc)
+        assert get_range_check(get_range_constraint(bound, None))("2024-01-01T00:00:00Z") is None
+
+    def test_range_check(self):
+        check = get_range_check(get_range_constraint(2, 10))
+
+        assert check(2) is None
+        assert check(10) is None
+        assert check(1) == "value must be at least 2"
+        assert check(11) == "value must be at most 10"
+        assert check("a") == "value can not be compared with 2"
+
+    def test_range_check_exclusive(self):
+        check = get_range_check(get_range_constraint(2, 10, BoundDefinition.GREATER_THAN, BoundDefinition.LESS_THAN))
+
+        assert check(3) is None
+        assert check(2) == "value must be greater than 2"
+        assert check(10) == "value must be less than 10"
+
+    def test_range_check_open(self):
+        constraint = get_range_constraint(2, 10, BoundDefinition.OPEN, BoundDefinition.OPEN)
+
+        assert get_range_check(constraint) is None
+
+    def test_range_check_date(self):
+        check = get_range_check(get_range_constraint(date(2024, 1, 1), None, upper=BoundDefinition.OPEN))
+
+        assert check("2024-01-02") is None
+        assert check("2023-12-31") == "value must be at least 2024-01-01"
+        assert check("not a date") == "value can not be compared with 2024-01-01"
+
+    def test_length_check(self):
+        check = get_length_check(mock.MagicMock(spec=LengthConstraint, min_value=2, max_value=3))
+
+        assert check("ab") is None
+        assert check([1, 2, 3]) is None
+        assert check(1) is None
+        assert check("a") == "length must be at least 2"
+        assert check([1, 2, 3, 4]) == "length must be at most 3"
+
+    def test_length_check_not_limited(self):
+        constraint = mock.MagicMock(spec=LengthConstraint, min_value=None, max_value=None)
+
+        assert get_length_check(constraint) is None
+
+    def test_regular_expression_check(self):
+        check = get_regular_expression_check(mock.MagicMock(spec=RegularExpressionConstraint, value="^[0-9]*$"))
+
+        assert check("123") is None
+        assert check(1) is None
+        assert check("12a") == "value does not match the pattern ^[0-9]*$"
+
+    def test_regular_expression_check_partial_match(self):
+        check = get_regular_expression_check(mock.MagicMock(spec=RegularExpressionConstraint, value="[0-9]"))
+
+        assert check("a1b") is None
+        assert check("ab") == "value does not match the pattern [0-9]"
+
+    def test_encoding_check(self):
+        check = get_encoding_check(mock.MagicMock(spec=EncodingConstraint, value="US-ASCII"))
+
+        assert check("text") is None
+        assert check("täxt") == "value can not be encoded in US-ASCII"
+
+    def test_encoding_check_unknown(self):
+        assert get_encoding_check(mock.MagicMock(spec=EncodingConstraint, value="UNKNOWN")) is None
+
+    def test_language_check(self):
+        check = get_language_check(mock.MagicMock(spec=LanguageConstraint, language_code="en"))
+
+        assert check({"en": "text"}) is None
+        assert check({"de": "Text"}) == "language must be en"
+
+    def test_fixed_point_check(self):
+        check = get_fixed_point_check(mock.MagicMock(spec=FixedPointConstraint, integer=3, scale=2))
+
+        assert check(123.45) is None
+        assert check(Decimal("0.1")) is None
+        assert check("text") is None
+        assert check(1234) == "value must have at most 3 integer and 2 fraction digits"
+        assert check(1.234) == "value must have at most 3 integer and 2 fraction digits"
+
+    def test_get_constraint_check(self):
+        length_check = get_constraint_check(mock.MagicMock(spec=LengthConstraint, min_value=1, max_value=None))
+
+        assert length_check("") == "length must be at least 1"
+        assert get_constraint_check(mock.MagicMock(spec=LocaleConstraint)) is None
+
+
+class TestEnumerationChecks:
+    """Enumeration checks test suite."""
+
+    def test_get_enumeration_values(self):
+        result = get_enumeration_values(["green", date(2024, 1, 1), {"entity": "value"}])
+
+        assert result == frozenset((("string", "green"), ("date", date(2024, 1, 1)), ("string", "2024-01-01")))
+
+    def test_enumeration_check(self):
+        check = get_enumeration_check(["green", "red"])
+
+        assert check("green") is None
+        assert check("blue") == "value is not one of the enumeration values"
+        assert check(["green"]) == "value is not one of the enumeration values"
+
+    def test_enumeration_check_of_booleans_and_numbers(self):
+        numbers = get_enumeration_check([1, 2.5])
+        booleans = get_enumeration_check([True])
+
+        assert numbers(1) is None
+        assert numbers(1.0) is None
+        assert numbers(2.5) is None
+        assert numbers(True) == "value is not one of the enumeration values"
+        assert booleans(True) is None
+        assert booleans(1) == "value is not one of the enumeration values"
+        assert booleans(1.0) == "value is not one of the enumeration values"
+
+    def test_get_json_type(self):
+        assert get_json_type(True) == "boolean"
+        assert get_json_type(1) == "number"
+        assert get_json_type(Decimal("1.5")) == "number"
+        assert get_json_type("1") == "string"
+        assert get_json_type(None) == "NoneType"
+
+    def test_enumeration_check_of_entities(self):
+        assert get_enumeration_check([{"entity": "value"}]) is None